@@ -13,6 +13,7 @@ FeedName = Literal[
     "yfinance",
     "ibkr_delayed",
     "replay",
+    "tick_replay",
     "synthetic_options",
     "ibkr_live",
 ]
@@ -29,11 +30,21 @@ class DataConfig(_Strict):
     feed: FeedName = "yfinance"
     bar_interval_seconds: int = 60
     options_feed: OptionsFeedName = "synthetic"
-    replay_path: str | None = None  # required if feed == replay
+    replay_path: str | None = None  # required if feed == replay / tick_replay
+    # Replay pacing: 0 = as fast as possible, 1 = real time, N = N times faster.
+    replay_speed: float = Field(default=0.0, ge=0)
     # IBKR reqMarketDataType: 1=live (requires API-eligible subscription),
     # 3=delayed (15-min lag, free). Default to delayed so the feed works
     # out of the box; bump to 1 when you have a real-time API subscription.
     market_data_type: Literal[1, 2, 3, 4] = 3
+    # Option quotes stay subscribed for ATM ± option_window_strikes; the
+    # window is re-centred (in the background) once the ATM strike is
+    # within option_recenter_strikes of its edge. 1 <= recenter <= window.
+    option_window_strikes: int = 5
+    option_recenter_strikes: int = 1
+    # Solve iv and greeks from the bid/ask mid for option quotes that
+    # arrive without them (IBKR before its model greeks come in).
+    backfill_greeks: bool = True
 
 
 class BrokerConfig(_Strict):
@@ -44,6 +55,9 @@ class BrokerConfig(_Strict):
     client_id: int = 17
     dry_run: bool = True
     paper_account_allowlist: list[str] = Field(default_factory=lambda: ["DEMO", "PAPER"])
+    # The run loop reuses the broker's last account snapshot (kept fresh by
+    # IBKR account-value events) until it is this old, then refetches.
+    account_max_age_seconds: float = 30.0
 
     @model_validator(mode="after")
     def _enforce_paper_in_v1(self) -> BrokerConfig:
@@ -65,6 +79,9 @@ class SignalParams(_Strict):
     # Tick-strategy params (ignored by bar strategy)
     sma_window_seconds: int = 9
     confirmation_seconds: int = 5
+    # Keep tick-strategy SMA/VWAP state in integer ten-thousandths instead
+    # of Decimal (same signals, cheaper per tick).
+    fixed_point_prices: bool = False
     # Sell-put strategy: minimum wall-clock between consecutive signals.
     cooldown_seconds: int = 30
 
@@ -129,6 +146,56 @@ class RiskConfig(_Strict):
     kill_switch_file: str = "./KILL"
 
 
+class CheckpointConfig(_Strict):
+    """Periodic strategy-state snapshots for warm restarts.
+
+    ``store=supabase`` needs migration 0005 and SUPABASE_DB_URL; without a
+    database the engine falls back to ``file``.
+    """
+
+    enabled: bool = False
+    store: Literal["file", "supabase"] = "file"
+    directory: str = "./checkpoints"
+    interval_seconds: int = 5
+    # Max persisted ticks/bars replayed after a restore; more starts cold.
+    replay_limit: int = 20_000
+
+
+class WarmupConfig(_Strict):
+    """Startup preload of today's persisted bars/ticks into the strategy.
+
+    Skipped when a checkpoint restore already replayed the session.
+    """
+
+    enabled: bool = True
+    # Max persisted ticks/bars preloaded; a busier session starts cold
+    # (audited as SESSION_WARMUP_FAILED) rather than with a gap.
+    max_events: int = 500_000
+
+
+class PersistenceConfig(_Strict):
+    """Write-behind queue in front of the storage backend.
+
+    With ``write_behind`` on, event rows are batched by a background
+    flusher instead of awaited per event; order intents are still flushed
+    before the broker sees them.
+    """
+
+    write_behind: bool = True
+    batch_size: int = Field(default=500, ge=1)
+    flush_interval_ms: int = Field(default=200, ge=1)
+    # Per-table cap. Full queues block the writer, except drop_tables,
+    # which shed their oldest rows.
+    max_queue_rows: int = Field(default=50_000, ge=1)
+    drop_tables: list[str] = Field(default_factory=lambda: ["ticks"])
+
+    @model_validator(mode="after")
+    def _queue_holds_a_batch(self) -> PersistenceConfig:
+        if self.max_queue_rows < self.batch_size:
+            raise ValueError("persistence.max_queue_rows must be >= batch_size")
+        return self
+
+
 class StrategyConfig(_Strict):
     data: DataConfig = Field(default_factory=DataConfig)
     broker: BrokerConfig = Field(default_factory=BrokerConfig)
@@ -137,6 +204,9 @@ class StrategyConfig(_Strict):
     entry: EntryConfig = Field(default_factory=EntryConfig)
     exit: ExitConfig = Field(default_factory=ExitConfig)
     risk: RiskConfig = Field(default_factory=RiskConfig)
+    checkpoint: CheckpointConfig = Field(default_factory=CheckpointConfig)
+    warmup: WarmupConfig = Field(default_factory=WarmupConfig)
+    persistence: PersistenceConfig = Field(default_factory=PersistenceConfig)
 
     @field_validator("entry")
     @classmethod
@@ -7,12 +7,13 @@ by the `data.feed` config value at runtime.
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Iterable
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Literal, Protocol, runtime_checkable
+from typing import Any, Literal, Protocol, runtime_checkable
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 OptionRight = Literal["C", "P"]
 
@@ -92,6 +93,134 @@ class OptionQuote(_Frozen):
         )
 
 
+class OptionChain(_Frozen):
+    """Immutable, indexed quotes for one underlying's option chain.
+
+    Built once per event, so strategy lookups don't rescan the quote list:
+    :meth:`get` / :meth:`find` are dict lookups keyed on
+    ``(expiry, strike, right)``, and :meth:`nearest` / :meth:`window`
+    bisect a sorted strike ladder. If a contract is quoted twice, the
+    later quote wins. ``expiry=None`` means the front (earliest) expiry.
+    """
+
+    underlying: str
+    quotes: tuple[OptionQuote, ...] = ()
+
+    _by_key: dict[tuple[date, Decimal, str], OptionQuote] = PrivateAttr(default_factory=dict)
+    _ladders: dict[tuple[date, str | None], list[Decimal]] = PrivateAttr(default_factory=dict)
+    _expiries: tuple[date, ...] = PrivateAttr(default=())
+
+    @model_validator(mode="after")
+    def _single_underlying(self) -> OptionChain:
+        for q in self.quotes:
+            if q.underlying != self.underlying:
+                raise ValueError(
+                    f"quote for {q.underlying} in {self.underlying} option chain"
+                )
+        return self
+
+    def model_post_init(self, context: Any, /) -> None:
+        by_key = self._by_key
+        for q in self.quotes:
+            by_key[(q.expiry, q.strike, q.right)] = q
+        ladders: dict[tuple[date, str | None], set[Decimal]] = {}
+        for expiry, strike, right in by_key:
+            ladders.setdefault((expiry, right), set()).add(strike)
+            ladders.setdefault((expiry, None), set()).add(strike)
+        self._ladders = {k: sorted(v) for k, v in ladders.items()}
+        self._expiries = tuple(sorted({expiry for expiry, _, _ in by_key}))
+
+    @classmethod
+    def from_quotes(cls, underlying: str, quotes: Iterable[OptionQuote]) -> OptionChain:
+        """Index the quotes in ``quotes`` that belong to ``underlying``."""
+        return cls(
+            underlying=underlying,
+            quotes=tuple(q for q in quotes if q.underlying == underlying),
+        )
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    @property
+    def expiries(self) -> tuple[date, ...]:
+        """Quoted expiries, earliest first."""
+        return self._expiries
+
+    def _expiry(self, expiry: date | None) -> date | None:
+        if expiry is not None:
+            return expiry
+        return self._expiries[0] if self._expiries else None
+
+    def get(
+        self, strike: Decimal, right: str, expiry: date | None = None
+    ) -> OptionQuote | None:
+        """Quote for exactly ``strike``/``right``, or ``None``."""
+        exp = self._expiry(expiry)
+        if exp is None:
+            return None
+        return self._by_key.get((exp, strike, right))
+
+    def find(self, contract: OptionContract) -> OptionQuote | None:
+        """Quote for ``contract`` (underlying, expiry, strike and right)."""
+        if contract.underlying != self.underlying:
+            return None
+        return self._by_key.get((contract.expiry, contract.strike, contract.right))
+
+    def strikes(self, right: str | None = None, expiry: date | None = None) -> list[Decimal]:
+        """Sorted strikes quoted for ``right`` (either right when ``None``)."""
+        exp = self._expiry(expiry)
+        if exp is None:
+            return []
+        return list(self._ladders.get((exp, right), ()))
+
+    def _nearest_index(self, ladder: list[Decimal], price: Decimal) -> int:
+        # Ties go to the lower strike.
+        i = bisect_left(ladder, price)
+        if i == len(ladder) or (i > 0 and price - ladder[i - 1] <= ladder[i] - price):
+            return i - 1
+        return i
+
+    def nearest(
+        self, price: Decimal, right: str, expiry: date | None = None
+    ) -> OptionQuote | None:
+        """Quote whose strike is closest to ``price`` (ties: lower strike)."""
+        exp = self._expiry(expiry)
+        if exp is None:
+            return None
+        ladder = self._ladders.get((exp, right))
+        if not ladder:
+            return None
+        strike = ladder[self._nearest_index(ladder, price)]
+        return self._by_key[(exp, strike, right)]
+
+    def window(
+        self,
+        price: Decimal,
+        n: int,
+        right: str | None = None,
+        expiry: date | None = None,
+    ) -> list[OptionQuote]:
+        """Quotes for the ATM strike and ``n`` strikes either side of it.
+
+        Ordered by strike, calls before puts at each strike.
+        """
+        exp = self._expiry(expiry)
+        if exp is None:
+            return []
+        ladder = self._ladders.get((exp, right))
+        if not ladder:
+            return []
+        i = self._nearest_index(ladder, price)
+        rights = ("C", "P") if right is None else (right,)
+        out: list[OptionQuote] = []
+        for strike in ladder[max(0, i - n) : i + n + 1]:
+            for r in rights:
+                q = self._by_key.get((exp, strike, r))
+                if q is not None:
+                    out.append(q)
+        return out
+
+
 class ChainSnapshot(_Frozen):
     """A single-instant view of a chain expiry."""
 
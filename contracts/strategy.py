@@ -15,10 +15,10 @@ from decimal import Decimal
 from enum import Enum
 from typing import Literal, Protocol, runtime_checkable
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from contracts.broker import OrderIntent
-from contracts.data_feed import Bar, OptionQuote, Quote
+from contracts.data_feed import Bar, OptionChain, OptionQuote, Quote
 
 
 class _Frozen(BaseModel):
@@ -51,7 +51,9 @@ class StrategyContext(_Frozen):
 
     Bar-driven strategies populate `last_bar` / `bar_history`.
     Tick-driven strategies populate `last_tick` / `tick_history`.
-    Both may receive `option_quotes` for entry pricing or exit triggers.
+    Both may receive `option_quotes` for entry pricing or exit triggers;
+    look quotes up through `chain_for`, which uses the orchestrator's
+    pre-built `option_chain` when there is one.
     """
 
     now: datetime
@@ -60,9 +62,29 @@ class StrategyContext(_Frozen):
     last_tick: Quote | None = None
     tick_history: list[Quote] = Field(default_factory=list)
     option_quotes: list[OptionQuote] = Field(default_factory=list)
+    option_chain: OptionChain | None = None
     open_positions: int = 0
     cash_available: Decimal = Decimal("0")
 
+    _chains: dict[str, OptionChain] = PrivateAttr(default_factory=dict)
+
+    def chain_for(self, underlying: str) -> OptionChain:
+        """Indexed view of `underlying`'s option quotes.
+
+        Returns `option_chain` when it is for `underlying`; otherwise
+        indexes `option_quotes` on first use and reuses that index for
+        the rest of this context's lifetime.
+        """
+        chain = self.option_chain
+        if chain is not None and chain.underlying == underlying:
+            return chain
+        chain = self._chains.get(underlying)
+        if chain is None:
+            chain = self._chains[underlying] = OptionChain.from_quotes(
+                underlying, self.option_quotes
+            )
+        return chain
+
 
 class StrategyDecision(_Frozen):
     """What the Strategy returns each event: zero or more signals + intents."""
@@ -6,6 +6,8 @@ Protocol declared in `contracts/broker.py`. The abstract base provides:
 * a `name` and `dry_run` attribute
 * a `_connected` flag and `_assert_connected()` helper
 * a `_audit(msg, payload)` hook for downstream integration code
+* a last-known `AccountSummary` (`account_snapshot`) that callers on the
+  hot path read synchronously instead of awaiting a broker round trip
 """
 
 from __future__ import annotations
@@ -13,6 +15,7 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
@@ -40,6 +43,7 @@ class AbstractBroker(ABC):
     def __init__(self, dry_run: bool = True) -> None:
         self.dry_run: bool = bool(dry_run)
         self._connected: bool = False
+        self._account_snapshot: AccountSummary | None = None
 
     # ------------------------------------------------------------------
     # Common helpers
@@ -51,6 +55,24 @@ class AbstractBroker(ABC):
                 f"broker {self.name!r} is not connected; call .connect() first"
             )
 
+    def account_snapshot(self, max_age_seconds: float) -> AccountSummary | None:
+        """Last known account summary, or None if older than `max_age_seconds`.
+
+        Never does I/O. `get_account_summary` refreshes it, and brokers
+        with push updates (IBKR account-value events) refresh it as they
+        arrive. Returns None while disconnected.
+        """
+        snapshot = self._account_snapshot
+        if snapshot is None or not self._connected:
+            return None
+        age = (datetime.now(tz=UTC) - snapshot.fetched_at).total_seconds()
+        return snapshot if age <= max_age_seconds else None
+
+    def _remember_account(self, summary: AccountSummary) -> AccountSummary:
+        """Store `summary` as the account snapshot and return it."""
+        self._account_snapshot = summary
+        return summary
+
     def _audit(self, msg: str, payload: dict[str, Any] | None = None) -> None:
         """Hook for the audit log. Default implementation logs at INFO.
 
@@ -83,6 +83,11 @@ class DryRunBroker(AbstractBroker):
     # ------------------------------------------------------------------
     async def get_account_summary(self) -> AccountSummary:
         self._assert_connected()
+        return self._remember_account(self.account_summary())
+
+    def account_summary(self) -> AccountSummary:
+        """The paper account as `get_account_summary` reports it, without a
+        connection. The NAV never moves, so a snapshot stays current."""
         return AccountSummary(
             account_id=self._account_id,
             account_type=AccountType.PAPER,
@@ -113,7 +118,7 @@ class DryRunBroker(AbstractBroker):
             },
         )
 
-        price = self._fill_price(intent)
+        price = self.fill_price(intent)
         broker_order_id = f"DRY-{intent.intent_id.hex[:8]}"
         now = datetime.now(tz=UTC)
 
@@ -146,6 +151,14 @@ class DryRunBroker(AbstractBroker):
 
         return update
 
+    @staticmethod
+    def fill_price(intent: OrderIntent) -> Decimal:
+        """The price `place_order` fills ``intent`` at: its limit, or
+        ``1.00`` for market orders."""
+        if intent.order_type == OrderType.LIMIT and intent.limit_price is not None:
+            return Decimal(intent.limit_price)
+        return _DEFAULT_MKT_FILL_PRICE
+
     async def cancel_order(self, intent_id: UUID) -> OrderUpdate:
         self._assert_connected()
         self._audit("dry_run.cancel_order", {"intent_id": str(intent_id)})
@@ -185,12 +198,6 @@ class DryRunBroker(AbstractBroker):
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
-    @staticmethod
-    def _fill_price(intent: OrderIntent) -> Decimal:
-        if intent.order_type == OrderType.LIMIT and intent.limit_price is not None:
-            return Decimal(intent.limit_price)
-        return _DEFAULT_MKT_FILL_PRICE
-
     def _record_fill(self, fill: Fill) -> None:
         self._fills.append(fill)
         key = self._position_key(fill.symbol, fill.option)
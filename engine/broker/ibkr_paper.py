@@ -103,6 +103,9 @@ class IBKRPaperBroker(AbstractBroker):
         self._account_id: str | None = None
         self._account_type: AccountType = AccountType.UNKNOWN
         self._account_summary_cache: list[Any] = []
+        self._base_currency: str | None = None
+        # Tags for which accountValueEvent pushes a converted BASE total.
+        self._base_tags: set[str] = set()
 
         # Maps for translating intent_id <-> ib_insync.Trade
         self._trades_by_intent: dict[UUID, Any] = {}
@@ -147,6 +150,8 @@ class IBKRPaperBroker(AbstractBroker):
         self._account_summary_cache = list(summary or [])
         self._account_id = self._extract_account_id(self._account_summary_cache)
         self._account_type = self._classify_account_type(self._account_summary_cache)
+        self._base_currency = self._extract_base_currency(self._account_summary_cache)
+        self._base_tags = set()
 
         # In dry_run we never call placeOrder against the live broker, so the
         # paper guard does not need to fire even if the connected account is
@@ -162,6 +167,17 @@ class IBKRPaperBroker(AbstractBroker):
         # Wire up event bridges (no-op if events are missing — useful for tests).
         self._wire_events()
 
+        # Seed the snapshot from the rows we just fetched so the first
+        # event doesn't pay another accountSummary round trip.
+        if self._dry_run_inner is not None:
+            self._remember_account(
+                (await self._dry_run_inner.get_account_summary()).model_copy(
+                    update={"account_id": self._account_id or "DRYRUN-IBKR-0001"}
+                )
+            )
+        else:
+            self._remember_account(self._summary_from_rows(self._account_summary_cache))
+
         self._connected = True
         self._audit(
             "ibkr.connect",
@@ -277,8 +293,8 @@ class IBKRPaperBroker(AbstractBroker):
         if self._dry_run_inner is not None:
             inner = await self._dry_run_inner.get_account_summary()
             # Override the account id with the real one if known.
-            return inner.model_copy(
-                update={"account_id": self._account_id or inner.account_id}
+            return self._remember_account(
+                inner.model_copy(update={"account_id": self._account_id or inner.account_id})
             )
 
         # See note in connect() — prefer the async variant.
@@ -289,13 +305,16 @@ class IBKRPaperBroker(AbstractBroker):
             summary = summary_call()
         if asyncio.iscoroutine(summary):
             summary = await summary
-        rows = list(summary or [])
+        self._account_summary_cache = list(summary or [])
+        return self._remember_account(self._summary_from_rows(self._account_summary_cache))
 
-        cash = self._tag_value(rows, "TotalCashValue") or Decimal("0")
-        bp = self._tag_value(rows, "BuyingPower") or Decimal("0")
-        nav = self._tag_value(rows, "NetLiquidation") or Decimal("0")
-        realized = self._tag_value(rows, "RealizedPnL") or Decimal("0")
-        unrealized = self._tag_value(rows, "UnrealizedPnL") or Decimal("0")
+    def _summary_from_rows(self, rows: list[Any]) -> AccountSummary:
+        ccy = self._base_currency
+        cash = self._tag_value(rows, "TotalCashValue", ccy) or Decimal("0")
+        bp = self._tag_value(rows, "BuyingPower", ccy) or Decimal("0")
+        nav = self._tag_value(rows, "NetLiquidation", ccy) or Decimal("0")
+        realized = self._tag_value(rows, "RealizedPnL", ccy) or Decimal("0")
+        unrealized = self._tag_value(rows, "UnrealizedPnL", ccy) or Decimal("0")
 
         return AccountSummary(
             account_id=self._account_id or self._extract_account_id(rows) or "UNKNOWN",
@@ -309,9 +328,22 @@ class IBKRPaperBroker(AbstractBroker):
         )
 
     @classmethod
-    def _tag_value(cls, rows: list[Any], tag: str) -> Decimal | None:
+    def _extract_base_currency(cls, rows: list[Any]) -> str | None:
+        """accountSummary reports NetLiquidation in the account's base currency."""
+        for row in rows:
+            if cls._row_attr(row, "tag", "") == "NetLiquidation":
+                return cls._row_attr(row, "currency", "") or None
+        return None
+
+    @classmethod
+    def _tag_value(
+        cls, rows: list[Any], tag: str, currency: str | None = None
+    ) -> Decimal | None:
+        """First ``tag`` row, restricted to ``currency`` (or untagged rows) if given."""
         for row in rows:
-            if cls._row_attr(row, "tag", "") == tag:
+            if cls._row_attr(row, "tag", "") == tag and (
+                currency is None or cls._row_attr(row, "currency", "") in (currency, "")
+            ):
                 value = cls._row_attr(row, "value", "")
                 try:
                     return Decimal(str(value))
@@ -494,6 +526,52 @@ class IBKRPaperBroker(AbstractBroker):
             except Exception:  # pragma: no cover - defensive
                 logger.debug("could not subscribe to execDetailsEvent")
 
+        # accountSummaryEvent follows the reqAccountSummary subscription
+        # that accountSummaryAsync() opens; accountValueEvent follows
+        # reqAccountUpdates. Either keeps the account snapshot current.
+        for event_name in ("accountSummaryEvent", "accountValueEvent"):
+            account_event = getattr(self.ib, event_name, None)
+            if account_event is not None and hasattr(account_event, "__iadd__"):
+                try:
+                    account_event += self._on_account_value  # type: ignore[operator]
+                except Exception:  # pragma: no cover - defensive
+                    logger.debug("could not subscribe to %s", event_name)
+
+    def _on_account_value(self, value: Any) -> None:
+        """Fold one pushed AccountValue into the cached rows and snapshot."""
+        if self._dry_run_inner is not None:
+            return  # dry-run reports the inner broker's account, not IBKR's
+        account = self._row_attr(value, "account", "")
+        if self._account_id and account and account != self._account_id:
+            return
+        tag = self._row_attr(value, "tag", "")
+        currency = self._row_attr(value, "currency", "")
+        base = self._base_currency
+        if base is not None and currency not in (base, "BASE"):
+            return  # per-currency breakdown, not an account total
+        if currency == "BASE":
+            # accountValueEvent's converted total: file it under the base
+            # currency so it replaces the accountSummary row for the tag.
+            self._base_tags.add(tag)
+            currency = base or ""
+            value = {
+                "account": account, "tag": tag, "currency": currency,
+                "value": self._row_attr(value, "value", ""),
+            }
+        elif tag in self._base_tags:
+            return  # a single-currency row; the BASE total already covers it
+        rows = self._account_summary_cache
+        for i, row in enumerate(rows):
+            if (
+                self._row_attr(row, "tag", "") == tag
+                and self._row_attr(row, "currency", "") == currency
+            ):
+                rows[i] = value
+                break
+        else:
+            rows.append(value)
+        self._remember_account(self._summary_from_rows(rows))
+
     def _on_order_status(self, trade: Any) -> None:
         order = getattr(trade, "order", None)
         order_id = int(getattr(order, "orderId", 0) or 0)
@@ -12,6 +12,7 @@ from engine.data_feeds.factory import make_feed, make_options_feed
 from engine.data_feeds.ibkr_delayed import IBKRDelayedFeed
 from engine.data_feeds.replay import ReplayFeed
 from engine.data_feeds.synthetic_options import SyntheticOptionsFeed
+from engine.data_feeds.tick_replay import TickReplayFeed
 from engine.data_feeds.yfinance import YFinanceFeed
 
 __all__ = [
@@ -19,6 +20,7 @@ __all__ = [
     "IBKRDelayedFeed",
     "ReplayFeed",
     "SyntheticOptionsFeed",
+    "TickReplayFeed",
     "YFinanceFeed",
     "make_feed",
     "make_options_feed",
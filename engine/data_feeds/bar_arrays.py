@@ -0,0 +1,176 @@
+"""Fixed-width columnar encoding of bars.
+
+A run of bars is one ``(len(FIELDS), n)`` int64 array: row ``k`` holds
+column ``FIELDS[k]`` for every bar, so each column is contiguous. Times
+are UTC epoch nanoseconds; prices are integer ten-thousandths (the
+``NUMERIC(18,4)`` scale of the ``bars`` table), so decoding gives back
+the exact ``Decimal`` that went in. A missing ``vwap`` is ``MISSING``.
+
+Arrays are stored as plain ``.npy`` files so they can be memory-mapped
+(``load(path)``): opening one costs no parsing, and processes reading
+the same file share its pages.
+
+One file holds one UTC day of one symbol at one resolution, laid out as
+``<root>/<SYMBOL>/<interval_seconds>/<YYYY-MM-DD>.npy`` (`day_path`).
+The on-disk bar cache and replay datasets share this layout, so a cache
+directory can be replayed as is.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator, Sequence
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+from contracts.data_feed import Bar
+
+FIELDS = ("open_time_ns", "open", "high", "low", "close", "vwap", "volume")
+OPEN_TIME, OPEN, HIGH, LOW, CLOSE, VWAP, VOLUME = range(len(FIELDS))
+
+SCALE = 10_000
+MISSING = np.iinfo(np.int64).min
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_PRICE_EXP = -4
+
+BarArray = npt.NDArray[np.int64]
+
+
+def to_ns(ts: datetime) -> int:
+    """UTC epoch nanoseconds of an aware datetime."""
+    return (ts - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def from_ns(ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def to_units(price: Decimal) -> int:
+    """``price`` in integer ten-thousandths; raises if it is any finer."""
+    scaled = price.scaleb(-_PRICE_EXP)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"price {price} has more than {-_PRICE_EXP} decimal places")
+    return int(scaled)
+
+
+def from_units(units: int) -> Decimal:
+    return Decimal(units).scaleb(_PRICE_EXP)
+
+
+def encode(bars: Sequence[Bar]) -> BarArray:
+    """Bars (oldest first) as a ``(len(FIELDS), n)`` array."""
+    out = np.empty((len(FIELDS), len(bars)), dtype=np.int64)
+    for i, b in enumerate(bars):
+        out[:, i] = (
+            to_ns(b.open_time),
+            to_units(b.open),
+            to_units(b.high),
+            to_units(b.low),
+            to_units(b.close),
+            MISSING if b.vwap is None else to_units(b.vwap),
+            b.volume,
+        )
+    return out
+
+
+def decode(array: BarArray, symbol: str, interval_seconds: int) -> Iterator[Bar]:
+    """Rebuild ``Bar`` objects lazily, one column read per field.
+
+    Every value came out of `encode`, so validation is skipped.
+    """
+    columns = [array[k].tolist() for k in range(len(FIELDS))]
+    for t, o, h, low, c, vwap, volume in zip(*columns):
+        yield Bar.model_construct(
+            symbol=symbol,
+            interval_seconds=interval_seconds,
+            open_time=from_ns(t),
+            open=from_units(o),
+            high=from_units(h),
+            low=from_units(low),
+            close=from_units(c),
+            volume=volume,
+            vwap=None if vwap == MISSING else from_units(vwap),
+        )
+
+
+def window(array: BarArray, start: datetime | None, end: datetime | None) -> BarArray:
+    """The bars with ``start <= open_time < end`` (columns are time-sorted)."""
+    times = array[OPEN_TIME]
+    lo = 0 if start is None else int(np.searchsorted(times, to_ns(start), side="left"))
+    hi = len(times) if end is None else int(np.searchsorted(times, to_ns(end), side="left"))
+    return array[:, lo:hi]
+
+
+def last_close(array: BarArray, as_of: datetime | None = None) -> Decimal | None:
+    """Close of the last bar with ``open_time <= as_of`` (the last bar when
+    ``as_of`` is None), found by bisection; None if there is none."""
+    times = array[OPEN_TIME]
+    i = len(times) if as_of is None else int(
+        np.searchsorted(times, to_ns(as_of), side="right")
+    )
+    return from_units(int(array[CLOSE, i - 1])) if i else None
+
+
+def day_path(root: str | Path, symbol: str, interval_seconds: int, day: date) -> Path:
+    """Where one day of bars lives under ``root``."""
+    return Path(root) / symbol.upper() / str(interval_seconds) / f"{day.isoformat()}.npy"
+
+
+def parse_day_path(path: str | Path) -> tuple[str, int, date]:
+    """``(symbol, interval_seconds, day)`` of a file laid out by `day_path`."""
+    path = Path(path)
+    try:
+        return (
+            path.parent.parent.name.upper(),
+            int(path.parent.name),
+            date.fromisoformat(path.stem),
+        )
+    except ValueError:
+        raise ValueError(
+            f"{path}: expected <SYMBOL>/<interval_seconds>/<YYYY-MM-DD>.npy"
+        ) from None
+
+
+def save(path: str | Path, array: BarArray) -> None:
+    """Write ``array`` atomically (temp file + rename), so a concurrent
+    reader never maps a half-written file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as fh:
+        np.save(fh, np.ascontiguousarray(array, dtype=np.int64), allow_pickle=False)
+    os.replace(tmp, path)
+
+
+def load(path: str | Path, *, fields: Sequence[str] = FIELDS) -> BarArray:
+    """Memory-map a saved array read-only, checking it has ``fields`` rows."""
+    array = np.load(path, mmap_mode="r", allow_pickle=False)
+    if array.ndim != 2 or array.shape[0] != len(fields) or array.dtype != np.int64:
+        raise ValueError(
+            f"{path}: not a {len(fields)}-column array (shape {array.shape}, {array.dtype})"
+        )
+    return array
+
+
+__all__ = [
+    "FIELDS",
+    "MISSING",
+    "SCALE",
+    "BarArray",
+    "day_path",
+    "decode",
+    "encode",
+    "from_ns",
+    "from_units",
+    "last_close",
+    "load",
+    "parse_day_path",
+    "save",
+    "to_ns",
+    "to_units",
+    "window",
+]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
-from datetime import date
+from datetime import UTC, date
 
 from contracts.data_feed import (
     Bar,
@@ -18,8 +18,9 @@ class BaseFeed:
     """Default implementation of the ``MarketDataFeed`` Protocol.
 
     Subclasses should override the four async streaming/fetch methods.
-    The base class only provides a ``name`` attribute and a ``_validate_symbol``
-    helper that subclasses can call before initiating a stream.
+    The base class provides a ``name`` attribute, a ``_validate_symbol``
+    helper that subclasses can call before initiating a stream, and a
+    `stream_sessions` built on ``stream_equity_bars``.
     """
 
     name: str = "base"
@@ -46,6 +47,31 @@ class BaseFeed:
         if False:
             yield  # type: ignore[unreachable]
 
+    async def stream_sessions(
+        self, symbol: str, interval_seconds: int = 60
+    ) -> AsyncIterator[tuple[date, AsyncIterator[Bar]]]:
+        """``stream_equity_bars`` split into ``(session_date, bars)`` runs.
+
+        This default splits on the UTC date of ``open_time``; feeds that
+        store data per session override it. As with ``itertools.groupby``,
+        a session's bars must be read before the next session is
+        requested; whatever is left unread is skipped.
+        """
+        bars = aiter(self.stream_equity_bars(symbol, interval_seconds))
+        head: list[Bar | None] = [await anext(bars, None)]
+
+        async def session(day: date) -> AsyncIterator[Bar]:
+            while (bar := head[0]) is not None and _session_date(bar) == day:
+                yield bar
+                head[0] = await anext(bars, None)
+
+        while head[0] is not None:
+            day = _session_date(head[0])
+            run = session(day)
+            yield day, run
+            async for _ in run:  # drain what the caller left unread
+                pass
+
     async def get_option_chain(self, underlying: str, expiry: date) -> ChainSnapshot:
         raise NotImplementedError
 
@@ -55,3 +81,7 @@ class BaseFeed:
         raise NotImplementedError
         if False:
             yield  # type: ignore[unreachable]
+
+
+def _session_date(bar: Bar) -> date:
+    return bar.open_time.astimezone(UTC).date()
@@ -9,6 +9,7 @@ from engine.data_feeds.ibkr_delayed import IBKRDelayedFeed
 from engine.data_feeds.ibkr_live import IBKRLiveFeed
 from engine.data_feeds.replay import ReplayFeed
 from engine.data_feeds.synthetic_options import SyntheticOptionsFeed
+from engine.data_feeds.tick_replay import TickReplayFeed
 
 
 def _make_yfinance_feed() -> MarketDataFeed:
@@ -38,10 +39,12 @@ def make_feed(
         return _make_yfinance_feed()
     if feed == "ibkr_delayed":
         return IBKRDelayedFeed()
-    if feed == "replay":
+    if feed in ("replay", "tick_replay"):
         if config.replay_path is None:
-            raise ValueError("data.replay_path is required when feed == 'replay'")
-        return ReplayFeed(config.replay_path)
+            raise ValueError(f"data.replay_path is required when feed == {feed!r}")
+        if feed == "tick_replay":
+            return TickReplayFeed(config.replay_path, speed=config.replay_speed)
+        return ReplayFeed(config.replay_path, speed=config.replay_speed)
     if feed == "synthetic_options":
         return SyntheticOptionsFeed(_make_yfinance_feed())
     if feed == "ibkr_live":
@@ -1,15 +1,26 @@
-"""Replay feed — yields recorded bars from a JSON fixture file."""
+"""Replay feed — yields recorded bars from a fixture file.
+
+Two fixture formats are accepted:
+
+* JSON (``*.json``): ``{"date": "YYYY-MM-DD", "symbol": "QQQ", "bars": [...]}``.
+  Parsed once when the feed is built.
+* Columnar (``*.npy``): one `engine.data_feeds.bar_arrays` day file at
+  ``<SYMBOL>/<interval_seconds>/<YYYY-MM-DD>.npy``; symbol, resolution and
+  date come from the path. The file is memory-mapped, so opening it costs
+  nothing and worker processes replaying the same day share its pages.
+  `convert_json_fixture` (and ``scripts/export_replay_bars.py``) write them.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import json
 import random
-from collections.abc import AsyncIterator
-from datetime import date, datetime
+from bisect import bisect_right
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
 
 from contracts.data_feed import (
     Bar,
@@ -19,15 +30,63 @@ from contracts.data_feed import (
     Quote,
 )
 
+from engine.data_feeds import bar_arrays
 from engine.data_feeds.base import BaseFeed
 
 
-class ReplayFeed(BaseFeed):
-    """Replay a fixture of historical 1-minute bars deterministically.
+def load_json_fixture(path: str | Path) -> tuple[str, date, list[Bar]]:
+    """``(symbol, date, bars)`` of a JSON replay fixture."""
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    bars = [
+        Bar(
+            symbol=raw["symbol"],
+            interval_seconds=int(raw["interval_seconds"]),
+            open_time=datetime.fromisoformat(raw["open_time"]),
+            open=Decimal(str(raw["open"])),
+            high=Decimal(str(raw["high"])),
+            low=Decimal(str(raw["low"])),
+            close=Decimal(str(raw["close"])),
+            volume=int(raw["volume"]),
+            vwap=(Decimal(str(raw["vwap"])) if raw.get("vwap") is not None else None),
+        )
+        for raw in payload.get("bars", [])
+    ]
+    return str(payload["symbol"]), date.fromisoformat(payload["date"]), bars
 
-    Fixture format::
 
-        {"date": "YYYY-MM-DD", "symbol": "QQQ", "bars": [<Bar dicts>]}
+def convert_json_fixture(
+    path: str | Path, root: str | Path, *, interval_seconds: int = 60
+) -> Path:
+    """Write a JSON fixture out as a columnar day file under ``root``.
+
+    ``interval_seconds`` is only used when the fixture has no bars. Raises
+    ``ValueError`` if the bars don't all fall on the fixture's UTC date, mix
+    resolutions, or carry prices finer than the ``bars`` table's 4 places.
+    """
+    symbol, day, bars = load_json_fixture(path)
+    intervals = {b.interval_seconds for b in bars} or {interval_seconds}
+    if len(intervals) > 1:
+        raise ValueError(f"{path}: mixed bar intervals {sorted(intervals)}")
+    stray = [b.open_time for b in bars if b.open_time.astimezone(UTC).date() != day]
+    if stray:
+        raise ValueError(f"{path}: bar at {stray[0].isoformat()} is not on {day} (UTC)")
+    out = bar_arrays.day_path(root, symbol, intervals.pop(), day)
+    bar_arrays.save(out, bar_arrays.encode(bars))
+    return out
+
+
+class ReplayFeed(BaseFeed):
+    """Replay historical bars deterministically.
+
+    ``path`` is either one fixture file (see the module docstring for the
+    formats) or a dataset directory of columnar day files laid out as
+    ``<SYMBOL>/<interval_seconds>/<YYYY-MM-DD>.npy`` — for example a
+    ``BAR_CACHE_DIR`` or the output of ``scripts/export_replay_bars.py``.
+    A dataset can hold several symbols and resolutions; each day file is
+    one session, mapped only when the stream reaches it and dropped when
+    the stream moves on, so a year of replay holds one day at a time.
+    ``interval_seconds`` picks the resolution `stream_equity_quotes` reads
+    from a dataset.
 
     With ``speed=0`` (the default), the feed yields all bars without
     sleeping (deterministic for unit tests). With ``speed > 0``, the feed
@@ -43,6 +102,8 @@ class ReplayFeed(BaseFeed):
         path: str | Path,
         speed: float = 0.0,
         jitter_seconds: float = 0.0,
+        *,
+        interval_seconds: int = 60,
     ) -> None:
         self._path = Path(path)
         if not self._path.exists():
@@ -53,33 +114,119 @@ class ReplayFeed(BaseFeed):
             raise ValueError("jitter_seconds must be >= 0")
         self._speed = float(speed)
         self._jitter = float(jitter_seconds)
-        self._payload: dict[str, Any] = json.loads(self._path.read_text(encoding="utf-8"))
+        self._interval = int(interval_seconds)
+        self._dataset = self._path.is_dir()
+        self._array: bar_arrays.BarArray | None = None
+        self._bars: list[Bar] = []
+        if self._dataset:
+            return
+        if self._path.suffix == ".npy":
+            self._symbol, self._interval, self._date = bar_arrays.parse_day_path(self._path)
+            self._array = bar_arrays.load(self._path)
+        else:
+            self._symbol, self._date, self._bars = load_json_fixture(self._path)
+            if self._bars:
+                self._interval = self._bars[0].interval_seconds
 
     @property
     def fixture_date(self) -> date:
-        return date.fromisoformat(self._payload["date"])
+        self._require_fixture()
+        return self._date
 
     @property
     def fixture_symbol(self) -> str:
-        return str(self._payload["symbol"])
-
-    def _iter_bars(self) -> list[Bar]:
-        bars: list[Bar] = []
-        for raw in self._payload.get("bars", []):
-            bars.append(
-                Bar(
-                    symbol=raw["symbol"],
-                    interval_seconds=int(raw["interval_seconds"]),
-                    open_time=datetime.fromisoformat(raw["open_time"]),
-                    open=Decimal(str(raw["open"])),
-                    high=Decimal(str(raw["high"])),
-                    low=Decimal(str(raw["low"])),
-                    close=Decimal(str(raw["close"])),
-                    volume=int(raw["volume"]),
-                    vwap=(Decimal(str(raw["vwap"])) if raw.get("vwap") is not None else None),
-                )
+        self._require_fixture()
+        return self._symbol
+
+    @property
+    def interval_seconds(self) -> int:
+        """Bar resolution of a fixture, or the one quotes are built from in
+        a dataset (and the one `latest_close` reads)."""
+        return self._interval
+
+    def _require_fixture(self) -> None:
+        if self._dataset:
+            raise ValueError(f"{self._path} is a dataset directory, not a single fixture")
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols with data in a dataset (just the fixture's for a file)."""
+        if not self._dataset:
+            return [self._symbol.upper()]
+        return sorted(p.name for p in self._path.iterdir() if p.is_dir())
+
+    def sessions(self, symbol: str, interval_seconds: int = 60) -> list[date]:
+        """Session dates a stream for ``symbol`` will cover, oldest first.
+
+        Read from the file names; nothing is loaded.
+        """
+        if not self._dataset:
+            self._check_fixture_symbol(self._validate_symbol(symbol))
+            return [self._date]
+        return [day for day, _ in self._day_files(symbol, interval_seconds)]
+
+    def _check_fixture_symbol(self, sym: str) -> None:
+        if sym != self._symbol.upper():
+            raise ValueError(f"replay fixture is for {self._symbol}, not {sym}")
+
+    def _day_files(self, symbol: str, interval_seconds: int) -> list[tuple[date, Path]]:
+        sym = self._validate_symbol(symbol)
+        directory = self._path / sym / str(interval_seconds)
+        if not directory.is_dir():
+            raise ValueError(
+                f"replay dataset {self._path} has no {interval_seconds}s bars for {sym}"
             )
-        return bars
+        files = [(bar_arrays.parse_day_path(p)[2], p) for p in directory.glob("*.npy")]
+        return sorted(files)
+
+    def iter_sessions(
+        self, symbol: str, interval_seconds: int = 60
+    ) -> Iterator[tuple[date, Iterator[Bar]]]:
+        """Synchronous, unpaced `stream_sessions` for in-process drivers.
+
+        Fixture bars come from the parsed JSON or are decoded straight off
+        the mapped columns; the same one-session-at-a-time rule applies.
+        """
+        if not self._dataset:
+            self._check_fixture_symbol(self._validate_symbol(symbol))
+            bars = (
+                bar_arrays.decode(self._array, self._symbol, self._interval)
+                if self._array is not None
+                else iter(self._bars)
+            )
+            yield self._date, bars
+            return
+        sym = self._validate_symbol(symbol)
+        for day, path in self._day_files(sym, interval_seconds):
+            # Only the session being replayed is mapped; rebinding ``array``
+            # on the next file releases this one.
+            array = bar_arrays.load(path)
+            yield day, bar_arrays.decode(array, sym, interval_seconds)
+
+    async def stream_sessions(
+        self, symbol: str, interval_seconds: int = 60
+    ) -> AsyncIterator[tuple[date, AsyncIterator[Bar]]]:
+        """``(session_date, bars)`` per session, oldest first.
+
+        Boundaries come from the day files, so callers can reset
+        per-session state without inspecting bar timestamps. As with
+        ``itertools.groupby``, a session's bars must be read before the
+        next session is requested; whatever is left unread is skipped.
+        """
+        first = True
+        for day, bars in self.iter_sessions(symbol, interval_seconds):
+            session = self._paced(bars, first=first)
+            yield day, session
+            async for _ in session:  # drain what the caller left unread
+                pass
+            first = False
+
+    async def _paced(self, bars: Iterator[Bar], *, first: bool) -> AsyncIterator[Bar]:
+        for bar in bars:
+            if not first:
+                await self._maybe_sleep(bar.interval_seconds)
+            first = False
+            yield bar
 
     async def _maybe_sleep(self, interval_seconds: int) -> None:
         if self._speed <= 0:
@@ -97,30 +244,14 @@ class ReplayFeed(BaseFeed):
     async def stream_equity_bars(
         self, symbol: str, interval_seconds: int = 60
     ) -> AsyncIterator[Bar]:
-        sym = self._validate_symbol(symbol)
-        if sym != self.fixture_symbol.upper():
-            raise ValueError(
-                f"replay fixture is for {self.fixture_symbol}, not {sym}"
-            )
-        first = True
-        for bar in self._iter_bars():
-            if not first:
-                await self._maybe_sleep(bar.interval_seconds)
-            first = False
-            yield bar
+        async for _, bars in self.stream_sessions(symbol, interval_seconds):
+            async for bar in bars:
+                yield bar
 
     async def stream_equity_quotes(self, symbol: str) -> AsyncIterator[Quote]:
         sym = self._validate_symbol(symbol)
-        if sym != self.fixture_symbol.upper():
-            raise ValueError(
-                f"replay fixture is for {self.fixture_symbol}, not {sym}"
-            )
         spread = Decimal("0.01")
-        first = True
-        for bar in self._iter_bars():
-            if not first:
-                await self._maybe_sleep(bar.interval_seconds)
-            first = False
+        async for bar in self.stream_equity_bars(sym, self._interval):
             yield Quote(
                 symbol=sym,
                 timestamp=bar.open_time,
@@ -129,11 +260,40 @@ class ReplayFeed(BaseFeed):
                 last=bar.close,
             )
 
+    async def latest_close(
+        self, symbol: str, as_of: datetime | None = None
+    ) -> Decimal | None:
+        """Close of the last bar opened at or before ``as_of`` (the last bar
+        of the replay when None), or None if there is none.
+
+        A lookup, not a scan: bisection over the fixture's bars, or over the
+        dataset's day files and then the one day's time column.
+        """
+        sym = self._validate_symbol(symbol)
+        if not self._dataset:
+            self._check_fixture_symbol(sym)
+            if self._array is not None:
+                return bar_arrays.last_close(self._array, as_of)
+            i = len(self._bars) if as_of is None else bisect_right(
+                self._bars, as_of, key=lambda bar: bar.open_time
+            )
+            return self._bars[i - 1].close if i else None
+        days = self._day_files(sym, self._interval)
+        i = len(days) if as_of is None else bisect_right(
+            days, as_of.astimezone(UTC).date(), key=lambda day: day[0]
+        )
+        for _, path in reversed(days[:i]):
+            close = bar_arrays.last_close(bar_arrays.load(path), as_of)
+            if close is not None:
+                return close
+        return None
+
     async def get_option_chain(self, underlying: str, expiry: date) -> ChainSnapshot:
         sym = self._validate_symbol(underlying)
         # Replay only carries equity bars; let SyntheticOptionsFeed fill in
         # chain construction.
-        snapshot_time = datetime.combine(self.fixture_date, datetime.min.time())
+        anchor = expiry if self._dataset else self._date
+        snapshot_time = datetime.combine(anchor, datetime.min.time())
         return ChainSnapshot(
             underlying=sym,
             expiry=expiry,
@@ -149,3 +309,6 @@ class ReplayFeed(BaseFeed):
         )
         if False:  # pragma: no cover - make this an async generator for typing
             yield  # type: ignore[unreachable]
+
+
+__all__ = ["ReplayFeed", "convert_json_fixture", "load_json_fixture"]
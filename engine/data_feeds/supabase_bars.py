@@ -11,15 +11,18 @@ Selecting bars
 
 Pass ``start`` / ``end`` to bound the time range and ``interval_seconds``
 to pick which resolution to replay (``60`` for 1-min, ``300`` for 5-min,
-etc.). Rows are streamed in ``open_time`` ascending order so the strategy
-sees the same chronology a live engine would.
+etc.). Rows are streamed in ``open_time`` ascending order, in keyset-paged
+chunks, so the strategy sees the same chronology a live engine would and
+memory doesn't grow with the range. Pass ``cache_dir`` to keep finished
+days in a local day-file cache so repeated runs only fetch what's new.
 """
 
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 from typing import Any
 
 from contracts.data_feed import (
@@ -40,71 +43,74 @@ class SupabaseBarsFeed(BaseFeed):
 
     def __init__(
         self,
-        dsn: str,
+        dsn: str | None,
         symbol: str,
         start: datetime,
         end: datetime,
         interval_seconds: int = 60,
+        *,
+        backend: Any | None = None,
+        page_size: int = 10_000,
+        cache_dir: str | Path | None = None,
     ) -> None:
         if start >= end:
             raise ValueError("start must be < end")
         if interval_seconds <= 0:
             raise ValueError("interval_seconds must be positive")
+        if dsn is None and backend is None:
+            raise ValueError("need a dsn or a backend")
         self._dsn = dsn
         self._symbol = symbol.upper()
         self._start = start
         self._end = end
         self._interval = int(interval_seconds)
-        self._pool: Any | None = None
-        self._cached_bars: list[Bar] | None = None
+        self._page_size = page_size
+        # With a cache_dir, closed days are served from local day files
+        # (services.persistence.bar_cache) and only gaps hit the database.
+        self._cache_dir = cache_dir
+        # An injected backend (tests, a shared pool) is the caller's to close.
+        self._backend: Any | None = backend
+        self._owns_backend = backend is None
 
     @property
     def interval_seconds(self) -> int:
-        """Bar resolution this feed is loaded for. Exposed so wrappers like
-        SyntheticOptionsFeed can match the interval when streaming bars
-        (the feed enforces a strict interval match in stream_equity_bars).
+        """Bar resolution this feed is loaded for. Exposed so callers can
+        match it (the feed enforces a strict interval match in
+        stream_equity_bars).
         """
         return self._interval
 
-    async def _ensure_pool(self) -> Any:
-        if self._pool is None:
-            import asyncpg
-            self._pool = await asyncpg.create_pool(self._dsn, min_size=1, max_size=2)
-        return self._pool
+    def _ensure_backend(self) -> Any:
+        if self._backend is None:
+            # Imported lazily: the persistence layer (and asyncpg) are only
+            # needed once a backtest actually reads from the database.
+            from services.persistence import SupabaseBackend
+            self._backend = SupabaseBackend(self._dsn)
+        return self._backend
 
     async def close(self) -> None:
-        if self._pool is not None:
-            await self._pool.close()
-            self._pool = None
-
-    async def _load_bars(self) -> list[Bar]:
-        if self._cached_bars is not None:
-            return self._cached_bars
-        pool = await self._ensure_pool()
-        sql = (
-            "SELECT symbol, interval_seconds, open_time, open, high, low, close, "
-            'volume, vwap FROM "bars" WHERE symbol = $1 AND interval_seconds = $2 '
-            "AND open_time >= $3 AND open_time < $4 ORDER BY open_time ASC"
-        )
-        async with pool.acquire() as conn:
-            rows = await conn.fetch(
-                sql, self._symbol, self._interval, self._start, self._end,
+        if self._backend is not None and self._owns_backend:
+            await self._backend.close()
+            self._backend = None
+
+    async def _iter_bars(self) -> AsyncIterator[Bar]:
+        # Keyset-paged, one chunk in memory (plus the prefetched next) at a
+        # time, so a multi-year backtest runs in constant memory.
+        from services.persistence import BarCache, BarStream
+        backend = self._ensure_backend()
+        chunks = (
+            BarCache(self._cache_dir, backend, page_size=self._page_size).bars(
+                self._symbol, self._interval, self._start, self._end,
             )
-        bars: list[Bar] = []
-        for r in rows:
-            bars.append(Bar(
-                symbol=r["symbol"],
-                interval_seconds=int(r["interval_seconds"]),
-                open_time=r["open_time"],
-                open=Decimal(str(r["open"])),
-                high=Decimal(str(r["high"])),
-                low=Decimal(str(r["low"])),
-                close=Decimal(str(r["close"])),
-                volume=int(r["volume"]),
-                vwap=(Decimal(str(r["vwap"])) if r["vwap"] is not None else None),
-            ))
-        self._cached_bars = bars
-        return bars
+            if self._cache_dir is not None
+            else BarStream(
+                backend, self._symbol, self._interval, self._start, self._end,
+                page_size=self._page_size,
+            ).bars()
+        )
+        async for chunk in chunks:
+            for bar in chunk:
+                yield bar
 
     async def stream_equity_bars(
         self, symbol: str, interval_seconds: int = 60
@@ -118,13 +124,13 @@ class SupabaseBarsFeed(BaseFeed):
             raise ValueError(
                 f"feed loaded for {self._interval}s bars, asked for {interval_seconds}s",
             )
-        for bar in await self._load_bars():
+        async for bar in self._iter_bars():
             yield bar
 
     async def stream_equity_quotes(self, symbol: str) -> AsyncIterator[Quote]:
         sym = self._validate_symbol(symbol)
         spread = Decimal("0.01")
-        for bar in await self._load_bars():
+        async for bar in self._iter_bars():
             yield Quote(
                 symbol=sym,
                 timestamp=bar.open_time,
@@ -133,13 +139,35 @@ class SupabaseBarsFeed(BaseFeed):
                 last=bar.close,
             )
 
+    async def latest_close(
+        self, symbol: str, as_of: datetime | None = None
+    ) -> Decimal | None:
+        """Close of the last bar in range opened at or before ``as_of``.
+
+        One indexed query, whatever the size of the range.
+        """
+        sym = self._validate_symbol(symbol)
+        if sym != self._symbol:
+            raise ValueError(f"feed loaded for {self._symbol}, asked for {sym}")
+        from services.persistence import PersistenceReader
+
+        upto = self._end - timedelta(microseconds=1)
+        bar = await PersistenceReader(self._ensure_backend()).latest_bar(
+            sym, self._interval, upto if as_of is None else min(as_of, upto), self._start,
+        )
+        return None if bar is None else bar.close
+
     async def get_option_chain(self, underlying: str, expiry: date) -> ChainSnapshot:
         sym = self._validate_symbol(underlying)
         # SyntheticOptionsFeed builds the chain from the underlying — we just
         # need to return a non-None ChainSnapshot anchored to the first bar.
-        bars = await self._load_bars()
+        first = await self._ensure_backend().select_range(
+            "bars", "open_time", start=self._start, end=self._end,
+            where={"symbol": self._symbol, "interval_seconds": self._interval},
+            order_by="open_time", limit=1, columns=["open_time"],
+        )
         snapshot_time = (
-            bars[0].open_time if bars
+            first[0]["open_time"] if first
             else datetime.combine(expiry, datetime.min.time())
         )
         return ChainSnapshot(
@@ -1,84 +1,166 @@
-"""Synthetic options feed — Black-Scholes priced quotes around an equity feed."""
+"""Synthetic options feed — Black-Scholes priced quotes around an equity feed.
+
+Chains are priced in one NumPy pass (`engine.pricing.bs_chain`), at a
+flat ``iv`` or, per expiry, from a `engine.pricing.VolSmile`. `PricedChain` holds the resulting arrays and only
+builds ``OptionQuote`` objects as they are asked for, so a caller that
+needs the numbers (the fast backtest) never pays for quote construction.
+
+Pricing reads the time from an injectable ``clock`` (wall clock by
+default; an `EventClock` advanced bar by bar in a backtest), so replayed
+chains are priced at event time and come out the same on every run.
+Priced chains are memoized in a `ChainPriceCache` keyed by spot, time to
+expiry (bucketed to ``tte_bucket_seconds``), strike set, vol and rate.
+The default cache is shared by every feed in the process, so repeated
+backtests and parameter sweeps over the same bars reuse prices.
+"""
 
 from __future__ import annotations
 
 import math
-from collections.abc import AsyncIterator
-from datetime import UTC, date, datetime, time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Hashable, Iterator, Mapping, Sequence
+from datetime import UTC, date, datetime
 from decimal import Decimal
 
+import numpy as np
 from contracts.data_feed import (
     Bar,
     ChainSnapshot,
     MarketDataFeed,
     OptionContract,
     OptionQuote,
-    OptionRight,
     Quote,
 )
 
 from engine.data_feeds.base import BaseFeed
+from engine.pricing.black_scholes import (
+    SECONDS_PER_YEAR,
+    ChainGreeks,
+    FloatArray,
+    bs_chain,
+    seconds_to_expiry,
+    to_decimal,
+)
+from engine.pricing.smile import VolSmile
 
-# 4pm ET = 20:00 UTC during DST (close enough for v1 — the contract treats
-# expiry resolution as best-effort; no DST gymnastics here).
-_EXPIRY_UTC_HOUR = 20
-_SECONDS_PER_YEAR = 365 * 86400
-_MIN_T_SECONDS = 60
-_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
-_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
-
-
-def _norm_cdf(x: float) -> float:
-    return 0.5 * (1.0 + math.erf(x * _INV_SQRT_2))
-
-
-def _norm_pdf(x: float) -> float:
-    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
-
-
-def _bs_d1_d2(s: float, k: float, t: float, r: float, sigma: float) -> tuple[float, float]:
-    if s <= 0 or k <= 0 or t <= 0 or sigma <= 0:
-        raise ValueError("Black-Scholes inputs must be strictly positive")
-    d1 = (math.log(s / k) + (r + 0.5 * sigma * sigma) * t) / (sigma * math.sqrt(t))
-    d2 = d1 - sigma * math.sqrt(t)
-    return d1, d2
-
-
-def _bs_price(
-    s: float, k: float, t: float, r: float, sigma: float, right: OptionRight
-) -> float:
-    d1, d2 = _bs_d1_d2(s, k, t, r, sigma)
-    if right == "C":
-        return s * _norm_cdf(d1) - k * math.exp(-r * t) * _norm_cdf(d2)
-    return k * math.exp(-r * t) * _norm_cdf(-d2) - s * _norm_cdf(-d1)
-
-
-def _bs_greeks(
-    s: float, k: float, t: float, r: float, sigma: float, right: OptionRight
-) -> tuple[float, float, float, float]:
-    """Return (delta, gamma, theta_per_day, vega_per_1pct)."""
-    d1, d2 = _bs_d1_d2(s, k, t, r, sigma)
-    pdf_d1 = _norm_pdf(d1)
-    sqrt_t = math.sqrt(t)
-    gamma = pdf_d1 / (s * sigma * sqrt_t)
-    vega = s * pdf_d1 * sqrt_t  # per 1.00 change in sigma
-    if right == "C":
-        delta = _norm_cdf(d1)
-        theta = (
-            -(s * pdf_d1 * sigma) / (2 * sqrt_t)
-            - r * k * math.exp(-r * t) * _norm_cdf(d2)
-        )
-    else:
-        delta = _norm_cdf(d1) - 1.0
-        theta = (
-            -(s * pdf_d1 * sigma) / (2 * sqrt_t)
-            + r * k * math.exp(-r * t) * _norm_cdf(-d2)
+
+class PricedChain:
+    """Synthetic quotes for a list of contracts at one instant.
+
+    Prices, greeks and the synthetic bid/ask live in arrays; ``OptionQuote``
+    objects are only built by `quote` / `quotes`. ``iv`` is the flat vol or,
+    when priced off a smile, one vol per contract.
+    """
+
+    def __init__(
+        self,
+        contracts: Sequence[OptionContract],
+        greeks: ChainGreeks,
+        iv: Decimal | FloatArray,
+        timestamp: datetime,
+    ) -> None:
+        self.contracts = list(contracts)
+        self.greeks = greeks
+        self.iv = iv
+        self.timestamp = timestamp
+        self.mid = np.maximum(greeks.price, 0.0)
+        half_spread = np.maximum(0.01, self.mid * 0.02)
+        self.bid = np.maximum(0.0, self.mid - half_spread)
+        self.ask = self.mid + half_spread
+        self._rows: list[list[float]] | None = None  # per-quote floats, built on first use
+
+    def __len__(self) -> int:
+        return len(self.contracts)
+
+    def quote(self, i: int) -> OptionQuote:
+        if self._rows is None:
+            g = self.greeks
+            iv = np.broadcast_to(np.nan if isinstance(self.iv, Decimal) else self.iv, len(self))
+            self._rows = np.stack(
+                (self.bid, self.ask, self.mid, g.delta, g.gamma, g.theta, g.vega, iv), axis=1
+            ).tolist()
+        c = self.contracts[i]
+        bid, ask, mid, delta, gamma, theta, vega, iv = self._rows[i]
+        # Every field is already typed (contract fields were validated when
+        # the contract was built), so skip pydantic validation.
+        return OptionQuote.model_construct(
+            underlying=c.underlying,
+            expiry=c.expiry,
+            strike=c.strike,
+            right=c.right,
+            timestamp=self.timestamp,
+            bid=to_decimal(bid),
+            ask=to_decimal(ask),
+            last=to_decimal(mid),
+            iv=self.iv if isinstance(self.iv, Decimal) else to_decimal(iv),
+            delta=to_decimal(delta),
+            gamma=to_decimal(gamma),
+            theta=to_decimal(theta),
+            vega=to_decimal(vega),
         )
-    return delta, gamma, theta / 365.0, vega / 100.0
 
+    def quotes(self) -> Iterator[OptionQuote]:
+        return (self.quote(i) for i in range(len(self)))
+
+
+class ChainPriceCache:
+    """LRU memo of `bs_chain` results; least recently used entries go first."""
 
-def _to_decimal(value: float) -> Decimal:
-    return Decimal(str(round(value, 6)))
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, ChainGreeks] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> ChainGreeks | None:
+        greeks = self._entries.get(key)
+        if greeks is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return greeks
+
+    def put(self, key: Hashable, greeks: ChainGreeks) -> None:
+        if self.maxsize == 0:
+            return
+        for arr in (greeks.price, greeks.delta, greeks.gamma, greeks.theta, greeks.vega):
+            arr.flags.writeable = False  # shared between every hit
+        self._entries[key] = greeks
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+_SHARED_CHAIN_CACHE = ChainPriceCache()
+
+
+class EventClock:
+    """A clock that reads back the last event time it was advanced to.
+
+    Pass one as a feed's ``clock`` and `advance` it as bars are replayed,
+    so pricing follows the replay instead of the wall clock.
+    """
+
+    def __init__(self, start: datetime | None = None) -> None:
+        self._now = start
+
+    def advance(self, ts: datetime) -> None:
+        self._now = ts
+
+    def __call__(self) -> datetime:
+        if self._now is None:
+            raise RuntimeError("EventClock read before any event was seen")
+        return self._now
 
 
 class SyntheticOptionsFeed(BaseFeed):
@@ -89,6 +171,21 @@ class SyntheticOptionsFeed(BaseFeed):
     around the latest equity bar close. ``stream_option_quotes`` yields one
     ``OptionQuote`` per requested contract using the latest underlying close
     and the configured implied vol.
+
+    The latest close is whatever was last observed (`observe`, or a bar or
+    quote streamed through this feed); before the first observation it is
+    looked up with the wrapped feed's ``latest_close(symbol, as_of)`` if it
+    has one. The wrapped feed is never streamed to find it.
+
+    ``clock`` supplies "now" for time to expiry and quote timestamps.
+    ``chain_cache`` defaults to one cache shared process-wide; pass
+    ``ChainPriceCache(maxsize=0)`` to turn memoization off. Time to expiry
+    is floored to ``tte_bucket_seconds`` so nearby instants share entries
+    (bars on minute boundaries land exactly on a bucket).
+
+    ``smiles`` (or `set_smile`) price an expiry off a fitted
+    `engine.pricing.VolSmile` instead of the flat ``iv``; quotes then carry
+    each strike's vol.
     """
 
     name: str = "synthetic_options"
@@ -98,7 +195,14 @@ class SyntheticOptionsFeed(BaseFeed):
         equity_feed: MarketDataFeed,
         iv: Decimal = Decimal("0.20"),
         risk_free_rate: Decimal = Decimal("0.05"),
+        *,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        chain_cache: ChainPriceCache | None = None,
+        tte_bucket_seconds: int = 60,
+        smiles: Mapping[date, VolSmile] | None = None,
     ) -> None:
+        if tte_bucket_seconds <= 0:
+            raise ValueError("tte_bucket_seconds must be > 0")
         if not isinstance(iv, Decimal):
             raise TypeError("iv must be Decimal")
         if not isinstance(risk_free_rate, Decimal):
@@ -108,49 +212,46 @@ class SyntheticOptionsFeed(BaseFeed):
         self._equity = equity_feed
         self._iv = iv
         self._r = risk_free_rate
+        self._clock = clock
+        self._cache = _SHARED_CHAIN_CACHE if chain_cache is None else chain_cache
+        self._tte_bucket = tte_bucket_seconds
+        self._smiles: dict[date, VolSmile] = dict(smiles or {})
         self._last_close: dict[str, Decimal] = {}
 
     # -- helpers -------------------------------------------------------------
 
-    def _record_close(self, symbol: str, close: Decimal) -> None:
+    def observe(self, symbol: str, close: Decimal) -> None:
+        """Record ``symbol``'s current price; chains are built around it.
+
+        Bars and quotes streamed through this feed are observed
+        automatically. Callers that read the underlying from the wrapped
+        feed directly (the backtest, the orchestrator) push it here.
+        """
         self._last_close[symbol.upper()] = close
 
+    def set_smile(self, expiry: date, smile: VolSmile | None) -> None:
+        """Price ``expiry`` off ``smile`` from now on (None: back to flat iv)."""
+        if smile is None:
+            self._smiles.pop(expiry, None)
+        else:
+            self._smiles[expiry] = smile
+
     async def _latest_close(self, symbol: str) -> Decimal:
         sym = symbol.upper()
-        if sym in self._last_close:
-            return self._last_close[sym]
-        # Match whatever resolution the wrapped feed is loaded for.
-        # SupabaseBarsFeed enforces a strict interval match in
-        # stream_equity_bars (raises ValueError on mismatch), so the
-        # previous hardcoded 60 here 500'd the backtest API any time a
-        # user picked 5m / 1h / 1d in the dashboard. Other feeds
-        # (yfinance, replay, IBKR delayed) default to 60s, so the
-        # fallback preserves their behaviour.
-        interval = getattr(self._equity, "interval_seconds", 60)
-        last: Decimal | None = None
-        async for bar in self._equity.stream_equity_bars(sym, interval):
-            last = bar.close
-        if last is None:
+        close = self._last_close.get(sym)
+        if close is not None:
+            return close
+        # Nothing observed yet: ask the wrapped feed for its close as of
+        # the clock, if it can look one up (ReplayFeed, SupabaseBarsFeed).
+        # Never stream the feed to find it: that re-reads the whole range.
+        lookup = getattr(self._equity, "latest_close", None)
+        if lookup is not None:
+            close = await lookup(sym, self._clock())
+        if close is None:
             raise RuntimeError(
-                f"unable to determine latest close for {sym}: equity feed yielded no bars"
+                f"no close observed for {sym}: stream it through this feed or call observe()"
             )
-        self._last_close[sym] = last
-        return last
-
-    @staticmethod
-    def _expiry_datetime(expiry: date) -> datetime:
-        return datetime.combine(
-            expiry, time(hour=_EXPIRY_UTC_HOUR, tzinfo=UTC)
-        )
-
-    @classmethod
-    def _time_to_expiry_years(cls, expiry: date, now: datetime | None = None) -> float:
-        ref = now or datetime.now(tz=UTC)
-        if ref.tzinfo is None:
-            ref = ref.replace(tzinfo=UTC)
-        seconds = (cls._expiry_datetime(expiry) - ref).total_seconds()
-        seconds = max(seconds, _MIN_T_SECONDS)
-        return seconds / _SECONDS_PER_YEAR
+        return close
 
     # -- equity passthrough --------------------------------------------------
 
@@ -159,14 +260,14 @@ class SyntheticOptionsFeed(BaseFeed):
     ) -> AsyncIterator[Bar]:
         sym = self._validate_symbol(symbol)
         async for bar in self._equity.stream_equity_bars(sym, interval_seconds):
-            self._record_close(bar.symbol, bar.close)
+            self.observe(bar.symbol, bar.close)
             yield bar
 
     async def stream_equity_quotes(self, symbol: str) -> AsyncIterator[Quote]:
         sym = self._validate_symbol(symbol)
         async for quote in self._equity.stream_equity_quotes(sym):
             if quote.last is not None:
-                self._record_close(quote.symbol, quote.last)
+                self.observe(quote.symbol, quote.last)
             yield quote
 
     # -- option chain --------------------------------------------------------
@@ -174,6 +275,16 @@ class SyntheticOptionsFeed(BaseFeed):
     async def get_option_chain(self, underlying: str, expiry: date) -> ChainSnapshot:
         sym = self._validate_symbol(underlying)
         close = await self._latest_close(sym)
+        return ChainSnapshot(
+            underlying=sym,
+            expiry=expiry,
+            snapshot_time=self._clock(),
+            contracts=self.atm_contracts(sym, close, expiry),
+        )
+
+    @staticmethod
+    def atm_contracts(underlying: str, close: Decimal, expiry: date) -> list[OptionContract]:
+        """The chain `get_option_chain` lists for ``underlying`` at ``close``."""
         atm = int(close.to_integral_value(rounding="ROUND_HALF_UP"))
         contracts: list[OptionContract] = []
         for offset in range(-5, 6):
@@ -181,17 +292,98 @@ class SyntheticOptionsFeed(BaseFeed):
             for right in ("C", "P"):
                 contracts.append(
                     OptionContract(
-                        underlying=sym,
+                        underlying=underlying,
                         expiry=expiry,
                         strike=strike,
                         right=right,  # type: ignore[arg-type]
                     )
                 )
-        return ChainSnapshot(
-            underlying=sym,
-            expiry=expiry,
-            snapshot_time=datetime.now(tz=UTC),
-            contracts=contracts,
+        return contracts
+
+    async def price_chain(self, contracts: Sequence[OptionContract]) -> PricedChain:
+        """Price ``contracts`` in one batch off their underlyings' latest closes.
+
+        Served from the chain cache when the same chain was priced at the
+        same spot and time-to-expiry bucket before.
+        """
+        spots = {
+            sym: await self._latest_close(sym)
+            for sym in dict.fromkeys(c.underlying for c in contracts)
+        }
+        return self.price_chain_at(contracts, spots, self._clock())
+
+    def price_chain_at(
+        self,
+        contracts: Sequence[OptionContract],
+        spots: Mapping[str, Decimal],
+        now: datetime,
+    ) -> PricedChain:
+        """`price_chain` at explicit underlying prices and time, synchronously.
+
+        For in-process drivers that already hold the bar being replayed;
+        ``spots`` must cover every underlying in ``contracts``.
+        """
+        spots = {sym: spots[sym] for sym in dict.fromkeys(c.underlying for c in contracts)}
+        seconds = {
+            expiry: seconds_to_expiry(expiry, now, self._tte_bucket)
+            for expiry in dict.fromkeys(c.expiry for c in contracts)
+        }
+        smiles = tuple((e, self._smiles[e]) for e in seconds if e in self._smiles)
+        key = (
+            tuple(spots.items()),
+            tuple(seconds.items()),
+            tuple((c.underlying, c.expiry, c.strike, c.right) for c in contracts),
+            self._iv,
+            self._r,
+            smiles,
+        )
+        vols = self._smile_vols(contracts, spots, seconds, smiles) if smiles else None
+        greeks = self._cache.get(key)
+        if greeks is None:
+            greeks = self._price(contracts, spots, seconds, vols)
+            self._cache.put(key, greeks)
+        return PricedChain(contracts, greeks, self._iv if vols is None else vols, now)
+
+    def _smile_vols(
+        self,
+        contracts: Sequence[OptionContract],
+        spots: dict[str, Decimal],
+        seconds: dict[date, int],
+        smiles: tuple[tuple[date, VolSmile], ...],
+    ) -> FloatArray:
+        vols = np.full(len(contracts), float(self._iv))
+        strikes = np.array([float(c.strike) for c in contracts])
+        for expiry, smile in smiles:
+            idx = np.array([i for i, c in enumerate(contracts) if c.expiry == expiry])
+            growth = math.exp(float(self._r) * seconds[expiry] / SECONDS_PER_YEAR)
+            forward = np.array([float(spots[contracts[i].underlying]) for i in idx]) * growth
+            vols[idx] = smile.vol(strikes[idx], forward)
+        return vols
+
+    def _price(
+        self,
+        contracts: Sequence[OptionContract],
+        spots: dict[str, Decimal],
+        seconds: dict[date, int],
+        vols: FloatArray | None = None,
+    ) -> ChainGreeks:
+        # A chain is normally one underlying and one expiry: keep those as
+        # scalars rather than broadcasting per-contract arrays.
+        s = (
+            float(next(iter(spots.values()))) if len(spots) == 1
+            else np.array([float(spots[c.underlying]) for c in contracts])
+        )
+        t = (
+            next(iter(seconds.values())) / SECONDS_PER_YEAR if len(seconds) == 1
+            else np.array([seconds[c.expiry] for c in contracts]) / SECONDS_PER_YEAR
+        )
+        return bs_chain(
+            s,
+            np.array([float(c.strike) for c in contracts]),
+            t,
+            float(self._r),
+            float(self._iv) if vols is None else vols,
+            is_call=np.array([c.right == "C" for c in contracts]),
         )
 
     async def stream_option_quotes(
@@ -199,32 +391,5 @@ class SyntheticOptionsFeed(BaseFeed):
     ) -> AsyncIterator[OptionQuote]:
         if not contracts:
             return
-        now = datetime.now(tz=UTC)
-        sigma = float(self._iv)
-        r = float(self._r)
-        for contract in contracts:
-            close = await self._latest_close(contract.underlying)
-            s = float(close)
-            k = float(contract.strike)
-            t = self._time_to_expiry_years(contract.expiry, now=now)
-            price = _bs_price(s, k, t, r, sigma, contract.right)
-            delta, gamma, theta, vega = _bs_greeks(s, k, t, r, sigma, contract.right)
-            mid = max(price, 0.0)
-            half_spread = max(0.01, mid * 0.02)
-            bid = max(0.0, mid - half_spread)
-            ask = mid + half_spread
-            yield OptionQuote(
-                underlying=contract.underlying,
-                expiry=contract.expiry,
-                strike=contract.strike,
-                right=contract.right,
-                timestamp=now,
-                bid=_to_decimal(bid),
-                ask=_to_decimal(ask),
-                last=_to_decimal(mid),
-                iv=self._iv,
-                delta=_to_decimal(delta),
-                gamma=_to_decimal(gamma),
-                theta=_to_decimal(theta),
-                vega=_to_decimal(vega),
-            )
+        for quote in (await self.price_chain(contracts)).quotes():
+            yield quote
@@ -0,0 +1,99 @@
+"""Fixed-width columnar encoding of ticks (equity quotes).
+
+The tick counterpart of `engine.data_feeds.bar_arrays`, with the same
+conventions: one ``(len(FIELDS), n)`` int64 array per run of quotes,
+epoch-nanosecond timestamps, prices in integer ten-thousandths (the
+``NUMERIC(18,4)`` scale of the ``ticks`` table), ``MISSING`` for a null
+``last`` / ``volume``, and plain ``.npy`` files that are memory-mapped
+on read. One file holds one UTC day of one symbol, laid out as
+``<root>/<SYMBOL>/ticks/<YYYY-MM-DD>.npy`` (`day_path`).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+from contracts.data_feed import Quote
+
+from engine.data_feeds.bar_arrays import (
+    MISSING,
+    BarArray,
+    from_ns,
+    from_units,
+    save,
+    to_ns,
+    to_units,
+)
+from engine.data_feeds.bar_arrays import load as _load
+
+FIELDS = ("ts_ns", "bid", "ask", "last", "volume")
+TS, BID, ASK, LAST, VOLUME = range(len(FIELDS))
+
+_TICKS_DIR = "ticks"
+
+TickArray = BarArray
+
+
+def encode(quotes: Sequence[Quote]) -> TickArray:
+    """Quotes (oldest first) as a ``(len(FIELDS), n)`` array."""
+    out = np.empty((len(FIELDS), len(quotes)), dtype=np.int64)
+    for i, q in enumerate(quotes):
+        out[:, i] = (
+            to_ns(q.timestamp),
+            to_units(q.bid),
+            to_units(q.ask),
+            MISSING if q.last is None else to_units(q.last),
+            MISSING if q.volume is None else q.volume,
+        )
+    return out
+
+
+def decode(array: TickArray, symbol: str) -> Iterator[Quote]:
+    """Rebuild ``Quote`` objects lazily; values came out of `encode`, so
+    validation is skipped."""
+    columns = [array[k].tolist() for k in range(len(FIELDS))]
+    for ts, bid, ask, last, volume in zip(*columns):
+        yield Quote.model_construct(
+            symbol=symbol,
+            timestamp=from_ns(ts),
+            bid=from_units(bid),
+            ask=from_units(ask),
+            last=None if last == MISSING else from_units(last),
+            volume=None if volume == MISSING else volume,
+        )
+
+
+def day_path(root: str | Path, symbol: str, day: date) -> Path:
+    """Where one day of ticks lives under ``root``."""
+    return Path(root) / symbol.upper() / _TICKS_DIR / f"{day.isoformat()}.npy"
+
+
+def parse_day_path(path: str | Path) -> tuple[str, date]:
+    """``(symbol, day)`` of a file laid out by `day_path`."""
+    path = Path(path)
+    try:
+        if path.parent.name != _TICKS_DIR:
+            raise ValueError
+        return path.parent.parent.name.upper(), date.fromisoformat(path.stem)
+    except ValueError:
+        raise ValueError(f"{path}: expected <SYMBOL>/ticks/<YYYY-MM-DD>.npy") from None
+
+
+def load(path: str | Path) -> TickArray:
+    """Memory-map a saved tick array read-only."""
+    return _load(path, fields=FIELDS)
+
+
+__all__ = [
+    "FIELDS",
+    "TickArray",
+    "day_path",
+    "decode",
+    "encode",
+    "load",
+    "parse_day_path",
+    "save",
+]
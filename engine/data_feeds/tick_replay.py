@@ -0,0 +1,209 @@
+"""Tick replay feed — yields recorded quotes with their original timing.
+
+Bar replay can only synthesize one quote per bar (close ± a penny), which
+is no use to the tick strategies. `TickReplayFeed` replays real ticks —
+original timestamps, bid/ask/last/volume — from either source:
+
+* columnar tick files (`engine.data_feeds.tick_arrays`): one ``.npy`` day
+  file, or a dataset directory of ``<SYMBOL>/ticks/<YYYY-MM-DD>.npy``
+  files (``scripts/export_replay_bars.py ticks`` writes them). Each day is
+  memory-mapped when the stream reaches it;
+* the ``ticks`` table, keyset-paged with the next page prefetched.
+
+Pacing
+------
+
+``speed=0`` (the default) replays as fast as the consumer takes ticks.
+``speed=1`` replays in real time and ``speed=N`` N times faster, keeping the
+recorded gaps between ticks; the clock restarts at each day file, so an
+overnight gap is not waited out. Ticks come out in batches
+(`stream_tick_batches`) of up to ``batch_size`` — at speed 0 every batch
+is full, when paced a batch holds every tick that has fallen due — so the
+per-tick cost stays at decoding the quote. `stream_equity_quotes` flattens
+the batches for ``MarketDataFeed`` consumers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from contracts.data_feed import (
+    Bar,
+    ChainSnapshot,
+    OptionContract,
+    OptionQuote,
+    Quote,
+)
+
+from engine.data_feeds import tick_arrays
+from engine.data_feeds.bar_arrays import to_ns
+from engine.data_feeds.base import BaseFeed
+
+# One run of ticks: their epoch-ns timestamps and a way to materialize the
+# quotes in ``[i, j)``. ``new_session`` restarts the pacing clock.
+_Chunk = tuple[bool, npt.NDArray[np.int64], Callable[[int, int], list[Quote]]]
+
+
+class TickReplayFeed(BaseFeed):
+    """Replay recorded ticks from tick files or the ``ticks`` table.
+
+    Pass ``path`` (a tick day file or dataset directory), or ``dsn`` /
+    ``backend`` plus ``start`` (and optionally ``end``) to read the table.
+    An injected ``backend`` is the caller's to close.
+    """
+
+    name: str = "tick_replay"
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        dsn: str | None = None,
+        backend: Any | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        speed: float = 0.0,
+        batch_size: int = 4096,
+        page_size: int = 10_000,
+    ) -> None:
+        if speed < 0:
+            raise ValueError("speed must be >= 0")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        from_db = dsn is not None or backend is not None
+        if (path is None) == (not from_db):
+            raise ValueError("pass exactly one of path or dsn/backend")
+        self._path: Path | None = None
+        if path is not None:
+            self._path = Path(path)
+            if not self._path.exists():
+                raise FileNotFoundError(f"tick replay data not found: {self._path}")
+        elif start is None:
+            raise ValueError("start is required when replaying the ticks table")
+        elif end is not None and start >= end:
+            raise ValueError("start must be < end")
+        self._dsn = dsn
+        self._backend: Any | None = backend
+        self._owns_backend = backend is None
+        self._start = start
+        self._end = end
+        self._speed = float(speed)
+        self._batch_size = batch_size
+        self._page_size = page_size
+
+    def _ensure_backend(self) -> Any:
+        if self._backend is None:
+            # Imported lazily, as in SupabaseBarsFeed: only table replays
+            # need the persistence layer (and asyncpg).
+            from services.persistence import SupabaseBackend
+            self._backend = SupabaseBackend(self._dsn)
+        return self._backend
+
+    async def close(self) -> None:
+        if self._backend is not None and self._owns_backend:
+            await self._backend.close()
+            self._backend = None
+
+    def sessions(self, symbol: str) -> list[date]:
+        """Days of tick files for ``symbol``, oldest first (file replays only)."""
+        return [day for day, _ in self._day_files(self._validate_symbol(symbol))]
+
+    def _day_files(self, sym: str) -> list[tuple[date, Path]]:
+        if self._path is None:
+            raise ValueError("sessions are only known for file replays")
+        if self._path.is_file():
+            file_sym, day = tick_arrays.parse_day_path(self._path)
+            if file_sym != sym:
+                raise ValueError(f"tick file is for {file_sym}, not {sym}")
+            return [(day, self._path)]
+        directory = tick_arrays.day_path(self._path, sym, date.min).parent
+        if not directory.is_dir():
+            raise ValueError(f"tick dataset {self._path} has no ticks for {sym}")
+        return sorted(
+            (tick_arrays.parse_day_path(p)[1], p) for p in directory.glob("*.npy")
+        )
+
+    async def _file_chunks(self, sym: str) -> AsyncIterator[_Chunk]:
+        for _, path in self._day_files(sym):
+            array = tick_arrays.load(path)
+            if array.shape[1]:
+                yield True, array[tick_arrays.TS], (
+                    lambda i, j, a=array: list(tick_arrays.decode(a[:, i:j], sym))
+                )
+
+    async def _table_chunks(self, sym: str) -> AsyncIterator[_Chunk]:
+        from services.persistence import PersistenceReader
+
+        reader = PersistenceReader(self._ensure_backend())
+        first = True
+        async for quotes in reader.iter_ticks(
+            sym, self._start, self._end, page_size=self._page_size,
+        ):
+            ts = np.fromiter((to_ns(q.timestamp) for q in quotes), np.int64, len(quotes))
+            yield first, ts, lambda i, j, q=quotes: q[i:j]
+            first = False
+
+    async def stream_tick_batches(self, symbol: str) -> AsyncIterator[list[Quote]]:
+        """Ticks for ``symbol``, oldest first, in batches (see the module docstring)."""
+        sym = self._validate_symbol(symbol)
+        chunks = self._file_chunks(sym) if self._path is not None else self._table_chunks(sym)
+        loop = asyncio.get_running_loop()
+        origin_ns, origin_wall = 0, 0.0
+        async for new_session, ts, take in chunks:
+            if new_session:
+                origin_ns, origin_wall = int(ts[0]), loop.time()
+            i, n = 0, len(ts)
+            while i < n:
+                if self._speed > 0:
+                    due = (int(ts[i]) - origin_ns) / 1e9 / self._speed
+                    lag = due - (loop.time() - origin_wall)
+                    if lag > 0:
+                        await asyncio.sleep(lag)
+                    now_ns = origin_ns + (loop.time() - origin_wall) * self._speed * 1e9
+                    j = int(np.searchsorted(ts, now_ns, side="right"))
+                    j = min(max(j, i + 1), i + self._batch_size)
+                else:
+                    j = min(i + self._batch_size, n)
+                    await asyncio.sleep(0)  # let other tasks run between batches
+                yield take(i, j)
+                i = j
+
+    async def stream_equity_quotes(self, symbol: str) -> AsyncIterator[Quote]:
+        async for batch in self.stream_tick_batches(symbol):
+            for quote in batch:
+                yield quote
+
+    async def stream_equity_bars(
+        self, symbol: str, interval_seconds: int = 60
+    ) -> AsyncIterator[Bar]:
+        raise NotImplementedError("TickReplayFeed replays ticks only — use ReplayFeed for bars")
+        if False:  # pragma: no cover - make this an async generator for typing
+            yield  # type: ignore[unreachable]
+
+    async def get_option_chain(self, underlying: str, expiry: date) -> ChainSnapshot:
+        sym = self._validate_symbol(underlying)
+        # Ticks carry no option data; SyntheticOptionsFeed builds the chain.
+        return ChainSnapshot(
+            underlying=sym,
+            expiry=expiry,
+            snapshot_time=datetime.combine(expiry, datetime.min.time()),
+            contracts=[],
+        )
+
+    async def stream_option_quotes(
+        self, contracts: list[OptionContract]
+    ) -> AsyncIterator[OptionQuote]:
+        raise NotImplementedError(
+            "TickReplayFeed has no option data — wrap with SyntheticOptionsFeed"
+        )
+        if False:  # pragma: no cover - make this an async generator for typing
+            yield  # type: ignore[unreachable]
+
+
+__all__ = ["TickReplayFeed"]
@@ -0,0 +1,13 @@
+"""Shared feature computation for the alpha-kite engine.
+
+Features are indicator state derived from market data that more than one
+strategy consumes. Maintaining them here, once per symbol and window,
+means N strategies on the same stream cost one update per event rather
+than N. Nothing here performs I/O.
+"""
+
+from __future__ import annotations
+
+from engine.features.tick_cross import CrossFeature, TickFeatureEngine
+
+__all__ = ["CrossFeature", "TickFeatureEngine"]
@@ -0,0 +1,313 @@
+"""Shared SMA(N-sec)/session-VWAP features for tick strategies.
+
+Every tick strategy in this repo derives the same three things from the
+NBBO stream: a rolling mean of 1-second mid snapshots, a session VWAP
+from cumulative trade volume, and the sign of ``SMA - VWAP``. The
+:class:`TickFeatureEngine` maintains them once per symbol (and once per
+SMA window on that symbol), so several strategies watching the same
+QQQ stream share a single update per tick.
+
+Strategies :meth:`~TickFeatureEngine.subscribe` to get a
+:class:`CrossFeature` handle and call :meth:`CrossFeature.update` with
+each tick. The engine remembers the last tick object it processed per
+symbol, so the second and later strategies handed the same ``Quote``
+get the cached result instead of recomputing it. A strategy built
+without an engine creates a private one, which behaves exactly like the
+per-strategy state it replaces.
+
+Session state (SMA windows, VWAP) resets on the first tick of each new
+UTC date for that symbol. :meth:`TickFeatureEngine.snapshot` and
+:meth:`~TickFeatureEngine.restore` round-trip all of it through plain
+JSON for strategy checkpoints.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from contracts.data_feed import Quote
+
+from engine.indicators.fixed_point import (
+    FixedRollingSMA,
+    FixedSessionVWAP,
+    compare_ratios,
+    fixed_ratio,
+    to_fixed,
+)
+from engine.indicators.sma import RollingSMA
+from engine.indicators.vwap import SessionVWAP
+
+
+class _SymbolState:
+    """Per-symbol session state plus one SMA per subscribed window.
+
+    In fixed-point mode the SMA samples are ``bid + ask`` in ticks
+    (2 x mid), which keeps them integral; see
+    :mod:`engine.indicators.fixed_point`.
+    """
+
+    __slots__ = (
+        "cur_mid",
+        "cur_mid2",
+        "cur_sec",
+        "fx_smas",
+        "fx_vwap",
+        "last_tick",
+        "session_date",
+        "signs",
+        "smas",
+        "vwap",
+    )
+
+    def __init__(self) -> None:
+        self.session_date: date | None = None
+        self.last_tick: Quote | None = None
+        self.cur_sec: datetime | None = None
+        self.cur_mid: Decimal | None = None
+        self.cur_mid2: int | None = None
+        self.vwap = SessionVWAP()
+        self.fx_vwap = FixedSessionVWAP()
+        self.smas: dict[int, RollingSMA] = {}
+        self.fx_smas: dict[int, FixedRollingSMA] = {}
+        # sign(SMA - VWAP) per window after the last tick; None = warming up.
+        self.signs: dict[int, int | None] = {}
+
+    def add_window(self, window: int) -> None:
+        if window not in self.smas:
+            self.smas[window] = RollingSMA(window)
+            self.fx_smas[window] = FixedRollingSMA(window)
+            self.signs[window] = None
+
+    def reset(self, session_date: date) -> None:
+        self.session_date = session_date
+        self.cur_sec = None
+        self.cur_mid = None
+        self.cur_mid2 = None
+        self.vwap.reset()
+        self.fx_vwap.reset()
+        for sma in self.smas.values():
+            sma.reset()
+        for fx in self.fx_smas.values():
+            fx.reset()
+        for window in self.signs:
+            self.signs[window] = None
+
+    def snapshot(self, fixed_point: bool) -> dict[str, Any]:
+        return {
+            "session_date": None if self.session_date is None else self.session_date.isoformat(),
+            "cur_sec": None if self.cur_sec is None else self.cur_sec.isoformat(),
+            "cur_mid": None if self.cur_mid is None else str(self.cur_mid),
+            "cur_mid2": self.cur_mid2,
+            "vwap": (self.fx_vwap if fixed_point else self.vwap).snapshot(),
+            "smas": {
+                str(w): sma.snapshot()
+                for w, sma in (self.fx_smas if fixed_point else self.smas).items()
+            },
+            "signs": {str(w): sign for w, sign in self.signs.items()},
+        }
+
+    def restore(self, state: dict[str, Any], fixed_point: bool) -> None:
+        raw_date = state["session_date"]
+        self.session_date = None if raw_date is None else date.fromisoformat(raw_date)
+        raw_sec = state["cur_sec"]
+        self.cur_sec = None if raw_sec is None else datetime.fromisoformat(raw_sec)
+        raw_mid = state["cur_mid"]
+        self.cur_mid = None if raw_mid is None else Decimal(raw_mid)
+        self.cur_mid2 = state["cur_mid2"]
+        (self.fx_vwap if fixed_point else self.vwap).restore(state["vwap"])
+        smas: dict[int, Any] = self.fx_smas if fixed_point else self.smas
+        # Windows subscribed now but absent from the snapshot warm up fresh.
+        for key, sma_state in state["smas"].items():
+            window = int(key)
+            if window in smas:
+                smas[window].restore(sma_state)
+                self.signs[window] = state["signs"].get(key)
+
+
+class CrossFeature:
+    """One subscriber's view of a ``(symbol, window_seconds)`` feature."""
+
+    __slots__ = ("_engine", "_state", "symbol", "window_seconds")
+
+    def __init__(
+        self,
+        engine: TickFeatureEngine,
+        state: _SymbolState,
+        symbol: str,
+        window_seconds: int,
+    ) -> None:
+        self._engine = engine
+        self._state = state
+        self.symbol = symbol
+        self.window_seconds = window_seconds
+
+    @property
+    def engine(self) -> TickFeatureEngine:
+        return self._engine
+
+    @property
+    def samples(self) -> int:
+        """Closed 1-second snapshots currently in this window."""
+        if self._engine.fixed_point:
+            return len(self._state.fx_smas[self.window_seconds])
+        return len(self._state.smas[self.window_seconds])
+
+    def update(self, tick: Quote) -> int | None:
+        """Feed ``tick`` to the shared engine and return :attr:`sign`."""
+        self._engine.update(tick)
+        return self._state.signs[self.window_seconds]
+
+    @property
+    def sign(self) -> int | None:
+        """sign(SMA - VWAP) after the last tick, or ``None`` while warming up."""
+        return self._state.signs[self.window_seconds]
+
+    def values(self) -> tuple[Decimal | None, Decimal | None]:
+        """Current ``(SMA, VWAP)`` as Decimal prices, e.g. for signal metadata."""
+        state = self._state
+        window = self.window_seconds
+        if self._engine.fixed_point:
+            mid2 = state.cur_mid2
+            total = None if mid2 is None else state.fx_smas[window].peek_total(mid2)
+            sma = None if total is None else fixed_ratio(total, 2 * window)
+            return sma, state.fx_vwap.value
+        mid = state.cur_mid
+        sma = None if mid is None else state.smas[window].peek(mid)
+        return sma, state.vwap.value
+
+
+class TickFeatureEngine:
+    """Per-symbol SMA/VWAP/diff-sign state shared by tick strategies.
+
+    ``fixed_point=True`` keeps the state in integer ten-thousandths
+    instead of Decimal; signs and values are identical, the per-tick cost
+    is lower, and ticks priced finer than 1/10000 raise ``ValueError``.
+    """
+
+    def __init__(self, fixed_point: bool = False) -> None:
+        self.fixed_point = fixed_point
+        self._symbols: dict[str, _SymbolState] = {}
+        self.updates = 0  # ticks actually folded in (cache hits excluded)
+
+    def subscribe(self, symbol: str, window_seconds: int) -> CrossFeature:
+        """Register interest in ``symbol``'s SMA(``window_seconds``) vs VWAP.
+
+        Subscribing to a window that already exists shares its state. A
+        window added mid-session starts empty and warms up on its own.
+        """
+        if not isinstance(window_seconds, int) or window_seconds <= 0:
+            raise ValueError("window_seconds must be a positive int")
+        state = self._symbols.get(symbol)
+        if state is None:
+            state = self._symbols[symbol] = _SymbolState()
+        state.add_window(window_seconds)
+        return CrossFeature(self, state, symbol, window_seconds)
+
+    def update(self, tick: Quote) -> None:
+        """Fold ``tick`` into its symbol's features, once per tick object.
+
+        Ticks for symbols nobody subscribed to are ignored.
+        """
+        state = self._symbols.get(tick.symbol)
+        if state is None or tick is state.last_tick:
+            return
+        state.last_tick = tick
+        self.updates += 1
+
+        tick_date = tick.timestamp.date()
+        if tick_date != state.session_date:
+            state.reset(tick_date)
+
+        if self.fixed_point:
+            self._update_fixed(state, tick)
+        else:
+            self._update_decimal(state, tick)
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-safe copy of every symbol's session state."""
+        return {
+            "fixed_point": self.fixed_point,
+            "symbols": {
+                symbol: state.snapshot(self.fixed_point)
+                for symbol, state in self._symbols.items()
+            },
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Load state captured by :meth:`snapshot` into subscribed symbols.
+
+        Raises ``ValueError`` when the snapshot was taken in the other
+        price representation.
+        """
+        if state["fixed_point"] != self.fixed_point:
+            raise ValueError("snapshot fixed_point mode does not match this engine")
+        for symbol, sym_state in state["symbols"].items():
+            current = self._symbols.get(symbol)
+            if current is not None:
+                current.restore(sym_state, self.fixed_point)
+                current.last_tick = None
+
+    # ──────────────────────────────────────────────────────── private ───
+
+    @staticmethod
+    def _update_decimal(state: _SymbolState, tick: Quote) -> None:
+        # ─── update VWAP from incremental volume * last trade price ───
+        vwap_state = state.vwap
+        if tick.last is not None and tick.volume is not None:
+            vwap_state.update_cumulative(tick.last, tick.volume)
+
+        # ─── 1-sec snap of mid-price ──────────────────────────────────
+        sec_ts = tick.timestamp.replace(microsecond=0)
+        mid = tick.mid
+        if state.cur_sec is None or sec_ts != state.cur_sec:
+            # Closing the previous second: record its last-seen mid into
+            # every window, then start a new second.
+            if state.cur_sec is not None and state.cur_mid is not None:
+                for sma in state.smas.values():
+                    sma.update(state.cur_mid)
+            state.cur_sec = sec_ts
+        # Mid-second update: keep the latest mid for this second
+        state.cur_mid = mid
+
+        vwap = vwap_state.value
+        signs = state.signs
+        for window, sma_state in state.smas.items():
+            sma = sma_state.peek(mid)
+            if sma is None or vwap is None:
+                signs[window] = None
+                continue
+            diff = sma - vwap
+            signs[window] = 1 if diff > 0 else (-1 if diff < 0 else 0)
+
+    @staticmethod
+    def _update_fixed(state: _SymbolState, tick: Quote) -> None:
+        # Integer-tick twin of _update_decimal: SMA is total / (2 * window),
+        # VWAP is pv / volume, and the sign of their difference comes from
+        # one exact cross-multiplication.
+        vwap_state = state.fx_vwap
+        if tick.last is not None and tick.volume is not None:
+            vwap_state.update_cumulative(to_fixed(tick.last), tick.volume)
+
+        sec_ts = tick.timestamp.replace(microsecond=0)
+        mid2 = to_fixed(tick.bid) + to_fixed(tick.ask)
+        if state.cur_sec is None or sec_ts != state.cur_sec:
+            if state.cur_sec is not None and state.cur_mid2 is not None:
+                for fx in state.fx_smas.values():
+                    fx.update(state.cur_mid2)
+            state.cur_sec = sec_ts
+        state.cur_mid2 = mid2
+
+        pv = vwap_state.pv
+        volume = vwap_state.volume
+        signs = state.signs
+        for window, fx in state.fx_smas.items():
+            total = fx.peek_total(mid2)
+            if total is None or volume <= 0:
+                signs[window] = None
+                continue
+            signs[window] = compare_ratios(total, 2 * window, pv, volume)
+
+
+__all__ = ["CrossFeature", "TickFeatureEngine"]
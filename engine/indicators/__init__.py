@@ -1,17 +1,25 @@
-"""Pure-function technical indicators for the alpha-kite engine.
+"""Technical indicators for the alpha-kite engine.
 
-All indicator functions are stateless, synchronous, and operate on
-``Decimal`` values. They are safe to call from any context and never
-perform I/O.
+The pure functions are stateless, synchronous, and operate on ``Decimal``
+values. Each has a streaming counterpart (``RollingSMA``, ``SessionVWAP``,
+``CrossDetector``) that keeps O(1) state per update and produces the same
+Decimal results; strategies use those on the hot path. Integer-tick
+twins of the streaming SMA/VWAP, for callers that opt into fixed-point
+prices, live in :mod:`engine.indicators.fixed_point`. NumPy batch
+kernels for whole-history computation live in
+:mod:`engine.indicators.vectorized`. Nothing here performs I/O.
 """
 
 from __future__ import annotations
 
-from engine.indicators.cross import cross_events, detect_cross
-from engine.indicators.sma import simple_moving_average
-from engine.indicators.vwap import session_vwap
+from engine.indicators.cross import CrossDetector, cross_events, detect_cross
+from engine.indicators.sma import RollingSMA, simple_moving_average
+from engine.indicators.vwap import SessionVWAP, session_vwap
 
 __all__ = [
+    "CrossDetector",
+    "RollingSMA",
+    "SessionVWAP",
     "cross_events",
     "detect_cross",
     "session_vwap",
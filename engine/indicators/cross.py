@@ -56,3 +56,31 @@ def cross_events(
             # Reset previous values; we cannot evaluate a cross with a missing side.
             prev_a, prev_b = None, None
     return events
+
+
+class CrossDetector:
+    """Streaming counterpart of :func:`cross_events`.
+
+    Remembers only the previous ``(a, b)`` pair, so each ``update`` is O(1).
+    Passing ``None`` for either side clears the previous pair, exactly as a
+    ``None`` entry does in :func:`cross_events`.
+    """
+
+    __slots__ = ("_prev_a", "_prev_b")
+
+    def __init__(self) -> None:
+        self._prev_a: Decimal | None = None
+        self._prev_b: Decimal | None = None
+
+    def update(self, a: Decimal | None, b: Decimal | None) -> CrossDirection:
+        """Feed the next pair and return the cross direction at this step."""
+        if a is None or b is None:
+            self._prev_a, self._prev_b = None, None
+            return "NONE"
+        direction = detect_cross(self._prev_a, self._prev_b, a, b)
+        self._prev_a, self._prev_b = a, b
+        return direction
+
+    def reset(self) -> None:
+        """Forget the previous pair (session boundary)."""
+        self._prev_a, self._prev_b = None, None
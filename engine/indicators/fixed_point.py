@@ -0,0 +1,234 @@
+"""Scaled-integer prices for the tick hot path.
+
+Prices are stored as ``int`` ten-thousandths ("ticks"), the same
+resolution as the ``NUMERIC(18,4)`` price columns, so ``449.1234`` is
+``4_491_234``. Integer addition and multiplication are exact and skip
+the Decimal context machinery that every ``Decimal`` operation goes
+through, which is most of the per-tick cost in the tick strategies.
+
+Conversion happens only at the contract boundary: :func:`to_fixed` on
+the way in (rejecting anything finer than 1/10000 instead of rounding
+it), :func:`from_fixed` / :func:`fixed_ratio` on the way out. Averages
+are kept as ``(numerator, denominator)`` pairs and compared by
+cross-multiplication (:func:`compare_ratios`), so no division, and no
+rounding, happens until a value is actually reported.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+PRICE_SCALE = 10_000
+_SCALE_DEC = Decimal(PRICE_SCALE)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def to_fixed(value: Decimal) -> int:
+    """Convert a Decimal price to integer ten-thousandths, losslessly.
+
+    Raises ``ValueError`` when ``value`` has precision beyond four decimal
+    places; silently rounding a price would break parity with the Decimal
+    path. Intraday quotes revisit the same few hundred price levels, so
+    results are memoised: a hit costs a dict lookup instead of a Decimal
+    multiply and compare.
+    """
+    if not isinstance(value, Decimal):
+        raise TypeError("to_fixed expects a Decimal")
+    scaled = value * _SCALE_DEC
+    ticks = int(scaled)
+    if ticks != scaled:
+        raise ValueError(f"price {value} is finer than 1/{PRICE_SCALE}")
+    return ticks
+
+
+def from_fixed(ticks: int) -> Decimal:
+    """Convert integer ten-thousandths back to a Decimal price (exact)."""
+    return Decimal(ticks).scaleb(-4)
+
+
+def fixed_ratio(numerator: int, denominator: int) -> Decimal:
+    """Decimal value of ``numerator / denominator`` ticks.
+
+    Rounded once, under the current Decimal context, exactly as the
+    equivalent Decimal division would be.
+    """
+    return Decimal(numerator) / Decimal(denominator * PRICE_SCALE)
+
+
+def compare_ratios(a_num: int, a_den: int, b_num: int, b_den: int) -> int:
+    """Sign of ``a_num / a_den - b_num / b_den`` as ``-1``, ``0`` or ``+1``.
+
+    Denominators must be positive. Exact for any integer inputs.
+    """
+    lhs = a_num * b_den
+    rhs = b_num * a_den
+    return (lhs > rhs) - (lhs < rhs)
+
+
+class FixedRollingSMA:
+    """Integer-tick counterpart of :class:`engine.indicators.sma.RollingSMA`.
+
+    Holds the trailing ``period`` samples and their exact integer sum. The
+    average itself is never materialised on the hot path: :meth:`peek_total`
+    returns the window sum, and callers divide by :attr:`period` only when
+    they need a Decimal (see :func:`fixed_ratio`).
+    """
+
+    __slots__ = ("_period", "_total", "_window")
+
+    def __init__(self, period: int) -> None:
+        if not isinstance(period, int):
+            raise TypeError("period must be an int")
+        if period <= 0:
+            raise ValueError("period must be a positive integer")
+        self._period = period
+        self._window: deque[int] = deque()
+        self._total = 0
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    @property
+    def period(self) -> int:
+        return self._period
+
+    @property
+    def ready(self) -> bool:
+        """True once ``period`` samples have been seen since the last reset."""
+        return len(self._window) == self._period
+
+    @property
+    def total(self) -> int | None:
+        """Sum of the current window, or ``None`` while it is still filling."""
+        if len(self._window) < self._period:
+            return None
+        return self._total
+
+    @property
+    def value(self) -> Decimal | None:
+        """Current SMA as a Decimal price, or ``None`` while filling."""
+        total = self.total
+        if total is None:
+            return None
+        return fixed_ratio(total, self._period)
+
+    def update(self, ticks: int) -> None:
+        """Append ``ticks`` to the window."""
+        window = self._window
+        window.append(ticks)
+        self._total += ticks
+        if len(window) > self._period:
+            self._total -= window.popleft()
+
+    def peek_total(self, ticks: int) -> int | None:
+        """Window sum as if ``ticks`` were appended, without mutating state."""
+        n = len(self._window)
+        if n + 1 < self._period:
+            return None
+        total = self._total + ticks
+        if n == self._period:
+            total -= self._window[0]
+        return total
+
+    def reset(self) -> None:
+        """Drop every sample (session boundary)."""
+        self._window.clear()
+        self._total = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-safe copy of the window, for strategy checkpoints."""
+        return {"period": self._period, "window": list(self._window)}
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Replace the window with one captured by :meth:`snapshot`."""
+        if state["period"] != self._period:
+            raise ValueError(
+                f"snapshot period {state['period']} does not match {self._period}"
+            )
+        self._window = deque(int(v) for v in state["window"][-self._period :])
+        self._total = sum(self._window)
+
+
+class FixedSessionVWAP:
+    """Integer-tick counterpart of :class:`engine.indicators.vwap.SessionVWAP`.
+
+    ``pv`` is ``sum(price_ticks * volume)``; the VWAP in ticks is
+    ``pv / volume``. Only the cumulative-volume feed used by the tick
+    strategies is supported.
+    """
+
+    __slots__ = ("_last_cum_volume", "_pv", "_volume")
+
+    def __init__(self) -> None:
+        self._pv = 0
+        self._volume = 0
+        self._last_cum_volume: int | None = None
+
+    @property
+    def pv(self) -> int:
+        return self._pv
+
+    @property
+    def volume(self) -> int:
+        return self._volume
+
+    @property
+    def value(self) -> Decimal | None:
+        """Current VWAP as a Decimal price, or ``None`` while no volume has traded."""
+        if self._volume <= 0:
+            return None
+        return fixed_ratio(self._pv, self._volume)
+
+    def update(self, ticks: int, volume: int) -> None:
+        """Add ``volume`` traded at ``ticks``."""
+        if volume < 0:
+            raise ValueError("volume must be non-negative")
+        self._pv += ticks * volume
+        self._volume += volume
+
+    def update_cumulative(self, ticks: int, cum_volume: int) -> None:
+        """Add the volume printed since the previous call at ``ticks``.
+
+        Same baseline / re-baseline rules as
+        :meth:`engine.indicators.vwap.SessionVWAP.update_cumulative`.
+        """
+        last = self._last_cum_volume
+        self._last_cum_volume = cum_volume
+        if last is not None and cum_volume > last:
+            self._pv += ticks * (cum_volume - last)
+            self._volume += cum_volume - last
+
+    def reset(self) -> None:
+        """Zero the accumulators (session boundary)."""
+        self._pv = 0
+        self._volume = 0
+        self._last_cum_volume = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-safe copy of the accumulators, for strategy checkpoints."""
+        return {
+            "pv": self._pv,
+            "volume": self._volume,
+            "last_cum_volume": self._last_cum_volume,
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Replace the accumulators with ones captured by :meth:`snapshot`."""
+        self._pv = int(state["pv"])
+        self._volume = int(state["volume"])
+        last = state["last_cum_volume"]
+        self._last_cum_volume = None if last is None else int(last)
+
+
+__all__ = [
+    "PRICE_SCALE",
+    "FixedRollingSMA",
+    "FixedSessionVWAP",
+    "compare_ratios",
+    "fixed_ratio",
+    "from_fixed",
+    "to_fixed",
+]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import deque
 from decimal import Decimal
+from typing import Any
 
 
 def simple_moving_average(closes: list[Decimal], period: int) -> Decimal | None:
@@ -24,3 +26,87 @@ def simple_moving_average(closes: list[Decimal], period: int) -> Decimal | None:
             raise TypeError("closes must contain Decimal values")
         total += value
     return total / Decimal(period)
+
+
+class RollingSMA:
+    """Streaming counterpart of :func:`simple_moving_average`.
+
+    Keeps the trailing ``period`` samples plus a running Decimal total, so
+    each ``update`` is O(1) regardless of how many samples the session has
+    seen. Decimal addition is exact, so the result compares equal to the
+    pure function applied to the same samples.
+    """
+
+    __slots__ = ("_divisor", "_period", "_total", "_window")
+
+    def __init__(self, period: int) -> None:
+        if not isinstance(period, int):
+            raise TypeError("period must be an int")
+        if period <= 0:
+            raise ValueError("period must be a positive integer")
+        self._period = period
+        self._divisor = Decimal(period)
+        self._window: deque[Decimal] = deque()
+        self._total = Decimal(0)
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    @property
+    def period(self) -> int:
+        return self._period
+
+    @property
+    def ready(self) -> bool:
+        """True once ``period`` samples have been seen since the last reset."""
+        return len(self._window) == self._period
+
+    @property
+    def value(self) -> Decimal | None:
+        """Current SMA, or ``None`` while the window is still filling."""
+        if len(self._window) < self._period:
+            return None
+        return self._total / self._divisor
+
+    def update(self, value: Decimal) -> Decimal | None:
+        """Append ``value`` to the window and return the new SMA."""
+        if not isinstance(value, Decimal):
+            raise TypeError("RollingSMA values must be Decimal")
+        window = self._window
+        window.append(value)
+        self._total += value
+        if len(window) > self._period:
+            self._total -= window.popleft()
+        return self.value
+
+    def peek(self, value: Decimal) -> Decimal | None:
+        """Return the SMA as if ``value`` were appended, without mutating state.
+
+        Used by the tick strategies, which fold the still-open second into
+        the average before that second has closed.
+        """
+        n = len(self._window)
+        if n + 1 < self._period:
+            return None
+        total = self._total + value
+        if n == self._period:
+            total -= self._window[0]
+        return total / self._divisor
+
+    def reset(self) -> None:
+        """Drop every sample (session boundary)."""
+        self._window.clear()
+        self._total = Decimal(0)
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-safe copy of the window, for strategy checkpoints."""
+        return {"period": self._period, "window": [str(v) for v in self._window]}
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Replace the window with one captured by :meth:`snapshot`."""
+        if state["period"] != self._period:
+            raise ValueError(
+                f"snapshot period {state['period']} does not match {self._period}"
+            )
+        self._window = deque(Decimal(v) for v in state["window"][-self._period :])
+        self._total = sum(self._window, Decimal(0))
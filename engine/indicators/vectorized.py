@@ -0,0 +1,247 @@
+"""NumPy batch kernels for full-series indicator computation.
+
+The Decimal functions in this package are the reference implementation and
+what strategies use event by event. These kernels compute the same
+series for a whole history at once. They are meant for backfills and
+research sweeps, where walking two years of 1-minute bars one Decimal at
+a time takes minutes.
+
+Inputs are columnar: ``float64`` price arrays, ``int64`` volumes and
+``int64`` epoch-second timestamps. Warm-up slots and sessions without
+volume are ``NaN``. Results are float64, so values agree with the Decimal
+functions to within float rounding, not bit for bit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+_SECONDS_PER_DAY = 86_400
+
+
+def utc_session_ids(epoch_seconds: npt.ArrayLike) -> IntArray:
+    """Label each timestamp with its UTC day number (days since 1970-01-01).
+
+    Matches the UTC-date session boundary used by ``scripts/backfill_signals``.
+    """
+    ts = np.asarray(epoch_seconds, dtype=np.int64)
+    return ts // _SECONDS_PER_DAY
+
+
+def _session_starts(session_ids: IntArray) -> IntArray:
+    """For each position, the index of the first element of its session."""
+    n = session_ids.shape[0]
+    is_start = np.empty(n, dtype=bool)
+    if n:
+        is_start[0] = True
+        np.not_equal(session_ids[1:], session_ids[:-1], out=is_start[1:])
+    starts = np.where(is_start, np.arange(n, dtype=np.int64), 0)
+    return np.maximum.accumulate(starts) if n else starts
+
+
+def _grouped_cumsum(values: npt.NDArray[np.generic], starts: IntArray) -> npt.NDArray[np.generic]:
+    """Cumulative sum that restarts at every session start."""
+    total = np.cumsum(values)
+    if total.shape[0] == 0:
+        return total
+    before = np.concatenate((np.zeros(1, dtype=total.dtype), total[:-1]))
+    return total - before[starts]
+
+
+def rolling_sma(values: npt.ArrayLike, period: int) -> FloatArray:
+    """Trailing simple moving average via one cumulative-sum pass.
+
+    ``out[i]`` is the mean of ``values[i - period + 1 : i + 1]``; the first
+    ``period - 1`` slots are ``NaN``. Like :func:`simple_moving_average`,
+    the window does not reset at session boundaries.
+    """
+    if not isinstance(period, int):
+        raise TypeError("period must be an int")
+    if period <= 0:
+        raise ValueError("period must be a positive integer")
+    x = np.asarray(values, dtype=np.float64)
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] < period:
+        return out
+    csum = np.concatenate((np.zeros(1), np.cumsum(x)))
+    out[period - 1 :] = (csum[period:] - csum[:-period]) / period
+    return out
+
+
+def session_vwap(
+    high: npt.ArrayLike,
+    low: npt.ArrayLike,
+    close: npt.ArrayLike,
+    volume: npt.ArrayLike,
+    session_ids: npt.ArrayLike | None = None,
+) -> FloatArray:
+    """Cumulative typical-price VWAP that restarts on every session change.
+
+    ``session_ids`` labels each bar's session (see :func:`utc_session_ids`);
+    ``None`` treats the whole input as one session, like
+    :func:`engine.indicators.vwap.session_vwap`. Bars with zero cumulative
+    session volume get ``NaN``.
+    """
+    h = np.asarray(high, dtype=np.float64)
+    lo = np.asarray(low, dtype=np.float64)
+    c = np.asarray(close, dtype=np.float64)
+    v = np.asarray(volume, dtype=np.int64)
+    if not (h.shape == lo.shape == c.shape == v.shape):
+        raise ValueError("high, low, close and volume must be the same length")
+    if (v < 0).any():
+        raise ValueError("bar volume must be non-negative")
+    if session_ids is None:
+        starts = np.zeros(v.shape[0], dtype=np.int64)
+    else:
+        sid = np.asarray(session_ids, dtype=np.int64)
+        if sid.shape != v.shape:
+            raise ValueError("session_ids must be the same length as the bars")
+        starts = _session_starts(sid)
+    typical = (h + lo + c) / 3.0
+    pv = _grouped_cumsum(typical * v, starts)
+    vol = _grouped_cumsum(v, starts)
+    out = np.full(v.shape[0], np.nan)
+    np.divide(pv, vol, out=out, where=vol > 0)
+    return out
+
+
+def sma_bank(
+    values: npt.ArrayLike,
+    periods: Sequence[int],
+    session_ids: npt.ArrayLike | None = None,
+) -> FloatArray:
+    """Trailing SMAs for many periods from a single prefix-sum pass.
+
+    Returns a ``(len(periods), len(values))`` array; row ``k`` equals
+    ``rolling_sma(values, periods[k])``. The cumulative sum is built once,
+    so a 3..60 parameter sweep costs one scan plus one subtraction per row.
+
+    With ``session_ids`` every window restarts at a session change, like
+    ``RollingSMA.reset()`` on each session boundary: a row is ``NaN``
+    until ``period`` bars into each session.
+    """
+    if not periods:
+        raise ValueError("periods must not be empty")
+    for p in periods:
+        if not isinstance(p, int):
+            raise TypeError("periods must be ints")
+        if p <= 0:
+            raise ValueError("periods must be positive integers")
+    x = np.asarray(values, dtype=np.float64)
+    n = x.shape[0]
+    out = np.full((len(periods), n), np.nan)
+    csum = np.concatenate((np.zeros(1), np.cumsum(x)))
+    if session_ids is None:
+        in_session = None
+    else:
+        sid = np.asarray(session_ids, dtype=np.int64)
+        if sid.shape[0] != n:
+            raise ValueError("session_ids must be the same length as values")
+        # Bars since the session opened; a window fits once it reaches p - 1.
+        in_session = np.arange(n, dtype=np.int64) - _session_starts(sid)
+    for row, p in enumerate(periods):
+        if n >= p:
+            out[row, p - 1 :] = (csum[p:] - csum[:-p]) / p
+            if in_session is not None:
+                out[row, in_session < p - 1] = np.nan
+    return out
+
+
+def _cross_masks(
+    diff: FloatArray,
+    session_ids: npt.ArrayLike | None,
+    strict: bool,
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    """Up/down masks over the last axis of ``diff``; slot ``j`` is step ``j + 1``."""
+    prev, curr = diff[..., :-1], diff[..., 1:]
+    paired = ~(np.isnan(prev) | np.isnan(curr))
+    if session_ids is not None:
+        sid = np.asarray(session_ids, dtype=np.int64)
+        if sid.shape[0] != diff.shape[-1]:
+            raise ValueError("session_ids must be the same length as the series")
+        paired &= sid[1:] == sid[:-1]
+    with np.errstate(invalid="ignore"):
+        if strict:
+            up = paired & (prev < 0) & (curr > 0)
+            down = paired & (prev > 0) & (curr < 0)
+        else:
+            up = paired & (prev <= 0) & (curr > 0)
+            down = paired & (prev >= 0) & (curr < 0)
+    return up, down
+
+
+def cross_indices(
+    series_a: npt.ArrayLike,
+    series_b: npt.ArrayLike,
+    session_ids: npt.ArrayLike | None = None,
+    *,
+    strict: bool = False,
+) -> tuple[IntArray, npt.NDArray[np.int8]]:
+    """Sign-change cross detection over whole series.
+
+    Returns ``(indices, directions)`` sorted by index, with ``+1`` for A
+    crossing above B and ``-1`` for crossing below. The default rules match
+    :func:`engine.indicators.cross.cross_events`: ``prev_a <= prev_b`` then
+    ``a > b`` is up. A ``NaN`` on either side breaks the pair, exactly like
+    ``None`` there. With ``strict=True`` both steps must be strictly on
+    opposite sides, so touching B is not a cross. ``session_ids`` stops a
+    cross being reported across a session boundary.
+    """
+    a = np.asarray(series_a, dtype=np.float64)
+    b = np.asarray(series_b, dtype=np.float64)
+    if a.shape != b.shape:
+        raise ValueError("series_a and series_b must be the same length")
+    if a.shape[0] < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)
+    up, down = _cross_masks(a - b, session_ids, strict)
+    directions = up.astype(np.int8) - down.astype(np.int8)
+    indices = np.flatnonzero(directions) + 1
+    return indices.astype(np.int64), directions[indices - 1]
+
+
+def bank_cross_indices(
+    bank: npt.ArrayLike,
+    series_b: npt.ArrayLike,
+    session_ids: npt.ArrayLike | None = None,
+    *,
+    strict: bool = False,
+) -> list[tuple[IntArray, npt.NDArray[np.int8]]]:
+    """:func:`cross_indices` for every row of an :func:`sma_bank` at once.
+
+    ``series_b`` (typically the shared session VWAP) is broadcast against
+    each row. Returns one ``(indices, directions)`` pair per row, in row
+    order.
+    """
+    a = np.asarray(bank, dtype=np.float64)
+    b = np.asarray(series_b, dtype=np.float64)
+    if a.ndim != 2 or a.shape[1] != b.shape[0]:
+        raise ValueError("bank must be 2-D with rows the same length as series_b")
+    if a.shape[1] < 2:
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8))
+        return [empty for _ in range(a.shape[0])]
+    up, down = _cross_masks(a - b[np.newaxis, :], session_ids, strict)
+    directions = up.astype(np.int8) - down.astype(np.int8)
+    rows, cols = np.nonzero(directions)
+    # np.nonzero walks row-major, so each row's hits are contiguous + sorted.
+    bounds = np.searchsorted(rows, np.arange(a.shape[0] + 1))
+    out: list[tuple[IntArray, npt.NDArray[np.int8]]] = []
+    for k in range(a.shape[0]):
+        c = cols[bounds[k] : bounds[k + 1]]
+        out.append(((c + 1).astype(np.int64), directions[k, c]))
+    return out
+
+
+__all__ = [
+    "bank_cross_indices",
+    "cross_indices",
+    "rolling_sma",
+    "session_vwap",
+    "sma_bank",
+    "utc_session_ids",
+]
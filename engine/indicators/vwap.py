@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from typing import Any
 
 from contracts.data_feed import Bar
 
@@ -28,3 +29,84 @@ def session_vwap(bars: list[Bar]) -> Decimal | None:
     if vol_total == 0:
         return None
     return pv_total / Decimal(vol_total)
+
+
+class SessionVWAP:
+    """Streaming session VWAP accumulator.
+
+    Holds the running ``sum(price * volume)`` and ``sum(volume)`` for the
+    current session, so each update is O(1). Feeding bars through
+    :meth:`update_bar` yields exactly :func:`session_vwap` over the same
+    bars. Tick strategies use :meth:`update_cumulative`, which turns the
+    feed's cumulative day volume into per-print deltas.
+
+    Call :meth:`reset` at each session boundary.
+    """
+
+    __slots__ = ("_last_cum_volume", "_pv", "_volume")
+
+    def __init__(self) -> None:
+        self._pv = Decimal(0)
+        self._volume = 0
+        self._last_cum_volume: int | None = None
+
+    @property
+    def volume(self) -> int:
+        return self._volume
+
+    @property
+    def value(self) -> Decimal | None:
+        """Current VWAP, or ``None`` while no volume has traded."""
+        if self._volume <= 0:
+            return None
+        return self._pv / Decimal(self._volume)
+
+    def update(self, price: Decimal, volume: int) -> Decimal | None:
+        """Add ``volume`` traded at ``price`` and return the new VWAP."""
+        if volume < 0:
+            raise ValueError("volume must be non-negative")
+        if volume:
+            self._pv += price * Decimal(volume)
+            self._volume += volume
+        return self.value
+
+    def update_bar(self, bar: Bar) -> Decimal | None:
+        """Add one bar's typical price ``(H+L+C)/3`` weighted by its volume."""
+        if bar.volume < 0:
+            raise ValueError("bar volume must be non-negative")
+        typical = (bar.high + bar.low + bar.close) / _THREE
+        return self.update(typical, bar.volume)
+
+    def update_cumulative(self, price: Decimal, cum_volume: int) -> Decimal | None:
+        """Add the volume printed since the previous call at ``price``.
+
+        ``cum_volume`` is the feed's cumulative session volume. The first
+        call only records the baseline; a drop in cumulative volume (feed
+        restart) re-baselines without adding anything.
+        """
+        last = self._last_cum_volume
+        self._last_cum_volume = cum_volume
+        if last is not None and cum_volume > last:
+            return self.update(price, cum_volume - last)
+        return self.value
+
+    def reset(self) -> None:
+        """Zero the accumulators (session boundary)."""
+        self._pv = Decimal(0)
+        self._volume = 0
+        self._last_cum_volume = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-safe copy of the accumulators, for strategy checkpoints."""
+        return {
+            "pv": str(self._pv),
+            "volume": self._volume,
+            "last_cum_volume": self._last_cum_volume,
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Replace the accumulators with ones captured by :meth:`snapshot`."""
+        self._pv = Decimal(state["pv"])
+        self._volume = int(state["volume"])
+        last = state["last_cum_volume"]
+        self._last_cum_volume = None if last is None else int(last)
@@ -0,0 +1,25 @@
+"""Option pricing for the alpha-kite engine.
+
+Black-Scholes prices and greeks (scalar and whole-chain), a vectorized
+implied-vol solver with greeks backfill for quotes that arrive without
+them, and per-expiry volatility smiles. Everything here is synchronous
+NumPy over floats; callers convert to and from ``Decimal`` at the edge.
+Nothing here performs I/O.
+"""
+
+from __future__ import annotations
+
+from engine.pricing.black_scholes import ChainGreeks, bs_chain, bs_greeks, bs_price
+from engine.pricing.iv_solver import backfill_greeks, implied_vol
+from engine.pricing.smile import VolSmile, fit_smiles
+
+__all__ = [
+    "ChainGreeks",
+    "VolSmile",
+    "backfill_greeks",
+    "bs_chain",
+    "bs_greeks",
+    "bs_price",
+    "fit_smiles",
+    "implied_vol",
+]
@@ -0,0 +1,173 @@
+"""Black-Scholes prices and greeks, one contract at a time or a chain at once.
+
+`bs_price` / `bs_greeks` are the scalar reference. `bs_chain` prices a
+batch in one NumPy pass: d1/d2, the normal CDFs and the discount factor
+are computed once per contract and shared by the price and every greek.
+Greeks use the quoting units of ``OptionQuote``: theta per calendar day,
+vega per vol point.
+
+Expiries settle at `expiry_datetime` (4pm ET, as 20:00 UTC).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+
+import numpy as np
+import numpy.typing as npt
+from contracts.data_feed import OptionRight
+
+# 4pm ET = 20:00 UTC during DST (close enough for v1 — the contract treats
+# expiry resolution as best-effort; no DST gymnastics here).
+EXPIRY_UTC_HOUR = 20
+SECONDS_PER_YEAR = 365 * 86400
+MIN_T_SECONDS = 60
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+FloatArray = npt.NDArray[np.float64]
+
+
+def expiry_datetime(expiry: date) -> datetime:
+    return datetime.combine(expiry, time(hour=EXPIRY_UTC_HOUR, tzinfo=UTC))
+
+
+def seconds_to_expiry(expiry: date, now: datetime, bucket: int = 1) -> int:
+    """Whole seconds from ``now`` to expiry, floored to ``bucket``, and at
+    least `MIN_T_SECONDS` (an expired contract still prices)."""
+    ref = now if now.tzinfo is not None else now.replace(tzinfo=UTC)
+    seconds = (expiry_datetime(expiry) - ref).total_seconds()
+    return max(int(seconds // bucket) * bucket, MIN_T_SECONDS)
+
+
+def to_decimal(value: float) -> Decimal:
+    """A model float as a quote ``Decimal``, rounded to 6 places."""
+    return Decimal(str(round(value, 6)))
+
+
+def norm_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT_2))
+
+
+def _norm_pdf(x: float) -> float:
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+def _bs_d1_d2(s: float, k: float, t: float, r: float, sigma: float) -> tuple[float, float]:
+    if s <= 0 or k <= 0 or t <= 0 or sigma <= 0:
+        raise ValueError("Black-Scholes inputs must be strictly positive")
+    d1 = (math.log(s / k) + (r + 0.5 * sigma * sigma) * t) / (sigma * math.sqrt(t))
+    d2 = d1 - sigma * math.sqrt(t)
+    return d1, d2
+
+
+def bs_price(
+    s: float, k: float, t: float, r: float, sigma: float, right: OptionRight
+) -> float:
+    d1, d2 = _bs_d1_d2(s, k, t, r, sigma)
+    if right == "C":
+        return s * norm_cdf(d1) - k * math.exp(-r * t) * norm_cdf(d2)
+    return k * math.exp(-r * t) * norm_cdf(-d2) - s * norm_cdf(-d1)
+
+
+def bs_greeks(
+    s: float, k: float, t: float, r: float, sigma: float, right: OptionRight
+) -> tuple[float, float, float, float]:
+    """Return (delta, gamma, theta_per_day, vega_per_1pct)."""
+    d1, d2 = _bs_d1_d2(s, k, t, r, sigma)
+    pdf_d1 = _norm_pdf(d1)
+    sqrt_t = math.sqrt(t)
+    gamma = pdf_d1 / (s * sigma * sqrt_t)
+    vega = s * pdf_d1 * sqrt_t  # per 1.00 change in sigma
+    if right == "C":
+        delta = norm_cdf(d1)
+        theta = (
+            -(s * pdf_d1 * sigma) / (2 * sqrt_t)
+            - r * k * math.exp(-r * t) * norm_cdf(d2)
+        )
+    else:
+        delta = norm_cdf(d1) - 1.0
+        theta = (
+            -(s * pdf_d1 * sigma) / (2 * sqrt_t)
+            + r * k * math.exp(-r * t) * norm_cdf(-d2)
+        )
+    return delta, gamma, theta / 365.0, vega / 100.0
+
+
+def _norm_cdf_array(x: FloatArray) -> FloatArray:
+    # NumPy has no erf; math.erf over the (short) chain keeps the batch CDF
+    # identical to the scalar one above.
+    return 0.5 * (1.0 + np.array(list(map(math.erf, (x * _INV_SQRT_2).tolist()))))
+
+
+def _positive(value: float | FloatArray) -> bool:
+    if isinstance(value, np.ndarray):
+        return bool((value > 0).all())
+    return value > 0
+
+
+@dataclass(frozen=True)
+class ChainGreeks:
+    """Black-Scholes price and greeks per contract (same units as `bs_greeks`)."""
+
+    price: FloatArray
+    delta: FloatArray
+    gamma: FloatArray
+    theta: FloatArray  # per day
+    vega: FloatArray  # per 1 vol point
+
+
+def bs_chain(
+    s: float | FloatArray,
+    k: FloatArray,
+    t: float | FloatArray,
+    r: float,
+    sigma: float | FloatArray,
+    *,
+    is_call: npt.NDArray[np.bool_],
+) -> ChainGreeks:
+    """Price a batch of contracts in one pass.
+
+    ``k`` and ``is_call`` have one entry per contract; ``s``, ``t`` and
+    ``sigma`` are either scalars or per-contract arrays.
+    """
+    if not (_positive(s) and _positive(k) and _positive(t) and _positive(sigma)):
+        raise ValueError("Black-Scholes inputs must be strictly positive")
+    sqrt_t = np.sqrt(t)
+    vol_t = sigma * sqrt_t
+    d1 = (np.log(s / k) + (r + 0.5 * sigma * sigma) * t) / vol_t
+    # Calls use N(d1), N(d2); puts N(-d1), N(-d2) with the signs flipped.
+    sign = np.where(is_call, 1.0, -1.0)
+    n = len(sign)
+    cdf = _norm_cdf_array(np.concatenate((sign * d1, sign * (d1 - vol_t))))
+    n_d1, n_d2 = cdf[:n], cdf[n:]
+    k_n_d2 = k * np.exp(-r * t) * n_d2
+    pdf_d1 = _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+    s_pdf = s * pdf_d1
+    price = sign * (s * n_d1 - k_n_d2)
+    theta = (-0.5 * sigma / sqrt_t) * s_pdf - r * sign * k_n_d2
+    return ChainGreeks(
+        price=price,
+        delta=np.where(is_call, n_d1, -n_d1),  # put: N(d1) - 1 = -N(-d1)
+        gamma=pdf_d1 / (s * vol_t),
+        theta=theta / 365.0,
+        vega=s_pdf * sqrt_t / 100.0,
+    )
+
+
+__all__ = [
+    "EXPIRY_UTC_HOUR",
+    "MIN_T_SECONDS",
+    "SECONDS_PER_YEAR",
+    "ChainGreeks",
+    "FloatArray",
+    "bs_chain",
+    "bs_greeks",
+    "bs_price",
+    "expiry_datetime",
+    "norm_cdf",
+    "seconds_to_expiry",
+]
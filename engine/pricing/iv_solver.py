@@ -0,0 +1,151 @@
+"""Implied volatility for a whole chain in one vectorized solve.
+
+`implied_vol` inverts `bs_chain` for every contract at once. Each
+iteration prices only the contracts still unsolved, takes a Newton step
+on vega and falls back to bisecting a ``[lo, hi]`` bracket whenever the
+step would leave it (the safeguard Brent's method uses). Newton converges
+in a handful of iterations near the money; the bracket keeps deep wings,
+where vega vanishes, from diverging.
+
+`backfill_greeks` uses it to fill the iv and greeks a quote is missing
+(IBKR sends none until its model greeks arrive) from the bid/ask mid.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import numpy.typing as npt
+from contracts.data_feed import OptionQuote
+
+from engine.pricing.black_scholes import (
+    SECONDS_PER_YEAR,
+    FloatArray,
+    bs_chain,
+    seconds_to_expiry,
+    to_decimal,
+)
+
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+_GREEK_FIELDS = ("iv", "delta", "gamma", "theta", "vega")
+
+
+def implied_vol(
+    price: FloatArray,
+    s: float | FloatArray,
+    k: FloatArray,
+    t: float | FloatArray,
+    r: float,
+    *,
+    is_call: npt.NDArray[np.bool_],
+    lo: float = 1e-4,
+    hi: float = 5.0,
+    tol: float = 1e-8,
+    max_iter: int = 64,
+) -> FloatArray:
+    """Black-Scholes implied vol per contract, NaN where there is none.
+
+    Arguments broadcast like `bs_chain`'s; ``price`` has one entry per
+    contract. A contract gets NaN when its price is outside the
+    no-arbitrage bounds, is not reached by a vol in ``[lo, hi]``, or has
+    not converged to within ``tol`` after ``max_iter`` iterations.
+    """
+    k = np.asarray(k, dtype=np.float64)
+    n = len(k)
+    price = np.asarray(price, dtype=np.float64)
+    s = np.broadcast_to(np.asarray(s, dtype=np.float64), n)
+    t = np.broadcast_to(np.asarray(t, dtype=np.float64), n)
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=np.bool_), n)
+    if not ((s > 0).all() and (k > 0).all() and (t > 0).all()):
+        raise ValueError("Black-Scholes inputs must be strictly positive")
+
+    disc_k = k * np.exp(-r * t)
+    lower = np.where(is_call, np.maximum(s - disc_k, 0.0), np.maximum(disc_k - s, 0.0))
+    upper = np.where(is_call, s, disc_k)
+    with np.errstate(invalid="ignore"):
+        active = np.isfinite(price) & (price > lower) & (price < upper)
+    sigma = np.full(n, np.nan)
+    if not active.any():
+        return sigma
+    lo_v = np.full(n, lo)
+    hi_v = np.full(n, hi)
+    idx = np.flatnonzero(active)
+    # Start from the Brenner-Subrahmanyam ATM approximation.
+    sigma[idx] = np.clip(price[idx] / s[idx] * _SQRT_2PI / np.sqrt(t[idx]), lo, hi)
+
+    for _ in range(max_iter):
+        idx = np.flatnonzero(active)
+        if not len(idx):
+            break
+        sig = sigma[idx]
+        g = bs_chain(s[idx], k[idx], t[idx], r, sig, is_call=is_call[idx])
+        diff = g.price - price[idx]
+        # Price rises with vol, so the sign of the error moves one bracket end.
+        above = diff > 0
+        hi_v[idx] = np.where(above, sig, hi_v[idx])
+        lo_v[idx] = np.where(above, lo_v[idx], sig)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = sig - diff / (g.vega * 100.0)
+        inside = (step > lo_v[idx]) & (step < hi_v[idx])
+        done = (np.abs(diff) <= tol) | (hi_v[idx] - lo_v[idx] <= tol * 1e-4)
+        sigma[idx] = np.where(
+            done, sig, np.where(inside, step, 0.5 * (lo_v[idx] + hi_v[idx]))
+        )
+        active[idx] = ~done
+    sigma[active] = np.nan
+    # A bracket end that never moved means the price needs a vol beyond it.
+    with np.errstate(invalid="ignore"):
+        sigma[(sigma <= lo) | (sigma >= hi)] = np.nan
+    return sigma
+
+
+def backfill_greeks(
+    quotes: Sequence[OptionQuote],
+    spot: Decimal,
+    now: datetime,
+    risk_free_rate: float = 0.05,
+) -> list[OptionQuote]:
+    """``quotes`` (one underlying, priced at ``spot``) with missing iv and
+    greeks solved from their bid/ask mids in one batch.
+
+    Only fields that are None are filled; a quote that is complete, has no
+    two-sided market, or whose mid has no implied vol is returned as is.
+    """
+    out = list(quotes)
+    todo = [
+        i for i, q in enumerate(out)
+        if q.bid > 0 and q.ask >= q.bid
+        and any(getattr(q, f) is None for f in _GREEK_FIELDS)
+    ]
+    if not todo or spot <= 0:
+        return out
+    rows = [out[i] for i in todo]
+    k = np.array([float(q.strike) for q in rows])
+    t = np.array([seconds_to_expiry(q.expiry, now) for q in rows]) / SECONDS_PER_YEAR
+    is_call = np.array([q.right == "C" for q in rows])
+    mid = np.array([float(q.mid) for q in rows])
+    s = float(spot)
+    iv = implied_vol(mid, s, k, t, risk_free_rate, is_call=is_call)
+    solved = np.flatnonzero(np.isfinite(iv))
+    if not len(solved):
+        return out
+    g = bs_chain(
+        s, k[solved], t[solved], risk_free_rate, iv[solved], is_call=is_call[solved],
+    )
+    columns = np.stack((iv[solved], g.delta, g.gamma, g.theta, g.vega), axis=1).tolist()
+    for j, values in zip(solved.tolist(), columns, strict=True):
+        q = rows[j]
+        update = {
+            f: to_decimal(v)
+            for f, v in zip(_GREEK_FIELDS, values, strict=True)
+            if getattr(q, f) is None
+        }
+        out[todo[j]] = q.model_copy(update=update)
+    return out
+
+
+__all__ = ["backfill_greeks", "implied_vol"]
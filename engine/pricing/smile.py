@@ -0,0 +1,103 @@
+"""Per-expiry volatility smiles fitted to a chain's implied vols.
+
+A `VolSmile` is a polynomial (quadratic by default) in log-moneyness
+``x = ln(K / F)``, held flat beyond the strikes it was fitted on. Being
+expressed in moneyness, it moves with the forward: a synthetic chain
+priced from it keeps the skew it was fitted with as the underlying
+drifts. `fit_smiles` fits one per expiry from out-of-the-money quotes,
+solving any missing iv from the mid.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+from contracts.data_feed import OptionQuote
+
+from engine.pricing.black_scholes import SECONDS_PER_YEAR, FloatArray, seconds_to_expiry
+from engine.pricing.iv_solver import implied_vol
+
+_MIN_VOL = 1e-3
+
+
+@dataclass(frozen=True)
+class VolSmile:
+    """Implied vol as ``polyval(coeffs, clip(ln(K / F), x_min, x_max))``."""
+
+    coeffs: tuple[float, ...]  # highest power first
+    x_min: float
+    x_max: float
+
+    @classmethod
+    def flat(cls, sigma: float) -> VolSmile:
+        return cls((float(sigma),), 0.0, 0.0)
+
+    @classmethod
+    def fit(
+        cls, strikes: FloatArray, ivs: FloatArray, forward: float, *, degree: int = 2
+    ) -> VolSmile:
+        """Least-squares fit through the finite ``ivs``; the degree drops
+        to what the number of points supports."""
+        x = np.log(np.asarray(strikes, dtype=np.float64) / forward)
+        ivs = np.asarray(ivs, dtype=np.float64)
+        ok = np.isfinite(ivs)
+        x, ivs = x[ok], ivs[ok]
+        if not len(x):
+            raise ValueError("no finite implied vols to fit a smile to")
+        deg = min(degree, len(np.unique(x)) - 1)
+        coeffs = np.polyfit(x, ivs, deg) if deg > 0 else np.array([ivs.mean()])
+        return cls(tuple(coeffs.tolist()), float(x.min()), float(x.max()))
+
+    def vol(self, strikes: FloatArray, forward: float | FloatArray) -> FloatArray:
+        x = np.clip(np.log(strikes / forward), self.x_min, self.x_max)
+        return np.maximum(np.polyval(self.coeffs, x), _MIN_VOL)
+
+
+def fit_smiles(
+    quotes: Sequence[OptionQuote],
+    spot: Decimal,
+    now: datetime,
+    risk_free_rate: float = 0.05,
+    *,
+    degree: int = 2,
+) -> dict[date, VolSmile]:
+    """One `VolSmile` per expiry of ``quotes`` (one underlying at ``spot``).
+
+    Fitted on the out-of-the-money side of each strike (puts below the
+    forward, calls at or above it), where the market is most liquid.
+    Quotes without an iv are solved from their mid in one batch; an
+    expiry with no usable iv gets no smile.
+    """
+    s = float(spot)
+    by_expiry: dict[date, list[OptionQuote]] = {}
+    for q in quotes:
+        by_expiry.setdefault(q.expiry, []).append(q)
+    smiles: dict[date, VolSmile] = {}
+    for expiry, rows in by_expiry.items():
+        t = seconds_to_expiry(expiry, now) / SECONDS_PER_YEAR
+        forward = s * math.exp(risk_free_rate * t)
+        rows = [
+            q for q in rows
+            if (q.right == "C") == (float(q.strike) >= forward) and q.bid > 0
+        ]
+        if not rows:
+            continue
+        k = np.array([float(q.strike) for q in rows])
+        ivs = np.array([np.nan if q.iv is None else float(q.iv) for q in rows])
+        missing = np.flatnonzero(np.isnan(ivs))
+        if len(missing):
+            ivs[missing] = implied_vol(
+                np.array([float(rows[i].mid) for i in missing]), s, k[missing], t,
+                risk_free_rate, is_call=np.array([rows[i].right == "C" for i in missing]),
+            )
+        if np.isfinite(ivs).any():
+            smiles[expiry] = VolSmile.fit(k, ivs, forward, degree=degree)
+    return smiles
+
+
+__all__ = ["VolSmile", "fit_smiles"]
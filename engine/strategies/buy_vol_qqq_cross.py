@@ -15,7 +15,7 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime, time, timedelta
 from decimal import Decimal
-from typing import Literal
+from typing import Any, Literal
 
 from contracts.broker import OrderIntent, OrderSide, OrderType
 from contracts.data_feed import Bar, OptionContract, OptionQuote
@@ -26,44 +26,8 @@ from contracts.strategy import (
     StrategyDecision,
 )
 
-
-def _sma(closes: list[Decimal], period: int) -> Decimal | None:
-    """Local trailing simple moving average — keeps the strategy parallelizable.
-
-    Returns ``None`` when there are fewer than ``period`` samples.
-    """
-
-    if period <= 0:
-        raise ValueError("period must be positive")
-    if len(closes) < period:
-        return None
-    window = closes[-period:]
-    return sum(window, Decimal(0)) / Decimal(period)
-
-
-def _session_vwap(buffer: list[Bar]) -> Decimal | None:
-    """Cumulative session VWAP from a bar buffer (typical-price weighted)."""
-
-    if not buffer:
-        return None
-    weighted = Decimal(0)
-    volume = Decimal(0)
-    for bar in buffer:
-        typical = (bar.high + bar.low + bar.close) / Decimal(3)
-        v = Decimal(bar.volume)
-        weighted += typical * v
-        volume += v
-    if volume == 0:
-        return None
-    return weighted / volume
-
-
-def _bar_vwap(bar: Bar, buffer: list[Bar]) -> Decimal | None:
-    """Prefer the broker-supplied bar VWAP; else compute the session VWAP."""
-
-    if bar.vwap is not None:
-        return bar.vwap
-    return _session_vwap(buffer)
+from engine.indicators.sma import RollingSMA
+from engine.indicators.vwap import SessionVWAP
 
 
 class _OpenLeg:
@@ -133,7 +97,9 @@ class BuyVolQQQCrossStrategy:
         self.session_open = session_open
         self.session_close = session_close
 
-        self._bars: list[Bar] = []
+        # Streaming SMA/VWAP state: O(1) per bar however long the session.
+        self._sma = RollingSMA(sma_period)
+        self._vwap = SessionVWAP()
         self._prev_diff: Decimal | None = None
         self._open_legs: dict[tuple[str, str, str, str], _OpenLeg] = {}
 
@@ -148,7 +114,8 @@ class BuyVolQQQCrossStrategy:
         intentionally preserved; the caller decides whether to flatten
         them across sessions.
         """
-        self._bars.clear()
+        self._sma.reset()
+        self._vwap.reset()
         self._prev_diff = None
 
     # ------------------------------------------------------------------ helpers
@@ -184,17 +151,6 @@ class BuyVolQQQCrossStrategy:
             return False
         return True
 
-    def _pick_atm_quote(
-        self,
-        quotes: list[OptionQuote],
-        underlying_close: Decimal,
-        right: Literal["C", "P"],
-    ) -> OptionQuote | None:
-        candidates = [q for q in quotes if q.right == right and q.underlying == self.symbol]
-        if not candidates:
-            return None
-        return min(candidates, key=lambda q: abs(q.strike - underlying_close))
-
     def _make_entry_intent(
         self,
         quote: OptionQuote,
@@ -251,6 +207,26 @@ class BuyVolQQQCrossStrategy:
         )
         self._open_legs[self._contract_key(intent.option)] = leg
 
+    def _update_features(self, bar: Bar) -> tuple[Decimal, Decimal, Decimal] | None:
+        """Fold ``bar`` into SMA/VWAP state; return ``(sma, vwap, sma - vwap)``.
+
+        Returns ``None`` (and leaves the previous diff untouched) while the
+        SMA or VWAP is still warming up.
+        """
+        sma = self._sma.update(bar.close)
+        session_vwap = self._vwap.update_bar(bar)
+        if sma is None:
+            return None
+
+        # Prefer the feed-supplied bar VWAP; else the locally accumulated one.
+        vwap = bar.vwap if bar.vwap is not None else session_vwap
+        if vwap is None:
+            return None
+
+        diff = sma - vwap
+        self._prev_diff = diff
+        return sma, vwap, diff
+
     # ------------------------------------------------------------------ on_bar
 
     def on_bar(self, ctx: StrategyContext) -> StrategyDecision:
@@ -258,27 +234,16 @@ class BuyVolQQQCrossStrategy:
             return StrategyDecision()
 
         bar = ctx.last_bar
-        # Only buffer bars for our configured symbol — keep the strategy
+        # Only track bars for our configured symbol — keep the strategy
         # robust if upstream multiplexes feeds.
         if bar.symbol != self.symbol:
             return StrategyDecision()
 
-        self._bars.append(bar)
-
-        sma = _sma([b.close for b in self._bars], self.sma_period)
-        if sma is None:
-            return StrategyDecision()
-
-        vwap = _bar_vwap(bar, self._bars)
-        if vwap is None:
-            return StrategyDecision()
-
-        diff = sma - vwap
         prev_diff = self._prev_diff
-        self._prev_diff = diff
-
-        if prev_diff is None:
+        features = self._update_features(bar)
+        if features is None or prev_diff is None:
             return StrategyDecision()
+        sma, vwap, diff = features
 
         cross_up = prev_diff < 0 <= diff
         cross_down = prev_diff > 0 >= diff
@@ -314,7 +279,7 @@ class BuyVolQQQCrossStrategy:
         intents: list[OrderIntent] = []
         if self.mode == "directional":
             right: Literal["C", "P"] = "C" if cross_up else "P"
-            atm = self._pick_atm_quote(ctx.option_quotes, bar.close, right)
+            atm = ctx.chain_for(self.symbol).nearest(bar.close, right)
             if atm is None:
                 # No tradable contract pre-staged — emit signal only.
                 return StrategyDecision(signals=[signal])
@@ -322,8 +287,9 @@ class BuyVolQQQCrossStrategy:
             intents.append(intent)
             self._register_leg(intent, atm.mid, ctx.now)
         else:  # straddle
-            call = self._pick_atm_quote(ctx.option_quotes, bar.close, "C")
-            put = self._pick_atm_quote(ctx.option_quotes, bar.close, "P")
+            chain = ctx.chain_for(self.symbol)
+            call = chain.nearest(bar.close, "C")
+            put = chain.nearest(bar.close, "P")
             if call is None or put is None:
                 return StrategyDecision(signals=[signal])
             for q in (call, put):
@@ -339,10 +305,7 @@ class BuyVolQQQCrossStrategy:
         if not self._open_legs:
             return StrategyDecision()
 
-        # Index incoming quotes by contract identity for O(1) lookup.
-        quote_index: dict[tuple[str, str, str, str], OptionQuote] = {}
-        for q in ctx.option_quotes:
-            quote_index[self._contract_key(q.contract())] = q
+        chain = ctx.chain_for(self.symbol)
 
         time_stop_now = self._within_time_stop(ctx.now)
 
@@ -352,7 +315,7 @@ class BuyVolQQQCrossStrategy:
 
         # Iterate over a stable snapshot so we can mutate _open_legs after.
         for key, leg in self._open_legs.items():
-            quote = quote_index.get(key)
+            quote = chain.find(leg.contract)
             current_mid = quote.mid if quote is not None else None
 
             reason: str | None = None
@@ -399,5 +362,50 @@ class BuyVolQQQCrossStrategy:
 
         return StrategyDecision(signals=signals, intents=intents)
 
+    # ----------------------------------------------------------- checkpointing
+
+    def warm_bar(self, bar: Bar) -> None:
+        """Replay a recorded bar into SMA/VWAP/cross state without emitting.
+
+        Used to catch up after a checkpoint restore.
+        """
+        if bar.symbol == self.symbol:
+            self._update_features(bar)
+
+    def snapshot_state(self) -> dict[str, Any]:
+        """JSON-safe copy of every piece of mutable state, for checkpoints."""
+        return {
+            "sma": self._sma.snapshot(),
+            "vwap": self._vwap.snapshot(),
+            "prev_diff": None if self._prev_diff is None else str(self._prev_diff),
+            "open_legs": [
+                {
+                    "contract": leg.contract.model_dump(mode="json"),
+                    "quantity": leg.quantity,
+                    "entry_mid": str(leg.entry_mid),
+                    "entry_intent_id": str(leg.entry_intent_id),
+                    "entry_time": leg.entry_time.isoformat(),
+                }
+                for leg in self._open_legs.values()
+            ],
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Load state captured by :meth:`snapshot_state`."""
+        self._sma.restore(state["sma"])
+        self._vwap.restore(state["vwap"])
+        raw_diff = state["prev_diff"]
+        self._prev_diff = None if raw_diff is None else Decimal(raw_diff)
+        self._open_legs = {}
+        for raw in state["open_legs"]:
+            contract = OptionContract.model_validate(raw["contract"])
+            self._open_legs[self._contract_key(contract)] = _OpenLeg(
+                contract=contract,
+                quantity=int(raw["quantity"]),
+                entry_mid=Decimal(raw["entry_mid"]),
+                entry_intent_id=uuid.UUID(raw["entry_intent_id"]),
+                entry_time=datetime.fromisoformat(raw["entry_time"]),
+            )
+
 
 __all__ = ["BuyVolQQQCrossStrategy"]
@@ -4,7 +4,7 @@ Differences from BuyVolQQQCrossStrategy (bar version):
 
 1. **Input**: every NBBO tick (Quote), not 1-minute bar closes.
 2. **SMA**: mean of last N 1-second mid-price snapshots (default N=9). The
-   strategy snaps each second's last seen mid into a fixed-size deque, so
+   strategy snaps each second's last seen mid into a rolling window, so
    "9-second SMA on tick data" rather than "SMA of 9 ticks".
 3. **VWAP**: cumulative session VWAP from trade prints. Each tick that
    carries a fresh `last` price + an increase in cumulative `volume` adds
@@ -21,6 +21,15 @@ Differences from BuyVolQQQCrossStrategy (bar version):
 6. **Exits unchanged**: profit_target_pct / stop_loss_pct / time_stop work
    exactly like the bar strategy on `on_option_quote`.
 
+SMA/VWAP/diff-sign state lives in a :class:`engine.features.TickFeatureEngine`.
+Pass a shared ``features`` engine to run several strategies on one tick
+stream for the cost of one feature update; otherwise the strategy builds
+a private one. With ``fixed_point=True`` that private engine keeps its
+state in integer ten-thousandths (see :mod:`engine.indicators.fixed_point`)
+instead of Decimal. Signals and intents are identical; only the per-tick
+cost changes. Ticks priced finer than 1/10000 raise ``ValueError`` in that
+mode.
+
 The strategy is deterministic: every clock read flows through ctx.now,
 random uuids flow through uuid.uuid4 (callers monkeypatch in tests).
 """
@@ -28,14 +37,13 @@ random uuids flow through uuid.uuid4 (callers monkeypatch in tests).
 from __future__ import annotations
 
 import uuid
-from collections import deque
 from dataclasses import dataclass
-from datetime import UTC, datetime, time, timedelta
+from datetime import UTC, date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Literal
+from typing import Any, Literal
 
 from contracts.broker import OrderIntent, OrderSide, OrderType
-from contracts.data_feed import OptionContract, OptionQuote
+from contracts.data_feed import OptionContract, Quote
 from contracts.strategy import (
     Signal,
     SignalDirection,
@@ -43,6 +51,8 @@ from contracts.strategy import (
     StrategyDecision,
 )
 
+from engine.features.tick_cross import TickFeatureEngine
+
 _DEFAULT_OPEN = time(13, 30, tzinfo=UTC)   # 9:30am ET in UTC (DST)
 _DEFAULT_CLOSE = time(20, 0, tzinfo=UTC)   # 4pm ET in UTC (DST)
 
@@ -74,6 +84,9 @@ class BuyVolQQQCrossTickStrategy:
         entry_delay_minutes_after_open: int = 10,
         session_open: time = _DEFAULT_OPEN,
         session_close: time = _DEFAULT_CLOSE,
+        *,
+        fixed_point: bool = False,
+        features: TickFeatureEngine | None = None,
     ) -> None:
         if sma_window_seconds <= 0:
             raise ValueError("sma_window_seconds must be positive")
@@ -83,6 +96,8 @@ class BuyVolQQQCrossTickStrategy:
             raise ValueError("entry_delay_minutes_after_open must be >= 0")
         if mode not in ("directional", "straddle"):
             raise ValueError(f"unknown mode: {mode!r}")
+        if features is not None and fixed_point and not features.fixed_point:
+            raise ValueError("fixed_point=True needs a fixed-point features engine")
 
         self.symbol = symbol
         self.sma_window_seconds = sma_window_seconds
@@ -96,17 +111,12 @@ class BuyVolQQQCrossTickStrategy:
         self.session_open = session_open
         self.session_close = session_close
 
-        # Per-second mid samples: maps second-truncated-ts -> last seen mid
-        self._sec_samples: deque[tuple[datetime, Decimal]] = deque(
-            maxlen=sma_window_seconds
-        )
-        self._cur_sec: datetime | None = None
-        self._cur_sec_mid: Decimal | None = None
-
-        # Session VWAP state
-        self._vwap_pv: Decimal = Decimal("0")
-        self._vwap_v: Decimal = Decimal("0")
-        self._last_volume: Decimal | None = None
+        # SMA over 1-second mid snapshots, session VWAP and their diff sign,
+        # possibly shared with other strategies on the same tick stream.
+        if features is None:
+            features = TickFeatureEngine(fixed_point=fixed_point)
+        self.fixed_point = features.fixed_point
+        self._features = features.subscribe(symbol, sma_window_seconds)
         self._session_date: object | None = None  # ctx.now.date() of first tick
 
         # Cross state
@@ -136,46 +146,16 @@ class BuyVolQQQCrossTickStrategy:
         if self._session_date is None or tick_date != self._session_date:
             self._reset_session(tick_date)
 
-        # ─── update VWAP from incremental volume * last trade price ───
-        if tick.last is not None and tick.volume is not None:
-            cur_v = Decimal(tick.volume)
-            if self._last_volume is None:
-                self._last_volume = cur_v
-            delta_v = cur_v - self._last_volume
-            if delta_v > 0:
-                self._vwap_pv += Decimal(tick.last) * delta_v
-                self._vwap_v += delta_v
-            self._last_volume = cur_v
-
-        # ─── 1-sec snap of mid-price ──────────────────────────────────
-        sec_ts = tick.timestamp.replace(microsecond=0)
-        mid = tick.mid
-        if self._cur_sec is None or sec_ts != self._cur_sec:
-            # Closing the previous second: record its last-seen mid into
-            # the rolling window, then start a new second.
-            if self._cur_sec is not None and self._cur_sec_mid is not None:
-                self._sec_samples.append((self._cur_sec, self._cur_sec_mid))
-            self._cur_sec = sec_ts
-            self._cur_sec_mid = mid
-        else:
-            # Mid-second update: keep the latest mid for this second
-            self._cur_sec_mid = mid
-
-        # ─── compute SMA, VWAP, cross ─────────────────────────────────
-        sma = self._sma()
-        vwap = self._vwap()
+        new_sign = self._features.update(tick)
         signals: list[Signal] = []
         intents: list[OrderIntent] = []
 
         # ─── exits: drive on every tick that updates a held option ───
         intents.extend(self._exit_intents(ctx))
 
-        if sma is None or vwap is None:
+        if new_sign is None:
             return StrategyDecision(signals=signals, intents=intents)
 
-        diff = sma - vwap
-        new_sign = 1 if diff > 0 else (-1 if diff < 0 else 0)
-
         # Cross detection — but only EMIT signals + arm pending entries
         # inside the configured trade window. State (_last_diff_sign etc.)
         # still tracks so charting/audit data remains continuous.
@@ -190,6 +170,7 @@ class BuyVolQQQCrossTickStrategy:
                 if new_sign > 0
                 else SignalDirection.LONG_VOL_DOWN
             )
+            sma, vwap = self._features.values()
             signals.append(
                 Signal(
                     name=self.name,
@@ -224,37 +205,87 @@ class BuyVolQQQCrossTickStrategy:
         """Drive exits when held option quotes update."""
         return StrategyDecision(signals=[], intents=self._exit_intents(ctx))
 
+    # ───────────────────────────────────────────────── checkpointing ────
+
+    def warm_tick(self, tick: Quote) -> None:
+        """Replay a recorded tick into indicator and cross state only.
+
+        Used to catch up after a checkpoint restore: nothing is emitted,
+        no entry is armed, and a pending entry whose confirmation window
+        lapses during the replay is dropped rather than fired late.
+        """
+        if tick.symbol != self.symbol:
+            return
+        tick_date = tick.timestamp.date()
+        if self._session_date is None or tick_date != self._session_date:
+            self._reset_session(tick_date)
+        new_sign = self._features.update(tick)
+        if new_sign is None:
+            return
+        if self._pending is not None:
+            pending_dir, queued_at = self._pending
+            pending_sign = 1 if pending_dir == SignalDirection.LONG_VOL_UP else -1
+            elapsed = (tick.timestamp - queued_at).total_seconds()
+            if new_sign not in (0, pending_sign) or elapsed >= self.confirmation_seconds:
+                self._pending = None
+        if new_sign != 0:
+            self._last_diff_sign = new_sign
+
+    def snapshot_state(self) -> dict[str, Any]:
+        """JSON-safe copy of every piece of mutable state, for checkpoints."""
+        pending = None
+        if self._pending is not None:
+            pending = [self._pending[0].value, self._pending[1].isoformat()]
+        return {
+            "features": self._features.engine.snapshot(),
+            "session_date": (
+                None if self._session_date is None else str(self._session_date)
+            ),
+            "last_diff_sign": self._last_diff_sign,
+            "pending": pending,
+            "open_legs": [
+                {
+                    "contract": leg.contract.model_dump(mode="json"),
+                    "entry_mid": str(leg.entry_mid),
+                    "entry_time": leg.entry_time.isoformat(),
+                    "side": leg.side.value,
+                }
+                for leg in self._open_legs.values()
+            ],
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Load state captured by :meth:`snapshot_state`."""
+        self._features.engine.restore(state["features"])
+        raw_date = state["session_date"]
+        self._session_date = None if raw_date is None else date.fromisoformat(raw_date)
+        self._last_diff_sign = int(state["last_diff_sign"])
+        pending = state["pending"]
+        self._pending = (
+            None if pending is None
+            else (SignalDirection(pending[0]), datetime.fromisoformat(pending[1]))
+        )
+        self._open_legs = {}
+        for raw in state["open_legs"]:
+            contract = OptionContract.model_validate(raw["contract"])
+            self._open_legs[(contract.expiry, contract.strike, contract.right)] = _OpenLeg(
+                contract=contract,
+                entry_mid=Decimal(raw["entry_mid"]),
+                entry_time=datetime.fromisoformat(raw["entry_time"]),
+                side=OrderSide(raw["side"]),
+            )
+
     # ──────────────────────────────────────────────────────── private ───
 
     def _reset_session(self, tick_date) -> None:  # type: ignore[no-untyped-def]
-        self._sec_samples.clear()
-        self._cur_sec = None
-        self._cur_sec_mid = None
-        self._vwap_pv = Decimal("0")
-        self._vwap_v = Decimal("0")
-        self._last_volume = None
+        # SMA/VWAP state resets inside the features engine on the same
+        # date change; only the strategy's own cross/pending state is here.
         self._session_date = tick_date
         self._last_diff_sign = 0
         self._pending = None
         # NOTE: open_legs deliberately NOT cleared across sessions; positions
         # held overnight (rare for 0DTE but possible) keep their entry data.
 
-    def _sma(self) -> Decimal | None:
-        # Include the in-progress current second for responsiveness
-        samples = list(self._sec_samples)
-        if self._cur_sec is not None and self._cur_sec_mid is not None:
-            samples.append((self._cur_sec, self._cur_sec_mid))
-        if len(samples) < self.sma_window_seconds:
-            return None
-        recent = samples[-self.sma_window_seconds :]
-        total = sum((s[1] for s in recent), Decimal("0"))
-        return total / Decimal(self.sma_window_seconds)
-
-    def _vwap(self) -> Decimal | None:
-        if self._vwap_v <= 0:
-            return None
-        return self._vwap_pv / self._vwap_v
-
     def _gating_blocks_entry(self, ctx: StrategyContext) -> bool:
         if ctx.open_positions >= 1 or self._open_legs:
             return True
@@ -300,7 +331,7 @@ class BuyVolQQQCrossTickStrategy:
 
         intents: list[OrderIntent] = []
         for right in rights:
-            quote = self._pick_atm_quote(ctx.option_quotes, atm_strike, right)
+            quote = ctx.chain_for(self.symbol).get(atm_strike, right)
             if quote is None:
                 continue
             contract = OptionContract(
@@ -340,8 +371,9 @@ class BuyVolQQQCrossTickStrategy:
             return []
         intents: list[OrderIntent] = []
         cutoff = self._cutoff_time(ctx.now)
+        chain = ctx.chain_for(self.symbol)
         for key, leg in list(self._open_legs.items()):
-            quote = self._pick_atm_quote(ctx.option_quotes, leg.contract.strike, leg.contract.right)
+            quote = chain.find(leg.contract)
             mid = quote.mid if quote is not None else None
 
             reason: str | None = None
@@ -374,15 +406,6 @@ class BuyVolQQQCrossTickStrategy:
             del self._open_legs[key]
         return intents
 
-    @staticmethod
-    def _pick_atm_quote(
-        quotes: list[OptionQuote], strike: Decimal, right: str
-    ) -> OptionQuote | None:
-        for q in quotes:
-            if q.strike == strike and q.right == right:
-                return q
-        return None
-
     @staticmethod
     def _round_strike(price: Decimal) -> Decimal:
         # QQQ trades in $1 strikes; round half-up to integer.
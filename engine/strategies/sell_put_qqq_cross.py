@@ -10,7 +10,9 @@ Behavior summary
 1. Drives off NBBO ticks (``kind = "tick"``).
 2. Maintains a 9-second SMA of mid-price snapshots and a session VWAP from
    incremental trade volume — same logic as
-   :class:`engine.strategies.buy_vol_qqq_cross_tick.BuyVolQQQCrossTickStrategy`.
+   :class:`engine.strategies.buy_vol_qqq_cross_tick.BuyVolQQQCrossTickStrategy`,
+   and shared with it when both are handed the same
+   :class:`engine.features.TickFeatureEngine`.
 3. On a cross-down (SMA below VWAP) → sell ATM put-to-open (``side=SELL``).
    IBKR opens a short-put position from a SELL on a contract not currently
    held, so this works through the existing :class:`OrderIntent` shape.
@@ -43,13 +45,13 @@ each; the final 25 % runs.
 from __future__ import annotations
 
 import uuid
-from collections import deque
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, time, timedelta
+from datetime import UTC, date, datetime, time, timedelta
 from decimal import Decimal
+from typing import Any
 
 from contracts.broker import OrderIntent, OrderSide, OrderType
-from contracts.data_feed import OptionContract, OptionQuote
+from contracts.data_feed import OptionContract, Quote
 from contracts.strategy import (
     Signal,
     SignalDirection,
@@ -57,6 +59,8 @@ from contracts.strategy import (
     StrategyDecision,
 )
 
+from engine.features.tick_cross import TickFeatureEngine
+
 _DEFAULT_OPEN = time(13, 30, tzinfo=UTC)   # 9:30am ET DST
 _DEFAULT_CLOSE = time(20, 0, tzinfo=UTC)   # 4pm ET DST
 
@@ -106,6 +110,9 @@ class SellPutQQQCrossStrategy:
         entry_delay_minutes_after_open: int = 10,
         session_open: time = _DEFAULT_OPEN,
         session_close: time = _DEFAULT_CLOSE,
+        *,
+        fixed_point: bool = False,
+        features: TickFeatureEngine | None = None,
     ) -> None:
         if sma_window_seconds <= 0:
             raise ValueError("sma_window_seconds must be positive")
@@ -124,6 +131,8 @@ class SellPutQQQCrossStrategy:
             raise ValueError("each tier qty_fraction must be in (0, 1]")
         if sum(t.qty_fraction for t in tiers) > Decimal("1"):
             raise ValueError("tier qty_fractions must sum to <= 1.0")
+        if features is not None and fixed_point and not features.fixed_point:
+            raise ValueError("fixed_point=True needs a fixed-point features engine")
 
         self.symbol = symbol
         self.sma_window_seconds = sma_window_seconds
@@ -136,17 +145,12 @@ class SellPutQQQCrossStrategy:
         self.session_open = session_open
         self.session_close = session_close
 
-        # Per-second mid samples for SMA
-        self._sec_samples: deque[tuple[datetime, Decimal]] = deque(
-            maxlen=sma_window_seconds
-        )
-        self._cur_sec: datetime | None = None
-        self._cur_sec_mid: Decimal | None = None
-
-        # Session VWAP state
-        self._vwap_pv: Decimal = Decimal("0")
-        self._vwap_v: Decimal = Decimal("0")
-        self._last_volume: Decimal | None = None
+        # SMA over 1-second mid snapshots, session VWAP and their diff sign,
+        # possibly shared with other strategies on the same tick stream.
+        if features is None:
+            features = TickFeatureEngine(fixed_point=fixed_point)
+        self.fixed_point = features.fixed_point
+        self._features = features.subscribe(symbol, sma_window_seconds)
         self._session_date: object | None = None
 
         # Cross + cooldown state
@@ -172,42 +176,16 @@ class SellPutQQQCrossStrategy:
         if self._session_date is None or tick_date != self._session_date:
             self._reset_session(tick_date)
 
-        # VWAP from incremental trade volume
-        if tick.last is not None and tick.volume is not None:
-            cur_v = Decimal(tick.volume)
-            if self._last_volume is None:
-                self._last_volume = cur_v
-            delta_v = cur_v - self._last_volume
-            if delta_v > 0:
-                self._vwap_pv += Decimal(tick.last) * delta_v
-                self._vwap_v += delta_v
-            self._last_volume = cur_v
-
-        # 1-sec mid snap
-        sec_ts = tick.timestamp.replace(microsecond=0)
-        mid = tick.mid
-        if self._cur_sec is None or sec_ts != self._cur_sec:
-            if self._cur_sec is not None and self._cur_sec_mid is not None:
-                self._sec_samples.append((self._cur_sec, self._cur_sec_mid))
-            self._cur_sec = sec_ts
-            self._cur_sec_mid = mid
-        else:
-            self._cur_sec_mid = mid
-
-        sma = self._sma()
-        vwap = self._vwap()
+        new_sign = self._features.update(tick)
         signals: list[Signal] = []
         intents: list[OrderIntent] = []
 
         # Exits run unconditionally (they don't care about trade window)
         intents.extend(self._exit_intents(ctx))
 
-        if sma is None or vwap is None:
+        if new_sign is None:
             return StrategyDecision(signals=signals, intents=intents)
 
-        diff = sma - vwap
-        new_sign = 1 if diff > 0 else (-1 if diff < 0 else 0)
-
         in_window = self._in_trade_window(ctx.now)
         cross_detected = (
             self._last_diff_sign != 0
@@ -224,6 +202,7 @@ class SellPutQQQCrossStrategy:
                 if new_sign > 0
                 else SignalDirection.LONG_VOL_DOWN
             )
+            sma, vwap = self._features.values()
             signals.append(
                 Signal(
                     name=self.name,
@@ -253,34 +232,78 @@ class SellPutQQQCrossStrategy:
     def on_option_quote(self, ctx: StrategyContext) -> StrategyDecision:
         return StrategyDecision(signals=[], intents=self._exit_intents(ctx))
 
+    # ───────────────────────────────────────────────── checkpointing ────
+
+    def warm_tick(self, tick: Quote) -> None:
+        """Replay a recorded tick into indicator and cross state only.
+
+        Used to catch up after a checkpoint restore: no signal, entry or
+        exit is produced, and the cooldown timer is left alone.
+        """
+        if tick.symbol != self.symbol:
+            return
+        tick_date = tick.timestamp.date()
+        if self._session_date is None or tick_date != self._session_date:
+            self._reset_session(tick_date)
+        new_sign = self._features.update(tick)
+        if new_sign:
+            self._last_diff_sign = new_sign
+
+    def snapshot_state(self) -> dict[str, Any]:
+        """JSON-safe copy of every piece of mutable state, for checkpoints."""
+        return {
+            "features": self._features.engine.snapshot(),
+            "session_date": (
+                None if self._session_date is None else str(self._session_date)
+            ),
+            "last_diff_sign": self._last_diff_sign,
+            "last_signal_at": (
+                None if self._last_signal_at is None else self._last_signal_at.isoformat()
+            ),
+            "open_legs": [
+                {
+                    "contract": leg.contract.model_dump(mode="json"),
+                    "entry_mid": str(leg.entry_mid),
+                    "entry_time": leg.entry_time.isoformat(),
+                    "entry_qty": leg.entry_qty,
+                    "closed_qty_so_far": leg.closed_qty_so_far,
+                    "tiers_hit": sorted(leg.tiers_hit),
+                }
+                for leg in self._open_legs.values()
+            ],
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Load state captured by :meth:`snapshot_state`."""
+        self._features.engine.restore(state["features"])
+        raw_date = state["session_date"]
+        self._session_date = None if raw_date is None else date.fromisoformat(raw_date)
+        self._last_diff_sign = int(state["last_diff_sign"])
+        raw_signal_at = state["last_signal_at"]
+        self._last_signal_at = (
+            None if raw_signal_at is None else datetime.fromisoformat(raw_signal_at)
+        )
+        self._open_legs = {}
+        for raw in state["open_legs"]:
+            contract = OptionContract.model_validate(raw["contract"])
+            self._open_legs[(contract.expiry, contract.strike, contract.right)] = _OpenLeg(
+                contract=contract,
+                entry_mid=Decimal(raw["entry_mid"]),
+                entry_time=datetime.fromisoformat(raw["entry_time"]),
+                entry_qty=int(raw["entry_qty"]),
+                closed_qty_so_far=int(raw["closed_qty_so_far"]),
+                tiers_hit=set(raw["tiers_hit"]),
+            )
+
     # ──────────────────────────────────────────────────────── private ───
 
     def _reset_session(self, tick_date) -> None:  # type: ignore[no-untyped-def]
-        self._sec_samples.clear()
-        self._cur_sec = None
-        self._cur_sec_mid = None
-        self._vwap_pv = Decimal("0")
-        self._vwap_v = Decimal("0")
-        self._last_volume = None
+        # SMA/VWAP state resets inside the features engine on the same
+        # date change; only the strategy's own cross/cooldown state is here.
         self._session_date = tick_date
         self._last_diff_sign = 0
         self._last_signal_at = None
 
-    def _sma(self) -> Decimal | None:
-        samples = list(self._sec_samples)
-        if self._cur_sec is not None and self._cur_sec_mid is not None:
-            samples.append((self._cur_sec, self._cur_sec_mid))
-        if len(samples) < self.sma_window_seconds:
-            return None
-        recent = samples[-self.sma_window_seconds :]
-        total = sum((s[1] for s in recent), Decimal("0"))
-        return total / Decimal(self.sma_window_seconds)
-
-    def _vwap(self) -> Decimal | None:
-        if self._vwap_v <= 0:
-            return None
-        return self._vwap_pv / self._vwap_v
-
     def _entry_open_time(self, now: datetime) -> datetime:
         open_dt = datetime.combine(
             now.date(), self.session_open, tzinfo=now.tzinfo or UTC
@@ -305,7 +328,7 @@ class SellPutQQQCrossStrategy:
         if last_tick is None:
             return []
         atm_strike = self._round_strike(last_tick.mid)
-        quote = self._pick_atm_quote(ctx.option_quotes, atm_strike, "P")
+        quote = ctx.chain_for(self.symbol).get(atm_strike, "P")
         if quote is None:
             return []
 
@@ -340,11 +363,10 @@ class SellPutQQQCrossStrategy:
             return []
         intents: list[OrderIntent] = []
         cutoff = self._cutoff_time(ctx.now)
+        chain = ctx.chain_for(self.symbol)
 
         for key, leg in list(self._open_legs.items()):
-            quote = self._pick_atm_quote(
-                ctx.option_quotes, leg.contract.strike, leg.contract.right,
-            )
+            quote = chain.find(leg.contract)
             mid = quote.mid if quote is not None else None
 
             remaining = leg.entry_qty - leg.closed_qty_so_far
@@ -429,15 +451,6 @@ class SellPutQQQCrossStrategy:
             tag=tag,
         )
 
-    @staticmethod
-    def _pick_atm_quote(
-        quotes: list[OptionQuote], strike: Decimal, right: str
-    ) -> OptionQuote | None:
-        for q in quotes:
-            if q.strike == strike and q.right == right:
-                return q
-        return None
-
     @staticmethod
     def _round_strike(price: Decimal) -> Decimal:
         return Decimal(int(price + Decimal("0.5")))
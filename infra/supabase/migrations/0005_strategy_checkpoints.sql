@@ -0,0 +1,17 @@
+-- Strategy state checkpoints for warm restarts of the strategy engine.
+--
+-- One row per strategy name, upserted every `checkpoint.interval_seconds`
+-- while the engine runs (see services/strategy_engine/checkpoint.py). On
+-- startup the engine loads its row, restores indicator windows / VWAP
+-- accumulators / open legs from `state`, and replays only the ticks or
+-- bars persisted after `taken_at`.
+--
+-- Apply: psql "$SUPABASE_DB_URL" -f infra/supabase/migrations/0005_strategy_checkpoints.sql
+
+CREATE TABLE IF NOT EXISTS strategy_checkpoints (
+    strategy    TEXT         PRIMARY KEY,
+    taken_at    TIMESTAMPTZ  NOT NULL,
+    version     INT          NOT NULL,
+    state       JSONB        NOT NULL,
+    updated_at  TIMESTAMPTZ  NOT NULL DEFAULT now()  -- wall time of the last save; set on every upsert
+);
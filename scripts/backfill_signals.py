@@ -25,6 +25,11 @@ Usage::
 
     # Different SMA period:
     python -m scripts.backfill_signals --symbol QQQ --sma-period 20
+
+    # Several periods in one pass over the bars (one row set per period,
+    # strategy = sma_vwap_cross_indicator_smaN):
+    python -m scripts.backfill_signals --symbol QQQ --sma-period 3 5 9 20
+    python -m scripts.backfill_signals --symbol QQQ --sma-range 3 60
 """
 
 from __future__ import annotations
@@ -33,12 +38,15 @@ import argparse
 import asyncio
 import logging
 import os
-from dataclasses import dataclass
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
-from decimal import Decimal
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+from engine.indicators import vectorized
 from services.persistence.storage import SupabaseBackend
+from services.persistence.stream import BarColumns, BarStream
 
 LOG = logging.getLogger("alpha_kite.backfill_signals")
 
@@ -49,103 +57,71 @@ LOG = logging.getLogger("alpha_kite.backfill_signals")
 _STRATEGY_PREFIX = "sma_vwap_cross_indicator"
 
 
-@dataclass(frozen=True)
-class _Bar:
-    open_time: datetime
-    high: Decimal
-    low: Decimal
-    close: Decimal
-    volume: int
-    vwap: Decimal | None
-
-
 def _strategy_name(sma_period: int) -> str:
     return f"{_STRATEGY_PREFIX}_sma{sma_period}"
 
 
-def _utc_day(ts: datetime) -> str:
-    return ts.astimezone(UTC).strftime("%Y-%m-%d")
-
+def _compute_sma(bars: BarColumns, periods: Sequence[int]) -> npt.NDArray[np.float64]:
+    """Trailing SMAs over bar closes, one row per period (NaN during warm-up).
 
-def _compute_sma(bars: list[_Bar], period: int) -> dict[datetime, Decimal]:
-    """Trailing simple moving average over bar closes, keyed by open_time."""
-    out: dict[datetime, Decimal] = {}
-    if period <= 0:
-        return out
-    rolling: list[Decimal] = []
-    total = Decimal("0")
-    for b in bars:
-        rolling.append(b.close)
-        total += b.close
-        if len(rolling) > period:
-            total -= rolling.pop(0)
-        if len(rolling) == period:
-            out[b.open_time] = total / Decimal(period)
-    return out
+    All periods share one prefix-sum pass (``vectorized.sma_bank``).
+    """
+    return vectorized.sma_bank(bars.close, periods)
 
 
-def _compute_vwap(bars: list[_Bar]) -> dict[datetime, Decimal]:
+def _compute_vwap(bars: BarColumns) -> npt.NDArray[np.float64]:
     """Session VWAP from typical price * volume. Numerator/denominator reset
     at every UTC date boundary so multi-day ranges don't blend yesterday's
     flow into today's VWAP. If the bar carries its own ``vwap`` from the feed,
-    that wins over the locally computed value.
+    that wins over the locally computed value (and the bar stays out of the
+    local accumulation). Bars before any session volume fall back to close.
     """
-    out: dict[datetime, Decimal] = {}
-    pv = Decimal("0")
-    vol = Decimal("0")
-    cur_day: str | None = None
-    for b in bars:
-        day = _utc_day(b.open_time)
-        if day != cur_day:
-            pv = Decimal("0")
-            vol = Decimal("0")
-            cur_day = day
-        if b.vwap is not None:
-            out[b.open_time] = b.vwap
-            continue
-        typical = (b.high + b.low + b.close) / Decimal("3")
-        pv += typical * Decimal(b.volume)
-        vol += Decimal(b.volume)
-        out[b.open_time] = (pv / vol) if vol > 0 else b.close
-    return out
+    has_feed_vwap = ~np.isnan(bars.vwap)
+    local = vectorized.session_vwap(
+        bars.high,
+        bars.low,
+        bars.close,
+        np.where(has_feed_vwap, 0, bars.volume),
+        vectorized.utc_session_ids(bars.epoch_seconds),
+    )
+    local = np.where(np.isnan(local), bars.close, local)
+    return np.where(has_feed_vwap, bars.vwap, local)
 
 
 def _detect_crosses(
-    bars: list[_Bar],
-    sma: dict[datetime, Decimal],
-    vwap: dict[datetime, Decimal],
-) -> list[dict[str, Any]]:
-    """Walk the bars and emit one cross row each time ``sma - vwap`` flips
-    sign relative to the previous bar. Resets at UTC-day boundaries — an
-    overnight gap is not a cross.
+    bars: BarColumns,
+    sma: npt.NDArray[np.float64],
+    vwap: npt.NDArray[np.float64],
+) -> list[list[dict[str, Any]]]:
+    """Emit one cross row each time ``sma - vwap`` strictly flips sign
+    relative to the previous bar, for every row of the SMA bank against the
+    shared VWAP. Resets at UTC-day boundaries — an overnight gap is not a
+    cross. Returns one row list per SMA period, in bank order.
     """
-    rows: list[dict[str, Any]] = []
-    prev_diff: Decimal | None = None
-    cur_day: str | None = None
-    for b in bars:
-        day = _utc_day(b.open_time)
-        if day != cur_day:
-            prev_diff = None
-            cur_day = day
-        s = sma.get(b.open_time)
-        v = vwap.get(b.open_time)
-        if s is None or v is None:
-            continue
-        diff = s - v
-        if prev_diff is not None and prev_diff != 0 and diff != 0:
-            if prev_diff < 0 < diff:
-                rows.append(_signal_row(b, s, v, "LONG_VOL_UP"))
-            elif prev_diff > 0 > diff:
-                rows.append(_signal_row(b, s, v, "LONG_VOL_DOWN"))
-        prev_diff = diff
-    return rows
+    per_period = vectorized.bank_cross_indices(
+        sma, vwap, vectorized.utc_session_ids(bars.epoch_seconds), strict=True,
+    )
+    return [
+        [
+            _signal_row(
+                bars.open_time[i], row_sma[i], vwap[i], bars.close[i],
+                "LONG_VOL_UP" if d > 0 else "LONG_VOL_DOWN",
+            )
+            for i, d in zip(indices.tolist(), directions.tolist())
+        ]
+        for row_sma, (indices, directions) in zip(sma, per_period)
+    ]
 
 
 def _signal_row(
-    bar: _Bar, sma_value: Decimal, vwap_value: Decimal, direction: str,
+    ts: datetime,
+    sma_value: float,
+    vwap_value: float,
+    close: float,
+    direction: str,
 ) -> dict[str, Any]:
     return {
-        "ts": bar.open_time,
+        "ts": ts,
         "direction": direction,
         "strength": "1",
         "metadata": {
@@ -153,7 +129,7 @@ def _signal_row(
             "scope": "security",
             "sma": f"{sma_value:.6f}",
             "vwap": f"{vwap_value:.6f}",
-            "close": f"{bar.close:.6f}",
+            "close": f"{close:.6f}",
         },
     }
 
@@ -164,27 +140,11 @@ async def _fetch_bars(
     interval_seconds: int,
     start: datetime,
     end: datetime,
-) -> list[_Bar]:
-    pool = await backend._ensure_pool()
-    sql = (
-        'SELECT open_time, high, low, close, volume, vwap FROM "bars" '
-        "WHERE symbol = $1 AND interval_seconds = $2 "
-        "AND open_time >= $3 AND open_time < $4 "
-        "ORDER BY open_time ASC"
-    )
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(sql, symbol, interval_seconds, start, end)
-    bars: list[_Bar] = []
-    for r in rows:
-        bars.append(_Bar(
-            open_time=r["open_time"],
-            high=Decimal(str(r["high"])),
-            low=Decimal(str(r["low"])),
-            close=Decimal(str(r["close"])),
-            volume=int(r["volume"]),
-            vwap=(Decimal(str(r["vwap"])) if r["vwap"] is not None else None),
-        ))
-    return bars
+) -> BarColumns:
+    # Streamed in keyset pages straight into numpy chunks, so a multi-year
+    # range never holds more than a page of row objects at once.
+    stream = BarStream(backend, symbol, interval_seconds, start, end)
+    return BarColumns.concat([chunk async for chunk in stream.columns()])
 
 
 async def _purge_existing(
@@ -232,8 +192,10 @@ async def run(
     interval_seconds: int,
     start: datetime,
     end: datetime,
-    sma_period: int,
+    sma_period: int | Sequence[int],
 ) -> dict[str, int]:
+    """Backfill crosses for one SMA period or several in a single bar scan."""
+    periods = [sma_period] if isinstance(sma_period, int) else sorted(set(sma_period))
     dsn = os.getenv("SUPABASE_DB_URL")
     if not dsn:
         raise RuntimeError("SUPABASE_DB_URL is required")
@@ -244,16 +206,21 @@ async def run(
                  len(bars), symbol, interval_seconds, start, end)
         if not bars:
             return {"bars": 0, "crosses": 0, "deleted": 0}
-        sma = _compute_sma(bars, sma_period)
+        sma = _compute_sma(bars, periods)
         vwap = _compute_vwap(bars)
-        crosses = _detect_crosses(bars, sma, vwap)
-        LOG.info("detected %d crosses (sma%d/vwap)", len(crosses), sma_period)
-
-        strategy = _strategy_name(sma_period)
-        deleted = await _purge_existing(backend, strategy, symbol, start, end)
-        LOG.info("purged %d prior security-scope rows for %s", deleted, strategy)
-        await _insert_signals(backend, strategy, symbol, crosses)
-        return {"bars": len(bars), "crosses": len(crosses), "deleted": deleted}
+        crosses_per_period = _detect_crosses(bars, sma, vwap)
+
+        total_crosses = 0
+        total_deleted = 0
+        for period, crosses in zip(periods, crosses_per_period):
+            LOG.info("detected %d crosses (sma%d/vwap)", len(crosses), period)
+            strategy = _strategy_name(period)
+            deleted = await _purge_existing(backend, strategy, symbol, start, end)
+            LOG.info("purged %d prior security-scope rows for %s", deleted, strategy)
+            await _insert_signals(backend, strategy, symbol, crosses)
+            total_crosses += len(crosses)
+            total_deleted += deleted
+        return {"bars": len(bars), "crosses": total_crosses, "deleted": total_deleted}
     finally:
         if backend._pool is not None:
             await backend._pool.close()
@@ -277,8 +244,12 @@ def main() -> None:
         help="bar resolution in seconds (default: 60 for 1-min)",
     )
     parser.add_argument(
-        "--sma-period", type=int, default=9,
-        help="SMA period in bars (default: 9)",
+        "--sma-period", type=int, nargs="+", default=[9],
+        help="SMA period(s) in bars (default: 9); several are computed in one pass",
+    )
+    parser.add_argument(
+        "--sma-range", type=int, nargs=2, metavar=("FIRST", "LAST"), default=None,
+        help="inclusive SMA period range, e.g. 3 60; overrides --sma-period",
     )
     parser.add_argument(
         "--start", type=_parse_date, default=None,
@@ -294,7 +265,11 @@ def main() -> None:
                                                     microsecond=0) + timedelta(days=1))
     start = args.start or (end - timedelta(days=7))
 
-    counts = asyncio.run(run(args.symbol, args.interval, start, end, args.sma_period))
+    periods = (
+        list(range(args.sma_range[0], args.sma_range[1] + 1))
+        if args.sma_range is not None else args.sma_period
+    )
+    counts = asyncio.run(run(args.symbol, args.interval, start, end, periods))
     LOG.info(
         "done: %d bars scanned, %d crosses written, %d prior rows purged",
         counts["bars"], counts["crosses"], counts["deleted"],
@@ -7,6 +7,11 @@ prints an expectancy report.
 Usage:
     python scripts/backtest.py --config config/strategy.yaml \
         --fixture tests/fixtures/qqq_2026-04-15_1min.json
+
+``--fixture`` may also be a replay dataset directory (see
+engine.data_feeds.replay), replayed one session at a time. ``--fast``
+runs the same backtest through the synchronous engine
+(:func:`run_fast_backtest`).
 """
 
 from __future__ import annotations
@@ -16,18 +21,21 @@ import asyncio
 import logging
 import os
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
 
-from config.schema import load_config
-from contracts.broker import OrderSide
-from contracts.data_feed import Bar, OptionContract, OptionQuote
+import numpy as np
+from config.schema import StrategyConfig, load_config
+from contracts.broker import AccountSummary, OrderIntent, OrderSide
+from contracts.data_feed import Bar, OptionChain, OptionContract, OptionQuote
 from contracts.strategy import StrategyContext, StrategyDecision
 from engine.broker.dry_run import DryRunBroker
 from engine.data_feeds.replay import ReplayFeed
-from engine.data_feeds.synthetic_options import SyntheticOptionsFeed
+from engine.data_feeds.synthetic_options import EventClock, SyntheticOptionsFeed
+from engine.indicators import vectorized
 from engine.risk.kill_switch import KillSwitchGuard
 from engine.risk.limits import (
     DailyLossLimitGuard,
@@ -37,9 +45,14 @@ from engine.risk.limits import (
 from engine.risk.paper_guard import PaperAccountGuard
 from engine.risk.pipeline import RiskPipeline
 from engine.strategies.buy_vol_qqq_cross import BuyVolQQQCrossStrategy
+from pydantic import PrivateAttr
 
 LOG = logging.getLogger("alpha_kite.backtest")
 
+# What every strategy context carries: the trailing bars and a fixed cash
+# figure (the dry-run account's NAV).
+_HISTORY_BARS = 200
+
 
 @dataclass
 class TradeRecord:
@@ -102,17 +115,31 @@ def _summarize(trades: list[TradeRecord]) -> dict:
     }
 
 
-async def _quote_for(
-    quotes: list[OptionQuote], contract: OptionContract
-) -> OptionQuote | None:
-    for q in quotes:
-        if (
-            q.strike == contract.strike
-            and q.right == contract.right
-            and q.expiry == contract.expiry
-        ):
-            return q
-    return None
+def _build_strategy(cfg: StrategyConfig) -> BuyVolQQQCrossStrategy:
+    return BuyVolQQQCrossStrategy(
+        symbol=cfg.universe.symbol,
+        sma_period=cfg.signal.params.sma_period,
+        mode=cfg.entry.mode,
+        contracts=cfg.entry.contracts,
+        profit_target_pct=cfg.exit.profit_target_pct,
+        stop_loss_pct=cfg.exit.stop_loss_pct,
+        time_stop_minutes_before_close=cfg.exit.time_stop_minutes_before_close,
+    )
+
+
+def _build_risk(cfg: StrategyConfig) -> RiskPipeline:
+    return RiskPipeline(
+        [
+            KillSwitchGuard(cfg.risk.kill_switch_file),
+            MaxOpenPositionsGuard(cfg.risk.max_open_positions),
+            DailyLossLimitGuard(cfg.risk.daily_loss_limit_usd),
+            MaxPremiumPctNavGuard(cfg.entry.max_premium_pct_nav),
+            PaperAccountGuard(
+                allowlist=cfg.broker.paper_account_allowlist,
+                required_mode=cfg.broker.mode,
+            ),
+        ]
+    )
 
 
 async def run_backtest(
@@ -127,9 +154,11 @@ async def run_backtest(
 ) -> Report:
     """Run the configured strategy through historical bars and return a Report.
 
-    Bars source: pass ``fixture_path`` (replay JSON) OR pass ``symbol`` +
-    ``start`` + ``end`` (Supabase ``bars`` table). The DB path uses the env
-    var ``SUPABASE_DB_URL`` by default; override via ``dsn``.
+    Bars source: pass ``fixture_path`` (replay JSON, columnar ``.npy`` or
+    a replay dataset directory) OR pass ``symbol`` + ``start`` + ``end``
+    (Supabase ``bars`` table). The DB path uses the env var
+    ``SUPABASE_DB_URL`` by default; override via ``dsn``. Set
+    ``BAR_CACHE_DIR`` to cache finished days of bars on local disk.
     """
     cfg = load_config(config_path)
 
@@ -155,102 +184,94 @@ async def run_backtest(
         feed = SupabaseBarsFeed(
             actual_dsn, symbol=symbol, start=start, end=end,
             interval_seconds=interval_seconds,
+            cache_dir=os.getenv("BAR_CACHE_DIR") or None,
         )
-    options_feed = SyntheticOptionsFeed(feed)
-    strategy = BuyVolQQQCrossStrategy(
-        symbol=cfg.universe.symbol,
-        sma_period=cfg.signal.params.sma_period,
-        mode=cfg.entry.mode,
-        contracts=cfg.entry.contracts,
-        profit_target_pct=cfg.exit.profit_target_pct,
-        stop_loss_pct=cfg.exit.stop_loss_pct,
-        time_stop_minutes_before_close=cfg.exit.time_stop_minutes_before_close,
-    )
-    risk = RiskPipeline(
-        [
-            KillSwitchGuard(cfg.risk.kill_switch_file),
-            MaxOpenPositionsGuard(cfg.risk.max_open_positions),
-            DailyLossLimitGuard(cfg.risk.daily_loss_limit_usd),
-            MaxPremiumPctNavGuard(cfg.entry.max_premium_pct_nav),
-            PaperAccountGuard(
-                allowlist=cfg.broker.paper_account_allowlist,
-                required_mode=cfg.broker.mode,
-            ),
-        ]
-    )
+    # Price chains at bar time, not wall-clock time: otherwise every
+    # historical 0DTE chain is "expired" and priced at the minimum T.
+    # The loop reads bars from ``feed`` directly and observes each close on
+    # the options feed, so chains are built around the bar being replayed.
+    clock = EventClock()
+    options_feed = SyntheticOptionsFeed(feed, clock=clock)
+    strategy = _build_strategy(cfg)
+    risk = _build_risk(cfg)
     broker = DryRunBroker()
     await broker.connect()
+    cash_available = broker.account_summary().cash
 
     bar_history: list[Bar] = []
     open_records: dict[uuid.UUID, TradeRecord] = {}
     report = Report()
-    # Track the date of the previous bar so we can reset the strategy's
-    # intraday state at session boundaries. Without this, multi-day
-    # backtests carry prior-day bars into VWAP/SMA buffers and crosses
-    # almost never fire after the first day. (See engine.strategies.
-    # buy_vol_qqq_cross.BuyVolQQQCrossStrategy.reset_session for why.)
-    prev_session_date: date | None = None
+    # Reset the strategy's intraday state at session boundaries. Without
+    # this, multi-day backtests carry prior-day bars into VWAP/SMA buffers
+    # and crosses almost never fire after the first day. (See engine.
+    # strategies.buy_vol_qqq_cross.BuyVolQQQCrossStrategy.reset_session for
+    # why.) The feed reports the boundaries, so no per-bar date check.
+    first_session = True
 
     # When pulling from Supabase, use the caller-supplied interval; for
-    # fixtures the value is fixed by the JSON schema.
+    # fixtures the value is fixed by the file, and a replay dataset
+    # directory picks its resolution by the configured interval.
     stream_interval = (
         interval_seconds if fixture_path is None else cfg.data.bar_interval_seconds
     )
-    async for bar in feed.stream_equity_bars(
+    async for _session_date, session_bars in feed.stream_sessions(
         cfg.universe.symbol, stream_interval
     ):
-        if prev_session_date is not None and bar.open_time.date() != prev_session_date:
+        if not first_session:
             strategy.reset_session()
-        prev_session_date = bar.open_time.date()
+        first_session = False
 
-        bar_history.append(bar)
+        async for bar in session_bars:
+            bar_history.append(bar)
+            clock.advance(bar.open_time)
+            options_feed.observe(bar.symbol, bar.close)
 
-        chain = await options_feed.get_option_chain(
-            cfg.universe.symbol, bar.open_time.date()
-        )
-        oqs: list[OptionQuote] = []
-        async for q in options_feed.stream_option_quotes(chain.contracts):
-            oqs.append(q)
-            if len(oqs) >= len(chain.contracts):
-                break
-
-        # Drive exits on option quote tick
-        if open_records:
-            ctx_exit = StrategyContext(
+            chain = await options_feed.get_option_chain(
+                cfg.universe.symbol, bar.open_time.date()
+            )
+            oqs: list[OptionQuote] = []
+            async for q in options_feed.stream_option_quotes(chain.contracts):
+                oqs.append(q)
+                if len(oqs) >= len(chain.contracts):
+                    break
+            option_chain = OptionChain.from_quotes(cfg.universe.symbol, oqs)
+
+            # Drive exits on option quote tick
+            if open_records:
+                ctx_exit = StrategyContext(
+                    now=bar.open_time,
+                    last_bar=bar,
+                    bar_history=bar_history[-_HISTORY_BARS:],
+                    option_quotes=oqs,
+                    option_chain=option_chain,
+                    open_positions=len(open_records),
+                    cash_available=cash_available,
+                )
+                decision_exit = strategy.on_option_quote(ctx_exit)
+                await _process_decision(
+                    decision_exit, oqs, broker, risk, open_records, report, exit_pass=True
+                )
+
+            ctx = StrategyContext(
                 now=bar.open_time,
                 last_bar=bar,
-                bar_history=bar_history[-200:],
+                bar_history=bar_history[-_HISTORY_BARS:],
                 option_quotes=oqs,
+                option_chain=option_chain,
                 open_positions=len(open_records),
-                cash_available=Decimal("5000"),
+                cash_available=cash_available,
             )
-            decision_exit = strategy.on_option_quote(ctx_exit)
+            decision = strategy.on_bar(ctx)
             await _process_decision(
-                decision_exit, oqs, broker, risk, open_records, report, exit_pass=True
+                decision, oqs, broker, risk, open_records, report, exit_pass=False
             )
 
-        ctx = StrategyContext(
-            now=bar.open_time,
-            last_bar=bar,
-            bar_history=bar_history[-200:],
-            option_quotes=oqs,
-            open_positions=len(open_records),
-            cash_available=Decimal("5000"),
-        )
-        decision = strategy.on_bar(ctx)
-        await _process_decision(
-            decision, oqs, broker, risk, open_records, report, exit_pass=False
-        )
-
     # Sweep any positions still open when the fixture's bars ran out. We
     # can't compute a realistic exit P&L without future data, so leave
     # pnl_pct=None — the summary excludes these from win/loss/expectancy
     # stats, but the trade ledger in the UI lists them so the user sees
     # entries fired even if the fixture was too short for an exit.
-    for _intent_id, rec in list(open_records.items()):
-        rec.reason = "open_at_fixture_end"
-        report.trades.append(rec)
-    open_records.clear()
+    _sweep_open(open_records, report)
 
     await broker.disconnect()
     if hasattr(feed, "close"):
@@ -282,30 +303,35 @@ async def _process_decision(
             continue
 
         update = await broker.place_order(intent)
-        fill_price = update.avg_fill_price or premium
-
-        if intent.side == OrderSide.BUY:
-            rec = TradeRecord(
-                intent_id=intent.intent_id,
-                entry_ts=intent.created_at,
-                entry_price=fill_price,
-                side=intent.side,
-                contract=intent.option,  # type: ignore[arg-type]
-            )
-            open_records[intent.intent_id] = rec
-        else:  # SELL — close a matching open record
-            match_id = _find_open_for_contract(open_records, intent.option)
-            if match_id is None:
-                continue
-            rec = open_records.pop(match_id)
-            rec.exit_ts = intent.created_at
-            rec.exit_price = fill_price
-            if rec.entry_price > 0:
-                rec.pnl_pct = (
-                    (rec.exit_price - rec.entry_price) / rec.entry_price * Decimal("100")
-                )
-            rec.reason = intent.tag
-            report.trades.append(rec)
+        _book_fill(intent, update.avg_fill_price or premium, open_records, report)
+
+
+def _book_fill(
+    intent: OrderIntent,
+    fill_price: Decimal,
+    open_records: dict[uuid.UUID, TradeRecord],
+    report: Report,
+) -> None:
+    """Open a trade record for a filled BUY, close the matching one for a SELL."""
+    if intent.side == OrderSide.BUY:
+        open_records[intent.intent_id] = TradeRecord(
+            intent_id=intent.intent_id,
+            entry_ts=intent.created_at,
+            entry_price=fill_price,
+            side=intent.side,
+            contract=intent.option,  # type: ignore[arg-type]
+        )
+        return
+    match_id = _find_open_for_contract(open_records, intent.option)
+    if match_id is None:
+        return
+    rec = open_records.pop(match_id)
+    rec.exit_ts = intent.created_at
+    rec.exit_price = fill_price
+    if rec.entry_price > 0:
+        rec.pnl_pct = (rec.exit_price - rec.entry_price) / rec.entry_price * Decimal("100")
+    rec.reason = intent.tag
+    report.trades.append(rec)
 
 
 def _find_open_for_contract(
@@ -323,6 +349,167 @@ def _find_open_for_contract(
     return None
 
 
+def _sweep_open(open_records: dict[uuid.UUID, TradeRecord], report: Report) -> None:
+    for rec in open_records.values():
+        rec.reason = "open_at_fixture_end"
+        report.trades.append(rec)
+    open_records.clear()
+
+
+class _ReplayContext(StrategyContext):
+    """The one `StrategyContext` a fast backtest reuses for every event.
+
+    `advance` repoints it at the next bar in place, so a strategy must not
+    keep a context (or its ``bar_history``) past the call it was given in.
+    The bar's option chain is priced on the first `chain_for`; until then
+    ``option_quotes`` is empty and ``option_chain`` is None.
+    """
+
+    _pricer: Callable[[Bar], OptionChain] | None = PrivateAttr(default=None)
+    _priced_bar: Bar | None = PrivateAttr(default=None)
+
+    def advance(self, bar: Bar, history: list[Bar], open_positions: int) -> None:
+        # Frozen to strategies, not to the engine that owns it.
+        fields = self.__dict__
+        fields["now"] = bar.open_time
+        fields["last_bar"] = bar
+        fields["bar_history"] = history
+        fields["option_quotes"] = []
+        fields["option_chain"] = None
+        fields["open_positions"] = open_positions
+
+    def set_open_positions(self, open_positions: int) -> None:
+        self.__dict__["open_positions"] = open_positions
+
+    def chain_for(self, underlying: str) -> OptionChain:
+        bar = self.last_bar
+        if self._pricer is not None and bar is not None and self._priced_bar is not bar:
+            chain = self._pricer(bar)
+            self.__dict__["option_quotes"] = list(chain.quotes)
+            self.__dict__["option_chain"] = chain
+            self._chains.clear()
+            self._priced_bar = bar
+        return super().chain_for(underlying)
+
+
+def _apply_decision(
+    decision: StrategyDecision,
+    account: AccountSummary,
+    risk: RiskPipeline,
+    open_records: dict[uuid.UUID, TradeRecord],
+    report: Report,
+) -> None:
+    """`_process_decision` against a fixed account, filling as `DryRunBroker` does."""
+    for intent in decision.intents:
+        premium = intent.limit_price or Decimal("1")
+        check = risk.evaluate(
+            intent=intent,
+            account=account,
+            open_positions=len(open_records),
+            realized_pnl_today=Decimal("0"),
+            last_premium=premium,
+        )
+        if not check.allowed:
+            LOG.info("intent blocked: %s", check.reasons)
+            continue
+        _book_fill(intent, DryRunBroker.fill_price(intent) or premium, open_records, report)
+
+
+def run_fast_backtest(config_path: str, fixture_path: str) -> Report:
+    """`run_backtest` over a replay fixture or dataset, without the event loop.
+
+    Same strategy, risk pipeline, synthetic option prices and fills, so
+    the report matches `run_backtest` trade for trade; only the per-bar
+    machinery differs. Bars come straight off the fixture (decoded from
+    the mapped columns), one `_ReplayContext` serves every event, a bar's
+    chain is priced in one batch only when the strategy looks it up, the
+    account is read once and orders fill in process at `DryRunBroker.fill_price`.
+    """
+    cfg = load_config(config_path)
+    LOG.info("fast backtest start: fixture=%s mode=%s", fixture_path, cfg.entry.mode)
+    feed = ReplayFeed(fixture_path)
+    symbol = cfg.universe.symbol
+    underlying = symbol.strip().upper()
+    options_feed = SyntheticOptionsFeed(feed)
+    strategy = _build_strategy(cfg)
+    risk = _build_risk(cfg)
+    account = DryRunBroker().account_summary()
+
+    def price_chain(bar: Bar) -> OptionChain:
+        # What run_backtest's feed lists and prices once the bar is observed.
+        contracts = options_feed.atm_contracts(underlying, bar.close, bar.open_time.date())
+        priced = options_feed.price_chain_at(contracts, {underlying: bar.close}, bar.open_time)
+        return OptionChain.from_quotes(symbol, priced.quotes())
+
+    ctx = _ReplayContext(now=datetime.now(tz=UTC), cash_available=account.cash)
+    ctx._pricer = price_chain
+    history: list[Bar] = []
+    open_records: dict[uuid.UUID, TradeRecord] = {}
+    report = Report()
+
+    sessions = feed.iter_sessions(symbol, cfg.data.bar_interval_seconds)
+    for n, (_session_date, bars) in enumerate(sessions):
+        if n:
+            strategy.reset_session()
+        for bar in bars:
+            history.append(bar)
+            if len(history) > _HISTORY_BARS:
+                del history[0]
+            ctx.advance(bar, history, len(open_records))
+            if open_records:
+                decision = strategy.on_option_quote(ctx)
+                if decision.intents:
+                    _apply_decision(decision, account, risk, open_records, report)
+                    ctx.set_open_positions(len(open_records))
+            decision = strategy.on_bar(ctx)
+            if decision.intents:
+                _apply_decision(decision, account, risk, open_records, report)
+
+    _sweep_open(open_records, report)
+    return report
+
+
+def sma_cross_sweep(bars: list[Bar], periods: list[int]) -> dict[int, dict[str, int]]:
+    """Count SMA(N)/session-VWAP crosses for every period in one pass.
+
+    Signal-level pre-screen for ``signal.params.sma_period`` tuning: the
+    SMA bank shares a single prefix sum and all periods are compared
+    against one session VWAP (the bar's own ``vwap`` when the feed supplied
+    it, like the strategy). Sessions are UTC days, matching
+    ``reset_session`` calls in :func:`run_backtest`: the SMAs and VWAP
+    both restart at every session, and no cross spans two.
+    """
+    if not bars:
+        return {p: {"crosses": 0, "up": 0, "down": 0} for p in periods}
+    close = np.array([float(b.close) for b in bars])
+    high = np.array([float(b.high) for b in bars])
+    low = np.array([float(b.low) for b in bars])
+    volume = np.array([b.volume for b in bars], dtype=np.int64)
+    feed_vwap = np.array([np.nan if b.vwap is None else float(b.vwap) for b in bars])
+    sessions = vectorized.utc_session_ids([int(b.open_time.timestamp()) for b in bars])
+
+    local_vwap = vectorized.session_vwap(high, low, close, volume, sessions)
+    vwap = np.where(np.isnan(feed_vwap), local_vwap, feed_vwap)
+    bank = vectorized.sma_bank(close, periods, sessions)
+    out: dict[int, dict[str, int]] = {}
+    for period, (_, directions) in zip(
+        periods, vectorized.bank_cross_indices(bank, vwap, sessions)
+    ):
+        up = int((directions > 0).sum())
+        out[period] = {"crosses": len(directions), "up": up, "down": len(directions) - up}
+    return out
+
+
+async def _load_fixture_bars(config_path: str, fixture_path: str) -> list[Bar]:
+    cfg = load_config(config_path)
+    feed = ReplayFeed(fixture_path)
+    return [
+        bar async for bar in feed.stream_equity_bars(
+            cfg.universe.symbol, cfg.data.bar_interval_seconds
+        )
+    ]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="alpha-kite-v2 backtest")
     parser.add_argument("--config", default="config/strategy.yaml")
@@ -338,6 +525,22 @@ def main() -> None:
             "and out-of-sample (entry_ts >= split) and prints both reports."
         ),
     )
+    parser.add_argument(
+        "--sweep-sma",
+        type=int,
+        nargs=2,
+        metavar=("FIRST", "LAST"),
+        default=None,
+        help=(
+            "Instead of a full backtest, count SMA(N)/VWAP crosses for every "
+            "N in FIRST..LAST (inclusive) in one pass over the fixture."
+        ),
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Run the synchronous engine (run_fast_backtest); same report, fixtures only.",
+    )
     parser.add_argument("--verbose", action="store_true")
     args = parser.parse_args()
 
@@ -349,7 +552,19 @@ def main() -> None:
     if not Path(args.fixture).exists():
         raise SystemExit(f"fixture not found: {args.fixture}")
 
-    report = asyncio.run(run_backtest(args.config, args.fixture))
+    if args.sweep_sma is not None:
+        periods = list(range(args.sweep_sma[0], args.sweep_sma[1] + 1))
+        bars = asyncio.run(_load_fixture_bars(args.config, args.fixture))
+        print(f"\nfixture:    {args.fixture}  ({len(bars)} bars)")
+        print("period  crosses  up  down")
+        for period, counts in sma_cross_sweep(bars, periods).items():
+            print(f"{period:>6}  {counts['crosses']:>7}  {counts['up']:>2}  {counts['down']:>4}")
+        return
+
+    if args.fast:
+        report = run_fast_backtest(args.config, args.fixture)
+    else:
+        report = asyncio.run(run_backtest(args.config, args.fixture))
 
     if args.split_date is None:
         _print_summary("backtest report", args.fixture, report.summary())
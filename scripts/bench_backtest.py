@@ -0,0 +1,131 @@
+"""Bars per second of ``run_backtest`` vs ``run_fast_backtest``.
+
+Copies one replay fixture onto ``--sessions`` consecutive weekdays as a
+per-day bar dataset (so every session replays the same tape), then times
+both engines over it, ``--repeat`` runs each, and prints the fastest and
+slowest run of each plus the speedup of the best runs. ``--loose`` lifts
+the premium and open-position caps the way the parity tests do, so
+entries and exits actually fire; the shipped config trades nothing on
+the bundled fixture. Both engines must produce the same trade ledger; the
+script exits non-zero if they do not.
+
+The speedup mostly tracks how many bars hold an open leg: the fast
+engine skips chain pricing on flat bars, but a bar whose exit check
+reads the chain pays the same quote construction as ``run_backtest``.
+
+Usage::
+
+    python -m scripts.bench_backtest
+    python -m scripts.bench_backtest --sessions 252 --repeat 5 --loose
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import yaml
+from engine.data_feeds import bar_arrays
+from engine.data_feeds.replay import load_json_fixture
+
+from scripts.backtest import Report, run_backtest, run_fast_backtest
+
+_ROOT = Path(__file__).resolve().parents[1]
+_DEFAULT_CONFIG = _ROOT / "config" / "strategy.yaml"
+_DEFAULT_FIXTURE = _ROOT / "tests" / "fixtures" / "qqq_2026-04-15_1min.json"
+
+
+def _build_dataset(fixture: Path, root: Path, sessions: int) -> int:
+    """Write ``sessions`` weekday copies of ``fixture``; returns the bar count."""
+    symbol, day, bars = load_json_fixture(str(fixture))
+    interval = bars[0].interval_seconds
+    target = day + timedelta(days=1)
+    written = 0
+    for _ in range(sessions):
+        while target.weekday() >= 5:
+            target += timedelta(days=1)
+        shift = datetime.combine(target, datetime.min.time()) - datetime.combine(
+            day, datetime.min.time()
+        )
+        shifted = [b.model_copy(update={"open_time": b.open_time + shift}) for b in bars]
+        bar_arrays.save(
+            bar_arrays.day_path(root, symbol, interval, target), bar_arrays.encode(shifted)
+        )
+        written += len(shifted)
+        target += timedelta(days=1)
+    return written
+
+
+def _loose_config(config: Path, out: Path) -> Path:
+    cfg = yaml.safe_load(config.read_text())
+    cfg["entry"]["max_premium_pct_nav"] = 50
+    cfg["risk"]["max_open_positions"] = 5
+    out.write_text(yaml.safe_dump(cfg))
+    return out
+
+
+def _ledger(report: Report) -> list[tuple]:
+    return [
+        (t.entry_ts, t.entry_price, t.side, t.contract, t.exit_ts, t.exit_price, t.reason)
+        for t in report.trades
+    ]
+
+
+def _time(run: Callable[[], Report], repeat: int) -> tuple[list[float], Report]:
+    elapsed: list[float] = []
+    report = Report()
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        report = run()
+        elapsed.append(time.perf_counter() - t0)
+    return elapsed, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark run_backtest against run_fast_backtest on a replay dataset.",
+    )
+    parser.add_argument("--config", type=Path, default=_DEFAULT_CONFIG)
+    parser.add_argument("--fixture", type=Path, default=_DEFAULT_FIXTURE)
+    parser.add_argument("--sessions", type=int, default=40, help="fixture copies to replay")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per engine")
+    parser.add_argument(
+        "--loose", action="store_true", help="lift the premium and position caps",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset = Path(tmp) / "bars"
+        n_bars = _build_dataset(args.fixture, dataset, args.sessions)
+        config = _loose_config(args.config, Path(tmp) / "strategy.yaml") if args.loose \
+            else args.config
+
+        slow, slow_report = _time(
+            lambda: asyncio.run(run_backtest(str(config), str(dataset))), args.repeat
+        )
+        fast, fast_report = _time(
+            lambda: run_fast_backtest(str(config), str(dataset)), args.repeat
+        )
+
+    if _ledger(fast_report) != _ledger(slow_report):
+        print("trade ledger mismatch between the two engines", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"{n_bars} bars, {args.sessions} sessions, {len(slow_report.trades)} trades, "
+        f"{args.repeat} runs each"
+    )
+    print(f"{'engine':8s} {'best':>12s} {'worst':>12s}   (bars/s)")
+    for label, elapsed in (("async", slow), ("fast", fast)):
+        print(f"{label:8s} {n_bars / min(elapsed):12,.0f} {n_bars / max(elapsed):12,.0f}")
+    print(f"{'speedup':8s} {min(slow) / min(fast):11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Per-tick cost of BuyVolQQQCrossTickStrategy: Decimal vs fixed-point state.
+
+Drives the same synthetic random-walk tape (several ticks per second,
+cumulative volume, penny prices) through the strategy twice -- once with
+the default Decimal SMA/VWAP state and once with ``fixed_point=True`` --
+and prints the mean cost of each. Two numbers per mode: the full
+``on_tick`` call, and the SMA/VWAP/cross-sign update alone (the part the
+price representation actually changes; the rest of ``on_tick`` is
+trade-window and pending-entry bookkeeping shared by both). Contexts are
+built up front so only the strategy itself is timed. Both runs must emit
+the same signals; the script exits non-zero if they do not.
+
+Usage::
+
+    python -m scripts.bench_tick_strategy
+    python -m scripts.bench_tick_strategy --ticks 200000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from decimal import Decimal
+
+from contracts.strategy import StrategyContext
+from engine.strategies.buy_vol_qqq_cross_tick import BuyVolQQQCrossTickStrategy
+
+from scripts.synthetic_tape import tape
+
+
+def _contexts(n: int, seed: int) -> list[StrategyContext]:
+    ticks = tape(n, seed=seed, step_ms=250, moves_cents=(-2, -1, 0, 0, 1, 2),
+                 volumes=(0, 100, 200, 500))
+    return [
+        StrategyContext(now=t.timestamp, last_tick=t, cash_available=Decimal("5000"))
+        for t in ticks
+    ]
+
+
+def _run_features(contexts: list[StrategyContext], fixed_point: bool) -> float:
+    strat = BuyVolQQQCrossTickStrategy(fixed_point=fixed_point)
+    update = strat._features.update
+    ticks = [ctx.last_tick for ctx in contexts]
+    t0 = time.perf_counter()
+    for tick in ticks:
+        update(tick)  # type: ignore[arg-type]
+    return time.perf_counter() - t0
+
+
+def _run(contexts: list[StrategyContext], fixed_point: bool) -> tuple[float, list[tuple]]:
+    strat = BuyVolQQQCrossTickStrategy(fixed_point=fixed_point)
+    on_tick = strat.on_tick
+    signals: list[tuple] = []
+    t0 = time.perf_counter()
+    for ctx in contexts:
+        decision = on_tick(ctx)
+        if decision.signals:
+            signals.extend((s.timestamp, s.direction) for s in decision.signals)
+    return time.perf_counter() - t0, signals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark tick-strategy on_tick with Decimal vs fixed-point prices.",
+    )
+    parser.add_argument("--ticks", type=int, default=100_000, help="ticks per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per mode (best is kept)")
+    parser.add_argument("--seed", type=int, default=1, help="tape RNG seed")
+    args = parser.parse_args()
+
+    contexts = _contexts(args.ticks, args.seed)
+    results: dict[str, tuple[float, float]] = {}
+    reference: list[tuple] | None = None
+    print(f"{'mode':8s} {'on_tick':>10s} {'features':>10s}   (us/tick, best of {args.repeat})")
+    for label, fixed_point in (("decimal", False), ("fixed", True)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            elapsed, signals = _run(contexts, fixed_point)
+            best = min(best, elapsed)
+            if reference is None:
+                reference = signals
+            elif signals != reference:
+                print("signal mismatch between decimal and fixed-point runs", file=sys.stderr)
+                sys.exit(1)
+        best_features = min(_run_features(contexts, fixed_point) for _ in range(args.repeat))
+        results[label] = (best, best_features)
+        print(
+            f"{label:8s} {best / args.ticks * 1e6:10.2f} "
+            f"{best_features / args.ticks * 1e6:10.2f}   ({len(reference or [])} signals)"
+        )
+
+    dec, fx = results["decimal"], results["fixed"]
+    print(f"{'speedup':8s} {dec[0] / fx[0]:9.2f}x {dec[1] / fx[1]:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Export bars (and ticks) as columnar replay day files.
+
+Writes `engine.data_feeds.bar_arrays` day files
+(``<out>/<SYMBOL>/<interval_seconds>/<YYYY-MM-DD>.npy``) that
+``ReplayFeed`` memory-maps instead of parsing JSON. Two sources:
+
+* ``json``: convert existing ``{"date", "symbol", "bars"}`` fixtures.
+* ``db``: pull a range of the ``bars`` table. This goes through the same
+  ``BarCache`` the backtest uses, so ``--out`` can double as
+  ``BAR_CACHE_DIR`` and days already on disk are not fetched again. Only
+  days that ended more than ``--settle-hours`` ago are exported.
+
+The ``ticks`` source exports a range of the ``ticks`` table as
+`engine.data_feeds.tick_arrays` day files
+(``<out>/<SYMBOL>/ticks/<YYYY-MM-DD>.npy``) for ``TickReplayFeed``.
+Days without ticks get no file.
+
+Usage::
+
+    python -m scripts.export_replay_bars json tests/fixtures/*.json --out data/replay
+
+    SUPABASE_DB_URL=postgres://... \\
+        python -m scripts.export_replay_bars db --symbol QQQ --interval 60 \\
+        --start 2026-01-01 --end 2026-05-01 --out data/replay
+
+    python -m scripts.export_replay_bars ticks --symbol QQQ \\
+        --start 2026-05-01 --end 2026-05-02 --out data/replay
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+from contracts.data_feed import Quote
+from engine.data_feeds import tick_arrays
+from engine.data_feeds.replay import convert_json_fixture
+from services.persistence.bar_cache import BarCache
+from services.persistence.reader import PersistenceReader
+from services.persistence.storage import SupabaseBackend
+
+LOG = logging.getLogger("alpha_kite.export_replay_bars")
+
+
+def export_json(fixtures: list[Path], out: Path, interval_seconds: int) -> list[Path]:
+    written = []
+    for fixture in fixtures:
+        path = convert_json_fixture(fixture, out, interval_seconds=interval_seconds)
+        LOG.info("%s -> %s", fixture, path)
+        written.append(path)
+    return written
+
+
+def _backend() -> SupabaseBackend:
+    dsn = os.getenv("SUPABASE_DB_URL")
+    if not dsn:
+        raise RuntimeError("SUPABASE_DB_URL is required")
+    return SupabaseBackend(dsn)
+
+
+async def export_db(
+    symbol: str,
+    interval_seconds: int,
+    start: datetime,
+    end: datetime,
+    out: Path,
+    *,
+    settle: timedelta,
+) -> list[Path]:
+    backend = _backend()
+    try:
+        # No size budget: this is an export, not a cache that may evict.
+        cache = BarCache(out, backend, max_bytes=1 << 62, settle=settle)
+        return await cache.warm(symbol, interval_seconds, start, end)
+    finally:
+        await backend.close()
+
+
+async def export_ticks(
+    symbol: str, start: datetime, end: datetime, out: Path,
+) -> list[Path]:
+    backend = _backend()
+    written: list[Path] = []
+    day: date | None = None
+    quotes: list[Quote] = []
+
+    def flush() -> None:
+        if day is not None and quotes:
+            path = tick_arrays.day_path(out, symbol, day)
+            tick_arrays.save(path, tick_arrays.encode(quotes))
+            LOG.info("%s: %d ticks -> %s", day, len(quotes), path)
+            written.append(path)
+
+    try:
+        async for page in PersistenceReader(backend).iter_ticks(symbol.upper(), start, end):
+            for quote in page:
+                quote_day = quote.timestamp.astimezone(UTC).date()
+                if quote_day != day:
+                    flush()
+                    day, quotes = quote_day, []
+                quotes.append(quote)
+        flush()
+    finally:
+        await backend.close()
+    return written
+
+
+def _parse_date(s: str) -> datetime:
+    return datetime.strptime(s, "%Y-%m-%d").replace(tzinfo=UTC)
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s | %(message)s",
+    )
+    parser = argparse.ArgumentParser(description="Export bars as columnar replay files.")
+    sub = parser.add_subparsers(dest="source", required=True)
+
+    from_json = sub.add_parser("json", help="convert JSON replay fixtures")
+    from_json.add_argument("fixtures", type=Path, nargs="+")
+    from_json.add_argument(
+        "--interval", type=int, default=60,
+        help="bar resolution for fixtures with no bars (default: 60)",
+    )
+
+    from_db = sub.add_parser("db", help="export a range of the bars table")
+    from_db.add_argument("--symbol", default="QQQ", help="ticker (default: QQQ)")
+    from_db.add_argument(
+        "--interval", type=int, default=60,
+        help="bar resolution in seconds (default: 60 for 1-min)",
+    )
+    from_db.add_argument(
+        "--start", type=_parse_date, required=True, help="UTC start date YYYY-MM-DD (inclusive)",
+    )
+    from_db.add_argument(
+        "--end", type=_parse_date, required=True, help="UTC end date YYYY-MM-DD (exclusive)",
+    )
+    from_db.add_argument(
+        "--settle-hours", type=float, default=6.0,
+        help="skip days that ended less than this long ago (default: 6)",
+    )
+
+    from_ticks = sub.add_parser("ticks", help="export a range of the ticks table")
+    from_ticks.add_argument("--symbol", default="QQQ", help="ticker (default: QQQ)")
+    from_ticks.add_argument(
+        "--start", type=_parse_date, required=True, help="UTC start date YYYY-MM-DD (inclusive)",
+    )
+    from_ticks.add_argument(
+        "--end", type=_parse_date, required=True, help="UTC end date YYYY-MM-DD (exclusive)",
+    )
+
+    for p in (from_json, from_db, from_ticks):
+        p.add_argument("--out", type=Path, required=True, help="dataset root directory")
+    args = parser.parse_args()
+
+    if args.source == "json":
+        written = export_json(args.fixtures, args.out, args.interval)
+    elif args.source == "ticks":
+        written = asyncio.run(export_ticks(args.symbol, args.start, args.end, args.out))
+    else:
+        written = asyncio.run(export_db(
+            args.symbol, args.interval, args.start, args.end, args.out,
+            settle=timedelta(hours=args.settle_hours),
+        ))
+    LOG.info("done: %d day files under %s", len(written), args.out)
+
+
+if __name__ == "__main__":
+    main()
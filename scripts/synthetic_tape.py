@@ -0,0 +1,53 @@
+"""Seeded synthetic tick tape for benchmarks and tests.
+
+A reproducible random walk of equity quotes with penny prices and a
+cumulative session volume. ``scripts/bench_tick_strategy.py`` drives the
+tick strategy with it, and the test suite uses it wherever it needs a
+realistic tape.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from contracts.data_feed import Quote
+
+SESSION_START = datetime(2026, 4, 15, 14, 0, tzinfo=UTC)
+
+_PENNY = Decimal("0.01")
+
+
+def tape(
+    n: int,
+    *,
+    seed: int,
+    start: datetime = SESSION_START,
+    symbol: str = "QQQ",
+    step_ms: int = 400,
+    moves_cents: Sequence[int] = (-3, -1, 0, 1, 3),
+    volumes: Sequence[int] = (0, 100, 300),
+) -> list[Quote]:
+    """``n`` quotes of a seeded random walk from $450.00, one every ``step_ms``.
+
+    Each tick moves the mid by a choice of ``moves_cents`` and adds a
+    choice of ``volumes`` to the cumulative session volume.
+    """
+    rng = random.Random(seed)
+    mid_cents = 45_000
+    cum = 0
+    out: list[Quote] = []
+    for i in range(n):
+        mid_cents += rng.choice(moves_cents)
+        cum += rng.choice(volumes)
+        mid = Decimal(mid_cents) * _PENNY
+        out.append(Quote(
+            symbol=symbol, timestamp=start + timedelta(milliseconds=step_ms * i),
+            bid=mid - _PENNY, ask=mid + _PENNY, last=mid, volume=cum,
+        ))
+    return out
+
+
+__all__ = ["SESSION_START", "tape"]
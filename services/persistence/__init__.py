@@ -8,21 +8,34 @@ Supabase/Postgres.
 
 from __future__ import annotations
 
+from services.persistence.bar_cache import BarCache
 from services.persistence.models import AuditEvent, DailyPnlRow
+from services.persistence.query import Compare, In, JsonKey, Predicate
 from services.persistence.reader import PersistenceReader
 from services.persistence.storage import (
     InMemoryBackend,
     StorageBackend,
     SupabaseBackend,
 )
+from services.persistence.stream import BarColumns, BarStream, stream_pages
+from services.persistence.write_behind import WriteBehindBackend
 from services.persistence.writer import PersistenceWriter
 
 __all__ = [
     "AuditEvent",
+    "BarCache",
+    "BarColumns",
+    "BarStream",
+    "Compare",
     "DailyPnlRow",
+    "In",
     "InMemoryBackend",
+    "JsonKey",
     "PersistenceReader",
     "PersistenceWriter",
+    "Predicate",
     "StorageBackend",
     "SupabaseBackend",
+    "WriteBehindBackend",
+    "stream_pages",
 ]
@@ -0,0 +1,172 @@
+"""Local on-disk cache of the ``bars`` table, one columnar file per day.
+
+Backtests replay the same history over and over; without a cache every
+run pulls every bar across the public internet from the pooler. `BarCache`
+keeps one `engine.data_feeds.bar_arrays` file per
+``(symbol, interval_seconds, UTC day)`` under ``directory``:
+
+  * A read works out which days of ``[start, end)`` are missing and
+    fetches each contiguous run of them with one keyset-paged
+    `BarStream`, writing a file per day (empty days included, so a
+    weekend is not re-queried).
+  * Days that are still open — ended less than ``settle`` ago, so live
+    bars or a late backfill may still land — are never cached; they are
+    read straight from the backend every time.
+  * Every hit bumps the file's mtime; after a write, least recently used
+    files are evicted until the cache is under ``max_bytes``.
+
+Files are written atomically and memory-mapped on read, so concurrent
+backtest processes can share one directory.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import AsyncIterator, Callable, Iterator
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from time import time_ns
+
+from contracts.data_feed import Bar
+from engine.data_feeds import bar_arrays
+
+from services.persistence.storage import StorageBackend
+from services.persistence.stream import BarStream
+
+LOG = logging.getLogger("alpha_kite.persistence.bar_cache")
+
+_DAY = timedelta(days=1)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time(), tzinfo=UTC)
+
+
+def _days(start: datetime, end: datetime) -> Iterator[date]:
+    day = start.astimezone(UTC).date()
+    while _day_start(day) < end:
+        yield day
+        day += _DAY
+
+
+class BarCache:
+    """Day-file cache in front of ``backend``'s ``bars`` table."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        backend: StorageBackend,
+        *,
+        max_bytes: int = 2 << 30,
+        settle: timedelta = timedelta(hours=6),
+        page_size: int = 10_000,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._root = Path(directory)
+        self._backend = backend
+        self._max_bytes = max_bytes
+        self._settle = settle
+        self._page_size = page_size
+        self._clock = clock
+
+    def path(self, symbol: str, interval_seconds: int, day: date) -> Path:
+        return bar_arrays.day_path(self._root, symbol, interval_seconds, day)
+
+    async def bars(
+        self,
+        symbol: str,
+        interval_seconds: int,
+        start: datetime,
+        end: datetime,
+    ) -> AsyncIterator[list[Bar]]:
+        """Bars with ``start <= open_time < end``, oldest first, one day per chunk."""
+        symbol = symbol.upper()
+        days = list(_days(start, end))
+        paths = await self._warm(symbol, interval_seconds, days)
+
+        for day in days:
+            lo, hi = max(start, _day_start(day)), min(end, _day_start(day) + _DAY)
+            path = paths.get(day)
+            if path is not None:
+                chunk = bar_arrays.window(bar_arrays.load(path), lo, hi)
+                stamp = time_ns()  # explicit: implicit utime is only tick-precise
+                os.utime(path, ns=(stamp, stamp))
+                if chunk.shape[1]:
+                    yield list(bar_arrays.decode(chunk, symbol, interval_seconds))
+            else:
+                stream = BarStream(
+                    self._backend, symbol, interval_seconds, lo, hi, page_size=self._page_size,
+                )
+                async for page in stream.bars():
+                    yield page
+
+    async def warm(
+        self,
+        symbol: str,
+        interval_seconds: int,
+        start: datetime,
+        end: datetime,
+    ) -> list[Path]:
+        """Make sure every closed day overlapping ``[start, end)`` is on disk.
+
+        Returns the day files, oldest first. Open days are skipped.
+        """
+        paths = await self._warm(symbol.upper(), interval_seconds, list(_days(start, end)))
+        return list(paths.values())
+
+    async def _warm(
+        self, symbol: str, interval_seconds: int, days: list[date],
+    ) -> dict[date, Path]:
+        cutoff = self._clock() - self._settle
+        closed = [d for d in days if _day_start(d) + _DAY <= cutoff]
+        paths = {d: self.path(symbol, interval_seconds, d) for d in closed}
+        missing = [d for d in closed if not paths[d].exists()]
+        if missing:
+            await self._fill(missing, symbol, interval_seconds)
+            self._evict(keep=set(paths.values()))
+        return paths
+
+    async def _fill(self, missing: list[date], symbol: str, interval_seconds: int) -> None:
+        """Fetch and write each contiguous run of ``missing`` days."""
+        runs: list[list[date]] = []
+        for day in missing:
+            if runs and runs[-1][-1] + _DAY == day:
+                runs[-1].append(day)
+            else:
+                runs.append([day])
+        for run in runs:
+            LOG.info("bar cache miss: %s @%ds %s..%s", symbol, interval_seconds, run[0], run[-1])
+            by_day: dict[date, list[Bar]] = {d: [] for d in run}
+            stream = BarStream(
+                self._backend, symbol, interval_seconds,
+                _day_start(run[0]), _day_start(run[-1]) + _DAY, page_size=self._page_size,
+            )
+            pending = iter(run)
+            current = next(pending)
+            async for page in stream.bars():
+                for bar in page:
+                    day = bar.open_time.astimezone(UTC).date()
+                    while current < day:  # days are ordered: write finished ones now
+                        self._write(symbol, interval_seconds, current, by_day.pop(current))
+                        current = next(pending)
+                    by_day[current].append(bar)
+            for day, bars in by_day.items():
+                self._write(symbol, interval_seconds, day, bars)
+
+    def _write(self, symbol: str, interval_seconds: int, day: date, bars: list[Bar]) -> None:
+        bar_arrays.save(self.path(symbol, interval_seconds, day), bar_arrays.encode(bars))
+
+    def _evict(self, keep: set[Path]) -> None:
+        # ``keep`` (the days being served right now) is never evicted, even
+        # if that leaves the cache over budget until the next write.
+        files = [(p.stat(), p) for p in self._root.rglob("*.npy") if p not in keep]
+        total = sum(st.st_size for st, _ in files) + sum(p.stat().st_size for p in keep)
+        for st, path in sorted(files, key=lambda f: f[0].st_mtime):
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+
+
+__all__ = ["BarCache"]
@@ -0,0 +1,106 @@
+"""Typed row predicates for `StorageBackend.select` / `select_range`.
+
+``where`` stays the plain equality dict; ``filters`` takes these for
+everything else. Each predicate renders itself as parameterized SQL for
+`SupabaseBackend` and evaluates itself against a row dict for
+`InMemoryBackend`, so both backends agree on what a filter means:
+
+    await backend.select(
+        "daily_pnl",
+        filters=[Compare("trading_day", ">=", cutoff)],
+        columns=["trading_day", "realized_usd"],
+    )
+
+As in SQL, a NULL column never satisfies a predicate.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+CompareOp = Literal["=", "!=", "<", "<=", ">", ">="]
+
+_COMPARE: dict[str, Callable[[Any, Any], bool]] = {
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def _bind(values: list[Any], value: Any) -> str:
+    values.append(value)
+    return f"${len(values)}"
+
+
+@dataclass(frozen=True)
+class Compare:
+    """``column <op> value``."""
+
+    column: str
+    op: CompareOp
+    value: Any
+
+    def __post_init__(self) -> None:
+        if self.op not in _COMPARE:
+            raise ValueError(f"unsupported comparison {self.op!r}")
+
+    def matches(self, row: dict[str, Any]) -> bool:
+        current = row.get(self.column)
+        return current is not None and _COMPARE[self.op](current, self.value)
+
+    def sql(self, values: list[Any]) -> str:
+        return f'"{self.column}" {self.op} {_bind(values, self.value)}'
+
+
+@dataclass(frozen=True)
+class In:
+    """``column IN (values)``; an empty ``values`` matches nothing."""
+
+    column: str
+    values: tuple[Any, ...]
+
+    def __init__(self, column: str, values: Sequence[Any]) -> None:
+        object.__setattr__(self, "column", column)
+        object.__setattr__(self, "values", tuple(values))
+
+    def matches(self, row: dict[str, Any]) -> bool:
+        return row.get(self.column) in self.values
+
+    def sql(self, values: list[Any]) -> str:
+        return f'"{self.column}" = ANY({_bind(values, list(self.values))})'
+
+
+def _json_text(value: Any) -> str | None:
+    # What Postgres' ->> yields for a JSON value.
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+@dataclass(frozen=True)
+class JsonKey:
+    """``column->>key = value`` on a JSON/JSONB column (text comparison)."""
+
+    column: str
+    key: str
+    value: str
+
+    def matches(self, row: dict[str, Any]) -> bool:
+        doc = row.get(self.column)
+        return isinstance(doc, dict) and _json_text(doc.get(self.key)) == self.value
+
+    def sql(self, values: list[Any]) -> str:
+        key = _bind(values, self.key)
+        return f'"{self.column}"->>{key} = {_bind(values, self.value)}'
+
+
+Predicate = Compare | In | JsonKey
+
+
+__all__ = ["Compare", "CompareOp", "In", "JsonKey", "Predicate"]
@@ -6,12 +6,17 @@ async so they work uniformly across the in-memory and Postgres backends.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import date, datetime, timedelta
-from decimal import Decimal
 from typing import Any
 
+from contracts.data_feed import Bar, Quote
+
 from services.persistence.models import DailyPnlRow
+from services.persistence.query import Compare, In, Predicate
+from services.persistence.rows import _coerce_decimal, row_to_bar, row_to_quote
 from services.persistence.storage import StorageBackend
+from services.persistence.stream import BarStream, stream_pages
 
 _SEVERITY_ORDER = {"INFO": 0, "WARN": 1, "ERROR": 2}
 
@@ -26,14 +31,6 @@ def _coerce_date(value: Any) -> date:
     raise TypeError(f"cannot coerce {value!r} to date")
 
 
-def _coerce_decimal(value: Any) -> Decimal:
-    if value is None:
-        return Decimal("0")
-    if isinstance(value, Decimal):
-        return value
-    return Decimal(str(value))
-
-
 class PersistenceReader:
     """Read recent signals, open positions, daily P&L, and audit entries."""
 
@@ -50,15 +47,14 @@ class PersistenceReader:
         return [r for r in rows if int(r.get("quantity", 0) or 0) != 0]
 
     async def daily_pnl(self, days: int = 30) -> list[DailyPnlRow]:
+        cutoff = date.today() - timedelta(days=days)
         rows = await self._backend.select(
-            "daily_pnl", order_by="trading_day DESC", limit=days
+            "daily_pnl", order_by="trading_day DESC", limit=days,
+            filters=[Compare("trading_day", ">=", cutoff)],
         )
-        cutoff = date.today() - timedelta(days=days)
         out: list[DailyPnlRow] = []
         for r in rows:
             day = _coerce_date(r["trading_day"])
-            if day < cutoff:
-                continue
             out.append(
                 DailyPnlRow(
                     trading_day=day,
@@ -71,25 +67,79 @@ class PersistenceReader:
             )
         return out
 
+    async def latest_bar(
+        self,
+        symbol: str,
+        interval_seconds: int,
+        as_of: datetime | None = None,
+        start: datetime | None = None,
+    ) -> Bar | None:
+        """The last bar with ``start <= open_time <= as_of``, or None.
+
+        One query that walks the ``(symbol, interval_seconds, open_time)``
+        index backwards from ``as_of``.
+        """
+        rows = await self._backend.select_range(
+            "bars", "open_time", start=start,
+            end=None if as_of is None else as_of + timedelta(microseconds=1),
+            where={"symbol": symbol, "interval_seconds": interval_seconds},
+            order_by="open_time DESC", limit=1,
+        )
+        return row_to_bar(rows[0]) if rows else None
+
+    async def iter_ticks(
+        self,
+        symbol: str,
+        start: datetime,
+        end: datetime | None = None,
+        *,
+        page_size: int = 10_000,
+    ) -> AsyncIterator[list[Quote]]:
+        """Ticks with ``start <= ts < end``, oldest first, one page per query.
+
+        Keyset pagination: memory stays at one page however busy the
+        session, and nothing in the range is skipped.
+        """
+        async for rows in stream_pages(
+            self._backend, "ticks", "ts", start=start, end=end,
+            where={"symbol": symbol}, order_by="ts, id", page_size=page_size,
+        ):
+            yield [row_to_quote(r) for r in rows]
+
+    async def iter_bars(
+        self,
+        symbol: str,
+        interval_seconds: int,
+        start: datetime,
+        end: datetime | None = None,
+        *,
+        page_size: int = 10_000,
+    ) -> AsyncIterator[list[Bar]]:
+        """Bars with ``start <= open_time < end``, oldest first, one page per query.
+
+        See `services.persistence.stream.BarStream` for row / columnar chunks.
+        """
+        stream = BarStream(
+            self._backend, symbol, interval_seconds, start, end, page_size=page_size
+        )
+        async for bars in stream.bars():
+            yield bars
+
     async def recent_audit(
         self,
         limit: int = 200,
         severity_min: str | None = None,
     ) -> list[dict[str, Any]]:
-        rows = await self._backend.select(
-            "audit_log", order_by="ts DESC", limit=limit
+        filters: list[Predicate] = []
+        threshold = None if severity_min is None else _SEVERITY_ORDER.get(severity_min.upper())
+        if threshold:
+            # Filter before the LIMIT so a burst of INFO rows can't crowd
+            # out the warnings asked for.
+            wanted = [s for s, n in _SEVERITY_ORDER.items() if n >= threshold]
+            filters.append(In("severity", wanted))
+        return await self._backend.select(
+            "audit_log", order_by="ts DESC", limit=limit, filters=filters
         )
-        if severity_min is None:
-            return rows
-        threshold = _SEVERITY_ORDER.get(severity_min.upper())
-        if threshold is None:
-            return rows
-        return [
-            r
-            for r in rows
-            if _SEVERITY_ORDER.get(str(r.get("severity", "INFO")).upper(), 0)
-            >= threshold
-        ]
-
-
-__all__ = ["PersistenceReader"]
+
+
+__all__ = ["PersistenceReader", "row_to_bar", "row_to_quote"]
@@ -0,0 +1,55 @@
+"""Row-dict <-> contract conversions shared by the reader and streams."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from contracts.data_feed import Bar, Quote
+
+
+def _coerce_decimal(value: Any) -> Decimal:
+    if value is None:
+        return Decimal("0")
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def _coerce_ts(value: Any) -> datetime:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _optional_decimal(value: Any) -> Decimal | None:
+    return None if value is None else _coerce_decimal(value)
+
+
+def row_to_quote(row: dict[str, Any]) -> Quote:
+    """Rebuild a ``Quote`` from a ``ticks`` row."""
+    return Quote(
+        symbol=row["symbol"],
+        timestamp=_coerce_ts(row["ts"]),
+        bid=_coerce_decimal(row["bid"]),
+        ask=_coerce_decimal(row["ask"]),
+        last=_optional_decimal(row.get("last")),
+        volume=row.get("volume"),
+    )
+
+
+def row_to_bar(row: dict[str, Any]) -> Bar:
+    """Rebuild a ``Bar`` from a ``bars`` row."""
+    return Bar(
+        symbol=row["symbol"],
+        interval_seconds=int(row["interval_seconds"]),
+        open_time=_coerce_ts(row["open_time"]),
+        open=_coerce_decimal(row["open"]),
+        high=_coerce_decimal(row["high"]),
+        low=_coerce_decimal(row["low"]),
+        close=_coerce_decimal(row["close"]),
+        volume=int(row["volume"]),
+        vwap=_optional_decimal(row.get("vwap")),
+    )
+
+
+__all__ = ["row_to_bar", "row_to_quote"]
@@ -13,8 +13,13 @@ turning Pydantic / dataclass models into row dicts before calling
 from __future__ import annotations
 
 import os
+from bisect import bisect_left, insort
+from collections.abc import Sequence
+from decimal import Decimal
 from typing import Any, Protocol, runtime_checkable
 
+from services.persistence.query import Compare, Predicate
+
 
 @runtime_checkable
 class StorageBackend(Protocol):
@@ -33,14 +38,55 @@ class StorageBackend(Protocol):
         """Insert-or-update using `conflict_columns` as the conflict target."""
         ...
 
+    async def increment(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        conflict_columns: list[str],
+    ) -> None:
+        """Insert-or-add: on conflict, every other column of the row is
+        added to the stored value, atomically on the server.
+
+        Rows sharing a conflict key are summed first, so one call can
+        carry a whole replay's worth of increments.
+        """
+        ...
+
     async def select(
         self,
         table: str,
         where: dict[str, Any] | None = None,
         order_by: str | None = None,
         limit: int | None = None,
+        *,
+        filters: Sequence[Predicate] = (),
+        columns: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Equality-only filtering. Returns row dicts."""
+        """Rows matching the equality ``where`` and every predicate in
+        ``filters`` (range / IN / JSON key, see `services.persistence.query`).
+
+        ``columns`` projects the returned row dicts; default is every column.
+        """
+        ...
+
+    async def select_range(
+        self,
+        table: str,
+        column: str,
+        *,
+        start: Any = None,
+        end: Any = None,
+        where: dict[str, Any] | None = None,
+        order_by: str | None = None,
+        limit: int | None = None,
+        filters: Sequence[Predicate] = (),
+        columns: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """`select` plus a half-open range ``start <= column < end``.
+
+        Either bound may be None (unbounded). One query on Postgres, so a
+        whole session of ticks comes back in a single round-trip.
+        """
         ...
 
 
@@ -49,31 +95,207 @@ class StorageBackend(Protocol):
 # ──────────────────────────────────────────────────────────────────────────
 
 
-def _matches(row: dict[str, Any], where: dict[str, Any] | None) -> bool:
-    if not where:
-        return True
-    for k, v in where.items():
-        if row.get(k) != v:
-            return False
-    return True
-
+# Secondary equality indexes mirroring the migrations' btree indexes (the
+# leading equality columns only; ordering comes from the sorted views).
+DEFAULT_INDEXES: dict[str, list[tuple[str, ...]]] = {
+    "ticks": [("symbol",)],
+    "bars": [("symbol", "interval_seconds")],
+    "signals": [("strategy",), ("symbol",)],
+    "fills": [("intent_id",)],
+    "audit_log": [("event_type",)],
+}
+
+
+def _matches(
+    row: dict[str, Any],
+    where: dict[str, Any] | None,
+    filters: Sequence[Predicate] = (),
+) -> bool:
+    if where:
+        for k, v in where.items():
+            if row.get(k) != v:
+                return False
+    return all(p.matches(row) for p in filters)
+
+
+def _project(
+    rows: list[dict[str, Any]], columns: Sequence[str] | None
+) -> list[dict[str, Any]]:
+    if columns is None:
+        return rows
+    return [{c: r.get(c) for c in columns} for r in rows]
+
+
+def _add(current: Any, delta: Any) -> Any:
+    # Numeric columns travel as strings (see writer._dec_str); keep the
+    # stored type and sum exactly.
+    if current is None:
+        return delta
+    if isinstance(current, str) or isinstance(delta, str):
+        return str(Decimal(str(current)) + Decimal(str(delta)))
+    return current + delta
+
+
+def _sum_by_key(
+    rows: list[dict[str, Any]], conflict_columns: list[str]
+) -> list[dict[str, Any]]:
+    """Collapse rows sharing a conflict key into one row of summed deltas."""
+    summed: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for row in rows:
+        key = tuple(row.get(c) for c in conflict_columns)
+        acc = summed.get(key)
+        if acc is None:
+            summed[key] = dict(row)
+            continue
+        for c, v in row.items():
+            if c not in conflict_columns:
+                acc[c] = _add(acc.get(c), v)
+    return list(summed.values())
+
+
+def _parse_order_by(order_by: str) -> list[tuple[str, bool]]:
+    """Returns [(column, descending), ...] for ``"a, b DESC"``-style input."""
+    keys: list[tuple[str, bool]] = []
+    for term in order_by.split(","):
+        parts = term.strip().split()
+        keys.append((parts[0], len(parts) > 1 and parts[1].upper() == "DESC"))
+    return keys
+
+
+def _sort_rows(rows: list[dict[str, Any]], order_by: str) -> None:
+    # Stable sorts, last key first, so earlier keys take precedence and
+    # ties keep insertion order (like an id tiebreak in Postgres).
+    for col, desc in reversed(_parse_order_by(order_by)):
+        rows.sort(key=lambda r, c=col: (r.get(c) is None, r.get(c)), reverse=desc)
+
+
+class _Table:
+    """One table's rows plus the indexes kept over them.
+
+    Rows are never deleted, so a row's position in ``rows`` is a stable
+    id. Every index is built on first use and kept current by inserts;
+    an in-place upsert that changes an indexed column just drops that
+    index to be rebuilt lazily.
+    """
+
+    def __init__(self, declared: list[tuple[str, ...]]) -> None:
+        self.rows: list[dict[str, Any]] = []
+        self.declared = declared
+        # conflict columns -> key -> row position (first row wins, as the
+        # old linear scan did)
+        self.unique: dict[tuple[str, ...], dict[tuple[Any, ...], int]] = {}
+        # declared columns -> key -> row positions in insertion order
+        self.secondary: dict[tuple[str, ...], dict[tuple[Any, ...], list[int]]] = {}
+        # column -> [(is_null, value, position)] ascending; NULLs sort last
+        self.views: dict[str, list[tuple[Any, ...]]] = {}
+
+    def unique_index(self, cols: tuple[str, ...]) -> dict[tuple[Any, ...], int]:
+        index = self.unique.get(cols)
+        if index is None:
+            index = {}
+            for i, row in enumerate(self.rows):
+                index.setdefault(tuple(row.get(c) for c in cols), i)
+            self.unique[cols] = index
+        return index
+
+    def secondary_index(self, cols: tuple[str, ...]) -> dict[tuple[Any, ...], list[int]]:
+        index = self.secondary.get(cols)
+        if index is None:
+            index = {}
+            for i, row in enumerate(self.rows):
+                index.setdefault(tuple(row.get(c) for c in cols), []).append(i)
+            self.secondary[cols] = index
+        return index
+
+    def view(self, col: str) -> list[tuple[Any, ...]]:
+        entries = self.views.get(col)
+        if entries is None:
+            entries = sorted(
+                (row.get(col) is None, row.get(col), i) for i, row in enumerate(self.rows)
+            )
+            self.views[col] = entries
+        return entries
+
+    def append(self, row: dict[str, Any]) -> None:
+        i = len(self.rows)
+        self.rows.append(row)
+        for cols, unique in self.unique.items():
+            unique.setdefault(tuple(row.get(c) for c in cols), i)
+        for cols, secondary in self.secondary.items():
+            secondary.setdefault(tuple(row.get(c) for c in cols), []).append(i)
+        for col, entries in self.views.items():
+            value = row.get(col)
+            insort(entries, (value is None, value, i))
+
+    def update(self, i: int, row: dict[str, Any]) -> None:
+        existing = self.rows[i]
+        changed = {k for k, v in row.items() if k not in existing or existing[k] != v}
+        existing.update(row)
+        if not changed:
+            return
+        for cols in [c for c in self.unique if changed.intersection(c)]:
+            del self.unique[cols]
+        for cols in [c for c in self.secondary if changed.intersection(c)]:
+            del self.secondary[cols]
+        for col in changed.intersection(self.views):
+            del self.views[col]
+
+    def candidates(self, where: dict[str, Any] | None) -> list[int] | None:
+        """Row positions from the widest declared index ``where`` covers."""
+        if not where:
+            return None
+        usable = [cols for cols in self.declared if all(c in where for c in cols)]
+        if not usable:
+            return None
+        cols = max(usable, key=len)
+        return self.secondary_index(cols).get(tuple(where[c] for c in cols), [])
+
+    def scan_view(
+        self,
+        entries: list[tuple[Any, ...]],
+        *,
+        desc: bool,
+        where: dict[str, Any] | None,
+        filters: Sequence[Predicate],
+        limit: int | None,
+    ) -> list[dict[str, Any]]:
+        """Matching rows from ``entries`` in view order, stopping once
+        ``limit`` rows are in hand and the sort value moves on (so ties
+        at the cut are all returned for the caller's full sort).
 
-def _parse_order_by(order_by: str) -> tuple[str, bool]:
-    """Returns (column, descending)."""
-    parts = order_by.strip().split()
-    col = parts[0]
-    desc = len(parts) > 1 and parts[1].upper() == "DESC"
-    return col, desc
+        Rows come back in insertion order; the caller sorts them.
+        """
+        hits: list[int] = []
+        last: Any = None
+        for null, value, i in reversed(entries) if desc else entries:
+            if limit is not None and len(hits) >= limit and (null, value) != last:
+                break
+            if _matches(self.rows[i], where, filters):
+                hits.append(i)
+                last = (null, value)
+        hits.sort()
+        return [dict(self.rows[i]) for i in hits]
 
 
 class InMemoryBackend:
-    """Dict-of-table → list[row] backend with proper conflict-resolution upsert."""
+    """Dict-of-table → rows backend with proper conflict-resolution upsert.
+
+    Upserts find their conflict row through a hash index on the
+    ``conflict_columns`` seen, ``where`` filters use the declared
+    ``indexes`` (default `DEFAULT_INDEXES`), and ``order_by`` on a single
+    column with a ``limit`` — or a range on the ``order_by`` column —
+    walks a sorted view instead of sorting the whole table.
+    """
 
-    def __init__(self) -> None:
-        self._tables: dict[str, list[dict[str, Any]]] = {}
+    def __init__(self, indexes: dict[str, list[tuple[str, ...]]] | None = None) -> None:
+        self._indexes = DEFAULT_INDEXES if indexes is None else indexes
+        self._tables: dict[str, _Table] = {}
 
-    def _table(self, name: str) -> list[dict[str, Any]]:
-        return self._tables.setdefault(name, [])
+    def _table(self, name: str) -> _Table:
+        table = self._tables.get(name)
+        if table is None:
+            table = self._tables[name] = _Table(list(self._indexes.get(name, [])))
+        return table
 
     async def insert(self, table: str, rows: list[dict[str, Any]]) -> None:
         if not rows:
@@ -91,17 +313,33 @@ class InMemoryBackend:
         if not rows:
             return
         bucket = self._table(table)
+        cols = tuple(conflict_columns)
         for row in rows:
-            row = dict(row)
-            replaced = False
-            for i, existing in enumerate(bucket):
-                if all(existing.get(c) == row.get(c) for c in conflict_columns):
-                    merged = {**existing, **row}
-                    bucket[i] = merged
-                    replaced = True
-                    break
-            if not replaced:
+            i = bucket.unique_index(cols).get(tuple(row.get(c) for c in cols))
+            if i is None:
+                bucket.append(dict(row))
+            else:
+                bucket.update(i, row)
+
+    async def increment(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        conflict_columns: list[str],
+    ) -> None:
+        if not rows:
+            return
+        bucket = self._table(table)
+        cols = tuple(conflict_columns)
+        for row in _sum_by_key(rows, conflict_columns):
+            i = bucket.unique_index(cols).get(tuple(row.get(c) for c in cols))
+            if i is None:
                 bucket.append(row)
+            else:
+                existing = bucket.rows[i]
+                bucket.update(i, {
+                    c: _add(existing.get(c), v) for c, v in row.items() if c not in cols
+                })
 
     async def select(
         self,
@@ -109,15 +347,77 @@ class InMemoryBackend:
         where: dict[str, Any] | None = None,
         order_by: str | None = None,
         limit: int | None = None,
+        *,
+        filters: Sequence[Predicate] = (),
+        columns: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
-        bucket = self._tables.get(table, [])
-        rows = [dict(r) for r in bucket if _matches(r, where)]
+        bucket = self._tables.get(table)
+        if bucket is None:
+            return []
+        positions = bucket.candidates(where)
+        keys = _parse_order_by(order_by) if order_by else []
+        if (
+            len(keys) == 1
+            and limit is not None
+            and (positions is None or 2 * len(positions) > len(bucket.rows))
+        ):
+            col, desc = keys[0]
+            rows = bucket.scan_view(
+                bucket.view(col), desc=desc, where=where, filters=filters, limit=limit
+            )
+        else:
+            source = bucket.rows if positions is None else [bucket.rows[i] for i in positions]
+            rows = [dict(r) for r in source if _matches(r, where, filters)]
         if order_by:
-            col, desc = _parse_order_by(order_by)
-            rows.sort(key=lambda r: (r.get(col) is None, r.get(col)), reverse=desc)
+            _sort_rows(rows, order_by)
         if limit is not None:
             rows = rows[:limit]
-        return rows
+        return _project(rows, columns)
+
+    async def select_range(
+        self,
+        table: str,
+        column: str,
+        *,
+        start: Any = None,
+        end: Any = None,
+        where: dict[str, Any] | None = None,
+        order_by: str | None = None,
+        limit: int | None = None,
+        filters: Sequence[Predicate] = (),
+        columns: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        bucket = self._tables.get(table)
+        if bucket is None:
+            return []
+        keys = _parse_order_by(order_by) if order_by else []
+        if keys and keys[0][0] == column:
+            # Bisect the column's sorted view to the range; NULLs (which
+            # sort last) never satisfy it.
+            entries = bucket.view(column)
+            lo = 0 if start is None else bisect_left(entries, (False, start))
+            hi = bisect_left(entries, (True,)) if end is None else bisect_left(
+                entries, (False, end)
+            )
+            rows = bucket.scan_view(
+                entries[lo:hi], desc=keys[0][1], where=where, filters=filters, limit=limit
+            )
+        else:
+            positions = bucket.candidates(where)
+            source = bucket.rows if positions is None else [bucket.rows[i] for i in positions]
+            rows = [
+                dict(r)
+                for r in source
+                if _matches(r, where, filters)
+                and r.get(column) is not None
+                and (start is None or r[column] >= start)
+                and (end is None or r[column] < end)
+            ]
+        if order_by:
+            _sort_rows(rows, order_by)
+        if limit is not None:
+            rows = rows[:limit]
+        return _project(rows, columns)
 
 
 # ──────────────────────────────────────────────────────────────────────────
@@ -128,7 +428,7 @@ class InMemoryBackend:
 class SupabaseBackend:
     """Postgres backend that uses `asyncpg` directly with parameterized SQL."""
 
-    def __init__(self, dsn: str | None = None) -> None:
+    def __init__(self, dsn: str | None = None, *, copy_threshold: int = 500) -> None:
         self._dsn = dsn or os.environ.get("SUPABASE_DB_URL")
         if not self._dsn:
             raise RuntimeError(
@@ -138,6 +438,9 @@ class SupabaseBackend:
         # in environments without the package available.
         import asyncpg  # noqa: F401  (side-effect-free import-time check)
 
+        # insert/upsert calls with at least this many rows go through
+        # binary COPY (`insert_many` / `upsert_many`) instead of VALUES.
+        self._copy_threshold = copy_threshold
         self._pool: Any = None
 
     async def _ensure_pool(self) -> Any:
@@ -149,14 +452,23 @@ class SupabaseBackend:
             async def _init_conn(conn: Any) -> None:
                 # Register Python dict <-> JSONB/JSON codecs. Without this,
                 # asyncpg sees a dict for a JSONB column and raises
-                # "expected str, got dict".
-                for type_name in ("jsonb", "json"):
-                    await conn.set_type_codec(
-                        type_name,
-                        encoder=json.dumps,
-                        decoder=json.loads,
-                        schema="pg_catalog",
-                    )
+                # "expected str, got dict". They are binary-format codecs so
+                # that COPY (which is binary-only) can carry JSONB columns
+                # too; jsonb's wire format is a version byte plus the text.
+                await conn.set_type_codec(
+                    "jsonb",
+                    encoder=lambda v: b"\x01" + json.dumps(v).encode(),
+                    decoder=lambda b: json.loads(b[1:]),
+                    schema="pg_catalog",
+                    format="binary",
+                )
+                await conn.set_type_codec(
+                    "json",
+                    encoder=lambda v: json.dumps(v).encode(),
+                    decoder=json.loads,
+                    schema="pg_catalog",
+                    format="binary",
+                )
 
             self._pool = await asyncpg.create_pool(
                 self._dsn,
@@ -193,6 +505,9 @@ class SupabaseBackend:
     async def insert(self, table: str, rows: list[dict[str, Any]]) -> None:
         if not rows:
             return
+        if len(rows) >= self._copy_threshold:
+            await self.insert_many(table, rows)
+            return
         pool = await self._ensure_pool()
         cols = list(rows[0].keys())
         col_sql = ", ".join(f'"{c}"' for c in cols)
@@ -217,13 +532,16 @@ class SupabaseBackend:
         so 13k rows * 50ms RTT ~= 11 minutes. Collapsing into multi-row
         VALUES statements brings that down to ~28 round-trips for the same
         13k rows. Same on-conflict semantics either way.
+
+        At ``copy_threshold`` rows and above this hands off to
+        `upsert_many` instead.
         """
         if not rows:
             return
-        pool = await self._ensure_pool()
+        if len(rows) >= self._copy_threshold:
+            await self.upsert_many(table, rows, conflict_columns)
+            return
         cols = list(rows[0].keys())
-        n_cols = len(cols)
-        col_sql = ", ".join(f'"{c}"' for c in cols)
         conflict_sql = ", ".join(f'"{c}"' for c in conflict_columns)
         update_cols = [c for c in cols if c not in conflict_columns]
         if update_cols:
@@ -231,6 +549,44 @@ class SupabaseBackend:
             on_conflict = f"ON CONFLICT ({conflict_sql}) DO UPDATE SET {set_sql}"
         else:
             on_conflict = f"ON CONFLICT ({conflict_sql}) DO NOTHING"
+        await self._insert_values(table, cols, rows, on_conflict)
+
+    async def increment(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        conflict_columns: list[str],
+    ) -> None:
+        """One ``INSERT ... ON CONFLICT DO UPDATE SET c = t.c + EXCLUDED.c``
+        per 500 (pre-summed) rows — no read, so racing writers can't lose
+        an increment."""
+        if not rows:
+            return
+        rows = _sum_by_key(rows, conflict_columns)
+        cols = list(rows[0].keys())
+        conflict_sql = ", ".join(f'"{c}"' for c in conflict_columns)
+        set_sql = ", ".join(
+            f'"{c}" = "{table}"."{c}" + EXCLUDED."{c}"'
+            for c in cols
+            if c not in conflict_columns
+        )
+        on_conflict = (
+            f"ON CONFLICT ({conflict_sql}) DO UPDATE SET {set_sql}"
+            if set_sql
+            else f"ON CONFLICT ({conflict_sql}) DO NOTHING"
+        )
+        await self._insert_values(table, cols, rows, on_conflict)
+
+    async def _insert_values(
+        self,
+        table: str,
+        cols: list[str],
+        rows: list[dict[str, Any]],
+        on_conflict: str,
+    ) -> None:
+        pool = await self._ensure_pool()
+        n_cols = len(cols)
+        col_sql = ", ".join(f'"{c}"' for c in cols)
 
         # 500 rows per statement keeps us comfortably under Postgres's
         # 65535-parameter cap (with 11 columns per row that's 5500 params).
@@ -256,21 +612,118 @@ class SupabaseBackend:
                 )
                 await conn.execute(sql, *values_flat)
 
+    async def insert_many(self, table: str, rows: list[dict[str, Any]]) -> None:
+        """Append rows with one binary COPY instead of one INSERT per row.
+
+        Columns come from the first row, as in `insert`; columns left out
+        (e.g. ``id``) take their defaults.
+        """
+        if not rows:
+            return
+        pool = await self._ensure_pool()
+        cols = list(rows[0].keys())
+        records = [tuple(row.get(c) for c in cols) for row in rows]
+        async with pool.acquire() as conn:
+            await conn.copy_records_to_table(table, records=records, columns=cols)
+
+    async def upsert_many(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        conflict_columns: list[str],
+    ) -> None:
+        """Upsert via binary COPY into a temp staging table, then one merge.
+
+        The staging table has just the copied columns (no constraints) and
+        is dropped at commit. Rows repeating a conflict key collapse to
+        the last one first — Postgres refuses to update the same row twice
+        in one ``INSERT ... ON CONFLICT``.
+        """
+        if not rows:
+            return
+        pool = await self._ensure_pool()
+        latest: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for row in rows:
+            latest[tuple(row.get(c) for c in conflict_columns)] = row
+        cols = list(rows[0].keys())
+        records = [tuple(row.get(c) for c in cols) for row in latest.values()]
+
+        stage = f"_stage_{table}"
+        col_sql = ", ".join(f'"{c}"' for c in cols)
+        conflict_sql = ", ".join(f'"{c}"' for c in conflict_columns)
+        update_cols = [c for c in cols if c not in conflict_columns]
+        if update_cols:
+            set_sql = ", ".join(f'"{c}" = EXCLUDED."{c}"' for c in update_cols)
+            on_conflict = f"ON CONFLICT ({conflict_sql}) DO UPDATE SET {set_sql}"
+        else:
+            on_conflict = f"ON CONFLICT ({conflict_sql}) DO NOTHING"
+
+        async with pool.acquire() as conn, conn.transaction():
+            await conn.execute(
+                f'CREATE TEMP TABLE "{stage}" ON COMMIT DROP AS '
+                f'SELECT {col_sql} FROM "{table}" WITH NO DATA'
+            )
+            await conn.copy_records_to_table(stage, records=records, columns=cols)
+            await conn.execute(
+                f'INSERT INTO "{table}" ({col_sql}) '
+                f'SELECT {col_sql} FROM "{stage}" {on_conflict}'
+            )
+
     async def select(
         self,
         table: str,
         where: dict[str, Any] | None = None,
         order_by: str | None = None,
         limit: int | None = None,
+        *,
+        filters: Sequence[Predicate] = (),
+        columns: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        return await self._fetch(
+            table, where=where, filters=filters, columns=columns,
+            order_by=order_by, limit=limit,
+        )
+
+    async def select_range(
+        self,
+        table: str,
+        column: str,
+        *,
+        start: Any = None,
+        end: Any = None,
+        where: dict[str, Any] | None = None,
+        order_by: str | None = None,
+        limit: int | None = None,
+        filters: Sequence[Predicate] = (),
+        columns: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        bounds: list[Predicate] = []
+        if start is not None:
+            bounds.append(Compare(column, ">=", start))
+        if end is not None:
+            bounds.append(Compare(column, "<", end))
+        return await self._fetch(
+            table, where=where, filters=[*bounds, *filters], columns=columns,
+            order_by=order_by, limit=limit,
+        )
+
+    async def _fetch(
+        self,
+        table: str,
+        *,
+        where: dict[str, Any] | None,
+        filters: Sequence[Predicate],
+        columns: Sequence[str] | None,
+        order_by: str | None,
+        limit: int | None,
     ) -> list[dict[str, Any]]:
         pool = await self._ensure_pool()
-        sql = f'SELECT * FROM "{table}"'
         values: list[Any] = []
-        if where:
-            clauses = []
-            for i, (k, v) in enumerate(where.items(), start=1):
-                clauses.append(f'"{k}" = ${i}')
-                values.append(v)
+        clauses = [Compare(k, "=", v).sql(values) for k, v in (where or {}).items()]
+        clauses += [p.sql(values) for p in filters]
+        col_sql = "*" if columns is None else ", ".join(f'"{c}"' for c in columns)
+        sql = f'SELECT {col_sql} FROM "{table}"'
+        if clauses:
             sql += " WHERE " + " AND ".join(clauses)
         if order_by:
             sql += f" ORDER BY {order_by}"
@@ -281,4 +734,4 @@ class SupabaseBackend:
         return [dict(r) for r in records]
 
 
-__all__ = ["InMemoryBackend", "StorageBackend", "SupabaseBackend"]
+__all__ = ["DEFAULT_INDEXES", "InMemoryBackend", "StorageBackend", "SupabaseBackend"]
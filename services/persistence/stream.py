@@ -0,0 +1,193 @@
+"""Keyset-paginated streaming reads for tables too big to fetch at once.
+
+`stream_pages` walks a range of one table in ``page_size`` chunks, each a
+``select_range`` that restarts at the last key seen — no server-side
+cursor, so it works over PgBouncer's transaction pooling and against any
+`StorageBackend`. While the consumer works on one page the next is
+already being fetched.
+
+`BarStream` wraps that for the ``bars`` table, keyed on
+``(symbol, interval_seconds, open_time)`` (the table's unique key), and
+hands chunks back as row dicts, ``Bar`` objects or `BarColumns` numpy
+arrays. Memory stays at about two pages however long the range.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from contracts.data_feed import Bar
+
+from services.persistence.rows import row_to_bar
+from services.persistence.storage import StorageBackend
+
+
+async def stream_pages(
+    backend: StorageBackend,
+    table: str,
+    column: str,
+    *,
+    start: Any,
+    end: Any = None,
+    where: dict[str, Any] | None = None,
+    order_by: str,
+    page_size: int = 10_000,
+    columns: Sequence[str] | None = None,
+    prefetch: bool = True,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Rows with ``start <= column < end`` in ``order_by`` order, a page at a time.
+
+    ``order_by`` must lead with ``column`` and break ties the same way on
+    every query. Each page restarts at the last key seen (inclusive) and
+    drops the rows at that key earlier pages already returned, so nothing
+    is skipped or repeated even when a page ends inside a run of ties.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    fetch_cols = None if columns is None else list(dict.fromkeys([*columns, column]))
+    strip = columns is not None and column not in columns
+
+    def fetch(cursor: Any, limit: int) -> asyncio.Task[list[dict[str, Any]]]:
+        return asyncio.create_task(backend.select_range(
+            table, column, start=cursor, end=end, where=where,
+            order_by=order_by, limit=limit, columns=fetch_cols,
+        ))
+
+    cursor = start
+    seen_at_cursor = 0
+    limit = page_size
+    pending = fetch(cursor, limit)
+    try:
+        while True:
+            rows = await pending
+            fresh = rows[seen_at_cursor:]
+            done = len(rows) < limit
+            if not done:
+                last = rows[-1][column]
+                if last == cursor:
+                    seen_at_cursor += len(fresh)
+                else:
+                    cursor = last
+                    seen_at_cursor = sum(1 for r in rows if r[column] == last)
+                limit = page_size + seen_at_cursor
+                if prefetch:
+                    pending = fetch(cursor, limit)
+            if fresh:
+                if strip:
+                    for r in fresh:
+                        del r[column]
+                yield fresh
+            if done:
+                return
+            if not prefetch:
+                pending = fetch(cursor, limit)
+    finally:
+        # The consumer stopped early (or failed): don't leave a page in flight.
+        if not pending.done():
+            pending.cancel()
+
+
+@dataclass(frozen=True)
+class BarColumns:
+    """Columnar view of a run of bars; ``vwap`` is NaN where a bar had none."""
+
+    open_time: list[datetime]
+    epoch_seconds: npt.NDArray[np.int64]
+    open: npt.NDArray[np.float64]
+    high: npt.NDArray[np.float64]
+    low: npt.NDArray[np.float64]
+    close: npt.NDArray[np.float64]
+    volume: npt.NDArray[np.int64]
+    vwap: npt.NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[dict[str, Any]]) -> BarColumns:
+        n = len(rows)
+
+        def floats(col: str) -> npt.NDArray[np.float64]:
+            return np.fromiter(
+                (np.nan if r[col] is None else float(r[col]) for r in rows),
+                dtype=np.float64, count=n,
+            )
+
+        open_time = [r["open_time"] for r in rows]
+        return cls(
+            open_time=open_time,
+            epoch_seconds=np.fromiter(
+                (int(t.timestamp()) for t in open_time), dtype=np.int64, count=n,
+            ),
+            open=floats("open"),
+            high=floats("high"),
+            low=floats("low"),
+            close=floats("close"),
+            volume=np.fromiter((int(r["volume"]) for r in rows), dtype=np.int64, count=n),
+            vwap=floats("vwap"),
+        )
+
+    @classmethod
+    def concat(cls, chunks: Sequence[BarColumns]) -> BarColumns:
+        if not chunks:
+            return cls.from_rows([])
+        return cls(
+            open_time=[t for c in chunks for t in c.open_time],
+            **{
+                name: np.concatenate([getattr(c, name) for c in chunks])
+                for name in ("epoch_seconds", "open", "high", "low", "close", "volume", "vwap")
+            },
+        )
+
+
+_BAR_COLUMNS = (
+    "symbol", "interval_seconds", "open_time", "open", "high", "low", "close",
+    "volume", "vwap",
+)
+
+
+class BarStream:
+    """One symbol/interval's bars over ``[start, end)``, oldest first, in chunks."""
+
+    def __init__(
+        self,
+        backend: StorageBackend,
+        symbol: str,
+        interval_seconds: int,
+        start: datetime,
+        end: datetime | None = None,
+        *,
+        page_size: int = 10_000,
+        prefetch: bool = True,
+    ) -> None:
+        self._backend = backend
+        self._where = {"symbol": symbol, "interval_seconds": interval_seconds}
+        self._start = start
+        self._end = end
+        self._page_size = page_size
+        self._prefetch = prefetch
+
+    def rows(self, columns: Sequence[str] | None = None) -> AsyncIterator[list[dict[str, Any]]]:
+        """Raw row dicts, projected to ``columns`` if given."""
+        return stream_pages(
+            self._backend, "bars", "open_time", start=self._start, end=self._end,
+            where=self._where, order_by="open_time", page_size=self._page_size,
+            columns=columns, prefetch=self._prefetch,
+        )
+
+    async def bars(self) -> AsyncIterator[list[Bar]]:
+        async for rows in self.rows(_BAR_COLUMNS):
+            yield [row_to_bar(r) for r in rows]
+
+    async def columns(self) -> AsyncIterator[BarColumns]:
+        async for rows in self.rows(_BAR_COLUMNS[2:]):
+            yield BarColumns.from_rows(rows)
+
+
+__all__ = ["BarColumns", "BarStream", "stream_pages"]
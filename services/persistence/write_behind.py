@@ -0,0 +1,338 @@
+"""Write-behind wrapper that takes storage writes off the event hot path.
+
+Every ``PersistenceWriter`` call used to be an awaited round trip to the
+backend — for ``SupabaseBackend`` a remote Postgres — so each tick paid
+for ``write_tick`` before the strategy even saw it, then again for each
+signal, intent and audit row. :class:`WriteBehindBackend` wraps any
+:class:`StorageBackend`: ``insert`` / ``upsert`` / ``increment`` append
+rows to a bounded in-memory queue per ``(table, op, conflict columns)``
+and return
+immediately, and a background task writes them out in batches of up to
+``batch_size`` rows at least every ``flush_interval`` seconds. Decision
+latency no longer depends on database RTT.
+
+Guarantees:
+  * Rows of one queue are written in enqueue order. Queues are flushed
+    in the order they were first used, so fills land after the order
+    intents they reference.
+  * Upsert batches keep only the last row per conflict key, because one
+    ``INSERT ... ON CONFLICT`` statement cannot touch a row twice.
+  * ``increment`` rows queue like any other write; a batch is summed per
+    key by the backend and written as one increment.
+  * Reads (``select`` / ``select_range``) flush their table first, so
+    callers always see their own writes.
+  * :meth:`WriteBehindBackend.flush` is a barrier: it returns once every
+    row queued for the given tables is persisted and raises if the
+    backend rejects them. The orchestrator flushes ``order_intents``
+    before handing an intent to the broker.
+  * :meth:`WriteBehindBackend.close` drains everything on shutdown.
+
+Full queues apply backpressure (the writer waits for the flusher), except
+for tables listed in ``drop_tables`` — market data by default — where the
+oldest queued rows are dropped and counted instead. A failed batch stays
+queued; the flusher then retries on a doubling timer (``flush_interval``
+up to ``max_retry_interval``) and logs once per outage.
+:meth:`~WriteBehindBackend.stats` exposes per-table depth, writes,
+batches, drops, waits and failures.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from services.persistence.query import Predicate
+from services.persistence.storage import StorageBackend
+
+LOG = logging.getLogger("alpha_kite.persistence.write_behind")
+
+_QueueKey = tuple[str, str, tuple[str, ...]]
+
+
+@dataclass
+class QueueStats:
+    """Counters for one table's write-behind queue(s)."""
+
+    queued: int = 0
+    written: int = 0
+    batches: int = 0
+    dropped: int = 0
+    waits: int = 0
+    failures: int = 0
+    max_depth: int = 0
+
+
+class _Queue:
+    __slots__ = ("conflict_columns", "lock", "op", "rows", "table")
+
+    def __init__(self, table: str, op: str, conflict_columns: tuple[str, ...]) -> None:
+        self.table = table
+        self.op = op
+        self.conflict_columns = conflict_columns
+        self.rows: deque[dict[str, Any]] = deque()
+        self.lock = asyncio.Lock()
+
+
+class WriteBehindBackend:
+    """Queueing :class:`StorageBackend` in front of ``backend``.
+
+    Call :meth:`start` once an event loop is running (the first write does
+    it too) and :meth:`close` on shutdown.
+    """
+
+    def __init__(
+        self,
+        backend: StorageBackend,
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 0.2,
+        max_queue_rows: int = 50_000,
+        drop_tables: Iterable[str] = ("ticks",),
+        max_retry_interval: float = 30.0,
+    ) -> None:
+        if batch_size <= 0 or max_queue_rows < batch_size:
+            raise ValueError("need batch_size > 0 and max_queue_rows >= batch_size")
+        self.inner = backend
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_rows = max_queue_rows
+        self._drop_tables = frozenset(drop_tables)
+        self._max_retry_interval = max(max_retry_interval, flush_interval)
+        self._queues: dict[_QueueKey, _Queue] = {}
+        self._stats: dict[str, QueueStats] = {}
+        self._wake = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    # ───────────────────────────────────────────────── StorageBackend ───
+
+    async def insert(self, table: str, rows: list[dict[str, Any]]) -> None:
+        await self._enqueue(table, "insert", (), rows)
+
+    async def upsert(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        conflict_columns: list[str],
+    ) -> None:
+        await self._enqueue(table, "upsert", tuple(conflict_columns), rows)
+
+    async def increment(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        conflict_columns: list[str],
+    ) -> None:
+        await self._enqueue(table, "increment", tuple(conflict_columns), rows)
+
+    async def select(
+        self,
+        table: str,
+        where: dict[str, Any] | None = None,
+        order_by: str | None = None,
+        limit: int | None = None,
+        *,
+        filters: Sequence[Predicate] = (),
+        columns: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        await self.flush(table)
+        return await self.inner.select(
+            table, where=where, order_by=order_by, limit=limit,
+            filters=filters, columns=columns,
+        )
+
+    async def select_range(
+        self,
+        table: str,
+        column: str,
+        *,
+        start: Any = None,
+        end: Any = None,
+        where: dict[str, Any] | None = None,
+        order_by: str | None = None,
+        limit: int | None = None,
+        filters: Sequence[Predicate] = (),
+        columns: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        await self.flush(table)
+        return await self.inner.select_range(
+            table, column, start=start, end=end, where=where, order_by=order_by, limit=limit,
+            filters=filters, columns=columns,
+        )
+
+    # ─────────────────────────────────────────────────────── control ───
+
+    def start(self) -> None:
+        """Start the background flusher (idempotent)."""
+        if self._task is None and not self._closed:
+            self._task = asyncio.create_task(self._run(), name="write-behind-flusher")
+
+    async def flush(self, *tables: str) -> None:
+        """Persist everything queued for ``tables`` (all tables if none given).
+
+        Raises whatever the backend raised if a batch could not be written;
+        the rows stay queued for the next attempt.
+        """
+        for queue in list(self._queues.values()):
+            if not tables or queue.table in tables:
+                await self._flush_queue(queue, everything=True)
+
+    async def close(self) -> None:
+        """Stop the flusher and drain every queue (best effort)."""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._drained.set()  # release writers blocked on a full queue
+        try:
+            await self.flush()
+        except Exception as exc:
+            pending = sum(len(q.rows) for q in self._queues.values())
+            LOG.error("write-behind drain failed with %d rows pending: %r", pending, exc)
+
+    def depth(self, table: str | None = None) -> int:
+        """Rows currently queued (for ``table``, or in total)."""
+        return sum(len(q.rows) for q in self._queues.values() if table in (None, q.table))
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-table counters plus current ``depth``, JSON-safe."""
+        return {
+            table: {**asdict(s), "depth": self.depth(table)}
+            for table, s in self._stats.items()
+        }
+
+    # ─────────────────────────────────────────────────────── private ───
+
+    async def _enqueue(
+        self,
+        table: str,
+        op: str,
+        conflict_columns: tuple[str, ...],
+        rows: list[dict[str, Any]],
+    ) -> None:
+        if not rows:
+            return
+        if self._closed:
+            # Late writes after shutdown go straight through.
+            await self._write_rows(table, op, conflict_columns, rows)
+            return
+        self.start()
+        key = (table, op, conflict_columns)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = _Queue(table, op, conflict_columns)
+        stats = self._stats.setdefault(table, QueueStats())
+
+        if len(queue.rows) + len(rows) > self._max_rows and table not in self._drop_tables:
+            stats.waits += 1
+            while len(queue.rows) + len(rows) > self._max_rows and self._task is not None:
+                self._drained.clear()
+                self._wake.set()
+                await self._drained.wait()
+
+        queue.rows.extend(rows)
+        stats.queued += len(rows)
+        overflow = len(queue.rows) - self._max_rows
+        if overflow > 0:
+            # Only reachable for drop_tables: shed the oldest rows.
+            if not stats.dropped:
+                LOG.warning("write-behind queue for %s is full; dropping oldest rows", table)
+            for _ in range(overflow):
+                queue.rows.popleft()
+            stats.dropped += overflow
+        stats.max_depth = max(stats.max_depth, len(queue.rows))
+        if len(queue.rows) >= self._batch_size:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        backoff = 0.0
+        while True:
+            if backoff:
+                # Outage: retry on a growing timer, not on every wake-up
+                # from a writer blocked on a full queue.
+                await asyncio.sleep(backoff)
+            else:
+                # asyncio.timeout rather than wait_for: on 3.11 wait_for can
+                # swallow the cancel() that close() sends.
+                try:
+                    async with asyncio.timeout(self._flush_interval):
+                        await self._wake.wait()
+                except TimeoutError:
+                    pass
+            self._wake.clear()
+            error: Exception | None = None
+            for queue in list(self._queues.values()):
+                try:
+                    await self._flush_queue(queue, everything=False)
+                except Exception as exc:
+                    # Stop here so later queues (fills) never overtake the
+                    # rows they reference (order_intents).
+                    error = exc
+                    break
+            if error is None:
+                if backoff:
+                    LOG.info("write-behind flush recovered; %d rows queued", self.depth())
+                backoff = 0.0
+            else:
+                if not backoff:
+                    LOG.warning("write-behind flush failed, retrying with back-off: %r", error)
+                backoff = min(max(backoff * 2, self._flush_interval), self._max_retry_interval)
+            self._drained.set()
+
+    async def _flush_queue(self, queue: _Queue, *, everything: bool) -> None:
+        # everything=False (background cycle) writes what is queued now;
+        # everything=True (barrier) also waits out a cycle in progress.
+        async with queue.lock:
+            stats = self._stats[queue.table]
+            while queue.rows:
+                batch = [queue.rows[i] for i in range(min(self._batch_size, len(queue.rows)))]
+                try:
+                    await self._write(queue, batch)
+                except Exception:
+                    stats.failures += 1
+                    raise
+                for _ in batch:
+                    queue.rows.popleft()
+                stats.written += len(batch)
+                stats.batches += 1
+                if not everything and len(queue.rows) < self._batch_size:
+                    # Leave a partial tail for the next interval unless it's due.
+                    break
+            self._drained.set()
+
+    async def _write(self, queue: _Queue, batch: list[dict[str, Any]]) -> None:
+        await self._write_rows(queue.table, queue.op, queue.conflict_columns, batch)
+
+    async def _write_rows(
+        self,
+        table: str,
+        op: str,
+        cols: tuple[str, ...],
+        batch: list[dict[str, Any]],
+    ) -> None:
+        if op == "insert":
+            await self.inner.insert(table, batch)
+            return
+        if op == "increment":
+            # The backend sums rows that share a key, so a batch of
+            # increments is still one statement.
+            await self.inner.increment(table, batch, list(cols))
+            return
+        latest: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for row in batch:
+            k = tuple(row.get(c) for c in cols)
+            latest.pop(k, None)  # re-insert so the last write keeps its position
+            latest[k] = row
+        await self.inner.upsert(table, list(latest.values()), list(cols))
+
+
+__all__ = ["QueueStats", "WriteBehindBackend"]
@@ -6,6 +6,7 @@ even if the same intent / fill / position is written twice).
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
 from typing import Any
@@ -66,8 +67,9 @@ class PersistenceWriter:
         Use this from any caller that has more than a handful of bars to
         persist (e.g. ``scripts/backfill_bars.py``). The writer hands every
         row to ``backend.upsert`` which then collapses them into 500-row
-        multi-row INSERTs — orders of magnitude faster than one upsert per
-        bar over the public internet.
+        multi-row INSERTs, or a single binary COPY + merge for large sets
+        on Postgres — orders of magnitude faster than one upsert per bar
+        over the public internet.
         """
         if not bars:
             return
@@ -191,41 +193,28 @@ class PersistenceWriter:
         - `trades` always +1.
         - `wins` += 1 when `win is True`; `losses` += 1 when `win is False`;
           neither is bumped when `win is None`.
-        """
-        existing = await self._backend.select(
-            "daily_pnl", where={"trading_day": trading_day}, limit=1
-        )
 
-        if existing:
-            current = existing[0]
-            cur_realized = Decimal(str(current.get("realized_usd", "0") or "0"))
-            cur_unrealized = Decimal(str(current.get("unrealized_usd", "0") or "0"))
-            cur_trades = int(current.get("trades", 0) or 0)
-            cur_wins = int(current.get("wins", 0) or 0)
-            cur_losses = int(current.get("losses", 0) or 0)
-        else:
-            cur_realized = Decimal("0")
-            cur_unrealized = Decimal("0")
-            cur_trades = 0
-            cur_wins = 0
-            cur_losses = 0
-
-        new_realized = cur_realized + realized_delta
-        new_trades = cur_trades + 1
-        new_wins = cur_wins + (1 if win is True else 0)
-        new_losses = cur_losses + (1 if win is False else 0)
+        One atomic ``backend.increment`` — no read first, so concurrent
+        engines can't lose each other's trades.
+        """
+        await self.bump_daily_pnl_many([(trading_day, realized_delta, win)])
 
-        row = {
-            "trading_day": trading_day,
-            "realized_usd": str(new_realized),
-            "unrealized_usd": str(cur_unrealized),
-            "trades": new_trades,
-            "wins": new_wins,
-            "losses": new_losses,
-        }
-        await self._backend.upsert(
-            "daily_pnl", [row], conflict_columns=["trading_day"]
-        )
+    async def bump_daily_pnl_many(
+        self, trades: Iterable[tuple[date, Decimal, bool | None]]
+    ) -> None:
+        """`bump_daily_pnl` for many closed trades in one call (e.g. when
+        replaying fills); the backend sums them per day."""
+        rows = [
+            {
+                "trading_day": trading_day,
+                "realized_usd": _dec_str(realized_delta),
+                "trades": 1,
+                "wins": 1 if win is True else 0,
+                "losses": 1 if win is False else 0,
+            }
+            for trading_day, realized_delta, win in trades
+        ]
+        await self._backend.increment("daily_pnl", rows, conflict_columns=["trading_day"])
 
 
 __all__ = ["PersistenceWriter"]
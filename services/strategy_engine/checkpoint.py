@@ -0,0 +1,271 @@
+"""Strategy state checkpoints and warm restart.
+
+A restart of the engine mid-session used to cost minutes of ticks before
+SMA/VWAP were valid again, and it forgot any legs the strategy held. The
+orchestrator now snapshots the strategy (indicator windows, VWAP
+accumulators, cross/pending state, open legs) every few seconds through
+a :class:`CheckpointStore`. On startup it restores the latest snapshot
+and replays only the ticks or bars persisted *after* it, via the
+strategy's ``warm_tick`` / ``warm_bar``, which update state but never
+emit signals or orders.
+
+Two stores are provided:
+  * :class:`FileCheckpointStore` — one JSON file per strategy, replaced
+    atomically. Survives process restarts on the same host/volume.
+  * :class:`StorageCheckpointStore` — one row per strategy in the
+    ``strategy_checkpoints`` table (migration 0005), through any
+    :class:`StorageBackend`. Survives redeploys.
+
+The replay reads the ``ticks`` / ``bars`` tables from the checkpoint (or
+today's session start, whichever is later) page by page through
+:mod:`services.strategy_engine.warmup`. More than ``replay_limit`` events
+raises :class:`~services.strategy_engine.warmup.WarmupTruncated` rather
+than replaying part of the gap, and the engine starts cold.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+from services.persistence.reader import PersistenceReader
+from services.persistence.storage import StorageBackend
+from services.strategy_engine.warmup import WarmupResult, session_start, warm_up_session
+
+LOG = logging.getLogger("alpha_kite.strategy_engine.checkpoint")
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_TABLE = "strategy_checkpoints"
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """A strategy's serialized state at ``taken_at`` (event time)."""
+
+    strategy: str
+    taken_at: datetime
+    state: dict[str, Any]
+    version: int = CHECKPOINT_VERSION
+
+
+@runtime_checkable
+class CheckpointableStrategy(Protocol):
+    """The extra surface a strategy needs for checkpoint/restore."""
+
+    name: str
+    kind: str
+
+    def snapshot_state(self) -> dict[str, Any]: ...
+
+    def restore_state(self, state: dict[str, Any]) -> None: ...
+
+
+@runtime_checkable
+class CheckpointStore(Protocol):
+    async def save(self, checkpoint: Checkpoint) -> None: ...
+
+    async def load(self, strategy: str) -> Checkpoint | None: ...
+
+
+class FileCheckpointStore:
+    """``<directory>/<strategy>.json``, written to a temp file then renamed."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self._dir = Path(directory)
+
+    def _path(self, strategy: str) -> Path:
+        return self._dir / f"{strategy}.json"
+
+    def _write(self, checkpoint: Checkpoint) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(checkpoint.strategy)
+        tmp = path.with_suffix(".json.tmp")
+        payload = {
+            "strategy": checkpoint.strategy,
+            "taken_at": checkpoint.taken_at.isoformat(),
+            "version": checkpoint.version,
+            "state": checkpoint.state,
+        }
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    async def save(self, checkpoint: Checkpoint) -> None:
+        await asyncio.to_thread(self._write, checkpoint)
+
+    async def load(self, strategy: str) -> Checkpoint | None:
+        path = self._path(strategy)
+        if not path.exists():
+            return None
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        return Checkpoint(
+            strategy=raw["strategy"],
+            taken_at=datetime.fromisoformat(raw["taken_at"]),
+            state=raw["state"],
+            version=int(raw["version"]),
+        )
+
+
+class StorageCheckpointStore:
+    """One upserted row per strategy in ``strategy_checkpoints``."""
+
+    def __init__(self, backend: StorageBackend) -> None:
+        self._backend = backend
+
+    async def save(self, checkpoint: Checkpoint) -> None:
+        row = {
+            "strategy": checkpoint.strategy,
+            "taken_at": checkpoint.taken_at,
+            "version": checkpoint.version,
+            "state": checkpoint.state,
+            "updated_at": datetime.now(UTC),
+        }
+        await self._backend.upsert(CHECKPOINT_TABLE, [row], conflict_columns=["strategy"])
+
+    async def load(self, strategy: str) -> Checkpoint | None:
+        rows = await self._backend.select(
+            CHECKPOINT_TABLE, where={"strategy": strategy}, limit=1
+        )
+        if not rows:
+            return None
+        row = rows[0]
+        taken_at = row["taken_at"]
+        if isinstance(taken_at, str):
+            taken_at = datetime.fromisoformat(taken_at)
+        state = row["state"]
+        if isinstance(state, str):
+            state = json.loads(state)
+        return Checkpoint(
+            strategy=row["strategy"],
+            taken_at=taken_at,
+            state=state,
+            version=int(row["version"]),
+        )
+
+
+async def restore_strategy(
+    strategy: CheckpointableStrategy,
+    store: CheckpointStore,
+    backend: StorageBackend,
+    *,
+    symbol: str,
+    bar_interval_seconds: int,
+    replay_limit: int,
+    now: datetime,
+) -> tuple[Checkpoint | None, WarmupResult | None]:
+    """Load the latest checkpoint into ``strategy`` and replay what followed.
+
+    Returns ``(checkpoint, replay)``; ``(None, None)`` when there is no
+    usable checkpoint. Exceptions from a corrupt or incompatible snapshot
+    propagate — the caller should fall back to a fresh strategy, because
+    ``restore_state`` may have been applied partially.
+    """
+    checkpoint = await store.load(strategy.name)
+    if checkpoint is None:
+        return None, None
+    if checkpoint.version != CHECKPOINT_VERSION:
+        LOG.warning(
+            "ignoring checkpoint version %s (expected %s)",
+            checkpoint.version, CHECKPOINT_VERSION,
+        )
+        return None, None
+    strategy.restore_state(checkpoint.state["strategy"])
+
+    # Nothing before today's session can affect session state, so a
+    # checkpoint from a previous day only contributes its open legs.
+    start = session_start(now)
+    if checkpoint.taken_at < start:
+        reset = getattr(strategy, "reset_session", None)
+        if reset is not None:
+            reset()
+    replay = await warm_up_session(
+        strategy,
+        PersistenceReader(backend),
+        symbol=symbol,
+        bar_interval_seconds=bar_interval_seconds,
+        start=max(start, checkpoint.taken_at),
+        after=checkpoint.taken_at,
+        limit=replay_limit,
+    )
+    return checkpoint, replay
+
+
+class Checkpointer:
+    """Rate-limited checkpoint writer for one strategy.
+
+    ``maybe_save`` is cheap to call on every event: once
+    ``interval_seconds`` of wall time have passed it takes the snapshot
+    synchronously and hands the store write to a background task, so the
+    event never waits on storage. At most one write is in flight; a
+    snapshot taken meanwhile replaces any older one still waiting.
+    Failures are logged and swallowed so a storage hiccup never stops
+    trading.
+    """
+
+    def __init__(
+        self,
+        strategy: CheckpointableStrategy,
+        store: CheckpointStore,
+        interval_seconds: float,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        self._strategy = strategy
+        self._store = store
+        self._interval = interval_seconds
+        self._last_save: float | None = None
+        self._queued: Checkpoint | None = None
+        self._writer: asyncio.Task[None] | None = None
+        # Event time of the newest maybe_save call, for the shutdown save.
+        self.last_event_at: datetime | None = None
+        self.extra: dict[str, Any] = dict(extra or {})
+
+    def maybe_save(self, now: datetime) -> None:
+        """Snapshot if ``interval_seconds`` have passed since the last save."""
+        self.last_event_at = now
+        last = self._last_save
+        if last is None or time.monotonic() - last >= self._interval:
+            self._submit(now)
+
+    async def save(self, now: datetime) -> None:
+        """Snapshot unconditionally and wait until it is stored (e.g. on shutdown)."""
+        await self._submit(now)
+
+    async def drain(self) -> None:
+        """Wait for the in-flight write, if any."""
+        if self._writer is not None:
+            await self._writer
+
+    def _submit(self, now: datetime) -> asyncio.Task[None]:
+        state = {"strategy": self._strategy.snapshot_state(), **self.extra}
+        self._queued = Checkpoint(self._strategy.name, now, state)
+        self._last_save = time.monotonic()
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_queued())
+        return self._writer
+
+    async def _write_queued(self) -> None:
+        while self._queued is not None:
+            checkpoint, self._queued = self._queued, None
+            try:
+                await self._store.save(checkpoint)
+            except Exception as exc:
+                LOG.warning("checkpoint save failed: %r", exc)
+
+
+__all__ = [
+    "CHECKPOINT_TABLE",
+    "CHECKPOINT_VERSION",
+    "Checkpoint",
+    "CheckpointStore",
+    "CheckpointableStrategy",
+    "Checkpointer",
+    "FileCheckpointStore",
+    "StorageCheckpointStore",
+    "restore_strategy",
+]
@@ -18,7 +18,8 @@ from decimal import Decimal
 from pathlib import Path
 
 from config.schema import StrategyConfig, load_config
-from contracts.broker import OrderIntent
+from contracts.broker import AccountSummary, OrderIntent
+from contracts.data_feed import OptionChain
 from contracts.risk import RiskCheck
 from contracts.strategy import (
     StrategyContext,
@@ -27,6 +28,7 @@ from contracts.strategy import (
 from engine.broker.dry_run import DryRunBroker
 from engine.broker.ibkr_paper import IBKRPaperBroker
 from engine.data_feeds.factory import make_feed, make_options_feed
+from engine.features import TickFeatureEngine
 from engine.risk.kill_switch import KillSwitchGuard
 from engine.risk.limits import (
     DailyLossLimitGuard,
@@ -45,8 +47,20 @@ from engine.strategies.sell_put_qqq_cross import (
 )
 
 from services.persistence.models import AuditEvent
+from services.persistence.reader import PersistenceReader
 from services.persistence.storage import InMemoryBackend, StorageBackend, SupabaseBackend
+from services.persistence.write_behind import WriteBehindBackend
 from services.persistence.writer import PersistenceWriter
+from services.strategy_engine.checkpoint import (
+    Checkpoint,
+    Checkpointer,
+    CheckpointStore,
+    FileCheckpointStore,
+    StorageCheckpointStore,
+    restore_strategy,
+)
+from services.strategy_engine.option_subscriptions import OptionSubscriptionManager
+from services.strategy_engine.warmup import session_start, warm_up_session
 
 LOG = logging.getLogger("alpha_kite.strategy_engine")
 
@@ -59,8 +73,15 @@ def _build_storage() -> StorageBackend:
     return InMemoryBackend()
 
 
-def _build_strategy(cfg: StrategyConfig):
-    """Select strategy implementation based on signal.name in config."""
+def _build_strategy(cfg: StrategyConfig, features: TickFeatureEngine | None = None):
+    """Select strategy implementation based on signal.name in config.
+
+    Tick strategies read SMA/VWAP state from ``features``; pass the same
+    engine to every tick strategy on a stream so they share one update
+    per tick. ``None`` builds one from ``signal.params.fixed_point_prices``.
+    """
+    if features is None:
+        features = TickFeatureEngine(fixed_point=cfg.signal.params.fixed_point_prices)
     if cfg.signal.name == "sell_put_qqq_cross":
         tiers_cfg = cfg.exit.tiers
         if tiers_cfg is None:
@@ -80,6 +101,7 @@ def _build_strategy(cfg: StrategyConfig):
             contracts=cfg.entry.contracts,
             time_stop_minutes_before_close=cfg.exit.time_stop_minutes_before_close,
             entry_delay_minutes_after_open=cfg.exit.entry_delay_minutes_after_open,
+            features=features,
         )
         if tier_objs is not None:
             kwargs["take_profit_tiers"] = tier_objs
@@ -97,6 +119,7 @@ def _build_strategy(cfg: StrategyConfig):
             stop_loss_pct=cfg.exit.stop_loss_pct,
             time_stop_minutes_before_close=cfg.exit.time_stop_minutes_before_close,
             entry_delay_minutes_after_open=cfg.exit.entry_delay_minutes_after_open,
+            features=features,
         )
     # default: bar strategy
     return BuyVolQQQCrossStrategy(
@@ -111,6 +134,18 @@ def _build_strategy(cfg: StrategyConfig):
     )
 
 
+def _build_checkpoint_store(
+    cfg: StrategyConfig, storage: StorageBackend
+) -> CheckpointStore | None:
+    if not cfg.checkpoint.enabled:
+        return None
+    if cfg.checkpoint.store == "supabase":
+        if isinstance(storage, SupabaseBackend):
+            return StorageCheckpointStore(storage)
+        LOG.warning("checkpoint.store=supabase without a database; using file store")
+    return FileCheckpointStore(cfg.checkpoint.directory)
+
+
 def _build_broker(cfg: StrategyConfig):
     """Return a BrokerGateway. v1 only allows paper mode; live raises at config load."""
     if cfg.broker.dry_run:
@@ -166,7 +201,18 @@ async def run(cfg: StrategyConfig) -> None:
              cfg.data.feed, cfg.broker.mode, cfg.broker.dry_run)
 
     storage = _build_storage()
-    writer = PersistenceWriter(storage)
+    # Event rows go through a write-behind queue so the hot path never
+    # waits on the database; ``storage`` stays the direct backend.
+    persistence: WriteBehindBackend | None = None
+    if cfg.persistence.write_behind:
+        persistence = WriteBehindBackend(
+            storage,
+            batch_size=cfg.persistence.batch_size,
+            flush_interval=cfg.persistence.flush_interval_ms / 1000,
+            max_queue_rows=cfg.persistence.max_queue_rows,
+            drop_tables=cfg.persistence.drop_tables,
+        )
+    writer = PersistenceWriter(persistence or storage)
 
     # Feed and broker share the same IB Gateway endpoint, but need different
     # clientIds when both are connected (broker uses cfg.broker.client_id).
@@ -184,6 +230,13 @@ async def run(cfg: StrategyConfig) -> None:
         ibkr_port=cfg.broker.port,
         ibkr_client_id=feed_client_id,
     )
+    option_book = OptionSubscriptionManager(
+        options_feed,
+        cfg.universe.symbol,
+        window_strikes=cfg.data.option_window_strikes,
+        recenter_strikes=cfg.data.option_recenter_strikes,
+        backfill_greeks=cfg.data.backfill_greeks,
+    )
     strategy = _build_strategy(cfg)
     risk = _build_risk_pipeline(cfg)
     broker = _build_broker(cfg)
@@ -217,6 +270,76 @@ async def run(cfg: StrategyConfig) -> None:
     open_positions = 0
     realized_pnl_today = Decimal("0")
 
+    # Warm restart: restore the last checkpoint, then replay only the
+    # ticks/bars persisted since it was taken.
+    now = datetime.now(UTC)
+    checkpoint_store = _build_checkpoint_store(cfg, storage)
+    checkpointer: Checkpointer | None = None
+    restored: Checkpoint | None = None
+    # Newest event already fed by the restore replay or the warm-up.
+    # Feeds that re-emit today's history (yfinance, replay) would
+    # otherwise count those bars/ticks twice.
+    warmed_until: datetime | None = None
+    if checkpoint_store is not None:
+        try:
+            restored, replay = await restore_strategy(
+                strategy, checkpoint_store, storage,
+                symbol=cfg.universe.symbol,
+                bar_interval_seconds=cfg.data.bar_interval_seconds,
+                replay_limit=cfg.checkpoint.replay_limit,
+                now=now,
+            )
+        except Exception as exc:
+            LOG.error("checkpoint restore failed: %r — starting cold", exc)
+            restored = None
+            strategy = _build_strategy(cfg)
+            await _audit(writer, "engine", "CHECKPOINT_RESTORE_FAILED", "WARN",
+                         repr(exc) or type(exc).__name__)
+        else:
+            if restored is not None and replay is not None:
+                open_positions = int(restored.state.get("open_positions", 0))
+                bar_history.extend(replay.bars)
+                warmed_until = replay.last_event_at or restored.taken_at
+                await _audit(writer, "engine", "CHECKPOINT_RESTORED", "INFO",
+                             f"restored {strategy.name} state", payload={
+                                 "taken_at": restored.taken_at.isoformat(),
+                                 "replayed": replay.events,
+                                 "open_positions": open_positions,
+                             })
+
+    # Session warm-up: with no checkpoint, preload everything persisted
+    # for today's session so SMA/VWAP match the tape before the first
+    # live event instead of minutes into it.
+    if restored is None and cfg.warmup.enabled:
+        try:
+            warm = await warm_up_session(
+                strategy, PersistenceReader(storage),
+                symbol=cfg.universe.symbol,
+                bar_interval_seconds=cfg.data.bar_interval_seconds,
+                start=session_start(now),
+                limit=cfg.warmup.max_events,
+            )
+        except Exception as exc:
+            LOG.error("session warm-up failed: %r — starting cold", exc)
+            strategy = _build_strategy(cfg)
+            await _audit(writer, "engine", "SESSION_WARMUP_FAILED", "WARN",
+                         repr(exc) or type(exc).__name__)
+        else:
+            bar_history.extend(warm.bars)
+            warmed_until = warm.last_event_at
+            LOG.info("session warm-up fed %d %ss since %s",
+                     warm.events, strategy.kind, warm.start.isoformat())
+            await _audit(writer, "engine", "SESSION_WARMUP", "INFO",
+                         f"preloaded {warm.events} {strategy.kind}s", payload={
+                             "session_start": warm.start.isoformat(),
+                             "events": warm.events,
+                         })
+
+    if checkpoint_store is not None:
+        checkpointer = Checkpointer(
+            strategy, checkpoint_store, cfg.checkpoint.interval_seconds
+        )
+
     stop_event = asyncio.Event()
 
     def _on_signal(_signo, _frame):  # type: ignore[no-untyped-def]
@@ -276,11 +399,14 @@ async def run(cfg: StrategyConfig) -> None:
                     payload={"new_value": override, "yaml_default": cfg.broker.dry_run},
                 )
 
+            heartbeat: dict = {"feed": cfg.data.feed, "dry_run": effective_dry_run}
+            if persistence is not None:
+                heartbeat["persistence"] = persistence.stats()
             await _audit(writer, "engine", "HEARTBEAT", "INFO",
-                         "engine alive",
-                         payload={"feed": cfg.data.feed,
-                                  "dry_run": effective_dry_run})
+                         "engine alive", payload=heartbeat)
             try:
+                # A real fetch: this also refreshes the snapshot the run
+                # loop reads through _account_summary() in quiet markets.
                 acct = await broker.get_account_summary()
                 await _audit(
                     writer, "broker", "BROKER_HEARTBEAT", "INFO",
@@ -308,27 +434,29 @@ async def run(cfg: StrategyConfig) -> None:
 
     heartbeat_task = asyncio.create_task(_heartbeat())
 
+    async def _account_summary() -> AccountSummary:
+        """Broker's cached account snapshot; a round trip only once it is stale."""
+        snapshot = broker.account_snapshot(cfg.broker.account_max_age_seconds)
+        if snapshot is not None:
+            return snapshot
+        return await broker.get_account_summary()
+
     async def _process_bar(bar) -> None:
         nonlocal open_positions
+        if warmed_until is not None and bar.open_time <= warmed_until:
+            return
         await writer.write_bar(bar, feed=cfg.data.feed)
         bar_history.append(bar)
-        account = await broker.get_account_summary()
-
-        chain = await options_feed.get_option_chain(
-            cfg.universe.symbol, bar.open_time.date()
-        )
-        quotes_iter = options_feed.stream_option_quotes(chain.contracts)
-        option_quotes = []
-        async for q in quotes_iter:
-            option_quotes.append(q)
-            if len(option_quotes) >= len(chain.contracts):
-                break
+        account = await _account_summary()
 
+        option_chain = await option_book.refresh(bar.close, bar.open_time.date())
+        option_quotes = list(option_chain.quotes)
         ctx = StrategyContext(
             now=bar.open_time,
             last_bar=bar,
             bar_history=bar_history[-200:],
             option_quotes=option_quotes,
+            option_chain=option_chain,
             open_positions=open_positions,
             cash_available=account.cash,
         )
@@ -338,7 +466,7 @@ async def run(cfg: StrategyConfig) -> None:
             await writer.write_signal(sig)
 
         for intent in decision.intents:
-            premium = _intent_premium(intent, option_quotes)
+            premium = _intent_premium(intent, option_chain)
             check: RiskCheck = risk.evaluate(
                 intent=intent,
                 account=account,
@@ -355,6 +483,9 @@ async def run(cfg: StrategyConfig) -> None:
                              })
                 continue
 
+            # The intent row must be durable before the broker sees it.
+            if persistence is not None:
+                await persistence.flush("order_intents")
             update = await broker.place_order(intent)
             await _audit(writer, "broker", "ORDER_PLACED", "INFO",
                          f"placed {intent.side.value} {intent.symbol}",
@@ -364,39 +495,27 @@ async def run(cfg: StrategyConfig) -> None:
                 open_positions += 1 if intent.side.name == "BUY" else -1
                 open_positions = max(open_positions, 0)
 
+        if checkpointer is not None:
+            checkpointer.extra["open_positions"] = open_positions
+            checkpointer.maybe_save(bar.open_time)
+
     async def _process_tick(quote) -> None:
         """Tick path: feed each NBBO to strategy.on_tick and process emissions."""
         nonlocal open_positions
+        if warmed_until is not None and quote.timestamp <= warmed_until:
+            return
         await writer.write_tick(quote, feed=cfg.data.feed)
-        account = await broker.get_account_summary()
-
-        # Pull current option chain ATM ±2 every N seconds (cheap once cached
-        # by the IBKR feed). For now, refresh on every tick — the IBKRLiveFeed
-        # handles caching internally; replay/yfinance feeds skip via early
-        # return on empty chains.
-        try:
-            chain = await options_feed.get_option_chain(
-                cfg.universe.symbol, quote.timestamp.date()
-            )
-        except Exception:
-            chain = None
-
-        option_quotes: list = []
-        if chain and chain.contracts:
-            quotes_iter = options_feed.stream_option_quotes(chain.contracts)
-            try:
-                # Drain just one snapshot per contract
-                async for q in quotes_iter:
-                    option_quotes.append(q)
-                    if len(option_quotes) >= len(chain.contracts):
-                        break
-            except Exception:
-                pass
+        account = await _account_summary()
 
+        # Quotes come from the persistent ATM window; the manager only
+        # touches the feed when the underlying crosses a strike boundary.
+        option_chain = await option_book.refresh(quote.mid, quote.timestamp.date())
+        option_quotes = list(option_chain.quotes)
         ctx = StrategyContext(
             now=quote.timestamp,
             last_tick=quote,
             option_quotes=option_quotes,
+            option_chain=option_chain,
             open_positions=open_positions,
             cash_available=account.cash,
         )
@@ -406,7 +525,7 @@ async def run(cfg: StrategyConfig) -> None:
             await writer.write_signal(sig)
 
         for intent in decision.intents:
-            premium = _intent_premium(intent, option_quotes)
+            premium = _intent_premium(intent, option_chain)
             check: RiskCheck = risk.evaluate(
                 intent=intent,
                 account=account,
@@ -422,6 +541,8 @@ async def run(cfg: StrategyConfig) -> None:
                                  "reasons": check.reasons,
                              })
                 continue
+            if persistence is not None:
+                await persistence.flush("order_intents")
             update = await broker.place_order(intent)
             await _audit(writer, "broker", "ORDER_PLACED", "INFO",
                          f"placed {intent.side.value} {intent.symbol}",
@@ -431,6 +552,10 @@ async def run(cfg: StrategyConfig) -> None:
                 open_positions += 1 if intent.side.name == "BUY" else -1
                 open_positions = max(open_positions, 0)
 
+        if checkpointer is not None:
+            checkpointer.extra["open_positions"] = open_positions
+            checkpointer.maybe_save(quote.timestamp)
+
     try:
         # Branch on strategy kind. Bar strategies consume bar streams; tick
         # strategies consume quote streams. Outer while-loop keeps the engine
@@ -482,11 +607,14 @@ async def run(cfg: StrategyConfig) -> None:
             except TimeoutError:
                 pass
     finally:
+        if checkpointer is not None and checkpointer.last_event_at is not None:
+            await checkpointer.save(checkpointer.last_event_at)
         heartbeat_task.cancel()
         try:
             await heartbeat_task
         except (asyncio.CancelledError, Exception):
             pass
+        await option_book.close()
         await broker.disconnect()
         if feed_connected and hasattr(equity_feed, "disconnect"):
             try:
@@ -494,23 +622,21 @@ async def run(cfg: StrategyConfig) -> None:
             except Exception:
                 pass
         await _audit(writer, "engine", "SHUTDOWN", "INFO", "engine shut down")
+        if persistence is not None:
+            await persistence.close()
         LOG.info("strategy engine stopped")
 
 
 def _intent_premium(
-    intent: OrderIntent, option_quotes: list
+    intent: OrderIntent, option_chain: OptionChain
 ) -> Decimal:
     """Pick a representative premium for a risk check. Falls back to limit_price."""
     if intent.limit_price is not None:
         return intent.limit_price
     if intent.option is not None:
-        for q in option_quotes:
-            if (
-                q.strike == intent.option.strike
-                and q.right == intent.option.right
-                and q.expiry == intent.option.expiry
-            ):
-                return q.mid
+        quote = option_chain.find(intent.option)
+        if quote is not None:
+            return quote.mid
     return Decimal("0")
 
 
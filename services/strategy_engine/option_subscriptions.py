@@ -0,0 +1,276 @@
+"""Long-lived option-quote subscriptions for the orchestrator.
+
+The run loop used to call ``get_option_chain`` and open a fresh
+``stream_option_quotes`` iterator on every bar and tick. Against
+``IBKRLiveFeed`` that is a ``reqSecDefOptParams``, an underlying snapshot,
+a ``qualifyContractsAsync`` and N ``reqMktData`` / ``cancelMktData``
+pairs per event: the largest per-tick latency in live mode, and a steady
+churn of market-data lines.
+
+:class:`OptionSubscriptionManager` keeps the ATM ± N strike window for
+the current expiry subscribed instead, one quote stream per strike,
+pumped into a latest-quote table by background tasks.
+:meth:`~OptionSubscriptionManager.refresh` returns that table as an
+:class:`~contracts.data_feed.OptionChain`, so strategies read quotes from
+memory.
+
+The window follows the underlying with hysteresis: it is re-centred only
+once the nearest strike is within ``recenter_strikes`` of the window's
+edge, so a price wobbling around a strike midpoint never re-subscribes.
+A re-centre runs in the background while the current window keeps
+serving, and only touches strikes that enter or leave the window. Only
+the first subscription for an expiry waits (up to ``ready_timeout``) for
+quotes.
+
+Feeds whose quote stream is a finite snapshot (``SyntheticOptionsFeed``)
+are detected when a stream ends on its own; for those the window is
+re-polled, and re-centred, inline on each refresh, which is what the old
+loop did. A feed with an ``observe(symbol, price)`` method is handed the
+underlying price on every refresh.
+
+With ``backfill_greeks``, quotes missing iv or greeks (IBKR sends none
+until its model greeks arrive) get them solved from their mids, for the
+whole window in one `engine.pricing.backfill_greeks` call per rebuild.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from contracts.data_feed import OptionChain, OptionContract, OptionQuote
+from engine.pricing import backfill_greeks
+
+LOG = logging.getLogger("alpha_kite.strategy_engine.option_subscriptions")
+
+_Key = tuple[date, Decimal, str]
+
+
+def _key(item: OptionContract | OptionQuote) -> _Key:
+    return (item.expiry, item.strike, item.right)
+
+
+def _nearest(ladder: list[Decimal], price: Decimal) -> int:
+    return min(range(len(ladder)), key=lambda i: (abs(ladder[i] - price), ladder[i]))
+
+
+class OptionSubscriptionManager:
+    """ATM ± ``window_strikes`` option quotes for ``underlying``, kept subscribed.
+
+    ``ready_timeout`` bounds how long the first subscription for an expiry
+    waits for a quote on every contract; ``retry_seconds`` is the back-off
+    after the feed returns an empty chain or fails.
+    """
+
+    def __init__(
+        self,
+        feed: Any,
+        underlying: str,
+        *,
+        window_strikes: int = 5,
+        recenter_strikes: int = 1,
+        ready_timeout: float = 2.0,
+        retry_seconds: float = 30.0,
+        backfill_greeks: bool = False,
+    ) -> None:
+        if not 1 <= recenter_strikes <= window_strikes:
+            raise ValueError("need 1 <= recenter_strikes <= window_strikes")
+        self._feed = feed
+        # Feeds that price off the underlying (SyntheticOptionsFeed) are
+        # told each price rather than looking it up themselves.
+        self._observe = getattr(feed, "observe", None)
+        self.underlying = underlying
+        self._window_strikes = window_strikes
+        self._recenter_strikes = recenter_strikes
+        self._ready_timeout = ready_timeout
+        self._retry_seconds = retry_seconds
+        self._backfill = backfill_greeks
+        self._price: Decimal | None = None
+
+        self._expiry: date | None = None
+        self._window: list[Decimal] = []      # subscribed strikes, ascending
+        self._anchor: Decimal | None = None   # ATM strike of the last (re)centre
+        self._contracts: dict[Decimal, list[OptionContract]] = {}
+        self._keys: frozenset[_Key] = frozenset()
+        self._quotes: dict[_Key, OptionQuote] = {}
+        self._version = 0
+        self._chain: OptionChain | None = None
+        self._chain_key: tuple[int, Decimal | None] | None = None
+
+        self._pumps: dict[Decimal, asyncio.Task[None]] = {}
+        self._stale: set[Decimal] = set()     # strikes whose stream failed
+        self._recentre: asyncio.Task[None] | None = None
+        self._ready = asyncio.Event()
+        self._finite = False
+        self._retry_at = 0.0
+        self.subscribes = 0  # chain fetch + subscribe cycles, for logs/tests
+
+    @property
+    def contracts(self) -> list[OptionContract]:
+        """Contracts in the currently subscribed window."""
+        return [c for k in self._window for c in self._contracts[k]]
+
+    async def refresh(self, price: Decimal, expiry: date) -> OptionChain:
+        """Follow ``price`` with the window, then return the latest quotes."""
+        self._price = price
+        if self._observe is not None:
+            self._observe(self.underlying, price)
+        due = time.monotonic() >= self._retry_at
+        if expiry != self._expiry or not self._window:
+            if due:
+                await self._cancel_recentre()
+                await self._subscribe(price, expiry, wait=True)
+        elif self._finite:
+            if due and self._should_recentre(price):
+                await self._subscribe(price, expiry, wait=True)
+            else:
+                await self._poll()
+        elif due and self._should_recentre(price) and (
+            self._recentre is None or self._recentre.done()
+        ):
+            self._recentre = asyncio.create_task(self._subscribe(price, expiry, wait=False))
+        return self.chain()
+
+    def chain(self) -> OptionChain:
+        """Latest quote per subscribed contract, rebuilt only after updates
+        (or, when backfilling greeks, a move in the underlying)."""
+        key = (self._version, self._price if self._backfill else None)
+        if self._chain is None or self._chain_key != key:
+            quotes = list(self._quotes.values())
+            if self._backfill and self._price is not None and quotes:
+                quotes = backfill_greeks(
+                    quotes, self._price, max(q.timestamp for q in quotes)
+                )
+            self._chain = OptionChain(underlying=self.underlying, quotes=tuple(quotes))
+            self._chain_key = key
+        return self._chain
+
+    async def close(self) -> None:
+        """Cancel every subscription (releases the feed's market-data lines)."""
+        await self._cancel_recentre()
+        await self._stop(list(self._pumps))
+
+    # ──────────────────────────────────────────────────────── private ───
+
+    def _should_recentre(self, price: Decimal) -> bool:
+        if self._stale:
+            return True
+        i = _nearest(self._window, price)
+        near_edge = min(i, len(self._window) - 1 - i) < self._recenter_strikes
+        # At the end of the listed chain the edge strike can be ATM; don't
+        # re-fetch the same window until the ATM strike changes.
+        return near_edge and self._window[i] != self._anchor
+
+    async def _subscribe(self, price: Decimal, expiry: date, *, wait: bool) -> None:
+        self.subscribes += 1
+        try:
+            snapshot = await self._feed.get_option_chain(self.underlying, expiry)
+        except Exception as exc:
+            LOG.warning("option chain fetch failed: %r", exc)
+            self._back_off()
+            return
+        contracts = [c for c in snapshot.contracts if c.underlying == self.underlying]
+        if not contracts:
+            LOG.warning("empty option chain for %s %s", self.underlying, expiry)
+            self._back_off()
+            return
+
+        ladder = sorted({c.strike for c in contracts})
+        atm = _nearest(ladder, price)
+        window = ladder[max(0, atm - self._window_strikes) : atm + self._window_strikes + 1]
+        if expiry != self._expiry:
+            await self._stop(list(self._pumps))
+            self._quotes.clear()
+            self._finite = False
+        # Only strikes that leave the window (or whose stream died) are
+        # cancelled; strikes that stay keep their stream and quotes.
+        await self._stop([k for k in self._pumps if k not in window or k in self._stale])
+        self._stale.clear()
+
+        self._expiry = expiry
+        self._window = window
+        self._anchor = ladder[atm]
+        self._contracts = {k: [c for c in contracts if c.strike == k] for k in window}
+        self._keys = frozenset(_key(c) for c in self.contracts)
+        self._quotes = {k: q for k, q in self._quotes.items() if k in self._keys}
+        self._version += 1
+        self._ready = asyncio.Event()
+        added = [k for k in window if k not in self._pumps]
+        for k in added:
+            self._pumps[k] = asyncio.create_task(self._pump(k, self._contracts[k]))
+        if wait and added:
+            try:
+                async with asyncio.timeout(self._ready_timeout):
+                    await self._ready.wait()
+            except TimeoutError:
+                LOG.info("option quotes still arriving after %.1fs", self._ready_timeout)
+        LOG.info(
+            "option window for %s %s now %s..%s around %s (+%d strikes)",
+            self.underlying, expiry, window[0], window[-1], self._anchor, len(added),
+        )
+
+    async def _pump(self, strike: Decimal, contracts: list[OptionContract]) -> None:
+        stream = self._feed.stream_option_quotes(contracts)
+        try:
+            async for quote in stream:
+                self._store(quote)
+            # A stream that ends by itself is a one-shot snapshot feed.
+            self._finite = True
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            LOG.warning("option quote stream for strike %s failed: %r", strike, exc)
+            self._stale.add(strike)
+            self._back_off()
+        finally:
+            if all(t.done() for k, t in self._pumps.items() if k != strike):
+                self._ready.set()  # nothing left that could still fill the window
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def _poll(self) -> None:
+        try:
+            async for quote in self._feed.stream_option_quotes(self.contracts):
+                self._store(quote)
+        except Exception as exc:
+            LOG.warning("option quote poll failed: %r", exc)
+
+    def _back_off(self) -> None:
+        # Keep serving whatever window is live, and retry the subscribe
+        # after retry_seconds rather than on every event.
+        self._retry_at = time.monotonic() + self._retry_seconds
+
+    def _store(self, quote: OptionQuote) -> None:
+        key = _key(quote)
+        if key in self._keys:
+            self._quotes[key] = quote
+            self._version += 1
+            if not self._ready.is_set() and self._keys.issubset(self._quotes):
+                self._ready.set()
+
+    async def _stop(self, strikes: list[Decimal]) -> None:
+        tasks = [t for k in strikes if (t := self._pumps.pop(k, None)) is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _cancel_recentre(self) -> None:
+        task, self._recentre = self._recentre, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+__all__ = ["OptionSubscriptionManager"]
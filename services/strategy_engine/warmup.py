@@ -0,0 +1,118 @@
+"""Session warm-up from persisted market data.
+
+A strategy started after the open has no history: the bar strategy needs
+``sma_period`` bars before its SMA exists, and the tick strategies' VWAP
+is only right once it has seen the whole session's volume. Waiting for
+the live feed to fill that in means minutes (bars: most of an hour) of
+missing or wrong signals.
+
+At startup the orchestrator instead reads everything already persisted
+for today's session from ``ticks`` / ``bars`` in keyset-paginated
+ranged queries and fast-feeds it through the strategy's ``warm_tick`` / ``warm_bar``
+path, which updates indicator and cross state but never emits signals or
+intents. The same routine replays the tail after a checkpoint restore
+(:func:`services.strategy_engine.checkpoint.restore_strategy`).
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, time
+from typing import Any
+
+from contracts.data_feed import Bar
+
+from services.persistence.reader import PersistenceReader
+
+LOG = logging.getLogger("alpha_kite.strategy_engine.warmup")
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    """What a warm-up fed into the strategy."""
+
+    start: datetime
+    events: int = 0
+    # Timestamp of the newest event fed, or None if nothing was. Live
+    # events at or before it were already seen and must be skipped.
+    last_event_at: datetime | None = None
+    # The replayed bars, oldest first (empty for tick strategies), so the
+    # orchestrator can seed ``bar_history`` with them.
+    bars: list[Bar] = field(default_factory=list)
+
+
+def session_start(now: datetime) -> datetime:
+    """Midnight UTC of ``now``'s date.
+
+    The tick strategies reset their session state on the first tick of a
+    new UTC date, so this is the earliest data that can affect them.
+    """
+    return datetime.combine(now.astimezone(UTC).date(), time(0), tzinfo=UTC)
+
+
+class WarmupTruncated(Exception):
+    """The session held more than ``limit`` events.
+
+    Raised instead of replaying part of the session: stopping early would
+    leave a gap before the first live event (whose volume VWAP would then
+    miss), so the caller should start cold and say so.
+    """
+
+
+async def warm_up_session(
+    strategy: Any,
+    reader: PersistenceReader,
+    *,
+    symbol: str,
+    bar_interval_seconds: int,
+    start: datetime,
+    after: datetime | None = None,
+    limit: int | None = None,
+    page_size: int = 10_000,
+) -> WarmupResult:
+    """Feed persisted events from ``start`` onwards through ``strategy``.
+
+    Events at or before ``after`` (e.g. a checkpoint's ``taken_at``) are
+    skipped. The range is read in keyset-paginated pages of ``page_size``
+    rows; ``limit`` caps the total, and :class:`WarmupTruncated` is raised
+    once more than that many events would be fed.
+    """
+    events = 0
+    last: datetime | None = None
+    bars: list[Bar] = []
+
+    def _count() -> None:
+        nonlocal events
+        events += 1
+        if limit is not None and events > limit:
+            raise WarmupTruncated(f"session has more than {limit} {strategy.kind}s since {start}")
+
+    if strategy.kind == "tick":
+        async for page in reader.iter_ticks(symbol, start, page_size=page_size):
+            for tick in page:
+                if after is not None and tick.timestamp <= after:
+                    continue
+                _count()
+                strategy.warm_tick(tick)
+                last = tick.timestamp
+        return WarmupResult(start=start, events=events, last_event_at=last)
+
+    async for page in reader.iter_bars(
+        symbol, bar_interval_seconds, start, page_size=page_size
+    ):
+        for bar in page:
+            if after is not None and bar.open_time <= after:
+                continue
+            _count()
+            strategy.warm_bar(bar)
+            bars.append(bar)
+    return WarmupResult(
+        start=start,
+        events=events,
+        last_event_at=bars[-1].open_time if bars else None,
+        bars=bars,
+    )
+
+
+__all__ = ["WarmupResult", "WarmupTruncated", "session_start", "warm_up_session"]
@@ -0,0 +1,42 @@
+"""Shared test data: a flat ATM option chain and the 1-minute QQQ fixture
+as ``Bar`` objects. The seeded tick tape lives in ``scripts.synthetic_tape``."""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+from contracts.data_feed import Bar, OptionQuote
+from scripts.synthetic_tape import SESSION_START
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "qqq_2026-04-15_1min.json"
+
+
+def atm_chain(
+    centre: int = 450, width: int = 3, expiry: date = date(2026, 4, 15)
+) -> list[OptionQuote]:
+    """Calls and puts at ``centre ± width`` $1 strikes, all 1.00 x 1.10."""
+    return [
+        OptionQuote(
+            underlying="QQQ", expiry=expiry, strike=Decimal(centre + k),
+            right=right, timestamp=SESSION_START,  # type: ignore[arg-type]
+            bid=Decimal("1.00"), ask=Decimal("1.10"),
+        )
+        for k in range(-width, width + 1) for right in ("C", "P")
+    ]
+
+
+def fixture_bars() -> list[Bar]:
+    """The replay fixture's bars, oldest first."""
+    raw = json.loads(FIXTURE.read_text())
+    return [
+        Bar(
+            symbol=e["symbol"], interval_seconds=e["interval_seconds"],
+            open_time=datetime.fromisoformat(e["open_time"]),
+            open=Decimal(e["open"]), high=Decimal(e["high"]), low=Decimal(e["low"]),
+            close=Decimal(e["close"]), volume=e["volume"],
+        )
+        for e in raw["bars"]
+    ]
@@ -0,0 +1,85 @@
+"""Parity between the synchronous backtest engine and the async driver."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+import yaml
+from contracts.data_feed import Bar
+from engine.data_feeds import bar_arrays
+from scripts.backtest import Report, run_backtest, run_fast_backtest
+
+from tests.helpers import FIXTURE
+
+CONFIG = Path(__file__).resolve().parents[1] / "config" / "strategy.yaml"
+
+
+def _ledger(report: Report) -> list[tuple]:
+    # intent ids are random per run; everything else must match.
+    return [
+        (t.entry_ts, t.entry_price, t.side, t.contract, t.exit_ts, t.exit_price,
+         t.pnl_pct, t.reason)
+        for t in report.trades
+    ]
+
+
+def _walk_dataset(root: Path, days: list[date], *, seed: int) -> None:
+    """Full 1-minute sessions of a seeded random walk, one day file each."""
+    rng = random.Random(seed)
+    cents = 45_000
+    for day in days:
+        open_time = datetime(day.year, day.month, day.day, 13, 30, tzinfo=UTC)
+        bars = []
+        for i in range(390):
+            prev = cents
+            cents += rng.choice((-40, -15, -5, 0, 5, 15, 40))
+            bars.append(Bar(
+                symbol="QQQ", interval_seconds=60,
+                open_time=open_time + timedelta(minutes=i),
+                open=Decimal(prev) / 100, close=Decimal(cents) / 100,
+                high=Decimal(max(prev, cents) + 3) / 100,
+                low=Decimal(min(prev, cents) - 3) / 100,
+                volume=rng.randrange(1_000, 50_000),
+            ))
+        bar_arrays.save(bar_arrays.day_path(root, "QQQ", 60, day), bar_arrays.encode(bars))
+
+
+def _loose_config(tmp_path: Path, mode: str) -> Path:
+    cfg = yaml.safe_load(CONFIG.read_text())
+    # Let entries through the premium cap and exits past the position cap.
+    cfg["entry"].update(mode=mode, max_premium_pct_nav=50)
+    cfg["risk"]["max_open_positions"] = 5
+    config = tmp_path / "strategy.yaml"
+    config.write_text(yaml.safe_dump(cfg))
+    return config
+
+
+@pytest.mark.parametrize("mode", ["directional", "straddle"])
+async def test_fast_engine_matches_run_backtest_on_the_fixture(
+    tmp_path: Path, mode: str
+) -> None:
+    config = _loose_config(tmp_path, mode)
+    slow = await run_backtest(str(config), str(FIXTURE))
+    fast = run_fast_backtest(str(config), str(FIXTURE))
+    assert slow.trades
+    assert _ledger(fast) == _ledger(slow)
+    assert fast.summary() == slow.summary()
+
+
+@pytest.mark.parametrize("mode", ["directional", "straddle"])
+async def test_fast_engine_matches_run_backtest_across_sessions(
+    tmp_path: Path, mode: str
+) -> None:
+    dataset = tmp_path / "bars"
+    _walk_dataset(dataset, [date(2026, 4, 13), date(2026, 4, 14), date(2026, 4, 15)], seed=4)
+    config = _loose_config(tmp_path, mode)
+
+    slow = await run_backtest(str(config), str(dataset))
+    fast = run_fast_backtest(str(config), str(dataset))
+    assert len(slow.trades) > 10
+    assert {t.reason for t in slow.trades} >= {"exit:profit", "exit:stop"}
+    assert _ledger(fast) == _ledger(slow)
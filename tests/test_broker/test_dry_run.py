@@ -96,6 +96,16 @@ async def test_account_summary_is_paper() -> None:
     assert summary.net_liquidation == Decimal("5000")
 
 
+def test_account_summary_and_fill_price_need_no_connection() -> None:
+    broker = DryRunBroker(account_id="DRYRUN-TEST", starting_nav=Decimal("1234"))
+    summary = broker.account_summary()
+    assert summary.account_id == "DRYRUN-TEST"
+    assert summary.account_type == AccountType.PAPER
+    assert summary.cash == summary.net_liquidation == Decimal("1234")
+    assert DryRunBroker.fill_price(_option_intent()) == Decimal("2.50")
+    assert DryRunBroker.fill_price(_equity_intent()) == Decimal("1.00")
+
+
 @pytest.mark.asyncio
 async def test_dry_run_is_dry_run_flag_true() -> None:
     broker = DryRunBroker()
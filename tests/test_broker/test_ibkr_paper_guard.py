@@ -218,3 +218,83 @@ async def test_account_summary_in_dry_run_uses_real_account_id() -> None:
     assert summary.account_type.value == "PAPER"
     # Cash/NAV come from the dry-run inner broker.
     assert summary.cash == Decimal("5000")
+
+
+class _FakeEvent:
+    """Minimal eventkit.Event: supports += and emit()."""
+
+    def __init__(self) -> None:
+        self.handlers: list[Any] = []
+
+    def __iadd__(self, handler: Any) -> _FakeEvent:
+        self.handlers.append(handler)
+        return self
+
+    def emit(self, *args: Any) -> None:
+        for handler in self.handlers:
+            handler(*args)
+
+
+class _CountingIB(_FakeIB):
+    def __init__(self, summary_rows: list[_FakeRow]) -> None:
+        super().__init__(summary_rows)
+        self.summary_calls = 0
+        self.accountSummaryEvent = _FakeEvent()
+        self.accountValueEvent = _FakeEvent()
+
+    def accountSummary(self) -> list[_FakeRow]:
+        self.summary_calls += 1
+        return super().accountSummary()
+
+
+@pytest.mark.asyncio
+async def test_account_snapshot_follows_pushed_account_values() -> None:
+    fake_ib = _CountingIB(_paper_summary())
+    broker = IBKRPaperBroker(dry_run=False, ib=fake_ib)
+    await broker.connect()
+    calls_after_connect = fake_ib.summary_calls
+    seeded = broker.account_snapshot(max_age_seconds=60)  # from connect's own fetch
+    assert seeded is not None and seeded.net_liquidation == Decimal("1000000")
+    assert fake_ib.summary_calls == calls_after_connect
+
+    fetched = await broker.get_account_summary()
+    assert broker.account_snapshot(max_age_seconds=60) is fetched
+
+    fake_ib.accountSummaryEvent.emit(_FakeRow("DU1234567", "NetLiquidation", "1000250"))
+    fake_ib.accountValueEvent.emit(_FakeRow("DU1234567", "TotalCashValue", "900000"))
+    fake_ib.accountValueEvent.emit(_FakeRow("DU7654321", "TotalCashValue", "1"))
+    snapshot = broker.account_snapshot(max_age_seconds=60)
+    assert snapshot is not None
+    assert snapshot.net_liquidation == Decimal("1000250")
+    assert snapshot.cash == Decimal("900000")
+    assert fake_ib.summary_calls == calls_after_connect + 1  # no extra round trips
+
+    assert broker.account_snapshot(max_age_seconds=-1) is None  # stale
+    await broker.disconnect()
+    assert broker.account_snapshot(max_age_seconds=60) is None
+
+
+@pytest.mark.asyncio
+async def test_dry_run_snapshot_ignores_ibkr_account_values() -> None:
+    fake_ib = _CountingIB(_paper_summary())
+    broker = IBKRPaperBroker(dry_run=True, ib=fake_ib)
+    await broker.connect()
+    await broker.get_account_summary()
+    fake_ib.accountValueEvent.emit(_FakeRow("DU1234567", "TotalCashValue", "900000"))
+    snapshot = broker.account_snapshot(max_age_seconds=60)
+    assert snapshot is not None and snapshot.cash == Decimal("5000")
+
+
+@pytest.mark.asyncio
+async def test_pushed_values_fold_only_base_currency_totals() -> None:
+    fake_ib = _CountingIB(_paper_summary())
+    broker = IBKRPaperBroker(dry_run=False, ib=fake_ib)
+    await broker.connect()
+    emit = fake_ib.accountValueEvent.emit
+    emit(_FakeRow("DU1234567", "TotalCashValue", "700", currency="EUR"))
+    emit(_FakeRow("DU1234567", "TotalCashValue", "900000", currency="USD"))
+    assert broker.account_snapshot(max_age_seconds=60).cash == Decimal("900000")  # type: ignore[union-attr]
+    # The converted BASE total wins over the single-currency row from now on.
+    emit(_FakeRow("DU1234567", "TotalCashValue", "900800", currency="BASE"))
+    emit(_FakeRow("DU1234567", "TotalCashValue", "900000", currency="USD"))
+    assert broker.account_snapshot(max_age_seconds=60).cash == Decimal("900800")  # type: ignore[union-attr]
@@ -109,3 +109,9 @@ def test_make_options_feed_ibkr_live_threads_host_port_when_constructing() -> No
     assert options._host == "ibkr-gateway.railway.internal"
     assert options._port == 4002
     assert options._client_id == 18
+
+
+def test_make_feed_tick_replay(tmp_path: Path) -> None:
+    from engine.data_feeds.tick_replay import TickReplayFeed
+    feed = make_feed(DataConfig(feed="tick_replay", replay_path=str(tmp_path), replay_speed=10))
+    assert isinstance(feed, TickReplayFeed)
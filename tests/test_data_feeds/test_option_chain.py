@@ -0,0 +1,84 @@
+"""Unit tests for the indexed OptionChain contract and StrategyContext.chain_for."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from contracts.data_feed import OptionChain, OptionContract, OptionQuote
+from contracts.strategy import StrategyContext
+
+_NOW = datetime(2026, 4, 15, 14, 0, tzinfo=UTC)
+_FRONT = date(2026, 4, 15)
+_BACK = date(2026, 4, 17)
+
+
+def _q(strike: str, right: str, expiry: date = _FRONT, bid: str = "1.00",
+       underlying: str = "QQQ") -> OptionQuote:
+    return OptionQuote(
+        underlying=underlying, expiry=expiry, strike=Decimal(strike),
+        right=right,  # type: ignore[arg-type]
+        timestamp=_NOW, bid=Decimal(bid), ask=Decimal(bid) + Decimal("0.10"),
+    )
+
+
+def _chain() -> OptionChain:
+    quotes = [_q(str(k), r) for k in range(445, 456) for r in ("C", "P")]
+    quotes += [_q(str(k), r, expiry=_BACK) for k in range(440, 461, 5) for r in ("C", "P")]
+    return OptionChain.from_quotes("QQQ", quotes)
+
+
+def test_keyed_lookup_ignores_strike_scale_and_defaults_to_front_expiry() -> None:
+    chain = _chain()
+    assert len(chain) == 22 + 10
+    assert chain.expiries == (_FRONT, _BACK)
+    q = chain.get(Decimal("450.00"), "P")
+    assert q is not None and (q.strike, q.right, q.expiry) == (Decimal(450), "P", _FRONT)
+    assert chain.get(Decimal("447"), "C", expiry=_BACK) is None
+    assert chain.get(Decimal("445"), "C", expiry=_BACK) is not None
+    contract = OptionContract(underlying="QQQ", expiry=_BACK, strike=Decimal(455), right="C")
+    assert chain.find(contract) is chain.get(Decimal(455), "C", expiry=_BACK)
+    assert chain.find(contract.model_copy(update={"underlying": "SPY"})) is None
+
+
+def test_nearest_bisects_and_breaks_ties_low() -> None:
+    chain = _chain()
+    assert chain.nearest(Decimal("450.49"), "C").strike == Decimal(450)  # type: ignore[union-attr]
+    assert chain.nearest(Decimal("450.50"), "C").strike == Decimal(450)  # type: ignore[union-attr]
+    assert chain.nearest(Decimal("450.51"), "P").strike == Decimal(451)  # type: ignore[union-attr]
+    assert chain.nearest(Decimal("300"), "P").strike == Decimal(445)  # type: ignore[union-attr]
+    assert chain.nearest(Decimal("999"), "C").strike == Decimal(455)  # type: ignore[union-attr]
+    back = chain.nearest(Decimal("452"), "C", expiry=_BACK)
+    assert back is not None and back.strike == Decimal(450)
+    assert OptionChain(underlying="QQQ").nearest(Decimal(450), "C") is None
+
+
+def test_window_slices_atm_plus_minus_n() -> None:
+    chain = _chain()
+    got = [(q.strike, q.right) for q in chain.window(Decimal("452.2"), 1)]
+    assert got == [(Decimal(k), r) for k in (451, 452, 453) for r in ("C", "P")]
+    puts = chain.window(Decimal("446"), 2, right="P")
+    assert [q.strike for q in puts] == [Decimal(k) for k in (445, 446, 447, 448)]
+    assert chain.strikes("C", expiry=_BACK) == [Decimal(k) for k in range(440, 461, 5)]
+
+
+def test_later_duplicate_wins_and_foreign_underlying_rejected() -> None:
+    chain = OptionChain(underlying="QQQ", quotes=(_q("450", "C"), _q("450", "C", bid="2.00")))
+    assert len(chain) == 1
+    assert chain.get(Decimal(450), "C").bid == Decimal("2.00")  # type: ignore[union-attr]
+    with pytest.raises(ValueError):
+        OptionChain(underlying="QQQ", quotes=(_q("450", "C", underlying="SPY"),))
+
+
+def test_context_chain_for_prefers_supplied_chain_and_memoises_fallback() -> None:
+    quotes = [_q("450", "C"), _q("450", "C", underlying="SPY")]
+    ctx = StrategyContext(now=_NOW, option_quotes=quotes)
+    built = ctx.chain_for("QQQ")
+    assert len(built) == 1
+    assert ctx.chain_for("QQQ") is built
+    assert ctx.chain_for("SPY") is not built
+
+    supplied = OptionChain.from_quotes("QQQ", quotes)
+    ctx = StrategyContext(now=_NOW, option_quotes=quotes, option_chain=supplied)
+    assert ctx.chain_for("QQQ") is supplied
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import json
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
 from contracts.data_feed import Bar, Quote
-from engine.data_feeds.replay import ReplayFeed
+from engine.data_feeds import bar_arrays
+from engine.data_feeds.replay import ReplayFeed, convert_json_fixture
+
+from tests.helpers import fixture_bars
 
 FIXTURE = Path(__file__).resolve().parents[1] / "fixtures" / "qqq_2026-04-15_1min.json"
 
@@ -93,3 +96,97 @@ async def test_replay_stream_option_quotes_raises() -> None:
     with pytest.raises(NotImplementedError):
         async for _ in feed.stream_option_quotes([]):
             pass
+
+
+async def test_replay_columnar_fixture_matches_json(tmp_path: Path) -> None:
+    npy = convert_json_fixture(FIXTURE, tmp_path)
+    assert npy == tmp_path / "QQQ" / "60" / "2026-04-15.npy"
+
+    from_json = [b async for b in ReplayFeed(FIXTURE).stream_equity_bars("QQQ")]
+    feed = ReplayFeed(npy)
+    assert feed.fixture_symbol == "QQQ"
+    assert feed.fixture_date == date(2026, 4, 15)
+    assert [b async for b in feed.stream_equity_bars("QQQ")] == from_json
+    # The file is mapped, not read: streaming twice replays the same bars.
+    assert [b async for b in feed.stream_equity_bars("QQQ")] == from_json
+
+
+def test_replay_columnar_fixture_needs_dataset_layout(tmp_path: Path) -> None:
+    stray = tmp_path / "qqq.npy"
+    bar_arrays.save(stray, bar_arrays.encode([]))
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        ReplayFeed(stray)
+
+
+def test_convert_rejects_bars_off_the_fixture_date(tmp_path: Path) -> None:
+    payload = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    payload["date"] = "2026-04-16"
+    shifted = tmp_path / "shifted.json"
+    shifted.write_text(json.dumps(payload), encoding="utf-8")
+    with pytest.raises(ValueError, match="not on 2026-04-16"):
+        convert_json_fixture(shifted, tmp_path)
+
+
+
+def _dataset(root: Path) -> list[list[Bar]]:
+    """QQQ on 2026-04-15 and 2026-04-16, plus one SPY day, under ``root``."""
+    day1 = fixture_bars()
+    day2 = [b.model_copy(update={"open_time": b.open_time + timedelta(days=1)}) for b in day1]
+    spy = [b.model_copy(update={"symbol": "SPY"}) for b in day1]
+    for symbol, bars in (("QQQ", day1), ("QQQ", day2), ("SPY", spy)):
+        path = bar_arrays.day_path(root, symbol, 60, bars[0].open_time.date())
+        bar_arrays.save(path, bar_arrays.encode(bars))
+    return [day1, day2]
+
+
+async def test_replay_dataset_streams_sessions_in_order(tmp_path: Path) -> None:
+    day1, day2 = _dataset(tmp_path)
+    feed = ReplayFeed(tmp_path)
+    assert feed.symbols == ["QQQ", "SPY"]
+    assert feed.sessions("QQQ") == [date(2026, 4, 15), date(2026, 4, 16)]
+
+    sessions = [(day, [b async for b in bars]) async for day, bars in feed.stream_sessions("QQQ")]
+    assert sessions == [(date(2026, 4, 15), day1), (date(2026, 4, 16), day2)]
+    assert [b async for b in feed.stream_equity_bars("qqq")] == day1 + day2
+    quotes = [q async for q in feed.stream_equity_quotes("QQQ")]
+    assert [q.last for q in quotes] == [b.close for b in day1 + day2]
+    assert [b.symbol async for b in feed.stream_equity_bars("SPY")] == ["SPY"] * len(day1)
+
+
+async def test_replay_dataset_skips_unread_session_bars(tmp_path: Path) -> None:
+    day1, day2 = _dataset(tmp_path)
+    firsts = [await anext(bars) async for _, bars in ReplayFeed(tmp_path).stream_sessions("QQQ")]
+    assert firsts == [day1[0], day2[0]]
+
+
+async def test_replay_dataset_rejects_missing_symbol_or_interval(tmp_path: Path) -> None:
+    _dataset(tmp_path)
+    feed = ReplayFeed(tmp_path)
+    with pytest.raises(ValueError, match="no 60s bars for AAPL"):
+        async for _ in feed.stream_equity_bars("AAPL"):
+            pass
+    with pytest.raises(ValueError, match="no 300s bars for QQQ"):
+        feed.sessions("QQQ", 300)
+    with pytest.raises(ValueError, match="dataset directory"):
+        _ = feed.fixture_date
+
+
+async def test_replay_latest_close_is_as_of(tmp_path: Path) -> None:
+    bars = fixture_bars()
+    mid = bars[10].open_time + timedelta(seconds=30)
+    before = bars[0].open_time - timedelta(seconds=1)
+    for feed in (ReplayFeed(FIXTURE), ReplayFeed(convert_json_fixture(FIXTURE, tmp_path))):
+        assert await feed.latest_close("QQQ", bars[10].open_time) == bars[10].close
+        assert await feed.latest_close("QQQ", mid) == bars[10].close
+        assert await feed.latest_close("QQQ") == bars[-1].close
+        assert await feed.latest_close("QQQ", before) is None
+
+
+async def test_replay_dataset_latest_close_reads_one_day(tmp_path: Path) -> None:
+    day1, day2 = _dataset(tmp_path / "ds")
+    feed = ReplayFeed(tmp_path / "ds")
+    assert await feed.latest_close("QQQ", day2[3].open_time) == day2[3].close
+    # Before the second day's first bar: the first day's last close.
+    assert await feed.latest_close("QQQ", day2[0].open_time - timedelta(hours=1)) == day1[-1].close
+    assert await feed.latest_close("QQQ") == day2[-1].close
+    assert await feed.latest_close("QQQ", day1[0].open_time - timedelta(days=3)) is None
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-import math
 from collections.abc import AsyncIterator
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 
+import numpy as np
 import pytest
 from contracts.data_feed import Bar, ChainSnapshot, OptionContract, Quote
 from engine.data_feeds.base import BaseFeed
 from engine.data_feeds.synthetic_options import (
+    ChainPriceCache,
+    EventClock,
     SyntheticOptionsFeed,
-    _bs_price,
 )
+from engine.pricing import VolSmile, bs_chain
 
 
 class _FixedEquityFeed(BaseFeed):
@@ -39,6 +41,9 @@ class _FixedEquityFeed(BaseFeed):
             volume=1_000,
         )
 
+    async def latest_close(self, symbol: str, as_of: datetime | None = None) -> Decimal:
+        return self.close
+
     async def stream_equity_quotes(  # type: ignore[override]
         self, symbol: str
     ) -> AsyncIterator[Quote]:
@@ -51,27 +56,6 @@ class _FixedEquityFeed(BaseFeed):
         )
 
 
-def test_bs_price_atm_one_day() -> None:
-    """Sanity-check ATM call price for QQQ-like S=K=450, T=1d, IV=0.2 lies in [1.0, 5.0]."""
-    s = 450.0
-    k = 450.0
-    t = 1 / 365.0
-    r = 0.05
-    sigma = 0.20
-    call = _bs_price(s, k, t, r, sigma, "C")
-    assert 1.0 <= call <= 5.0
-
-
-def test_bs_put_call_parity() -> None:
-    """For ATM with same expiry: C - P ~= S - K * exp(-r*T) within $0.01."""
-    s, k, r, sigma = 450.0, 450.0, 0.05, 0.20
-    t = 1 / 365.0
-    c = _bs_price(s, k, t, r, sigma, "C")
-    p = _bs_price(s, k, t, r, sigma, "P")
-    expected = s - k * math.exp(-r * t)
-    assert abs((c - p) - expected) < 0.01
-
-
 async def test_synthetic_chain_has_atm_plus_minus_5() -> None:
     equity = _FixedEquityFeed("QQQ", Decimal("450.30"))
     feed = SyntheticOptionsFeed(equity)
@@ -153,3 +137,159 @@ def test_iv_must_be_positive() -> None:
     equity = _FixedEquityFeed("QQQ", Decimal("100"))
     with pytest.raises(ValueError):
         SyntheticOptionsFeed(equity, iv=Decimal("0"))
+
+
+async def test_price_chain_quotes_match_streamed_quotes() -> None:
+    feed = SyntheticOptionsFeed(_FixedEquityFeed("QQQ", Decimal("450.30")))
+    expiry = (datetime.now(tz=UTC) + timedelta(days=1)).date()
+    contracts = (await feed.get_option_chain("QQQ", expiry)).contracts
+    contracts += [contracts[0].model_copy(update={"expiry": expiry + timedelta(days=7)})]
+
+    priced = await feed.price_chain(contracts)
+    assert len(priced) == len(contracts)
+    streamed = [q async for q in feed.stream_option_quotes(contracts)]
+    for q, s in zip(priced.quotes(), streamed, strict=True):
+        assert q.contract() == s.contract()
+        assert q.model_dump(exclude={"timestamp"}) == pytest.approx(
+            s.model_dump(exclude={"timestamp"}), abs=Decimal("0.000002"),
+        )
+    # The added week-out contract prices above its next-day twin.
+    assert streamed[-1].last > streamed[0].last  # type: ignore[operator]
+
+
+async def test_event_clock_prices_chains_at_event_time() -> None:
+    clock = EventClock()
+    feed = SyntheticOptionsFeed(
+        _FixedEquityFeed("QQQ", Decimal("450")), clock=clock, chain_cache=ChainPriceCache(),
+    )
+    expiry = date(2026, 4, 16)
+    with pytest.raises(RuntimeError):
+        await feed.get_option_chain("QQQ", expiry)
+
+    clock.advance(datetime(2026, 4, 16, 14, 0, tzinfo=UTC))
+    chain = await feed.get_option_chain("QQQ", expiry)
+    assert chain.snapshot_time == clock()
+    morning = await feed.price_chain(chain.contracts)
+    assert {q.timestamp for q in morning.quotes()} == {clock()}
+
+    clock.advance(datetime(2026, 4, 16, 19, 0, tzinfo=UTC))
+    afternoon = await feed.price_chain(chain.contracts)
+    # Same chain, less time left: every contract has decayed.
+    assert (afternoon.greeks.price < morning.greeks.price).all()
+
+
+async def test_chain_cache_reuses_prices_within_a_bucket() -> None:
+    cache = ChainPriceCache()
+    clock = EventClock(datetime(2026, 4, 16, 14, 0, 5, tzinfo=UTC))
+    feed = SyntheticOptionsFeed(
+        _FixedEquityFeed("QQQ", Decimal("450")), clock=clock, chain_cache=cache,
+    )
+    contracts = (await feed.get_option_chain("QQQ", date(2026, 4, 16))).contracts
+
+    first = await feed.price_chain(contracts)
+    clock.advance(datetime(2026, 4, 16, 14, 0, 40, tzinfo=UTC))
+    second = await feed.price_chain(contracts)
+    assert second.greeks is first.greeks
+    assert (cache.hits, cache.misses) == (1, 1)
+    with pytest.raises(ValueError):
+        first.greeks.price[0] = 0.0
+
+    # A second feed over the same cache (a repeated backtest) hits too.
+    other = SyntheticOptionsFeed(
+        _FixedEquityFeed("QQQ", Decimal("450")), clock=clock, chain_cache=cache,
+    )
+    assert (await other.price_chain(contracts)).greeks is first.greeks
+
+    clock.advance(datetime(2026, 4, 16, 14, 1, 30, tzinfo=UTC))
+    assert (await feed.price_chain(contracts)).greeks is not first.greeks
+    assert cache.misses == 2
+
+
+def test_chain_cache_evicts_least_recently_used() -> None:
+    cache = ChainPriceCache(maxsize=2)
+    g = bs_chain(450.0, np.array([450.0]), 0.01, 0.05, 0.2, is_call=np.array([True]))
+    cache.put("a", g)
+    cache.put("b", g)
+    assert cache.get("a") is g
+    cache.put("c", g)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is g and cache.get("c") is g
+
+
+class _StreamOnlyFeed(_FixedEquityFeed):
+    """No ``latest_close`` lookup, and streaming it is an error."""
+
+    latest_close = None  # type: ignore[assignment]
+
+    async def stream_equity_bars(  # type: ignore[override]
+        self, symbol: str, interval_seconds: int = 60
+    ) -> AsyncIterator[Bar]:
+        raise AssertionError("chain construction must not stream the equity feed")
+        yield  # pragma: no cover
+
+
+async def test_observed_close_centres_the_chain_without_streaming() -> None:
+    feed = SyntheticOptionsFeed(_StreamOnlyFeed("QQQ", Decimal("450")))
+    with pytest.raises(RuntimeError, match="no close observed for QQQ"):
+        await feed.get_option_chain("QQQ", date(2026, 4, 16))
+
+    feed.observe("qqq", Decimal("431.60"))
+    snap = await feed.get_option_chain("QQQ", date(2026, 4, 16))
+    assert sorted({c.strike for c in snap.contracts})[5] == Decimal(432)
+    feed.observe("QQQ", Decimal("440"))
+    snap = await feed.get_option_chain("QQQ", date(2026, 4, 16))
+    assert sorted({c.strike for c in snap.contracts})[5] == Decimal(440)
+
+
+async def test_price_chain_at_prices_without_the_clock_or_feed() -> None:
+    clock = EventClock(datetime(2026, 4, 16, 14, 0, tzinfo=UTC))
+    feed = SyntheticOptionsFeed(_StreamOnlyFeed("QQQ", Decimal("450")), clock=clock)
+    feed.observe("QQQ", Decimal("450.40"))
+    contracts = (await feed.get_option_chain("QQQ", date(2026, 4, 16))).contracts
+    assert contracts == feed.atm_contracts("QQQ", Decimal("450.40"), date(2026, 4, 16))
+
+    priced = await feed.price_chain(contracts)
+    # Another instant and spot on the clock; explicit arguments win.
+    clock.advance(datetime(2026, 4, 16, 19, 0, tzinfo=UTC))
+    feed.observe("QQQ", Decimal("400"))
+    again = feed.price_chain_at(
+        contracts, {"QQQ": Decimal("450.40")}, datetime(2026, 4, 16, 14, 0, tzinfo=UTC)
+    )
+    assert list(again.quotes()) == list(priced.quotes())
+
+
+async def test_unobserved_close_is_looked_up_as_of_the_clock() -> None:
+    asked: list[datetime | None] = []
+
+    class _Lookup(_StreamOnlyFeed):
+        async def latest_close(  # type: ignore[override]
+            self, symbol: str, as_of: datetime | None = None
+        ) -> Decimal:
+            asked.append(as_of)
+            return Decimal("450")
+
+    now = datetime(2026, 4, 16, 14, 0, tzinfo=UTC)
+    feed = SyntheticOptionsFeed(_Lookup("QQQ", Decimal("0")), clock=EventClock(now))
+    snap = await feed.get_option_chain("QQQ", date(2026, 4, 16))
+    assert len(snap.contracts) == 22
+    assert asked == [now]
+
+
+async def test_prices_an_expiry_off_its_smile() -> None:
+    now = datetime(2026, 4, 16, 14, 0, tzinfo=UTC)
+    expiry = date(2026, 4, 16)
+    smile = VolSmile((2.0, -0.3, 0.25), -0.05, 0.05)  # put skew
+    feed = SyntheticOptionsFeed(
+        _FixedEquityFeed("QQQ", Decimal("450")), clock=EventClock(now),
+        chain_cache=ChainPriceCache(), smiles={expiry: smile},
+    )
+    contracts = (await feed.get_option_chain("QQQ", expiry)).contracts
+    quotes = {(q.strike, q.right): q async for q in feed.stream_option_quotes(contracts)}
+    wing, atm = quotes[Decimal(445), "P"], quotes[Decimal(450), "P"]
+    assert wing.iv is not None and atm.iv is not None and wing.iv > atm.iv
+    assert float(atm.iv) == pytest.approx(0.25, abs=0.001)
+
+    feed.set_smile(expiry, None)
+    flat = [q async for q in feed.stream_option_quotes(contracts)]
+    assert {q.iv for q in flat} == {Decimal("0.20")}
@@ -0,0 +1,85 @@
+"""Unit tests for engine.data_feeds.tick_replay."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from contracts.data_feed import Quote
+from engine.data_feeds import tick_arrays
+from engine.data_feeds.tick_replay import TickReplayFeed
+from scripts.synthetic_tape import SESSION_START, tape
+from services.persistence import InMemoryBackend, PersistenceWriter
+
+
+def _save(root: Path, quotes: list[Quote]) -> Path:
+    path = tick_arrays.day_path(root, quotes[0].symbol, quotes[0].timestamp.date())
+    tick_arrays.save(path, tick_arrays.encode(quotes))
+    return path
+
+
+async def test_tick_file_replays_every_field_in_batches(tmp_path: Path) -> None:
+    ticks = tape(1000, seed=7)
+    ticks[3] = ticks[3].model_copy(update={"last": None, "volume": None})
+    path = _save(tmp_path, ticks)
+
+    feed = TickReplayFeed(path, batch_size=256)
+    batches = [b async for b in feed.stream_tick_batches("QQQ")]
+    assert [len(b) for b in batches] == [256, 256, 256, 232]
+    assert [q for b in batches for q in b] == ticks
+    assert [q async for q in feed.stream_equity_quotes("qqq")] == ticks
+
+
+async def test_tick_dataset_replays_days_in_order(tmp_path: Path) -> None:
+    day2 = tape(50, seed=2, start=SESSION_START + timedelta(days=1))
+    day1 = tape(50, seed=1)
+    for day in (day2, day1):
+        _save(tmp_path, day)
+    _save(tmp_path, tape(10, seed=3, symbol="SPY"))
+
+    feed = TickReplayFeed(tmp_path)
+    assert feed.sessions("QQQ") == [date(2026, 4, 15), date(2026, 4, 16)]
+    assert [q async for q in feed.stream_equity_quotes("QQQ")] == day1 + day2
+    with pytest.raises(ValueError, match="no ticks for AAPL"):
+        async for _ in feed.stream_equity_quotes("AAPL"):
+            pass
+
+
+async def test_paced_replay_keeps_recorded_gaps(tmp_path: Path) -> None:
+    ticks = tape(21, seed=5, step_ms=500)  # 10 s of ticks
+    feed = TickReplayFeed(_save(tmp_path, ticks), speed=200)  # → 50 ms
+
+    t0 = time.monotonic()
+    batches = [b async for b in feed.stream_tick_batches("QQQ")]
+    elapsed = time.monotonic() - t0
+    assert [q for b in batches for q in b] == ticks
+    assert elapsed >= 0.045
+    assert len(batches) > 1
+
+
+async def test_replays_the_ticks_table(tmp_path: Path) -> None:
+    ticks = tape(30, seed=9)
+    backend = InMemoryBackend()
+    writer = PersistenceWriter(backend)
+    for q in ticks:
+        await writer.write_tick(q, feed="ibkr_live")
+
+    feed = TickReplayFeed(
+        backend=backend, start=ticks[5].timestamp, end=ticks[-5].timestamp, page_size=4,
+    )
+    assert [q async for q in feed.stream_equity_quotes("QQQ")] == ticks[5:-5]
+
+
+def test_tick_replay_rejects_bad_arguments(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="exactly one"):
+        TickReplayFeed()
+    with pytest.raises(ValueError, match="exactly one"):
+        TickReplayFeed(tmp_path, backend=InMemoryBackend())
+    with pytest.raises(ValueError, match="start is required"):
+        TickReplayFeed(backend=InMemoryBackend())
+    with pytest.raises(ValueError):
+        TickReplayFeed(tmp_path, speed=-1)
+    with pytest.raises(FileNotFoundError):
+        TickReplayFeed(tmp_path / "missing")
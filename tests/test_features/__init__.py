@@ -0,0 +1,3 @@
+"""Tests for engine.features."""
+
+from __future__ import annotations
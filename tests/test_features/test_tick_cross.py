@@ -0,0 +1,98 @@
+"""Tests for engine.features.tick_cross.TickFeatureEngine."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from contracts.strategy import StrategyContext
+from engine.features import TickFeatureEngine
+from engine.strategies.buy_vol_qqq_cross_tick import BuyVolQQQCrossTickStrategy
+from engine.strategies.sell_put_qqq_cross import SellPutQQQCrossStrategy
+from scripts.synthetic_tape import SESSION_START, tape
+
+from tests.helpers import atm_chain
+
+
+def _decisions(strategies, ticks):  # type: ignore[no-untyped-def]
+    chain = atm_chain()
+    out = []
+    for tick in ticks:
+        ctx = StrategyContext(now=tick.timestamp, last_tick=tick, option_quotes=chain,
+                              cash_available=Decimal("5000"))
+        for strat in strategies:
+            d = strat.on_tick(ctx)
+            out.append((
+                strat.name,
+                [(s.direction, s.timestamp, s.metadata["sma"]) for s in d.signals],
+                [(i.tag, i.side, i.limit_price) for i in d.intents],
+            ))
+    return out
+
+
+def test_shared_engine_matches_private_engines_with_one_update_per_tick() -> None:
+    ticks = tape(800, seed=3)
+    private = [
+        BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1),
+        SellPutQQQCrossStrategy(sma_window_seconds=3, cooldown_seconds=5),
+    ]
+    engine = TickFeatureEngine()
+    shared = [
+        BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1,
+                                   features=engine),
+        SellPutQQQCrossStrategy(sma_window_seconds=3, cooldown_seconds=5, features=engine),
+    ]
+    ref = _decisions(private, ticks)
+    got = _decisions(shared, ticks)
+    assert got == ref
+    assert any(signals for _, signals, _ in ref)
+    assert engine.updates == len(ticks)
+
+
+def test_windows_are_shared_per_symbol_and_window() -> None:
+    engine = TickFeatureEngine()
+    a = engine.subscribe("QQQ", 3)
+    b = engine.subscribe("QQQ", 3)
+    c = engine.subscribe("QQQ", 9)
+    for tick in tape(60, seed=3):
+        a.update(tick)
+        b.update(tick)
+        c.update(tick)
+    assert engine.updates == 60
+    assert a.values() == b.values()
+    assert a.samples == 3
+    assert c.samples == 9
+    assert a.values()[1] == c.values()[1]  # VWAP is per symbol
+
+
+def test_unsubscribed_symbol_is_ignored_and_session_resets() -> None:
+    engine = TickFeatureEngine()
+    feat = engine.subscribe("QQQ", 3)
+    for tick in tape(20, seed=3, symbol="SPY"):
+        engine.update(tick)
+    assert engine.updates == 0
+
+    ticks = tape(30, seed=3)
+    for tick in ticks:
+        feat.update(tick)
+    assert feat.sign is not None
+    next_day = ticks[-1].model_copy(update={"timestamp": SESSION_START + timedelta(days=1)})
+    assert feat.update(next_day) is None
+    assert feat.samples == 0
+
+
+@pytest.mark.parametrize("window", [1, 3, 9])
+def test_fixed_point_engine_matches_decimal_engine(window: int) -> None:
+    dec = TickFeatureEngine().subscribe("QQQ", window)
+    fx = TickFeatureEngine(fixed_point=True).subscribe("QQQ", window)
+    for tick in tape(400, seed=window):
+        assert fx.update(tick) == dec.update(tick)
+        assert fx.values() == dec.values()
+
+
+def test_fixed_point_strategy_requires_fixed_point_engine() -> None:
+    with pytest.raises(ValueError):
+        BuyVolQQQCrossTickStrategy(fixed_point=True, features=TickFeatureEngine())
+    with pytest.raises(ValueError):
+        TickFeatureEngine().subscribe("QQQ", 0)
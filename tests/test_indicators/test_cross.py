@@ -9,9 +9,9 @@ from pathlib import Path
 
 import pytest
 from contracts.data_feed import Bar
-from engine.indicators.cross import cross_events, detect_cross
-from engine.indicators.sma import simple_moving_average
-from engine.indicators.vwap import session_vwap
+from engine.indicators.cross import CrossDetector, cross_events, detect_cross
+from engine.indicators.sma import RollingSMA, simple_moving_average
+from engine.indicators.vwap import SessionVWAP, session_vwap
 
 FIXTURE = Path(__file__).resolve().parents[1] / "fixtures" / "qqq_2026-04-15_1min.json"
 
@@ -166,3 +166,37 @@ def test_golden_first_cross_index_has_priming_pair() -> None:
     assert sma9_series[first_idx - 1] is not None
     assert vwap_series[first_idx] is not None
     assert vwap_series[first_idx - 1] is not None
+
+
+# ---------------------------------------------------------------------------
+# Streaming indicators reproduce the golden pipeline
+# ---------------------------------------------------------------------------
+
+
+def test_streaming_pipeline_matches_pure_functions() -> None:
+    bars = _load_fixture_bars()
+    sma9_series, vwap_series = _compute_series(bars)
+    sma = RollingSMA(9)
+    vwap = SessionVWAP()
+    detector = CrossDetector()
+    events: list[tuple[int, str]] = []
+    for i, bar in enumerate(bars):
+        s = sma.update(bar.close)
+        v = vwap.update_bar(bar)
+        assert s == sma9_series[i]
+        assert v == vwap_series[i]
+        direction = detector.update(s, v)
+        if direction != "NONE":
+            events.append((i, direction))
+    assert events == cross_events(sma9_series, vwap_series)
+
+
+def test_cross_detector_none_resets_prev_pair() -> None:
+    detector = CrossDetector()
+    assert detector.update(Decimal("1"), Decimal("2")) == "NONE"
+    assert detector.update(None, Decimal("2")) == "NONE"
+    # Prev pair was cleared, so this cannot report a cross.
+    assert detector.update(Decimal("3"), Decimal("2")) == "NONE"
+    assert detector.update(Decimal("1"), Decimal("2")) == "DOWN"
+    detector.reset()
+    assert detector.update(Decimal("3"), Decimal("2")) == "NONE"
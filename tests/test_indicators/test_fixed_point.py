@@ -0,0 +1,70 @@
+"""Unit tests for engine.indicators.fixed_point."""
+
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+
+import pytest
+from engine.indicators.fixed_point import (
+    FixedRollingSMA,
+    FixedSessionVWAP,
+    compare_ratios,
+    fixed_ratio,
+    from_fixed,
+    to_fixed,
+)
+from engine.indicators.sma import RollingSMA
+from engine.indicators.vwap import SessionVWAP
+
+
+def test_round_trip_is_lossless() -> None:
+    for raw in ("449.1234", "0", "-1.5", "0.0001", "12345678901234.0000"):
+        value = Decimal(raw)
+        assert from_fixed(to_fixed(value)) == value
+    assert to_fixed(Decimal("449.12")) == 4_491_200
+
+
+def test_to_fixed_rejects_sub_tick_precision() -> None:
+    with pytest.raises(ValueError):
+        to_fixed(Decimal("449.12345"))
+    with pytest.raises(TypeError):
+        to_fixed(449.12)  # type: ignore[arg-type]
+
+
+def test_compare_ratios_is_exact() -> None:
+    assert compare_ratios(1, 3, 2, 6) == 0
+    assert compare_ratios(1, 3, 333_333, 1_000_000) == 1
+    assert compare_ratios(-5, 2, -2, 1) == -1
+
+
+def test_fixed_rolling_sma_matches_decimal() -> None:
+    rng = random.Random(7)
+    ref = RollingSMA(9)
+    fx = FixedRollingSMA(9)
+    for _ in range(200):
+        price = Decimal(rng.randint(4_400_000, 4_600_000)).scaleb(-4)
+        assert fx.peek_total(to_fixed(price)) is None or fx.ready or len(fx) == 8
+        ref.update(price)
+        fx.update(to_fixed(price))
+        assert fx.value == ref.value
+    fx.reset()
+    assert fx.total is None
+    assert len(fx) == 0
+
+
+def test_fixed_session_vwap_matches_decimal() -> None:
+    rng = random.Random(11)
+    ref = SessionVWAP()
+    fx = FixedSessionVWAP()
+    cum = 0
+    for _ in range(200):
+        price = Decimal(rng.randint(4_400_000, 4_600_000)).scaleb(-4)
+        cum += rng.choice((0, 0, 100, 250, 1_000))
+        ref.update_cumulative(price, cum)
+        fx.update_cumulative(to_fixed(price), cum)
+        assert fx.value == ref.value
+    assert fx.volume == ref.volume
+    assert fixed_ratio(fx.pv, fx.volume) == ref.value
+    with pytest.raises(ValueError):
+        fx.update(4_500_000, -1)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from decimal import Decimal
 
 import pytest
-from engine.indicators.sma import simple_moving_average
+from engine.indicators.sma import RollingSMA, simple_moving_average
 
 
 def _d(values: list[str]) -> list[Decimal]:
@@ -58,3 +58,44 @@ def test_does_not_use_floats() -> None:
     assert isinstance(result, Decimal)
     # Float arithmetic would give 0.15000000000000002; Decimal is exact.
     assert result == Decimal("0.15")
+
+
+# ---------------------------------------------------------------------------
+# RollingSMA (streaming counterpart)
+# ---------------------------------------------------------------------------
+
+
+def test_rolling_matches_pure_function_every_step() -> None:
+    closes = _d(["10.01", "10.02", "9.98", "10.10", "10.07", "10.11", "9.95", "10.00"])
+    sma = RollingSMA(3)
+    for i, close in enumerate(closes, start=1):
+        assert sma.update(close) == simple_moving_average(closes[:i], period=3)
+
+
+def test_rolling_peek_does_not_mutate() -> None:
+    sma = RollingSMA(3)
+    sma.update(Decimal("1"))
+    sma.update(Decimal("2"))
+    assert sma.peek(Decimal("6")) == Decimal("3")
+    assert sma.value is None
+    sma.update(Decimal("3"))
+    # Full window: peek drops the oldest sample → (2 + 3 + 7) / 3
+    assert sma.peek(Decimal("7")) == Decimal("4")
+    assert sma.value == Decimal("2")
+
+
+def test_rolling_reset_clears_window() -> None:
+    sma = RollingSMA(2)
+    sma.update(Decimal("1"))
+    sma.update(Decimal("3"))
+    assert sma.ready
+    sma.reset()
+    assert not sma.ready
+    assert sma.update(Decimal("5")) is None
+
+
+def test_rolling_rejects_bad_period_and_floats() -> None:
+    with pytest.raises(ValueError):
+        RollingSMA(0)
+    with pytest.raises(TypeError):
+        RollingSMA(2).update(1.5)  # type: ignore[arg-type]
@@ -0,0 +1,178 @@
+"""Parity tests: engine.indicators.vectorized vs the Decimal reference functions."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+from contracts.data_feed import Bar
+from engine.indicators import vectorized
+from engine.indicators.cross import cross_events
+from engine.indicators.sma import RollingSMA, simple_moving_average
+from engine.indicators.vwap import session_vwap
+
+FIXTURE = Path(__file__).resolve().parents[1] / "fixtures" / "qqq_2026-04-15_1min.json"
+
+
+def _load_fixture_bars() -> list[Bar]:
+    raw = json.loads(FIXTURE.read_text())
+    return [
+        Bar(
+            symbol=e["symbol"],
+            interval_seconds=e["interval_seconds"],
+            open_time=datetime.fromisoformat(e["open_time"]),
+            open=Decimal(e["open"]),
+            high=Decimal(e["high"]),
+            low=Decimal(e["low"]),
+            close=Decimal(e["close"]),
+            volume=e["volume"],
+        )
+        for e in raw["bars"]
+    ]
+
+
+def _columns(bars: list[Bar]) -> dict[str, np.ndarray]:
+    return {
+        "ts": np.array([int(b.open_time.timestamp()) for b in bars], dtype=np.int64),
+        "high": np.array([float(b.high) for b in bars]),
+        "low": np.array([float(b.low) for b in bars]),
+        "close": np.array([float(b.close) for b in bars]),
+        "volume": np.array([b.volume for b in bars], dtype=np.int64),
+    }
+
+
+def test_rolling_sma_matches_decimal_reference() -> None:
+    bars = _load_fixture_bars()
+    closes = [b.close for b in bars]
+    got = vectorized.rolling_sma(_columns(bars)["close"], 9)
+    for i in range(len(bars)):
+        ref = simple_moving_average(closes[: i + 1], period=9)
+        if ref is None:
+            assert np.isnan(got[i])
+        else:
+            assert got[i] == pytest.approx(float(ref), abs=1e-9)
+
+
+def test_rolling_sma_short_input_is_all_nan() -> None:
+    assert np.isnan(vectorized.rolling_sma([1.0, 2.0], 3)).all()
+    with pytest.raises(ValueError):
+        vectorized.rolling_sma([1.0], 0)
+
+
+def test_session_vwap_matches_decimal_reference() -> None:
+    bars = _load_fixture_bars()
+    c = _columns(bars)
+    got = vectorized.session_vwap(c["high"], c["low"], c["close"], c["volume"])
+    for i in range(len(bars)):
+        ref = session_vwap(bars[: i + 1])
+        assert ref is not None
+        assert got[i] == pytest.approx(float(ref), abs=1e-9)
+
+
+def test_session_vwap_resets_on_session_change() -> None:
+    bars = _load_fixture_bars()
+    # Second copy of the session shifted by one day.
+    shifted = [b.model_copy(update={"open_time": b.open_time + timedelta(days=1)}) for b in bars]
+    c = _columns(bars + shifted)
+    got = vectorized.session_vwap(
+        c["high"], c["low"], c["close"], c["volume"], vectorized.utc_session_ids(c["ts"]),
+    )
+    np.testing.assert_allclose(got[: len(bars)], got[len(bars) :])
+
+
+def test_session_vwap_zero_volume_is_nan() -> None:
+    got = vectorized.session_vwap([11.0, 12.0], [9.0, 10.0], [10.0, 11.0], [0, 100])
+    assert np.isnan(got[0])
+    assert got[1] == pytest.approx(11.0)
+
+
+def test_cross_indices_match_cross_events_on_fixture() -> None:
+    bars = _load_fixture_bars()
+    c = _columns(bars)
+    sma = vectorized.rolling_sma(c["close"], 9)
+    vwap = vectorized.session_vwap(c["high"], c["low"], c["close"], c["volume"])
+    indices, directions = vectorized.cross_indices(sma, vwap)
+    got = [(int(i), "UP" if d > 0 else "DOWN") for i, d in zip(indices, directions)]
+    closes = [b.close for b in bars]
+    ref_sma = [simple_moving_average(closes[: i + 1], 9) for i in range(len(bars))]
+    ref_vwap = [session_vwap(bars[: i + 1]) for i in range(len(bars))]
+    assert got == cross_events(ref_sma, ref_vwap)
+    assert got == [(19, "UP"), (47, "DOWN")]
+
+
+def test_cross_indices_touch_rules() -> None:
+    a = [1.0, 2.0, 3.0, 2.0, 1.0]
+    b = [2.0, 2.0, 2.0, 2.0, 2.0]
+    indices, directions = vectorized.cross_indices(a, b)
+    assert indices.tolist() == [2, 4]
+    assert directions.tolist() == [1, -1]
+    # Strict mode: touching B is not a cross from either side.
+    indices, _ = vectorized.cross_indices(a, b, strict=True)
+    assert indices.tolist() == []
+
+
+def test_cross_indices_nan_and_session_break_pairs() -> None:
+    a = [1.0, np.nan, 3.0, 1.0, 3.0]
+    b = [2.0, 2.0, 2.0, 2.0, 2.0]
+    indices, _ = vectorized.cross_indices(a, b)
+    assert indices.tolist() == [3, 4]
+    indices, _ = vectorized.cross_indices(a, b, [0, 0, 0, 0, 1])
+    assert indices.tolist() == [3]
+
+
+def test_sma_bank_rows_match_rolling_sma() -> None:
+    close = _columns(_load_fixture_bars())["close"]
+    periods = [3, 9, 20, 60, 61]
+    bank = vectorized.sma_bank(close, periods)
+    assert bank.shape == (len(periods), close.shape[0])
+    for row, p in zip(bank, periods):
+        np.testing.assert_allclose(row, vectorized.rolling_sma(close, p), equal_nan=True)
+    # Period longer than the series → whole row is warm-up.
+    assert np.isnan(bank[-1]).all()
+
+
+def test_sma_bank_restarts_every_session_like_rolling_sma_reset() -> None:
+    bars = _load_fixture_bars()
+    closes = [b.close for b in bars] * 2
+    sessions = np.repeat([0, 1], len(bars))
+    periods = [3, 9, 20]
+    bank = vectorized.sma_bank([float(c) for c in closes], periods, sessions)
+    for row, p in zip(bank, periods):
+        sma = RollingSMA(p)
+        expected = []
+        for i, close in enumerate(closes):
+            if i == len(bars):
+                sma.reset()
+            value = sma.update(close)
+            expected.append(np.nan if value is None else float(value))
+        np.testing.assert_allclose(row, expected, equal_nan=True)
+        # Warm-up again at the start of the second session.
+        assert np.isnan(row[len(bars) : len(bars) + p - 1]).all()
+    with pytest.raises(ValueError):
+        vectorized.sma_bank([1.0, 2.0], [2], [0])
+
+
+def test_bank_cross_indices_match_per_row_cross_indices() -> None:
+    bars = _load_fixture_bars()
+    c = _columns(bars)
+    sessions = vectorized.utc_session_ids(c["ts"])
+    vwap = vectorized.session_vwap(c["high"], c["low"], c["close"], c["volume"], sessions)
+    periods = list(range(3, 31))
+    bank = vectorized.sma_bank(c["close"], periods)
+    per_row = vectorized.bank_cross_indices(bank, vwap, sessions)
+    assert len(per_row) == len(periods)
+    for row, (indices, directions) in zip(bank, per_row):
+        ref_idx, ref_dir = vectorized.cross_indices(row, vwap, sessions)
+        assert indices.tolist() == ref_idx.tolist()
+        assert directions.tolist() == ref_dir.tolist()
+
+
+def test_sma_bank_rejects_bad_periods() -> None:
+    with pytest.raises(ValueError):
+        vectorized.sma_bank([1.0, 2.0], [])
+    with pytest.raises(ValueError):
+        vectorized.sma_bank([1.0, 2.0], [2, 0])
@@ -7,7 +7,7 @@ from decimal import Decimal
 
 import pytest
 from contracts.data_feed import Bar
-from engine.indicators.vwap import session_vwap
+from engine.indicators.vwap import SessionVWAP, session_vwap
 
 
 def _bar(
@@ -77,3 +77,50 @@ def test_negative_volume_raises() -> None:
     )
     with pytest.raises(ValueError):
         session_vwap([bad])
+
+
+# ---------------------------------------------------------------------------
+# SessionVWAP (streaming counterpart)
+# ---------------------------------------------------------------------------
+
+
+def test_streaming_matches_pure_function_every_step() -> None:
+    bars = [
+        _bar(high="12", low="10", close="11", volume=100, minute=0),
+        _bar(high="14", low="12", close="13", volume=300, minute=1),
+        _bar(high="13.5", low="12.25", close="12.75", volume=0, minute=2),
+        _bar(high="13.1", low="12.9", close="13.05", volume=250, minute=3),
+    ]
+    vwap = SessionVWAP()
+    for i, bar in enumerate(bars, start=1):
+        assert vwap.update_bar(bar) == session_vwap(bars[:i])
+
+
+def test_streaming_none_until_volume() -> None:
+    vwap = SessionVWAP()
+    assert vwap.value is None
+    assert vwap.update_bar(_bar(high="11", low="9", close="10", volume=0)) is None
+
+
+def test_update_cumulative_uses_volume_deltas() -> None:
+    vwap = SessionVWAP()
+    # First print only sets the cumulative-volume baseline.
+    assert vwap.update_cumulative(Decimal("100"), 1_000) is None
+    assert vwap.update_cumulative(Decimal("101"), 1_100) == Decimal("101")
+    expected = (Decimal("101") * 100 + Decimal("103") * 300) / Decimal(400)
+    assert vwap.update_cumulative(Decimal("103"), 1_400) == expected
+    # A drop in cumulative volume re-baselines without adding.
+    assert vwap.update_cumulative(Decimal("50"), 10) == expected
+
+
+def test_streaming_reset_clears_accumulators() -> None:
+    vwap = SessionVWAP()
+    vwap.update(Decimal("10"), 100)
+    vwap.reset()
+    assert vwap.value is None
+    assert vwap.volume == 0
+
+
+def test_streaming_negative_volume_raises() -> None:
+    with pytest.raises(ValueError):
+        SessionVWAP().update(Decimal("10"), -1)
@@ -0,0 +1,86 @@
+"""BarCache: gap fetches, open-day bypass, exact round-trip, LRU eviction."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from contracts.data_feed import Bar
+from services.persistence import BarCache, InMemoryBackend, PersistenceWriter
+
+_DAY0 = datetime(2026, 4, 13, tzinfo=UTC)  # Monday
+
+
+class _Ranges(InMemoryBackend):
+    """Records the (start, end) of every bars range read."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: list[tuple[datetime, datetime]] = []
+
+    async def select_range(self, table: str, column: str, **kwargs: Any) -> list[dict[str, Any]]:
+        self.reads.append((kwargs["start"], kwargs["end"]))
+        return await super().select_range(table, column, **kwargs)
+
+
+def _bars(days: int, per_day: int = 5) -> list[Bar]:
+    out = []
+    for d in range(days):
+        if (_DAY0 + timedelta(days=d)).weekday() >= 5:
+            continue  # no weekend bars
+        for i in range(per_day):
+            t = _DAY0 + timedelta(days=d, hours=14, minutes=i)
+            out.append(Bar(
+                symbol="QQQ", interval_seconds=60, open_time=t,
+                open=Decimal("450.0000"), high=Decimal("450.5125"), low=Decimal("449.9"),
+                close=Decimal(450) + Decimal(i) / 100, volume=100 + i,
+                vwap=None if i == 0 else Decimal("450.1234"),
+            ))
+    return out
+
+
+async def _read(cache: BarCache, start: datetime, end: datetime) -> list[Bar]:
+    return [b async for chunk in cache.bars("qqq", 60, start, end) for b in chunk]
+
+
+async def test_second_read_only_fetches_the_open_day(tmp_path: Path) -> None:
+    bars = _bars(8)
+    backend = _Ranges()
+    await PersistenceWriter(backend).write_bars(bars, feed="replay")
+    now = _DAY0 + timedelta(days=7, hours=15)  # day 7 is still open
+    cache = BarCache(tmp_path, backend, clock=lambda: now)
+    start, end = _DAY0 + timedelta(hours=14, minutes=2), _DAY0 + timedelta(days=8)
+
+    first = await _read(cache, start, end)
+    assert first == [b for b in bars if start <= b.open_time < end]
+    assert first[0].vwap is not None and bars[0].vwap is None
+
+    backend.reads.clear()
+    assert await _read(cache, start, end) == first
+    assert {s for s, _ in backend.reads} == {_DAY0 + timedelta(days=7)}
+
+
+async def test_only_gaps_are_fetched_and_lru_evicts(tmp_path: Path) -> None:
+    bars = _bars(6)
+    backend = _Ranges()
+    await PersistenceWriter(backend).write_bars(bars, feed="replay")
+    cache = BarCache(tmp_path, backend, clock=lambda: _DAY0 + timedelta(days=30))
+
+    await _read(cache, _DAY0 + timedelta(days=1), _DAY0 + timedelta(days=2))
+    await _read(cache, _DAY0 + timedelta(days=4), _DAY0 + timedelta(days=5))
+    backend.reads.clear()
+    assert await _read(cache, _DAY0, _DAY0 + timedelta(days=6)) == bars
+    # Two runs of missing days: [0] and [2, 3] and [5].
+    assert [(s.day, e.day) for s, e in backend.reads] == [(13, 14), (15, 17), (18, 19)]
+
+    day_file = cache.path("QQQ", 60, _DAY0.date()).stat().st_size
+    small = BarCache(tmp_path, backend, max_bytes=3 * day_file,
+                     clock=lambda: _DAY0 + timedelta(days=30))
+    await _read(small, _DAY0 + timedelta(days=6), _DAY0 + timedelta(days=7))
+    kept = sorted(p.stem for p in tmp_path.rglob("*.npy"))
+    # Day 6 (an empty Sunday) is new; the most recently read days before
+    # it survive, oldest first out, until the files fit the budget.
+    assert kept == ["2026-04-16", "2026-04-17", "2026-04-18", "2026-04-19"]
+    assert sum(p.stat().st_size for p in tmp_path.rglob("*.npy")) <= 3 * day_file
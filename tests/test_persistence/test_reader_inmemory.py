@@ -18,7 +18,10 @@ from contracts.data_feed import Bar, Quote
 from contracts.strategy import Signal, SignalDirection
 from services.persistence import (
     AuditEvent,
+    Compare,
+    In,
     InMemoryBackend,
+    JsonKey,
     PersistenceReader,
     PersistenceWriter,
 )
@@ -205,3 +208,56 @@ async def test_full_round_trip_all_event_types() -> None:
     assert len(await backend.select("fills")) == 1
     assert len(await reader.open_positions()) == 1
     assert len(await reader.recent_audit()) == 1
+
+
+async def test_iter_ticks_pages_through_ties_without_gaps_or_repeats() -> None:
+    backend = InMemoryBackend()
+    writer = PersistenceWriter(backend)
+    reader = PersistenceReader(backend)
+    # Runs of identical timestamps longer than a page straddle page edges.
+    minutes = [1, 1, 1, 2, 3, 3, 3, 3, 3, 3, 3, 4, 5, 5]
+    for volume, minute in enumerate(minutes):
+        await writer.write_tick(
+            Quote(symbol="QQQ", timestamp=_ts(minute), bid=Decimal("1"),
+                  ask=Decimal("2"), volume=volume),
+            feed="replay",
+        )
+    pages = [page async for page in reader.iter_ticks("QQQ", _ts(0), page_size=3)]
+    assert all(len(p) <= 3 for p in pages)
+    assert [t.volume for p in pages for t in p] == list(range(len(minutes)))
+
+
+@pytest.mark.asyncio
+async def test_recent_audit_severity_filter_applies_before_the_limit() -> None:
+    backend = InMemoryBackend()
+    writer = PersistenceWriter(backend)
+    await writer.write_audit(AuditEvent(_ts(1), "risk", "RISK_BLOCK", "WARN", "old", {}))
+    for minute in range(2, 12):
+        await writer.write_audit(AuditEvent(_ts(minute), "engine", "TICK", "INFO", "", {}))
+
+    rows = await PersistenceReader(backend).recent_audit(limit=5, severity_min="WARN")
+    assert [r["message"] for r in rows] == ["old"]
+
+
+@pytest.mark.asyncio
+async def test_select_predicates_and_projection() -> None:
+    backend = InMemoryBackend()
+    await backend.insert("signals", [
+        {"symbol": s, "ts": _ts(m), "metadata": {"scope": scope, "n": m}}
+        for m, (s, scope) in enumerate(
+            [("QQQ", "security"), ("SPY", "portfolio"), ("QQQ", "portfolio"), ("IWM", None)]
+        )
+    ])
+    rows = await backend.select(
+        "signals", order_by="ts",
+        filters=[In("symbol", ["QQQ", "IWM"]), Compare("ts", ">", _ts(0))],
+        columns=["symbol"],
+    )
+    assert rows == [{"symbol": "QQQ"}, {"symbol": "IWM"}]
+
+    portfolio = await backend.select(
+        "signals", filters=[JsonKey("metadata", "scope", "portfolio")]
+    )
+    assert [r["symbol"] for r in portfolio] == ["SPY", "QQQ"]
+    assert await backend.select("signals", filters=[JsonKey("metadata", "n", "3")]) != []
+    assert await backend.select("signals", filters=[In("symbol", [])]) == []
@@ -0,0 +1,92 @@
+"""InMemoryBackend indexes and sorted views agree with a plain table scan."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from services.persistence import InMemoryBackend
+from services.persistence.storage import _matches, _sort_rows
+
+_T0 = datetime(2026, 4, 15, 14, 0, tzinfo=UTC)
+
+
+def _scan(
+    rows: list[dict[str, Any]],
+    where: dict[str, Any] | None,
+    order_by: str | None,
+    limit: int | None,
+) -> list[dict[str, Any]]:
+    out = [dict(r) for r in rows if _matches(r, where)]
+    if order_by:
+        _sort_rows(out, order_by)
+    return out if limit is None else out[:limit]
+
+
+def _merge(rows: list[dict[str, Any]], row: dict[str, Any], cols: list[str]) -> None:
+    for existing in rows:
+        if all(existing.get(c) == row.get(c) for c in cols):
+            existing.update(row)
+            return
+    rows.append(dict(row))
+
+
+async def test_indexed_reads_match_a_full_scan() -> None:
+    rng = random.Random(7)
+    backend = InMemoryBackend()
+    signals: list[dict[str, Any]] = []
+    bars: list[dict[str, Any]] = []
+    for i in range(600):
+        # Coarse timestamps so ties (and NULLs) exercise the view cut-off.
+        ts = None if i % 97 == 0 else _T0 + timedelta(seconds=rng.randrange(60))
+        signal = {
+            "strategy": rng.choice("ab"), "symbol": rng.choice(["QQQ", "SPY", "IWM"]),
+            "ts": ts, "n": i,
+        }
+        await backend.insert("signals", [signal])
+        signals.append(dict(signal))
+
+        bar = {
+            "symbol": rng.choice(["QQQ", "SPY"]), "interval_seconds": 60,
+            "open_time": _T0 + timedelta(minutes=rng.randrange(40)), "close": i,
+        }
+        await backend.upsert("bars", [bar], ["symbol", "interval_seconds", "open_time"])
+        _merge(bars, bar, ["symbol", "interval_seconds", "open_time"])
+
+        if i % 50 == 49:
+            for where in (None, {"strategy": "a"}, {"symbol": "SPY", "strategy": "b"}):
+                for order_by, limit in (("ts DESC", 25), ("ts", 10), ("n DESC", None)):
+                    got = await backend.select("signals", where, order_by, limit)
+                    assert got == _scan(signals, where, order_by, limit)
+
+            start = _T0 + timedelta(minutes=rng.randrange(20))
+            got = await backend.select_range(
+                "bars", "open_time", start=start, end=start + timedelta(minutes=15),
+                where={"symbol": "QQQ", "interval_seconds": 60},
+                order_by="open_time, id", limit=7,
+            )
+            expected = [
+                r for r in _scan(bars, {"symbol": "QQQ"}, "open_time, id", None)
+                if start <= r["open_time"] < start + timedelta(minutes=15)
+            ][:7]
+            assert got == expected
+
+    assert await backend.select("bars", order_by="open_time DESC", limit=5) == _scan(
+        bars, None, "open_time DESC", 5
+    )
+
+
+async def test_upsert_that_moves_an_indexed_column_reindexes() -> None:
+    backend = InMemoryBackend()
+    await backend.upsert("fills", [{"fill_id": "F1", "intent_id": "I1", "ts": 2}], ["fill_id"])
+    await backend.upsert("fills", [{"fill_id": "F2", "intent_id": "I1", "ts": 1}], ["fill_id"])
+    assert [r["fill_id"] for r in await backend.select("fills", {"intent_id": "I1"})] == [
+        "F1", "F2",
+    ]
+    assert (await backend.select("fills", order_by="ts DESC", limit=1))[0]["fill_id"] == "F1"
+
+    await backend.upsert("fills", [{"fill_id": "F1", "intent_id": "I2", "ts": 0}], ["fill_id"])
+    assert [r["fill_id"] for r in await backend.select("fills", {"intent_id": "I1"})] == ["F2"]
+    assert [r["fill_id"] for r in await backend.select("fills", {"intent_id": "I2"})] == ["F1"]
+    assert (await backend.select("fills", order_by="ts DESC", limit=1))[0]["fill_id"] == "F2"
@@ -0,0 +1,74 @@
+"""Keyset-paged streaming reads: chunking, prefetch, projection, formats."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import numpy as np
+from services.persistence import (
+    BarColumns,
+    BarStream,
+    InMemoryBackend,
+    PersistenceWriter,
+    stream_pages,
+)
+
+from tests.helpers import fixture_bars
+
+
+class _Counting(InMemoryBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def select_range(self, *args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        self.reads += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            return await super().select_range(*args, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+async def test_bar_stream_chunks_match_a_single_read_in_every_format() -> None:
+    bars = fixture_bars()
+    backend = InMemoryBackend()
+    await PersistenceWriter(backend).write_bars(bars, feed="replay")
+    stream = BarStream(backend, "QQQ", 60, bars[0].open_time, page_size=7)
+
+    chunks = [chunk async for chunk in stream.bars()]
+    assert {len(c) for c in chunks[:-1]} == {7}
+    assert [b for c in chunks for b in c] == bars
+
+    rows = [r async for chunk in stream.rows(["close"]) for r in chunk]
+    assert rows == [{"close": str(b.close)} for b in bars]
+
+    cols = BarColumns.concat([c async for c in stream.columns()])
+    assert len(cols) == len(bars)
+    assert cols.open_time == [b.open_time for b in bars]
+    np.testing.assert_array_equal(cols.close, [float(b.close) for b in bars])
+    assert np.isnan(cols.vwap).all()
+
+
+async def test_stream_prefetches_the_next_page_and_cancels_it_on_early_exit() -> None:
+    backend = _Counting()
+    t0 = datetime(2026, 4, 15, tzinfo=UTC)
+    await backend.insert("ticks", [
+        {"symbol": "QQQ", "ts": t0 + timedelta(seconds=i)} for i in range(100)
+    ])
+    pages = stream_pages(
+        backend, "ticks", "ts", start=t0, where={"symbol": "QQQ"},
+        order_by="ts", page_size=10,
+    )
+    first = await anext(pages)
+    assert len(first) == 10
+    await asyncio.sleep(0.01)
+    assert backend.reads == 2  # page two was fetched while we held page one
+    await pages.aclose()
+    assert backend.reads == 2 and backend.in_flight == 0
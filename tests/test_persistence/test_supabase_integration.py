@@ -147,3 +147,43 @@ async def test_supabase_round_trip() -> None:
         assert any(p["symbol"] == symbol for p in positions_open)
     finally:
         await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_supabase_copy_paths_above_threshold() -> None:
+    dsn = _require_dsn()
+    backend = SupabaseBackend(dsn=dsn, copy_threshold=2)
+    writer = PersistenceWriter(backend)
+    try:
+        ts = datetime.now(UTC).replace(second=0, microsecond=0)
+        symbol = f"TEST-{uuid4().hex[:6]}"
+        bars = [
+            Bar(
+                symbol=symbol, interval_seconds=60, open_time=ts.replace(minute=m),
+                open=Decimal("100"), high=Decimal("101"), low=Decimal("99"),
+                close=Decimal("100") + m, volume=m,
+            )
+            for m in range(5)
+        ]
+        await writer.write_bars(bars, feed="integration")
+        # Re-upsert with a changed close and a repeated key: last row wins.
+        await writer.write_bars(
+            [*bars[:2], bars[1].model_copy(update={"close": Decimal("7")})],
+            feed="integration",
+        )
+        await backend.insert("signals", [
+            {"strategy": "integration_test", "symbol": symbol, "direction": "LONG_VOL_UP",
+             "ts": ts, "metadata": {"i": i}}
+            for i in range(3)
+        ])
+
+        rows = await backend.select(
+            "bars", where={"symbol": symbol}, order_by="open_time"
+        )
+        assert [Decimal(str(r["close"])) for r in rows] == [
+            Decimal("100"), Decimal("7"), Decimal("102"), Decimal("103"), Decimal("104"),
+        ]
+        signals = await backend.select("signals", where={"symbol": symbol})
+        assert sorted(s["metadata"]["i"] for s in signals) == [0, 1, 2]
+    finally:
+        await backend.close()
@@ -0,0 +1,140 @@
+"""WriteBehindBackend batching, barriers, backpressure and drop accounting."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import pytest
+from services.persistence import InMemoryBackend, WriteBehindBackend
+
+
+class _Recording(InMemoryBackend):
+    """In-memory backend that records each write call and can be made to fail."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[tuple[str, str, int]] = []
+        self.fail = False
+
+    async def insert(self, table: str, rows: list[dict[str, Any]]) -> None:
+        if self.fail:
+            raise ConnectionError("db down")
+        self.calls.append(("insert", table, len(rows)))
+        await super().insert(table, rows)
+
+    async def upsert(
+        self, table: str, rows: list[dict[str, Any]], conflict_columns: list[str]
+    ) -> None:
+        if self.fail:
+            raise ConnectionError("db down")
+        self.calls.append(("upsert", table, len(rows)))
+        await super().upsert(table, rows, conflict_columns)
+
+    async def increment(
+        self, table: str, rows: list[dict[str, Any]], conflict_columns: list[str]
+    ) -> None:
+        self.calls.append(("increment", table, len(rows)))
+        await super().increment(table, rows, conflict_columns)
+
+
+@pytest.fixture
+async def make_wb() -> AsyncIterator[Callable[..., WriteBehindBackend]]:
+    made: list[WriteBehindBackend] = []
+
+    def make(inner: InMemoryBackend, **kwargs: Any) -> WriteBehindBackend:
+        wb = WriteBehindBackend(inner, **kwargs)
+        made.append(wb)
+        return wb
+
+    yield make
+    for wb in made:  # never leave a flusher running, even on failure
+        await wb.close()
+
+
+async def _until(cond: Callable[[], bool], timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not cond():
+            await asyncio.sleep(0.001)
+
+
+async def test_writes_are_queued_then_batched(make_wb) -> None:
+    inner = _Recording()
+    wb = make_wb(inner, batch_size=4, flush_interval=60)
+    for i in range(10):
+        await wb.insert("ticks", [{"i": i}])
+    assert wb.depth("ticks") == 10 and not inner.calls  # nothing awaited the db
+    # The full batches go out as soon as the flusher wakes; the tail waits.
+    await _until(lambda: len(inner.calls) == 2)
+    assert inner.calls == [("insert", "ticks", 4), ("insert", "ticks", 4)]
+    assert wb.depth("ticks") == 2
+    await wb.close()
+    assert [r["i"] for r in await inner.select("ticks")] == list(range(10))
+    assert wb.stats()["ticks"]["written"] == 10
+    assert wb.stats()["ticks"]["depth"] == 0
+
+
+async def test_flush_barrier_and_read_your_writes(make_wb) -> None:
+    inner = _Recording()
+    wb = make_wb(inner, flush_interval=60)
+    await wb.insert("order_intents", [{"intent_id": "a"}])
+    await wb.insert("ticks", [{"i": 1}])
+    await wb.flush("order_intents")
+    assert inner.calls == [("insert", "order_intents", 1)]
+
+    await wb.upsert("daily_pnl", [{"d": 1, "pnl": 1}], ["d"])
+    await wb.upsert("daily_pnl", [{"d": 1, "pnl": 3}], ["d"])
+    rows = await wb.select("daily_pnl", where={"d": 1})
+    assert rows[0]["pnl"] == 3
+    assert ("upsert", "daily_pnl", 1) in inner.calls  # deduped by conflict key
+
+    for pnl in (1, 2, 4):
+        await wb.increment("counters", [{"d": 1, "pnl": pnl}], ["d"])
+    assert (await wb.select("counters", where={"d": 1}))[0]["pnl"] == 7
+    assert ("increment", "counters", 3) in inner.calls  # one batch, summed by the backend
+
+
+async def test_failed_batch_stays_queued_and_barrier_raises(make_wb) -> None:
+    inner = _Recording()
+    wb = make_wb(inner, flush_interval=60)
+    inner.fail = True
+    await wb.insert("order_intents", [{"intent_id": "a"}])
+    with pytest.raises(ConnectionError):
+        await wb.flush("order_intents")
+    assert wb.depth("order_intents") == 1
+    assert wb.stats()["order_intents"]["failures"] == 1
+    inner.fail = False
+    await wb.flush()
+    assert await inner.select("order_intents") == [{"intent_id": "a"}]
+
+
+async def test_full_queue_drops_market_data_and_blocks_the_rest(
+    make_wb, caplog: pytest.LogCaptureFixture
+) -> None:
+    inner = _Recording()
+    wb = make_wb(inner, batch_size=2, flush_interval=0.005, max_queue_rows=3,
+                 max_retry_interval=0.02)
+    inner.fail = True  # nothing drains while the database is down
+    for i in range(5):
+        await wb.insert("ticks", [{"i": i}])
+    assert wb.depth("ticks") == 3
+    assert wb.stats()["ticks"]["dropped"] == 2
+
+    for i in range(3):
+        await wb.insert("fills", [{"i": i}])
+    with caplog.at_level(logging.WARNING, logger="alpha_kite.persistence.write_behind"):
+        blocked = asyncio.create_task(wb.insert("fills", [{"i": 3}]))
+        await asyncio.sleep(0.1)
+        assert not blocked.done()
+        assert wb.stats()["fills"]["waits"] == 1
+        # Retries back off instead of spinning, and the outage logs once.
+        assert wb.stats()["ticks"]["failures"] < 15
+        assert sum("retrying with back-off" in r.message for r in caplog.records) <= 1
+
+        inner.fail = False
+        await asyncio.wait_for(blocked, 1)
+    await wb.close()
+    assert [r["i"] for r in await inner.select("fills")] == [0, 1, 2, 3]
+    assert [r["i"] for r in await inner.select("ticks")] == [2, 3, 4]
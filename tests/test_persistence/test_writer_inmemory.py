@@ -258,3 +258,27 @@ async def test_bump_daily_pnl_handles_none_win() -> None:
     assert rows[0]["trades"] == 2
     assert rows[0]["wins"] == 1
     assert rows[0]["losses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bump_daily_pnl_many_sums_per_day_and_never_reads() -> None:
+    class _NoReads(InMemoryBackend):
+        async def select(self, *args: object, **kwargs: object) -> list[dict]:  # type: ignore[override]
+            raise AssertionError("increment must not read")
+
+    backend = _NoReads()
+    writer = PersistenceWriter(backend)
+    day1, day2 = date(2026, 5, 7), date(2026, 5, 8)
+
+    await writer.bump_daily_pnl(day1, Decimal("10.00"), win=True)
+    await writer.bump_daily_pnl_many([
+        (day1, Decimal("-4.50"), False),
+        (day2, Decimal("2.25"), True),
+        (day1, Decimal("1.00"), None),
+    ])
+
+    rows = {r["trading_day"]: r for r in await InMemoryBackend.select(backend, "daily_pnl")}
+    assert Decimal(rows[day1]["realized_usd"]) == Decimal("6.50")
+    assert (rows[day1]["trades"], rows[day1]["wins"], rows[day1]["losses"]) == (3, 1, 1)
+    assert Decimal(rows[day2]["realized_usd"]) == Decimal("2.25")
+    assert (rows[day2]["trades"], rows[day2]["wins"], rows[day2]["losses"]) == (1, 1, 0)
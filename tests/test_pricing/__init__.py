@@ -0,0 +1,3 @@
+"""Tests for engine.pricing."""
+
+from __future__ import annotations
@@ -0,0 +1,48 @@
+"""Unit tests for engine.pricing.black_scholes."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from engine.pricing import bs_chain, bs_greeks, bs_price
+
+
+def test_bs_price_atm_one_day() -> None:
+    """Sanity-check ATM call price for QQQ-like S=K=450, T=1d, IV=0.2 lies in [1.0, 5.0]."""
+    s = 450.0
+    k = 450.0
+    t = 1 / 365.0
+    r = 0.05
+    sigma = 0.20
+    call = bs_price(s, k, t, r, sigma, "C")
+    assert 1.0 <= call <= 5.0
+
+
+def test_bs_put_call_parity() -> None:
+    """For ATM with same expiry: C - P ~= S - K * exp(-r*T) within $0.01."""
+    s, k, r, sigma = 450.0, 450.0, 0.05, 0.20
+    t = 1 / 365.0
+    c = bs_price(s, k, t, r, sigma, "C")
+    p = bs_price(s, k, t, r, sigma, "P")
+    expected = s - k * math.exp(-r * t)
+    assert abs((c - p) - expected) < 0.01
+
+
+def test_bs_chain_matches_scalar_pricer() -> None:
+    strikes = np.array([440.0, 449.5, 450.0, 450.0, 461.0, 300.0])
+    is_call = np.array([True, False, True, False, True, False])
+    t = np.array([1 / 365, 2 / 365, 1 / 365, 1 / 365, 30 / 365, 0.5])
+    g = bs_chain(450.0, strikes, t, 0.05, 0.2, is_call=is_call)
+    for i, (k, call, ti) in enumerate(zip(strikes, is_call, t)):
+        right = "C" if call else "P"
+        expected = (bs_price(450.0, k, ti, 0.05, 0.2, right),
+                    *bs_greeks(450.0, k, ti, 0.05, 0.2, right))
+        got = (g.price[i], g.delta[i], g.gamma[i], g.theta[i], g.vega[i])
+        assert got == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+def test_bs_chain_rejects_non_positive_inputs() -> None:
+    with pytest.raises(ValueError):
+        bs_chain(450.0, np.array([450.0, 0.0]), 0.01, 0.05, 0.2, is_call=np.array([True, True]))
@@ -0,0 +1,81 @@
+"""Unit tests for engine.pricing.iv_solver."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from contracts.data_feed import OptionQuote
+from engine.pricing import backfill_greeks, bs_chain, implied_vol
+
+_NOW = datetime(2026, 4, 15, 14, 0, tzinfo=UTC)
+
+
+def test_recovers_the_vol_of_every_contract_in_one_call() -> None:
+    rng = np.random.default_rng(3)
+    n = 400
+    k = rng.uniform(300, 600, n)
+    t = rng.uniform(1 / 365 / 24, 1.0, n)
+    sigma = rng.uniform(0.05, 1.5, n)
+    is_call = rng.random(n) < 0.5
+    price = bs_chain(450.0, k, t, 0.05, sigma, is_call=is_call).price
+
+    iv = implied_vol(price, 450.0, k, t, 0.05, is_call=is_call)
+    # Where the option has vega enough to pin the vol, it is recovered.
+    vega = bs_chain(450.0, k, t, 0.05, sigma, is_call=is_call).vega
+    pinned = vega > 1e-2  # at least a cent per vol point
+    assert pinned.sum() > n // 2
+    assert iv[pinned] == pytest.approx(sigma[pinned], rel=1e-6)
+    # Wherever a vol came back, it reprices the option.
+    solved = np.isfinite(iv)
+    repriced = bs_chain(450.0, k[solved], t[solved], 0.05, iv[solved], is_call=is_call[solved])
+    assert repriced.price == pytest.approx(price[solved], abs=1e-7)
+
+
+def test_prices_outside_no_arbitrage_bounds_have_no_vol() -> None:
+    k = np.array([450.0, 450.0, 400.0, 500.0, 450.0])
+    is_call = np.array([True, True, True, False, True])
+    # Above spot; below intrinsic; below intrinsic (put); NaN; a sane one.
+    price = np.array([451.0, 0.0, 49.0, 40.0, np.nan])
+    iv = implied_vol(price, 450.0, k, 0.1, 0.0, is_call=is_call)
+    assert np.isnan(iv).all()
+
+
+def test_rejects_non_positive_inputs() -> None:
+    with pytest.raises(ValueError):
+        implied_vol(np.array([1.0]), 450.0, np.array([450.0]), 0.0, 0.05, is_call=np.array([True]))
+
+
+def _quote(strike: int, right: str, bid: str, ask: str, **greeks: Decimal) -> OptionQuote:
+    return OptionQuote(
+        underlying="QQQ", expiry=date(2026, 4, 17), strike=Decimal(strike), right=right,
+        timestamp=_NOW, bid=Decimal(bid), ask=Decimal(ask), **greeks,
+    )
+
+
+def test_backfill_fills_only_missing_fields() -> None:
+    quotes = [
+        _quote(450, "C", "3.10", "3.20"),
+        _quote(445, "P", "1.50", "1.60", iv=Decimal("0.3"), delta=Decimal("-0.3")),
+        _quote(
+            455, "C", "1.00", "1.10", iv=Decimal("0.2"), delta=Decimal("0.3"),
+            gamma=Decimal("0.05"), theta=Decimal("-0.4"), vega=Decimal("0.1"),
+        ),
+        _quote(500, "C", "0", "0.01"),  # no bid: nothing to solve from
+    ]
+    out = backfill_greeks(quotes, Decimal("450"), _NOW)
+    assert out[2] is quotes[2] and out[3] is quotes[3]
+
+    atm = out[0]
+    assert atm.iv is not None and Decimal("0.1") < atm.iv < Decimal("0.5")
+    assert atm.delta is not None and Decimal("0.4") < atm.delta < Decimal("0.65")
+    assert atm.gamma > 0 and atm.vega > 0 and atm.theta < 0  # type: ignore[operator]
+    t = (2 * 86400 + 6 * 3600) / (365 * 86400)
+    mid = bs_chain(450.0, np.array([450.0]), t, 0.05, float(atm.iv), is_call=np.array([True]))
+    assert float(mid.price[0]) == pytest.approx(3.15, abs=1e-4)
+
+    put = out[1]
+    assert (put.iv, put.delta) == (Decimal("0.3"), Decimal("-0.3"))
+    assert put.gamma is not None and put.theta is not None and put.vega is not None
@@ -0,0 +1,53 @@
+"""Unit tests for engine.pricing.smile."""
+
+from __future__ import annotations
+
+import math
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from contracts.data_feed import OptionQuote
+from engine.pricing import VolSmile, bs_chain, fit_smiles
+
+_NOW = datetime(2026, 4, 15, 14, 0, tzinfo=UTC)
+_EXPIRY = date(2026, 4, 17)
+
+
+def test_fit_recovers_a_quadratic_and_is_flat_outside_the_data() -> None:
+    forward = 450.0
+    k = np.linspace(420, 480, 13)
+    x = np.log(k / forward)
+    smile = VolSmile.fit(k, 0.2 - 0.3 * x + 2.0 * x * x, forward)
+    assert smile.vol(k, forward) == pytest.approx(0.2 - 0.3 * x + 2.0 * x * x)
+    assert smile.vol(np.array([300.0, 600.0]), forward) == pytest.approx(
+        smile.vol(np.array([420.0, 480.0]), forward)
+    )
+    # Too few points for a quadratic: the degree drops.
+    line = VolSmile.fit(np.array([440.0, 460.0]), np.array([0.25, np.nan]), forward)
+    assert line.coeffs == (0.25,)
+    with pytest.raises(ValueError):
+        VolSmile.fit(k, np.full(len(k), np.nan), forward)
+
+
+def test_fit_smiles_from_quotes_without_iv() -> None:
+    spot, r = 450.0, 0.05
+    t = (2 * 86400 + 6 * 3600) / (365 * 86400)
+    forward = spot * math.exp(r * t)
+    strikes = np.arange(440.0, 461.0)
+    true_vol = 0.2 - 0.5 * np.log(strikes / forward) + 3.0 * np.log(strikes / forward) ** 2
+    quotes = []
+    for right in ("C", "P"):
+        is_call = np.full(len(strikes), right == "C")
+        prices = bs_chain(spot, strikes, t, r, true_vol, is_call=is_call).price
+        for k, p in zip(strikes, prices, strict=True):
+            mid = Decimal(str(round(p, 6)))
+            quotes.append(OptionQuote(
+                underlying="QQQ", expiry=_EXPIRY, strike=Decimal(int(k)), right=right,
+                timestamp=_NOW, bid=mid, ask=mid,
+            ))
+
+    smiles = fit_smiles(quotes, Decimal(spot), _NOW, r)
+    assert list(smiles) == [_EXPIRY]
+    assert smiles[_EXPIRY].vol(strikes, forward) == pytest.approx(true_vol, rel=1e-3)
@@ -239,7 +239,7 @@ def test_session_reset_clears_window_and_vwap():
 
     next_day = datetime(2026, 4, 16, 14, 0, tzinfo=UTC)
     tape.push(next_day, Decimal("451.00"), vol_increment=100)
-    assert len(strat._sec_samples) <= 1
+    assert strat._features.samples <= 1
     assert strat._last_diff_sign == 0
 
 
@@ -251,3 +251,35 @@ def test_on_bar_is_noop():
     assert decision.signals == []
     assert decision.intents == []
     assert strat.kind == "tick"
+
+
+def test_fixed_point_mode_matches_decimal_mode():
+    """Same random tape through both price representations → same decisions."""
+    import random
+
+    rng = random.Random(42)
+    samples = []
+    mid = Decimal("450.00")
+    for i in range(600):
+        mid += Decimal(rng.choice((-3, -1, 0, 1, 3))) / 100
+        samples.append((_ts(i / 2), mid))
+
+    strats = [
+        BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1,
+                                   fixed_point=fp)
+        for fp in (False, True)
+    ]
+    tapes = [_Tape(s) for s in strats]
+    n_signals = 0
+    for ts, m in samples:
+        vol = rng.choice((0, 100, 300))
+        ref, fx = (t.push(ts, m, vol_increment=vol) for t in tapes)
+        assert [(s.direction, s.timestamp) for s in fx.signals] == \
+            [(s.direction, s.timestamp) for s in ref.signals]
+        for a, b in zip(fx.signals, ref.signals):
+            assert Decimal(a.metadata["sma"]) == Decimal(b.metadata["sma"])
+            assert Decimal(a.metadata["vwap"]) == Decimal(b.metadata["vwap"])
+        assert [(i.tag, i.limit_price) for i in fx.intents] == \
+            [(i.tag, i.limit_price) for i in ref.intents]
+        n_signals += len(ref.signals)
+    assert n_signals > 0
@@ -0,0 +1,3 @@
+"""Tests for services.strategy_engine."""
+
+from __future__ import annotations
@@ -0,0 +1,186 @@
+"""Checkpoint / warm-restart tests against the in-memory backend."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from contracts.strategy import StrategyContext
+from engine.strategies.buy_vol_qqq_cross import BuyVolQQQCrossStrategy
+from engine.strategies.buy_vol_qqq_cross_tick import BuyVolQQQCrossTickStrategy
+from engine.strategies.sell_put_qqq_cross import SellPutQQQCrossStrategy
+from scripts.synthetic_tape import SESSION_START, tape
+from services.persistence import InMemoryBackend, PersistenceWriter
+from services.strategy_engine.checkpoint import (
+    Checkpoint,
+    Checkpointer,
+    FileCheckpointStore,
+    StorageCheckpointStore,
+    restore_strategy,
+)
+
+from tests.helpers import atm_chain, fixture_bars
+
+
+def _drive(strategy, ticks):  # type: ignore[no-untyped-def]
+    chain = atm_chain()
+    out = []
+    for tick in ticks:
+        d = strategy.on_tick(StrategyContext(
+            now=tick.timestamp, last_tick=tick, option_quotes=chain,
+            cash_available=Decimal("5000"),
+        ))
+        out.append(([(s.direction, s.metadata["sma"]) for s in d.signals],
+                     [(i.tag, i.limit_price) for i in d.intents]))
+    return out
+
+
+def test_tick_strategies_resume_identically_from_json_snapshot() -> None:
+    ticks = tape(900, seed=5)
+    for make in (
+        lambda: BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1),
+        lambda: BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1,
+                                           fixed_point=True),
+        lambda: SellPutQQQCrossStrategy(sma_window_seconds=3, cooldown_seconds=5),
+    ):
+        reference = make()
+        ref = _drive(reference, ticks)
+        first = make()
+        head = _drive(first, ticks[:450])
+        state = json.loads(json.dumps(first.snapshot_state()))
+        resumed = make()
+        resumed.restore_state(state)
+        assert resumed.snapshot_state() == first.snapshot_state()
+        assert head + _drive(resumed, ticks[450:]) == ref
+        assert any(intents for _, intents in ref)
+
+
+def test_bar_strategy_resumes_identically_from_json_snapshot() -> None:
+    bars = fixture_bars()
+
+    def drive(strategy, bars):  # type: ignore[no-untyped-def]
+        return [
+            strategy.on_bar(StrategyContext(
+                now=b.open_time, last_bar=b, cash_available=Decimal("5000"),
+            )).signals
+            for b in bars
+        ]
+
+    ref = drive(BuyVolQQQCrossStrategy(), bars)
+    first = BuyVolQQQCrossStrategy()
+    head = drive(first, bars[:30])
+    resumed = BuyVolQQQCrossStrategy()
+    resumed.restore_state(json.loads(json.dumps(first.snapshot_state())))
+    assert head + drive(resumed, bars[30:]) == ref
+
+
+async def test_restore_replays_only_ticks_after_checkpoint(tmp_path: Path) -> None:
+    ticks = tape(600, seed=5)
+    backend = InMemoryBackend()
+    writer = PersistenceWriter(backend)
+    for tick in ticks:
+        await writer.write_tick(tick, feed="replay")
+
+    live = BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1)
+    for tick in ticks[:400]:
+        live.warm_tick(tick)
+    store = FileCheckpointStore(tmp_path)
+    await Checkpointer(live, store, interval_seconds=5).save(ticks[399].timestamp)
+    for tick in ticks[400:]:
+        live.warm_tick(tick)
+
+    restarted = BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1)
+    checkpoint, replay = await restore_strategy(
+        restarted, store, backend, symbol="QQQ", bar_interval_seconds=60, replay_limit=1000,
+        now=ticks[-1].timestamp,
+    )
+    assert checkpoint is not None
+    assert replay is not None
+    assert replay.events == 200
+    assert replay.last_event_at == ticks[-1].timestamp
+    assert restarted._features.values() == live._features.values()
+    assert restarted._last_diff_sign == live._last_diff_sign
+
+
+async def test_restore_replays_bars_after_checkpoint() -> None:
+    bars = fixture_bars()
+    backend = InMemoryBackend()
+    await PersistenceWriter(backend).write_bars(bars, feed="replay")
+
+    live = BuyVolQQQCrossStrategy()
+    for bar in bars[:25]:
+        live.warm_bar(bar)
+    store = StorageCheckpointStore(backend)
+    await Checkpointer(live, store, interval_seconds=5).save(bars[24].open_time)
+    for bar in bars[25:]:
+        live.warm_bar(bar)
+
+    restarted = BuyVolQQQCrossStrategy()
+    _, replay = await restore_strategy(
+        restarted, store, backend, symbol="QQQ", bar_interval_seconds=60, replay_limit=1000,
+        now=bars[-1].open_time,
+    )
+    assert replay is not None
+    assert replay.events == len(bars) - 25
+    assert replay.bars == bars[25:]
+    assert restarted.snapshot_state() == live.snapshot_state()
+
+
+async def test_missing_or_foreign_version_checkpoint_is_ignored(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path)
+    strat = BuyVolQQQCrossTickStrategy()
+    assert await restore_strategy(
+        strat, store, InMemoryBackend(), symbol="QQQ", bar_interval_seconds=60, replay_limit=10,
+        now=SESSION_START,
+    ) == (None, None)
+    await store.save(Checkpoint(strat.name, SESSION_START, {"strategy": {}}, version=99))
+    assert await restore_strategy(
+        strat, store, InMemoryBackend(), symbol="QQQ", bar_interval_seconds=60, replay_limit=10,
+        now=SESSION_START,
+    ) == (None, None)
+
+
+async def test_checkpointer_rate_limits_saves() -> None:
+    saved: list[Checkpoint] = []
+
+    class _Store:
+        async def save(self, checkpoint: Checkpoint) -> None:
+            saved.append(checkpoint)
+
+        async def load(self, strategy: str) -> Checkpoint | None:
+            return None
+
+    cp = Checkpointer(BuyVolQQQCrossTickStrategy(), _Store(), interval_seconds=3600,
+                      extra={"open_positions": 1})
+    for i in range(5):
+        cp.maybe_save(SESSION_START + timedelta(seconds=i))
+    assert saved == []  # the store write runs in the background
+    await cp.drain()
+    assert len(saved) == 1
+    assert saved[0].state["open_positions"] == 1
+    assert cp.last_event_at == SESSION_START + timedelta(seconds=4)
+
+
+async def test_checkpointer_writes_in_background_one_at_a_time() -> None:
+    release = asyncio.Event()
+    saved: list[datetime] = []
+
+    class _SlowStore:
+        async def save(self, checkpoint: Checkpoint) -> None:
+            await release.wait()
+            saved.append(checkpoint.taken_at)
+
+        async def load(self, strategy: str) -> Checkpoint | None:
+            return None
+
+    cp = Checkpointer(BuyVolQQQCrossTickStrategy(), _SlowStore(), interval_seconds=0)
+    for i in range(4):  # returns at once although the store is stuck
+        cp.maybe_save(SESSION_START + timedelta(seconds=i))
+        await asyncio.sleep(0)
+    release.set()
+    await cp.drain()
+    # The first write was in flight; of the three taken meanwhile only the newest is kept.
+    assert saved == [SESSION_START, SESSION_START + timedelta(seconds=3)]
@@ -0,0 +1,187 @@
+"""OptionSubscriptionManager against fake streaming and snapshot feeds."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+from contracts.data_feed import ChainSnapshot, OptionContract, OptionQuote
+from engine.data_feeds.base import BaseFeed
+from engine.data_feeds.synthetic_options import EventClock, SyntheticOptionsFeed
+from services.strategy_engine.option_subscriptions import OptionSubscriptionManager
+
+_EXPIRY = date(2026, 4, 15)
+_NOW = datetime(2026, 4, 15, 14, 0, tzinfo=UTC)
+
+
+def _quote(c: OptionContract, bid: Decimal) -> OptionQuote:
+    return OptionQuote(
+        underlying=c.underlying, expiry=c.expiry, strike=c.strike, right=c.right,
+        timestamp=_NOW, bid=bid, ask=bid + Decimal("0.10"),
+    )
+
+
+class _Feed:
+    """Chain of 21 $1 strikes around ``centre``; quote streams never end
+    (``live=True``, like IBKR) or yield one snapshot (``live=False``).
+    ``push`` sends a new bid to every open stream."""
+
+    def __init__(self, live: bool = True, empty: bool = False) -> None:
+        self.live = live
+        self.empty = empty
+        self.chain_calls = 0
+        self.open_streams = 0
+        self.streams_opened = 0
+        self.polls = 0
+        self._inboxes: list[asyncio.Queue[Decimal]] = []
+
+    def push(self, bid: Decimal) -> None:
+        for inbox in self._inboxes:
+            inbox.put_nowait(bid)
+
+    async def get_option_chain(self, underlying: str, expiry: date) -> ChainSnapshot:
+        self.chain_calls += 1
+        contracts = [] if self.empty else [
+            OptionContract(underlying=underlying, expiry=expiry, strike=Decimal(k), right=r)
+            for k in range(440, 461) for r in ("C", "P")
+        ]
+        return ChainSnapshot(
+            underlying=underlying, expiry=expiry, snapshot_time=_NOW, contracts=contracts,
+        )
+
+    async def stream_option_quotes(
+        self, contracts: list[OptionContract]
+    ) -> AsyncIterator[OptionQuote]:
+        self.streams_opened += 1
+        self.open_streams += 1
+        inbox: asyncio.Queue[Decimal] = asyncio.Queue()
+        self._inboxes.append(inbox)
+        try:
+            self.polls += 1
+            for c in contracts:
+                yield _quote(c, Decimal(self.polls))
+            while self.live:
+                bid = await inbox.get()
+                for c in contracts:
+                    yield _quote(c, bid)
+        finally:
+            self._inboxes.remove(inbox)
+            self.open_streams -= 1
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _until(cond) -> None:  # type: ignore[no-untyped-def]
+    async with asyncio.timeout(2):
+        while not cond():
+            await asyncio.sleep(0.001)
+
+
+async def test_live_feed_subscribes_once_and_reads_from_table() -> None:
+    feed = _Feed()
+    book = OptionSubscriptionManager(feed, "QQQ", window_strikes=2)
+    chain = await book.refresh(Decimal("450.10"), _EXPIRY)
+    assert len(chain) == 10
+    assert [float(k) for k in chain.strikes()] == [448, 449, 450, 451, 452]
+
+    for price in ("450.20", "449.60", "450.49"):
+        chain = await book.refresh(Decimal(price), _EXPIRY)
+    # One chain fetch; one stream per strike, all still open.
+    assert (feed.chain_calls, feed.streams_opened, feed.open_streams) == (1, 5, 5)
+
+    feed.push(Decimal("7.00"))
+    await _until(lambda: all(q.bid == Decimal("7.00") for q in book.chain().quotes))
+    first = book.chain()
+    assert first.get(Decimal(450), "C").bid == Decimal("7.00")  # type: ignore[union-attr]
+    assert book.chain() is first  # unchanged table -> same snapshot
+    await book.close()
+    assert feed.open_streams == 0
+
+
+async def test_wobbling_around_a_strike_midpoint_does_not_resubscribe() -> None:
+    feed = _Feed()
+    book = OptionSubscriptionManager(feed, "QQQ", window_strikes=2)
+    await book.refresh(Decimal("450.49"), _EXPIRY)
+    for i in range(20):
+        await book.refresh(Decimal("450.51" if i % 2 else "450.49"), _EXPIRY)
+    await _settle()
+    assert (book.subscribes, feed.chain_calls, feed.streams_opened) == (1, 1, 5)
+    await book.close()
+
+
+async def test_recentres_in_background_near_the_edge_and_diffs_the_window() -> None:
+    feed = _Feed()
+    book = OptionSubscriptionManager(feed, "QQQ", window_strikes=2)
+    await book.refresh(Decimal("450.00"), _EXPIRY)
+    await book.refresh(Decimal("451.40"), _EXPIRY)  # ATM 451: one strike from the edge
+    assert book.subscribes == 1
+
+    chain = await book.refresh(Decimal("451.60"), _EXPIRY)  # ATM 452 is the edge
+    # The old window keeps serving while the re-centre runs.
+    assert [float(k) for k in chain.strikes()] == [448, 449, 450, 451, 452]
+    await _until(lambda: feed.streams_opened == 7)
+    chain = await book.refresh(Decimal("451.60"), _EXPIRY)
+    assert book.subscribes == 2
+    assert [float(k) for k in chain.strikes()] == [450, 451, 452, 453, 454]
+    # Only 453 and 454 were subscribed; 448 and 449 were cancelled.
+    assert feed.open_streams == 5
+
+    await book.refresh(Decimal("451.60"), date(2026, 4, 16))
+    assert book.subscribes == 3
+    await book.close()
+    assert feed.open_streams == 0
+
+
+async def test_snapshot_feed_is_repolled_each_refresh() -> None:
+    feed = _Feed(live=False)
+    book = OptionSubscriptionManager(feed, "QQQ", window_strikes=1)
+    await book.refresh(Decimal("450"), _EXPIRY)
+    await _settle()
+    assert feed.polls == 3  # one snapshot stream per strike
+    chain = await book.refresh(Decimal("450"), _EXPIRY)
+    chain = await book.refresh(Decimal("450.2"), _EXPIRY)
+    assert feed.chain_calls == 1
+    assert feed.polls == 5
+    assert chain.get(Decimal(451), "P").bid == Decimal(5)  # type: ignore[union-attr]
+
+
+async def test_empty_chain_backs_off() -> None:
+    feed = _Feed(empty=True)
+    book = OptionSubscriptionManager(feed, "QQQ", window_strikes=1, retry_seconds=3600)
+    for _ in range(5):
+        chain = await book.refresh(Decimal("450"), _EXPIRY)
+    assert len(chain) == 0
+    assert feed.chain_calls == 1
+
+
+async def test_synthetic_feed_is_handed_the_underlying_price() -> None:
+    # BaseFeed can neither stream bars nor look a close up: the chain can
+    # only be centred on the price the manager observes on the feed.
+    feed = SyntheticOptionsFeed(BaseFeed(), clock=EventClock(_NOW))
+    book = OptionSubscriptionManager(feed, "QQQ", window_strikes=2)
+    chain = await book.refresh(Decimal("431.40"), _EXPIRY)
+    assert [float(k) for k in chain.strikes()] == [429, 430, 431, 432, 433]
+    chain = await book.refresh(Decimal("436.20"), _EXPIRY)
+    assert [float(k) for k in chain.strikes()] == [434, 435, 436, 437, 438]
+    await book.close()
+
+
+async def test_backfills_missing_greeks_from_mids() -> None:
+    feed = _Feed()
+    book = OptionSubscriptionManager(feed, "QQQ", window_strikes=2, backfill_greeks=True)
+    chain = await book.refresh(Decimal("450.10"), _EXPIRY)
+    atm = chain.get(Decimal(450), "C")
+    assert atm is not None and atm.iv is not None and atm.iv > 0
+    assert atm.delta is not None and Decimal("0.4") < atm.delta < Decimal("0.6")
+    # The 448 strike streamed first, quoted at $1.00 / $1.10: below the
+    # call's intrinsic value, so it has no iv to solve.
+    assert chain.get(Decimal(448), "C").iv is None  # type: ignore[union-attr]
+    assert book.chain() is chain
+    moved = await book.refresh(Decimal("450.30"), _EXPIRY)
+    assert moved is not chain  # greeks depend on the underlying
+    await book.close()
@@ -0,0 +1,120 @@
+"""Session warm-up tests against the in-memory backend."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from contracts.data_feed import Quote
+from contracts.strategy import StrategyContext
+from engine.strategies.buy_vol_qqq_cross import BuyVolQQQCrossStrategy
+from engine.strategies.buy_vol_qqq_cross_tick import BuyVolQQQCrossTickStrategy
+from scripts.synthetic_tape import tape
+from services.persistence import InMemoryBackend, PersistenceReader, PersistenceWriter
+from services.strategy_engine.checkpoint import (
+    Checkpointer,
+    FileCheckpointStore,
+    restore_strategy,
+)
+from services.strategy_engine.warmup import WarmupTruncated, session_start, warm_up_session
+
+from tests.helpers import fixture_bars
+
+_TODAY = datetime(2026, 4, 15, 14, 0, tzinfo=UTC)
+
+
+async def _persist_ticks(backend: InMemoryBackend, ticks: list[Quote]) -> None:
+    writer = PersistenceWriter(backend)
+    for tick in ticks:
+        await writer.write_tick(tick, feed="replay")
+
+
+def test_session_start_is_utc_midnight() -> None:
+    assert session_start(_TODAY) == datetime(2026, 4, 15, tzinfo=UTC)
+
+
+async def test_tick_warmup_feeds_only_todays_session() -> None:
+    yesterday = tape(300, seed=1, start=_TODAY - timedelta(days=1))
+    today = tape(500, seed=2, start=_TODAY)
+    backend = InMemoryBackend()
+    await _persist_ticks(backend, yesterday + today)
+
+    reference = BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1)
+    for tick in today:
+        reference.warm_tick(tick)
+
+    warmed = BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1)
+    result = await warm_up_session(
+        warmed, PersistenceReader(backend), symbol="QQQ", bar_interval_seconds=60,
+        start=session_start(today[-1].timestamp), page_size=37,
+    )
+    assert result.events == len(today)
+    assert result.last_event_at == today[-1].timestamp
+    assert result.bars == []
+    assert warmed._features.values() == reference._features.values()
+    assert warmed.snapshot_state() == reference.snapshot_state()
+
+
+async def test_warmup_past_the_limit_raises_instead_of_leaving_a_gap() -> None:
+    backend = InMemoryBackend()
+    await _persist_ticks(backend, tape(50, seed=2, start=_TODAY))
+    with pytest.raises(WarmupTruncated):
+        await warm_up_session(
+            BuyVolQQQCrossTickStrategy(), PersistenceReader(backend), symbol="QQQ",
+            bar_interval_seconds=60, start=session_start(_TODAY), limit=49, page_size=20,
+        )
+
+
+async def test_bar_warmup_makes_first_live_bars_match_uninterrupted_run() -> None:
+    bars = fixture_bars()
+    split = 30
+
+    def drive(strategy, bars):  # type: ignore[no-untyped-def]
+        return [
+            strategy.on_bar(StrategyContext(
+                now=b.open_time, last_bar=b, cash_available=Decimal("5000"),
+            )).signals
+            for b in bars
+        ]
+
+    reference = drive(BuyVolQQQCrossStrategy(), bars)
+    backend = InMemoryBackend()
+    await PersistenceWriter(backend).write_bars(bars[:split], feed="replay")
+
+    warmed = BuyVolQQQCrossStrategy()
+    result = await warm_up_session(
+        warmed, PersistenceReader(backend), symbol="QQQ", bar_interval_seconds=60,
+        start=session_start(bars[split].open_time),
+    )
+    assert result.events == split
+    assert result.bars == bars[:split]
+    assert drive(warmed, bars[split:]) == reference[split:]
+
+
+async def test_stale_checkpoint_replays_only_todays_session(tmp_path: Path) -> None:
+    yesterday = tape(300, seed=3, start=_TODAY - timedelta(days=1))
+    today = tape(400, seed=4, start=_TODAY)
+    backend = InMemoryBackend()
+    await _persist_ticks(backend, yesterday + today)
+
+    live = BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1)
+    for tick in yesterday:
+        live.warm_tick(tick)
+    store = FileCheckpointStore(tmp_path)
+    await Checkpointer(live, store, interval_seconds=5).save(yesterday[-1].timestamp)
+
+    reference = BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1)
+    for tick in today:
+        reference.warm_tick(tick)
+
+    restarted = BuyVolQQQCrossTickStrategy(sma_window_seconds=3, confirmation_seconds=1)
+    _, replay = await restore_strategy(
+        restarted, store, backend, symbol="QQQ", bar_interval_seconds=60,
+        replay_limit=10_000, now=today[-1].timestamp,
+    )
+    assert replay is not None
+    assert replay.start == session_start(_TODAY)
+    assert replay.events == len(today)
+    assert restarted._features.values() == reference._features.values()